@@ -0,0 +1,3 @@
+"""
+Platform API Benchmarks
+"""
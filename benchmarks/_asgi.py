@@ -0,0 +1,114 @@
+"""
+In-process ASGI driver shared by the benchmarks
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from starlette.types import ASGIApp, Message
+
+
+@dataclass
+class RunResult:
+    """Latency samples collected for a single benchmark run"""
+
+    requests: int
+    elapsed: float
+    latencies: List[float]
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct: float) -> float:
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "rps": round(self.rps, 1),
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+        }
+
+
+def build_scope(
+    method: str,
+    path: str,
+    headers: Optional[Dict[str, str]] = None,
+    query_string: str = "",
+) -> Dict:
+    """Build an HTTP connection scope as uvicorn would"""
+    raw_headers = [(b"host", b"localhost:8082")]
+    for key, value in (headers or {}).items():
+        raw_headers.append((key.lower().encode("latin-1"), value.encode("latin-1")))
+
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8082),
+    }
+
+
+async def call_app(app: ASGIApp, scope: Dict, body: bytes = b"") -> int:
+    """Drive one request through ``app`` and return the response status"""
+    status = 0
+    request_sent = False
+    response_complete = asyncio.Event()
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Like uvicorn, only report a disconnect once the response is done
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    await app(dict(scope), receive, send)
+    return status
+
+
+async def run(
+    app: ASGIApp,
+    scope: Dict,
+    requests: int,
+    concurrency: int = 1,
+    body: bytes = b"",
+) -> RunResult:
+    """Issue ``requests`` calls with ``concurrency`` in-flight at a time"""
+    latencies: List[float] = []
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            await call_app(app, scope, body)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return RunResult(requests=requests, elapsed=time.perf_counter() - started, latencies=latencies)
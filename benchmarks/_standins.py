@@ -0,0 +1,327 @@
+"""
+In-process stand-ins for the app's external dependencies
+
+Repositories keep their rows in memory, provider APIs answer from an
+httpx.MockTransport, and Redis and NATS are simply absent: every
+component already degrades to its local path without them. Lets the
+benchmarks run the real app on a laptop.
+"""
+
+import asyncio
+import copy
+import os
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+import httpx
+from fastapi import Depends
+
+from src.domain.entities.provider import ProviderConfig
+from src.domain.entities.tenant import Tenant, TenantStatus, TenantTier
+from src.domain.entities.user import User, UserRole
+from src.domain.ports.repositories.pagination import Cursor, Page
+from src.domain.ports.repositories.provider_repository import ProviderConfigRepository
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.domain.ports.repositories.user_repository import EmailTakenError, UserRepository
+from src.infrastructure.config.settings import settings
+
+# Credentials of the user every tenant has, for the login benchmarks
+LOGIN_PASSWORD = "Bench-password-1"
+
+
+def tenant_id(index: int) -> UUID:
+    """Deterministic tenant ids, the same in every benchmark process"""
+    return uuid5(NAMESPACE_URL, f"bench-tenant-{index}")
+
+
+def user_id(index: int) -> UUID:
+    """Deterministic user ids; users below the tenant count are the login users"""
+    return uuid5(NAMESPACE_URL, f"bench-user-{index}")
+
+
+def login_email(index: int) -> str:
+    return f"admin@tenant{index}.example.com"
+
+
+def _page(rows: List, limit: int, after: Optional[Cursor]) -> Page:
+    start = 0
+    if after is not None:
+        start = next(
+            (i + 1 for i, row in enumerate(rows) if (row.created_at, row.id) == after), len(rows)
+        )
+    items = rows[start : start + limit]
+    more = start + limit < len(rows)
+    return Page(items, (items[-1].created_at, items[-1].id) if more and items else None)
+
+
+class InMemoryTenantRepository(TenantRepository):
+    """Tenants in a dict, in insertion (creation) order"""
+
+    def __init__(self, tenants: Sequence[Tenant]) -> None:
+        self.tenants = {tenant.id: tenant for tenant in tenants}
+        self.slugs = {tenant.slug for tenant in tenants}
+
+    async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        return self.tenants.get(tenant_id)
+
+    async def get_by_slug(self, slug: str) -> Optional[Tenant]:
+        return next((t for t in self.tenants.values() if t.slug == slug), None)
+
+    async def get_many(self, tenant_ids: Sequence[UUID]) -> List[Tenant]:
+        return [self.tenants[i] for i in tenant_ids if i in self.tenants]
+
+    async def save(self, tenant: Tenant) -> None:
+        self.tenants[tenant.id] = tenant
+        self.slugs.add(tenant.slug)
+
+    async def upsert_many(self, tenants: Sequence[Tenant]) -> int:
+        self.tenants.update((tenant.id, tenant) for tenant in tenants)
+        self.slugs.update(tenant.slug for tenant in tenants)
+        return len(tenants)
+
+    async def insert_new(self, tenants: Sequence[Tenant]) -> Set[UUID]:
+        inserted = set()
+        for tenant in tenants:
+            if tenant.id not in self.tenants and tenant.slug not in self.slugs:
+                await self.save(tenant)
+                inserted.add(tenant.id)
+        return inserted
+
+    async def list_page(self, limit: int, after: Optional[Cursor] = None) -> Page[Tenant]:
+        return _page(list(self.tenants.values()), limit, after)
+
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[Tenant]:
+        for tenant in list(self.tenants.values()):
+            yield tenant
+
+    async def count_estimate(self) -> int:
+        return len(self.tenants)
+
+
+class InMemoryUserRepository(UserRepository):
+    """
+    Users of every tenant in shared dicts; ``for_tenant`` gives the view of
+    one tenant that the app works with
+    """
+
+    def __init__(self, users: Sequence[User] = (), tenant_id: Optional[UUID] = None) -> None:
+        self.tenant_id = tenant_id
+        self.users = {user.id: user for user in users}
+        self.by_email = {(user.tenant_id, user.email): user for user in users}
+
+    def for_tenant(self, tenant_id: UUID) -> "InMemoryUserRepository":
+        view = copy.copy(self)
+        view.tenant_id = tenant_id
+        return view
+
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        user = self.users.get(user_id)
+        return user if user is not None and user.tenant_id == self.tenant_id else None
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return self.by_email.get((self.tenant_id, email))
+
+    async def save(self, user: User) -> None:
+        if user.tenant_id != self.tenant_id:
+            raise ValueError(f"Users must belong to tenant {self.tenant_id}")
+        taken = self.by_email.get((user.tenant_id, user.email))
+        if taken is not None and taken.id != user.id:
+            raise EmailTakenError(f"Email already registered: {user.email}")
+        self.users[user.id] = user
+        self.by_email[(user.tenant_id, user.email)] = user
+
+    async def delete(self, user_id: UUID) -> bool:
+        user = await self.get_by_id(user_id)
+        if user is None:
+            return False
+        del self.users[user.id]
+        del self.by_email[(user.tenant_id, user.email)]
+        return True
+
+    async def insert_new(self, users: Sequence[User]) -> Set[UUID]:
+        inserted = set()
+        for user in users:
+            if user.id not in self.users and (user.tenant_id, user.email) not in self.by_email:
+                await self.save(user)
+                inserted.add(user.id)
+        return inserted
+
+    async def list_page(self, limit: int, after: Optional[Cursor] = None) -> Page[User]:
+        return _page(self._own(), limit, after)
+
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[User]:
+        for user in self._own():
+            yield user
+
+    async def count_estimate(self) -> int:
+        return len(self._own())
+
+    def _own(self) -> List[User]:
+        return [user for user in self.users.values() if user.tenant_id == self.tenant_id]
+
+
+class InMemoryProviderRepository(ProviderConfigRepository):
+    """Provider configs keyed by tenant and provider"""
+
+    def __init__(self, configs: Sequence[ProviderConfig] = ()) -> None:
+        self.configs: Dict[Tuple[str, str], ProviderConfig] = {
+            (config.tenant_id, config.provider): config for config in configs
+        }
+
+    async def list_for_tenant(self, tenant_id: str) -> List[ProviderConfig]:
+        return [config for (owner, _), config in self.configs.items() if owner == tenant_id]
+
+    async def save(self, config: ProviderConfig) -> None:
+        self.configs[(config.tenant_id, config.provider)] = config
+
+    async def delete(self, tenant_id: str, provider: str) -> bool:
+        return self.configs.pop((tenant_id, provider), None) is not None
+
+
+def provider_transport(latency: float = 0.0) -> httpx.MockTransport:
+    """Every provider API answers 200 after ``latency`` seconds"""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if latency:
+            await asyncio.sleep(latency)
+        return httpx.Response(200, json={"data": []})
+
+    return httpx.MockTransport(handler)
+
+
+class StandIns:
+    """
+    Populated stand-ins and the app singletons wired to them
+
+    ``tenants`` active tenants each get one user (see ``login_email``) and
+    two configured providers. Password hashing runs in the real process
+    pool at ``bcrypt_rounds``, so login and user creation cost a few
+    milliseconds rather than the production quarter second.
+    """
+
+    def __init__(self, tenants: int = 100, users: int = 1000, bcrypt_rounds: int = 4) -> None:
+        self.tenant_count = tenants
+        self.user_count = users
+        self.bcrypt_rounds = bcrypt_rounds
+        self.tenants = InMemoryTenantRepository(
+            [
+                Tenant(
+                    id=tenant_id(i),
+                    name=f"Tenant {i}",
+                    status=TenantStatus.ACTIVE,
+                    tier=TenantTier.ENTERPRISE,
+                    organization_name=f"Organization {i}",
+                    primary_contact_email=login_email(i),
+                    max_users=-1,
+                    max_requests_per_month=-1,
+                )
+                for i in range(tenants)
+            ]
+        )
+        self.users = InMemoryUserRepository()
+        self.providers = InMemoryProviderRepository(
+            [
+                ProviderConfig(
+                    str(tenant_id(i)), name, api_key="sk-" + "x" * 48, default_model="default"
+                )
+                for i in range(tenants)
+                for name in ("openai", "anthropic")
+            ]
+        )
+        self._initial_users: Dict[UUID, User] = {}
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self.log_stream = None
+
+    async def start(self) -> None:
+        """Initialize the app singletons against the stand-ins (what lifespan does)"""
+        from src.infrastructure.cache.provider_cache import init_provider_cache
+        from src.infrastructure.cache.tenant_resolver import init_tenant_resolver
+        from src.infrastructure.metering.quota_meter import init_quota_meter
+        from src.infrastructure.observability.access_log import init_access_log
+        from src.infrastructure.observability.health import init_health_monitor
+        from src.infrastructure.providers.connectivity import init_provider_tester
+        from src.infrastructure.ratelimit.limiter import init_rate_limiter
+        from src.infrastructure.security.encryption import get_secret_box
+        from src.infrastructure.security.passwords import init_password_service
+        from src.infrastructure.security.tokens import init_token_service
+
+        # Measure the limiter, never trip it
+        settings.RATE_LIMIT_PER_MINUTE = settings.RATE_LIMIT_PER_HOUR = 10**9
+        settings.PASSWORD_BCRYPT_ROUNDS = self.bcrypt_rounds
+
+        self.log_stream = open(os.devnull, "w")
+        init_access_log(self.log_stream)
+        init_rate_limiter(None)
+        init_quota_meter(None)
+        await init_tenant_resolver(self.tenants)
+        await init_token_service()
+        await init_provider_cache(self.providers, get_secret_box())
+        self._http_client = httpx.AsyncClient(transport=provider_transport())
+        init_provider_tester(self._http_client)
+        passwords = init_password_service()
+
+        async def healthy() -> None:
+            return None
+
+        await init_health_monitor({"database": healthy, "redis": healthy, "nats": healthy})
+
+        password_hash = await passwords.hash(LOGIN_PASSWORD)
+        for i in range(self.user_count):
+            owner = i % max(1, self.tenant_count)
+            email = (
+                login_email(owner)
+                if i < self.tenant_count
+                else f"user{i}@tenant{owner}.example.com"
+            )
+            await self.users.for_tenant(tenant_id(owner)).save(
+                User(
+                    id=user_id(i),
+                    tenant_id=tenant_id(owner),
+                    email=email,
+                    full_name=f"User {i}",
+                    role=UserRole.ADMIN if i < self.tenant_count else UserRole.MEMBER,
+                    password_hash=password_hash,
+                )
+            )
+        self._initial_users = dict(self.users.users)
+
+    def reset(self) -> None:
+        """Drop users created since ``start``, so every run sees the same data"""
+        self.users = InMemoryUserRepository(list(self._initial_users.values()))
+
+    def install(self, app) -> None:
+        """Route the app's repository dependencies to the stand-ins"""
+        from src.adapters.inbound.rest import dependencies
+
+        app.dependency_overrides[dependencies.get_tenant_repository] = lambda: self.tenants
+        # Looked up per request, so ``reset`` takes effect
+        app.dependency_overrides[dependencies.get_user_repository] = lambda tenant=Depends(
+            dependencies.get_current_tenant_id
+        ): self.users.for_tenant(tenant)
+        app.dependency_overrides[dependencies.get_provider_repository] = lambda: self.providers
+
+    async def close(self) -> None:
+        """Tear the singletons down again"""
+        from src.infrastructure.cache.provider_cache import close_provider_cache
+        from src.infrastructure.cache.tenant_resolver import close_tenant_resolver
+        from src.infrastructure.metering.quota_meter import close_quota_meter
+        from src.infrastructure.observability.access_log import close_access_log
+        from src.infrastructure.observability.health import close_health_monitor
+        from src.infrastructure.providers.connectivity import close_provider_tester
+        from src.infrastructure.ratelimit.limiter import close_rate_limiter
+        from src.infrastructure.security.passwords import close_password_service
+        from src.infrastructure.security.tokens import close_token_service
+
+        await close_health_monitor()
+        await close_password_service()
+        close_provider_tester()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        await close_provider_cache()
+        await close_token_service()
+        await close_tenant_resolver()
+        await close_quota_meter()
+        close_rate_limiter()
+        close_access_log()
+        if self.log_stream is not None:
+            self.log_stream.close()
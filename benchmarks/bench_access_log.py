@@ -0,0 +1,84 @@
+"""
+Access Logging Latency Benchmark
+
+Runs the request pipeline with access logging off, written synchronously in
+the request path (format + write), and through the queue with a background
+writer. Output goes to /dev/null so only the logging overhead is measured;
+``--write-latency-us`` adds a delay to every write to model a slow sink
+(a pipe to a busy log shipper). A final run with a tiny queue shows
+sampling and dropping under overload.
+
+Usage: python -m benchmarks.bench_access_log [--requests N] [--concurrency C]
+       [--write-latency-us US]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+from benchmarks._asgi import build_scope, run
+from benchmarks.bench_middleware import build_app
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability import access_log
+from src.infrastructure.observability.access_log import AccessLog, JsonFormatter
+
+
+class SlowSink:
+    """File-like sink sleeping ``latency`` seconds on every write"""
+
+    def __init__(self, stream, latency: float) -> None:
+        self._stream = stream
+        self._latency = latency
+
+    def write(self, data: str) -> int:
+        if self._latency:
+            time.sleep(self._latency)
+        return self._stream.write(data)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+async def measure(name: str, requests: int, concurrency: int) -> None:
+    scope = build_scope("GET", "/v1/tenants/acme", headers={"X-Tenant-Id": "acme"})
+    app = build_app(pipeline=True)
+    await run(app, scope, requests=min(requests, 500), concurrency=concurrency)  # warm-up
+    result = await run(app, scope, requests=requests, concurrency=concurrency)
+    print(name, result.summary())
+
+
+async def main(requests: int, concurrency: int, write_latency_us: float) -> None:
+    settings.ENABLE_METRICS = False
+    devnull = open(os.devnull, "w")
+    sink = SlowSink(devnull, write_latency_us / 1e6)
+
+    access_log._access_log = None
+    await measure("logging_off", requests, concurrency)
+
+    writer = logging.StreamHandler(sink)
+    writer.setFormatter(JsonFormatter())
+    access_log._access_log = AccessLog(writer, background=False)
+    await measure("logging_sync", requests, concurrency)
+
+    access_log.init_access_log(sink)
+    await measure("logging_queued", requests, concurrency)
+    print("  ", access_log.get_access_log().stats())
+    access_log.close_access_log()
+
+    settings.ACCESS_LOG_QUEUE_SIZE = 64
+    access_log.init_access_log(sink)
+    await measure("logging_queued_overload (queue of 64)", requests, concurrency)
+    print("  ", access_log.get_access_log().stats())
+    access_log.close_access_log()
+    devnull.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--write-latency-us", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.write_latency_us))
@@ -0,0 +1,265 @@
+"""
+Batch Provisioning Benchmark
+
+Uploads --rows users and tenants (100k by default) through
+POST /v1/users:batch and /v1/tenants:batch, as NDJSON and CSV, and
+compares them with creating a sample of users one request at a time through
+POST /v1/users. Also reports the worst event-loop lag seen by a 10 ms
+ticker during each upload, and the longest garbage collection pause. The
+benchmark's own data (request bodies, stand-in rows) is frozen out of
+collection before each upload, as the launcher does with the preloaded app.
+
+The app runs in-process against the stand-ins of ``_standins``, with
+bcrypt at 4 rounds. With --database the repositories write to the
+Postgres at DATABASE_URL instead: users with COPY, tenants with
+multi-row inserts. Tables are created if needed and the benchmark's rows
+are deleted afterwards.
+
+Usage: python -m benchmarks.bench_batch [--rows N] [--password-share F] [--single N] [--database]
+"""
+
+import argparse
+import asyncio
+import csv
+import gc
+import io
+import time
+from typing import Any, Dict, List, Tuple
+
+import httpx
+from fastapi import Depends
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks._standins import LOGIN_PASSWORD, StandIns, tenant_id
+from src.infrastructure.config.settings import settings
+from src.infrastructure.security.tokens import get_token_service
+from src.infrastructure.serialization.encoder import dumps
+
+# Marks every row the benchmark writes, for the cleanup
+DOMAIN = "bench-batch.example.com"
+
+USER_FIELDS = ["email", "password", "full_name", "role"]
+TENANT_FIELDS = ["name", "slug", "tier", "organization_name", "primary_contact_email", "features"]
+
+
+def user_rows(count: int, password_share: float, run: str) -> List[Dict[str, Any]]:
+    every = round(1 / password_share) if password_share else 0
+    rows = []
+    for i in range(count):
+        row = {"email": f"user{i}.{run}@{DOMAIN}", "full_name": f"Batch User {i}", "role": "member"}
+        if every and i % every == 0:
+            row["password"] = LOGIN_PASSWORD
+        rows.append(row)
+    return rows
+
+
+def tenant_rows(count: int, run: str) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"Batch Tenant {i}",
+            "slug": f"bench-batch-{run}-{i}",
+            "tier": "pro",
+            "organization_name": f"Organization {i}",
+            "primary_contact_email": f"owner{i}@{DOMAIN}",
+            "features": "sso;audit",
+        }
+        for i in range(count)
+    ]
+
+
+def admin_headers() -> Dict[str, str]:
+    """Headers of an admin of the first stand-in tenant"""
+    token = (
+        get_token_service().issue("bench-batch-admin", str(tenant_id(0)), role="admin").access_token
+    )
+    return {"X-Tenant-Id": str(tenant_id(0)), "Authorization": f"Bearer {token}"}
+
+
+def operator_headers() -> Dict[str, str]:
+    """Headers of a platform operator, bound to no tenant"""
+    token = get_token_service().issue("bench-batch-operator", role="platform_admin").access_token
+    return {"Authorization": f"Bearer {token}"}
+
+
+def ndjson_body(rows: List[Dict[str, Any]]) -> Tuple[str, bytes]:
+    return "application/x-ndjson", b"".join(dumps(row) + b"\n" for row in rows)
+
+
+def csv_body(rows: List[Dict[str, Any]], fields: List[str]) -> Tuple[str, bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fields)
+    writer.writeheader()
+    writer.writerows(rows)
+    return "text/csv", buffer.getvalue().encode()
+
+
+async def max_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Worst delay, beyond ``interval``, of a ticker on the event loop"""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+class GCPauses:
+    """Longest garbage collection pause while installed"""
+
+    def __init__(self) -> None:
+        self.longest = 0.0
+        self._started = 0.0
+
+    def __call__(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+        else:
+            self.longest = max(self.longest, time.perf_counter() - self._started)
+
+
+async def upload(client: httpx.AsyncClient, path: str, body: Tuple[str, bytes], rows: int) -> None:
+    media_type, content = body
+    # Tenants are created by platform operators, users by a tenant's admins
+    auth = operator_headers() if path.startswith("/v1/tenants") else admin_headers()
+    gc.collect()
+    gc.freeze()
+    pauses = GCPauses()
+    gc.callbacks.append(pauses)
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(max_loop_lag(stop))
+    started = time.perf_counter()
+    response = await client.post(
+        f"{path}?errors_only=true",
+        content=content,
+        headers={**auth, "Content-Type": media_type},
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    lag = await ticker
+    gc.callbacks.remove(pauses)
+    gc.unfreeze()
+
+    # With errors_only, a clean upload answers with the summary line alone
+    lines = response.content.splitlines()
+    if response.status_code != 200 or len(lines) != 1:
+        raise RuntimeError(f"{path} ({media_type}): {response.status_code} {lines[:3]}")
+    print(
+        f"  {path:<18} {media_type:<20} {rows:>7} rows {len(content) / 1e6:6.1f} MB"
+        f" {elapsed:7.2f} s {rows / elapsed:>9,.0f} rows/s  max loop lag {lag * 1000:4.0f} ms"
+        f" (GC {pauses.longest * 1000:3.0f} ms)"
+    )
+
+
+async def one_at_a_time(client: httpx.AsyncClient, count: int, total: int) -> None:
+    headers = admin_headers()
+    started = time.perf_counter()
+    for i in range(count):
+        response = await client.post(
+            "/v1/users/",
+            json={
+                "email": f"single{i}@{DOMAIN}",
+                "password": LOGIN_PASSWORD,
+                "full_name": f"Single User {i}",
+            },
+            headers=headers,
+        )
+        if response.status_code != 201:
+            raise RuntimeError(f"POST /v1/users/: {response.status_code} {response.text}")
+    elapsed = time.perf_counter() - started
+    print(
+        f"  {'POST /v1/users/':<18} {'application/json':<20} {count:>7} rows"
+        f" {elapsed:16.2f} s {count / elapsed:>9,.0f} rows/s"
+        f"  ({total} rows est. {total / count * elapsed:,.0f} s)"
+    )
+
+
+def use_database(app):
+    """
+    Point the repository dependencies at DATABASE_URL, returning the engine;
+    tenant resolution keeps using the stand-ins
+    """
+    from src.adapters.inbound.rest import dependencies
+    from src.adapters.outbound.persistence.tenant_repository import SqlAlchemyTenantRepository
+    from src.adapters.outbound.persistence.user_repository import SqlAlchemyUserRepository
+    from src.infrastructure.database.session import build_engine
+
+    engine = build_engine(settings.DATABASE_URL, pool_size=4, max_overflow=0, pool_timeout=30)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    tenants = SqlAlchemyTenantRepository(session_factory)
+    app.dependency_overrides[dependencies.get_tenant_repository] = lambda: tenants
+    app.dependency_overrides[dependencies.get_user_repository] = lambda tenant=Depends(
+        dependencies.get_current_tenant_id
+    ): SqlAlchemyUserRepository(session_factory, tenant)
+    return engine
+
+
+async def create_tables(engine) -> None:
+    from src.adapters.outbound.persistence.models import Base, TenantBase
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(TenantBase.metadata.create_all)
+
+
+async def delete_rows(engine) -> None:
+    from src.adapters.outbound.persistence.models import TenantModel, UserModel
+
+    async with engine.begin() as connection:
+        await connection.execute(delete(UserModel).where(UserModel.email.like(f"%@{DOMAIN}")))
+        await connection.execute(delete(TenantModel).where(TenantModel.slug.like("bench-batch-%")))
+
+
+async def main(rows: int, password_share: float, single: int, database: bool) -> None:
+    from src.main import create_app
+
+    settings.BATCH_MAX_ROWS = max(settings.BATCH_MAX_ROWS, rows)
+    standins = StandIns(tenants=1, users=1)
+    await standins.start()
+    app = create_app()
+    standins.install(app)
+    engine = use_database(app) if database else None
+    if engine is not None:
+        await create_tables(engine)
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            print(
+                f"{'Postgres' if database else 'in-memory stand-ins'},"
+                f" bcrypt rounds {standins.bcrypt_rounds},"
+                f" passwords on {password_share:.0%} of user rows,"
+                f" chunks of {settings.BATCH_CHUNK_SIZE}"
+            )
+            await one_at_a_time(client, single, rows)
+            await upload(
+                client, "/v1/users:batch", ndjson_body(user_rows(rows, password_share, "a")), rows
+            )
+            await upload(
+                client,
+                "/v1/users:batch",
+                csv_body(user_rows(rows, password_share, "b"), USER_FIELDS),
+                rows,
+            )
+            await upload(client, "/v1/users:batch", ndjson_body(user_rows(rows, 0.0, "c")), rows)
+            await upload(client, "/v1/tenants:batch", ndjson_body(tenant_rows(rows, "a")), rows)
+            await upload(
+                client, "/v1/tenants:batch", csv_body(tenant_rows(rows, "b"), TENANT_FIELDS), rows
+            )
+    finally:
+        if engine is not None:
+            await delete_rows(engine)
+            await engine.dispose()
+        await standins.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--password-share", type=float, default=0.1)
+    parser.add_argument("--single", type=int, default=1000)
+    parser.add_argument("--database", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.password_share, args.single, args.database))
@@ -0,0 +1,138 @@
+"""
+Response Compression Benchmark
+
+Compresses representative tenant payloads - a page of the tenant list as
+JSON and a tenant export as NDJSON - with every installed encoding at a
+range of levels, reporting CPU time per response and the bytes saved.
+Then drives the NDJSON export through the middleware as a streamed
+response, one line per chunk, against Starlette's GZipMiddleware.
+
+Usage: python -m benchmarks.bench_compression [--tenants N] [--seconds S]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable, Dict, List, Tuple
+
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.responses import StreamingResponse
+
+from benchmarks._asgi import build_scope
+from benchmarks.bench_serialization import make_tenants
+from src.infrastructure.fastapi.middleware.compression import CODECS, CompressionMiddleware
+from src.infrastructure.serialization.encoder import dumps
+
+LEVELS: Dict[str, Tuple[int, ...]] = {"gzip": (1, 6, 9), "br": (1, 2, 4, 6), "zstd": (1, 3, 6)}
+
+
+def payloads(tenants: int) -> Dict[str, bytes]:
+    entities = make_tenants(tenants)
+    page = dumps({"items": entities[:100], "next_cursor": "eyJpZCI6ICIxMjMifQ"})
+    export = b"".join(dumps(tenant) + b"\n" for tenant in entities)
+    return {"tenant page (json)": page, f"export[{tenants}] (ndjson)": export}
+
+
+def cpu_ms(fn: Callable[[], bytes], seconds: float) -> float:
+    """Average CPU milliseconds per call over roughly ``seconds``"""
+    calls = 0
+    started = time.process_time()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline or calls == 0:
+        fn()
+        calls += 1
+    return (time.process_time() - started) * 1000 / calls
+
+
+def streaming_app(lines: List[bytes], compression: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/export")
+    async def export():
+        async def body():
+            for line in lines:
+                yield line
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    if compression == "gzip-middleware":
+        app.add_middleware(GZipMiddleware, minimum_size=1000)
+    else:
+        app.add_middleware(CompressionMiddleware, encodings=(compression,))
+    return app
+
+
+async def stream_once(app: FastAPI, accept_encoding: str) -> Tuple[int, int, float]:
+    """Total compressed bytes, body messages and ms to the first byte"""
+    scope = build_scope("GET", "/export", headers={"Accept-Encoding": accept_encoding})
+    size = messages = 0
+    first_byte = 0.0
+    request_sent = False
+    response_complete = asyncio.Event()
+    started = time.perf_counter()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal size, messages, first_byte
+        if message["type"] != "http.response.body":
+            return
+        if message.get("body"):
+            if not messages:
+                first_byte = (time.perf_counter() - started) * 1000
+            size += len(message["body"])
+            messages += 1
+        if not message.get("more_body", False):
+            response_complete.set()
+
+    await app(scope, receive, send)
+    return size, messages, first_byte
+
+
+async def main(tenants: int, seconds: float) -> None:
+    for name, payload in payloads(tenants).items():
+        print(f"{name}: {len(payload)} bytes")
+        for encoding, levels in LEVELS.items():
+            if encoding not in CODECS:
+                print(f"  {encoding:5} not installed")
+                continue
+            compress = CODECS[encoding][0]
+            for level in levels:
+                size = len(compress(payload, level))
+                ms = cpu_ms(lambda: compress(payload, level), seconds)
+                print(
+                    f"  {encoding:5} level {level}: {ms:7.2f} ms CPU, {size:8} bytes, "
+                    f"saved {100 - size * 100 / len(payload):4.1f}%, "
+                    f"{(len(payload) - size) / 1024 / ms:6.1f} KiB saved per CPU ms"
+                )
+
+    lines = [dumps(tenant) + b"\n" for tenant in make_tenants(tenants)]
+    raw = sum(map(len, lines))
+    print(f"streamed export, {len(lines)} chunks, {raw} bytes:")
+    for compression in ("gzip-middleware", "gzip", "br", "zstd"):
+        if compression != "gzip-middleware" and compression not in CODECS:
+            continue
+        app = streaming_app(lines, compression)
+        accept = "gzip" if compression == "gzip-middleware" else compression
+        started = time.process_time()
+        size, messages, first_byte = await stream_once(app, accept)
+        ms = (time.process_time() - started) * 1000
+        print(
+            f"  {compression:15}: {ms:7.1f} ms CPU, {size:8} bytes in {messages} messages, "
+            f"first byte after {first_byte:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=10000)
+    parser.add_argument("--seconds", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(main(args.tenants, args.seconds))
@@ -0,0 +1,94 @@
+"""
+Health Check Benchmark
+
+Polls /health/ready with dependency probes that take a few milliseconds
+(simulated database, Redis and NATS round-trips, one of them hanging past
+the timeout) and compares probing on every request, sequentially as the
+checks are usually written, against the cached background monitor. Reports
+the probe calls each approach sends to the dependencies.
+
+Usage: python -m benchmarks.bench_health [--requests N] [--concurrency C] [--probe-ms MS]
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+
+from fastapi import FastAPI, Response
+
+from benchmarks._asgi import build_scope, run
+from src.adapters.inbound.rest.v1 import health
+from src.infrastructure.observability import health as monitor_module
+from src.infrastructure.observability.health import HealthMonitor
+
+calls: Counter = Counter()
+
+
+def fake_probes(probe_ms: float):
+    def probe(name: str, hang: bool = False):
+        async def run_probe() -> None:
+            calls[name] += 1
+            await asyncio.sleep(10 if hang else probe_ms / 1000)
+
+        return run_probe
+
+    return {
+        "database": probe("database"),
+        "redis": probe("redis"),
+        "nats": probe("nats", hang=True),
+    }
+
+
+def build_inline_app(probes, timeout: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health/ready")
+    async def ready():
+        results = {}
+        for name, probe in probes.items():
+            try:
+                await asyncio.wait_for(probe(), timeout=timeout)
+                results[name] = "healthy"
+            except Exception:
+                results[name] = "unhealthy"
+        code = 200 if results["database"] == "healthy" else 503
+        return Response(content=str(results), status_code=code)
+
+    return app
+
+
+def build_cached_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(health.router, prefix="/health")
+    return app
+
+
+async def main(requests: int, concurrency: int, probe_ms: float) -> None:
+    timeout = 0.05
+    probes = fake_probes(probe_ms)
+    scope = build_scope("GET", "/health/ready")
+
+    result = await run(
+        build_inline_app(probes, timeout), scope, requests=requests, concurrency=concurrency
+    )
+    print("probe_per_request", result.summary(), "probe_calls", sum(calls.values()))
+
+    calls.clear()
+    monitor = HealthMonitor(probes, interval=5.0, timeout=timeout)
+    await monitor.start()
+    monitor_module._monitor = monitor
+    app = build_cached_app()
+    await run(app, scope, requests=min(requests, 500), concurrency=concurrency)  # warm-up
+    result = await run(app, scope, requests=requests, concurrency=concurrency)
+    print("cached_monitor", result.summary(), "probe_calls", sum(calls.values()))
+    await monitor.close()
+    monitor_module._monitor = None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--probe-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.probe_ms))
@@ -0,0 +1,159 @@
+"""
+Kong Sync Benchmark
+
+Reconciles tenants against a mock Kong Admin API (httpx.MockTransport with
+a simulated latency per call; entities read back carry Kong-style
+defaults and timestamps). Compares pushing every tenant with one call at a
+time against the diffed, concurrent sync, then changes the tier of 1% of
+the tenants, and finally introduces drift in Kong (deleted and stray
+consumers) that only a full resync repairs.
+
+Usage: python -m benchmarks.bench_kong_sync [--tenants N] [--latency-ms MS] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import httpx
+
+from benchmarks._standins import InMemoryTenantRepository
+from src.domain.entities.tenant import Tenant, TenantTier
+from src.infrastructure.gateway.kong import MANAGED_TAG, KongAdminClient, tenant_state
+from src.infrastructure.gateway.kong_sync import KongSync
+
+ADMIN_URL = "http://kong-admin.test"
+
+
+class MockKongAdmin:
+    """In-memory consumers and plugins behind the Admin API endpoints the sync uses"""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.calls = 0
+        self.entities: Dict[str, Dict[str, Dict[str, Any]]] = {"consumers": {}, "plugins": {}}
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        parts = request.url.path.strip("/").split("/")
+        collection = self.entities[parts[0]]
+
+        if request.method == "GET":
+            tag = request.url.params.get("tags")
+            size = int(request.url.params.get("size", 100))
+            offset = int(request.url.params.get("offset", 0))
+            matching = [e for e in collection.values() if tag in e.get("tags", ())]
+            page = matching[offset : offset + size]
+            more = offset + size < len(matching)
+            return httpx.Response(
+                200, json={"data": page, "offset": str(offset + size) if more else None}
+            )
+
+        entity_id = parts[1]
+        if request.method == "DELETE":
+            if collection.pop(entity_id, None) is None:
+                return httpx.Response(404)
+            if parts[0] == "consumers":
+                plugins = self.entities["plugins"]
+                for plugin_id in [
+                    p for p, e in plugins.items() if e["consumer"]["id"] == entity_id
+                ]:
+                    del plugins[plugin_id]
+            return httpx.Response(204)
+
+        body = json.loads(request.content)
+        if parts[0] == "plugins":
+            if body["consumer"]["id"] not in self.entities["consumers"]:
+                return httpx.Response(400, json={"message": "consumer does not exist"})
+            body["config"] = {"second": None, "fault_tolerant": True, **body["config"]}
+        collection[entity_id] = {"id": entity_id, "created_at": int(time.time()), **body}
+        return httpx.Response(200, json=collection[entity_id])
+
+
+def active_tenants(count: int) -> List[Tenant]:
+    tenants = [Tenant(name=f"Tenant {i}") for i in range(count)]
+    for tenant in tenants:
+        tenant.activate()
+        tenant.pull_events()
+    return tenants
+
+
+def in_sync(mock: MockKongAdmin, repository: InMemoryTenantRepository) -> bool:
+    desired = {}
+    for tenant in repository.tenants.values():
+        desired.update(tenant_state(tenant))
+    actual = {(c, i) for c, entities in mock.entities.items() for i in entities}
+    return actual == set(desired)
+
+
+async def main(tenants: int, latency_ms: float, concurrency: int) -> None:
+    repository = InMemoryTenantRepository(active_tenants(tenants))
+
+    # Baseline: every tenant's entities pushed one call at a time
+    mock = MockKongAdmin(latency_ms / 1000)
+    async with httpx.AsyncClient(transport=mock.transport()) as client:
+        naive = KongSync(repository, KongAdminClient(client, ADMIN_URL), concurrency=1)
+        started = time.perf_counter()
+        await naive.sync_all()
+        print(
+            f"push all, 1 call at a time: {time.perf_counter() - started:.2f} s, {mock.calls} calls"
+        )
+
+    mock = MockKongAdmin(latency_ms / 1000)
+    async with httpx.AsyncClient(transport=mock.transport()) as client:
+        sync = KongSync(repository, KongAdminClient(client, ADMIN_URL), concurrency=concurrency)
+        started = time.perf_counter()
+        await sync.resync()
+        print(
+            f"initial resync, {concurrency} concurrent: {time.perf_counter() - started:.2f} s, "
+            f"{mock.calls} calls"
+        )
+
+        changed = list(repository.tenants.values())[: max(1, tenants // 100)]
+        for tenant in changed:
+            tenant.update_tier(TenantTier.PRO)
+        mock.calls = 0
+        started = time.perf_counter()
+        writes = await sync.sync_tenants(str(tenant.id) for tenant in changed)
+        print(
+            f"{len(changed)} tier changes: {(time.perf_counter() - started) * 1000:.0f} ms, "
+            f"{writes} writes, {mock.calls} calls"
+        )
+
+        mock.calls = 0
+        writes = await sync.sync_all()
+        print(f"full sync with nothing changed: {writes} writes, {mock.calls} calls")
+
+        # Drift behind the platform's back: lost consumers and stray managed ones
+        for consumer_id in list(mock.entities["consumers"])[:50]:
+            await client.delete(f"{ADMIN_URL}/consumers/{consumer_id}")
+        for _ in range(10):
+            stray = str(uuid4())
+            body = {"username": stray, "tags": [MANAGED_TAG]}
+            await client.put(f"{ADMIN_URL}/consumers/{stray}", json=body)
+        writes = await sync.sync_all()
+        print(f"after drift, snapshot sync: {writes} writes, in sync: {in_sync(mock, repository)}")
+
+        mock.calls = 0
+        started = time.perf_counter()
+        writes = await sync.resync()
+        print(
+            f"after drift, full resync: {time.perf_counter() - started:.2f} s, {writes} writes, "
+            f"{mock.calls} calls, in sync: {in_sync(mock, repository)}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.tenants, args.latency_ms, args.concurrency))
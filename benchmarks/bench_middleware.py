@@ -0,0 +1,88 @@
+"""
+Middleware Stack Benchmark
+
+Compares the pure ASGI request pipeline against the former stack of three
+BaseHTTPMiddleware classes (tenant, logging, metrics).
+
+Usage: python -m benchmarks.bench_middleware [--requests N] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Callable
+
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from benchmarks._asgi import build_scope, run
+from src.infrastructure.fastapi.middleware.pipeline import RequestPipelineMiddleware
+
+
+class LegacyTenantMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        tenant_id = request.headers.get("X-Tenant-Id")
+        if not tenant_id:
+            host = request.headers.get("host", "")
+            if "." in host:
+                tenant_id = host.split(".")[0]
+        request.state.tenant_id = tenant_id
+        response = await call_next(request)
+        if tenant_id:
+            response.headers["X-Tenant-Id"] = tenant_id
+        return response
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = request.headers.get("X-Request-Id", str(uuid.uuid4()))
+        start_time = time.time()
+        response = await call_next(request)
+        response.headers["X-Request-Id"] = request_id
+        response.headers["X-Process-Time"] = str(time.time() - start_time)
+        return response
+
+
+class LegacyMetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        time.time() - start_time
+        return response
+
+
+def build_app(pipeline: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/tenants/{tenant_id}")
+    async def get_tenant(tenant_id: str):
+        return {"tenant_id": tenant_id}
+
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    if pipeline:
+        app.add_middleware(RequestPipelineMiddleware)
+    else:
+        app.add_middleware(LegacyMetricsMiddleware)
+        app.add_middleware(LegacyLoggingMiddleware)
+        app.add_middleware(LegacyTenantMiddleware)
+    return app
+
+
+async def main(requests: int, concurrency: int) -> None:
+    scope = build_scope("GET", "/v1/tenants/acme", headers={"X-Tenant-Id": "acme"})
+
+    for name, pipeline in (("base_http_stack", False), ("asgi_pipeline", True)):
+        app = build_app(pipeline)
+        await run(app, scope, requests=min(requests, 500), concurrency=concurrency)  # warm-up
+        result = await run(app, scope, requests=requests, concurrency=concurrency)
+        print(name, result.summary())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
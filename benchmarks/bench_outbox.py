@@ -0,0 +1,197 @@
+"""
+Outbox Relay Benchmark
+
+Relays tenant lifecycle events from an in-memory outbox (one relay at a
+time, with a simulated transaction latency) to JetStream, first with one
+ack in flight at a time and then with the bounded in-flight window. A
+second run loses a share of the acks and runs three competing relays,
+cancelling some mid-batch, then checks that every event reached the
+stream exactly once after deduplication and in order per tenant.
+
+Without --nats-url the stream is simulated: acks arrive after --ack-ms and
+Nats-Msg-Id deduplication is emulated. With --nats-url the events go to a
+real nats-server started with -js (the ordering check is skipped there).
+
+Usage: python -m benchmarks.bench_outbox [--events N] [--tenants T] [--ack-ms MS] [--nats-url URL]
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set
+
+import nats
+from nats.js.api import PubAck
+
+from src.adapters.outbound.persistence.outbox_repository import event_to_row
+from src.domain.entities.tenant import Tenant, TenantStatus, TenantTier
+from src.domain.ports.repositories.outbox_repository import EventOutbox, OutboxMessage, Publisher
+from src.infrastructure.nats.outbox_relay import EVENT_SUBJECT_PREFIX, OutboxRelay
+from src.infrastructure.serialization.encoder import loads
+
+STREAM = "BENCH_OUTBOX"
+
+
+class InMemoryOutbox(EventOutbox):
+    """Outbox rows in a list, relayed by one relay at a time like the advisory lock"""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.rows: List[OutboxMessage] = []
+        self.locked = False
+
+    async def relay_batch(self, limit: int, publish: Publisher) -> int:
+        if self.locked or not self.rows:
+            return 0
+        self.locked = True
+        try:
+            await asyncio.sleep(self.latency)
+            delivered = set(await publish(self.rows[:limit]))
+            self.rows = [row for row in self.rows if row.id not in delivered]
+            return len(delivered)
+        finally:
+            # Commit or rollback releases the lock
+            self.locked = False
+
+    async def pending(self) -> int:
+        return len(self.rows)
+
+
+class SimulatedJetStream:
+    """Stores each Nats-Msg-Id once; optionally loses the ack after storing"""
+
+    def __init__(self, ack_latency: float, lost_acks: float = 0.0) -> None:
+        self.ack_latency = ack_latency
+        self.lost_acks = lost_acks
+        self.seen: Set[str] = set()
+        self.stream: List[bytes] = []
+
+    async def publish(self, subject: str, payload: bytes, timeout=None, headers=None) -> PubAck:
+        await asyncio.sleep(self.ack_latency)
+        msg_id = headers["Nats-Msg-Id"]
+        duplicate = msg_id in self.seen
+        if not duplicate:
+            self.seen.add(msg_id)
+            self.stream.append(payload)
+        if random.random() < self.lost_acks:
+            raise asyncio.TimeoutError()
+        return PubAck(stream=STREAM, seq=len(self.stream), duplicate=duplicate)
+
+
+def fill(outbox: InMemoryOutbox, events: int, tenants: int) -> int:
+    """Walk tenants through their lifecycle until ``events`` events exist"""
+    pool = [Tenant(name=f"Tenant {t}") for t in range(tenants)]
+    written = 0
+    for step in itertools.count():
+        for tenant in pool:
+            if written >= events:
+                return written
+            if tenant.status is TenantStatus.PENDING:
+                tenant.activate()
+            elif tenant.status is TenantStatus.SUSPENDED:
+                tenant.reactivate()
+            elif step % 2:
+                tenant.suspend("billing")
+            else:
+                tier = TenantTier.FREE if tenant.tier is TenantTier.PRO else TenantTier.PRO
+                tenant.update_tier(tier)
+            for event in tenant.pull_events():
+                row = event_to_row(event)
+                outbox.rows.append(
+                    OutboxMessage(row["id"], row["event_type"], row["aggregate_id"], row["payload"])
+                )
+                written += 1
+    return written
+
+
+async def drain(relay: OutboxRelay, outbox: InMemoryOutbox) -> float:
+    started = time.perf_counter()
+    while await outbox.pending():
+        await relay.relay_once()
+    return time.perf_counter() - started
+
+
+def ordered(stream: Sequence[bytes]) -> bool:
+    """Check that each tenant's events arrived in the order they occurred"""
+    last: Dict[str, str] = defaultdict(str)
+    for payload in stream:
+        event = loads(payload)
+        if event["occurred_at"] < last[event["aggregate_id"]]:
+            return False
+        last[event["aggregate_id"]] = event["occurred_at"]
+    return True
+
+
+async def stream_count(js) -> int:
+    info = await js.stream_info(STREAM)
+    return info.state.messages
+
+
+async def main(
+    events: int, tenants: int, ack_ms: float, db_ms: float, nats_url: Optional[str]
+) -> None:
+    nc = None
+    if nats_url:
+        nc = await nats.connect(nats_url)
+        js = nc.jetstream()
+
+    async def fresh_stream(lost_acks: float = 0.0):
+        if nc is None:
+            return SimulatedJetStream(ack_ms / 1000, lost_acks)
+        try:
+            await js.delete_stream(STREAM)
+        except Exception:
+            pass
+        await js.add_stream(
+            name=STREAM, subjects=[f"{EVENT_SUBJECT_PREFIX}.>"], duplicate_window=120
+        )
+        return js
+
+    for in_flight in (1, 64):
+        outbox = InMemoryOutbox(db_ms / 1000)
+        total = fill(outbox, events, tenants)
+        target = await fresh_stream()
+        relay = OutboxRelay(outbox, target, batch_size=500, max_in_flight=in_flight)
+        elapsed = await drain(relay, outbox)
+        print(f"max_in_flight={in_flight}: {total / elapsed:,.0f} events/s ({total} events)")
+
+    # At-least-once: lose 10% of acks and cancel relays mid-batch
+    outbox = InMemoryOutbox(db_ms / 1000)
+    total = fill(outbox, events, tenants)
+    target = await fresh_stream(lost_acks=0.1 if nc is None else 0.0)
+    relays = [OutboxRelay(outbox, target, batch_size=200, max_in_flight=64) for _ in range(3)]
+    crashes = 0
+    while await outbox.pending():
+        tasks = [asyncio.ensure_future(relay.relay_once()) for relay in relays]
+        await asyncio.sleep(ack_ms / 1000 * 2)
+        if crashes < 5:
+            tasks[0].cancel()
+            crashes += 1
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    stats = [relay.stats() for relay in relays]
+    stored = len(target.stream) if nc is None else await stream_count(js)
+    print(
+        f"with lost acks and {crashes} cancelled batches: {total} events, {stored} in stream, "
+        f"{sum(s['duplicates'] for s in stats)} duplicates dropped, "
+        f"{sum(s['failures'] for s in stats)} failed publishes retried"
+    )
+    if nc is None:
+        print(f"per-tenant order preserved: {ordered(target.stream)}")
+    else:
+        await js.delete_stream(STREAM)
+        await nc.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--ack-ms", type=float, default=1.0)
+    parser.add_argument("--db-ms", type=float, default=2.0)
+    parser.add_argument("--nats-url", default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.events, args.tenants, args.ack_ms, args.db_ms, args.nats_url))
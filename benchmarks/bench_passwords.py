@@ -0,0 +1,113 @@
+"""
+Password Hashing Event-Loop Latency Benchmark
+
+Fires a burst of concurrent logins (bcrypt verifications) while a probe task
+measures how late the event loop wakes it up every millisecond - the extra
+latency every other request in the worker would see. Compares verifying
+inline in the coroutine against the process-pool PasswordService, and shows
+backpressure rejections when the burst exceeds the pending-job limit.
+
+Usage: python -m benchmarks.bench_passwords [--logins N] [--rounds R] [--workers W]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+from benchmarks._asgi import RunResult
+from src.infrastructure.security.passwords import (
+    PasswordService,
+    PasswordServiceBusyError,
+    _context,
+)
+
+PASSWORD = "Benchmark-passw0rd!"
+PROBE_INTERVAL = 0.001
+
+
+async def probe(stop: asyncio.Event, lags: List[float]) -> None:
+    """Record how late each 1 ms sleep wakes up"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - started - PROBE_INTERVAL))
+
+
+async def burst(login: Callable[[], Awaitable[None]], logins: int) -> Tuple[RunResult, float, int]:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(stop, lags))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await prober
+    rejected = sum(isinstance(result, PasswordServiceBusyError) for result in results)
+    return RunResult(requests=len(lags), elapsed=elapsed, latencies=lags), elapsed, rejected
+
+
+def report(name: str, result: RunResult, elapsed: float, logins: int, rejected: int) -> None:
+    print(f"{name}:")
+    print(
+        f"  {logins} logins in {elapsed:.2f} s, {rejected} rejected;"
+        f" loop lag p50 {result.percentile(50) * 1000:.2f} ms,"
+        f" p99 {result.percentile(99) * 1000:.2f} ms,"
+        f" max {max(result.latencies) * 1000:.1f} ms"
+    )
+
+
+async def main(logins: int, rounds: int, workers: int) -> None:
+    password_hash = _context(rounds).hash(PASSWORD)
+
+    async def inline_login() -> None:
+        _context(rounds).verify_and_update(PASSWORD, password_hash)
+
+    result, elapsed, rejected = await burst(inline_login, logins)
+    report("inline bcrypt in the coroutine", result, elapsed, logins, rejected)
+
+    service = PasswordService(workers=workers, max_pending=logins, queue_timeout=60, rounds=rounds)
+    service.start()
+    try:
+        await service.verify(PASSWORD, password_hash)  # spawn the workers before measuring
+
+        async def pooled_login() -> None:
+            await service.verify(PASSWORD, password_hash)
+
+        result, elapsed, rejected = await burst(pooled_login, logins)
+        report(f"PasswordService ({workers} processes)", result, elapsed, logins, rejected)
+    finally:
+        await service.close()
+
+    limited = PasswordService(
+        workers=workers, max_pending=workers * 2, queue_timeout=0.05, rounds=rounds
+    )
+    limited.start()
+    try:
+        await limited.verify(PASSWORD, password_hash)
+
+        async def limited_login() -> None:
+            await limited.verify(PASSWORD, password_hash)
+
+        result, elapsed, rejected = await burst(limited_login, logins)
+        report(
+            f"PasswordService (max {workers * 2} pending, 50 ms queue timeout)",
+            result,
+            elapsed,
+            logins,
+            rejected,
+        )
+    finally:
+        await limited.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds, args.workers))
@@ -0,0 +1,104 @@
+"""
+Provider Config Cache Benchmark
+
+Reads provider configs for a set of tenants from a repository with a
+simulated database latency: uncached, through the in-process L1, and - with
+--redis-url - through L2 from a cold replica (empty L1). Also fires a burst
+of concurrent misses for one tenant to show they share a single load.
+
+Usage: python -m benchmarks.bench_provider_cache [--reads N] [--tenants T] [--db-ms MS]
+       [--redis-url URL]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+from redis.asyncio import Redis
+
+from src.domain.entities.provider import ProviderConfig
+from src.domain.ports.repositories.provider_repository import ProviderConfigRepository
+from src.infrastructure.cache.provider_cache import ProviderConfigCache
+from src.infrastructure.security.encryption import SecretBox
+
+
+class SlowRepository(ProviderConfigRepository):
+    """Two configured providers per tenant behind a fixed query latency"""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.queries = 0
+
+    async def list_for_tenant(self, tenant_id: str) -> List[ProviderConfig]:
+        self.queries += 1
+        await asyncio.sleep(self.latency)
+        return [
+            ProviderConfig(tenant_id, "openai", api_key="sk-" + "x" * 48, default_model="gpt-4o"),
+            ProviderConfig(tenant_id, "anthropic", api_key="sk-ant-" + "y" * 48, models=["claude"]),
+        ]
+
+    async def save(self, config: ProviderConfig) -> None:
+        pass
+
+    async def delete(self, tenant_id: str, provider: str) -> bool:
+        return True
+
+
+async def timed_reads(read, reads: int, tenants: int, concurrency: int) -> float:
+    """Reads per second with ``concurrency`` concurrent readers"""
+    per_worker = reads // concurrency
+
+    async def worker(offset: int) -> None:
+        for i in range(per_worker):
+            await read(f"tenant-{(offset + i) % tenants}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(w * 7) for w in range(concurrency)))
+    return per_worker * concurrency / (time.perf_counter() - started)
+
+
+async def main(
+    reads: int, tenants: int, db_ms: float, concurrency: int, redis_url: Optional[str]
+) -> None:
+    box = SecretBox("benchmark-encryption-key-of-32-chars!")
+    repository = SlowRepository(db_ms / 1000)
+
+    rate = await timed_reads(repository.list_for_tenant, min(reads, 5000), tenants, concurrency)
+    print(f"uncached: {rate:,.0f} reads/s, {repository.queries} queries")
+
+    repository.queries = 0
+    cache = ProviderConfigCache(repository, box, ttl=60.0)
+    rate = await timed_reads(cache.get_all, reads, tenants, concurrency)
+    print(f"l1: {rate:,.0f} reads/s, {repository.queries} queries, {cache.stats()}")
+
+    repository.queries = 0
+    cache = ProviderConfigCache(repository, box, ttl=60.0)
+    await asyncio.gather(*(cache.get_all("stampede") for _ in range(1000)))
+    print(f"1000 concurrent misses for one tenant: {repository.queries} query")
+
+    if redis_url:
+        redis = Redis.from_url(redis_url, max_connections=concurrency)
+        warm = ProviderConfigCache(repository, box, redis)
+        for t in range(tenants):
+            await warm.invalidate(f"tenant-{t}")
+            await warm.get_all(f"tenant-{t}")
+
+        repository.queries = 0
+        cold = ProviderConfigCache(repository, box, redis, ttl=0.0)
+        rate = await timed_reads(cold.get_all, min(reads, 20000), tenants, concurrency)
+        print(
+            f"l2 (L1 disabled): {rate:,.0f} reads/s, {repository.queries} queries, {cold.stats()}"
+        )
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=200000)
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--db-ms", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.reads, args.tenants, args.db_ms, args.concurrency, args.redis_url))
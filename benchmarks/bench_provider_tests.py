@@ -0,0 +1,96 @@
+"""
+Provider Connectivity Test Benchmark
+
+Tests the four providers of many tenants against an httpx.MockTransport
+that answers after a simulated upstream latency; no real provider is
+called. Compares testing one provider after another with the concurrent
+ProviderTester, shows cached repeats, and runs against an upstream that
+hangs to show the circuit breaker refusing calls after the threshold
+instead of waiting out every timeout.
+
+Usage: python -m benchmarks.bench_provider_tests [--tenants T] [--latency-ms MS]
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from src.domain.entities.provider import KNOWN_PROVIDERS, ProviderConfig
+from src.infrastructure.http.circuit_breaker import CircuitBreakerRegistry
+from src.infrastructure.http.client import HostLimitedTransport
+from src.infrastructure.providers.connectivity import ProviderTester
+
+
+def mock_transport(latency: float, hang_host: str = "") -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(60 if request.url.host == hang_host else latency)
+        if request.headers.get("x-api-key", "").endswith("bad"):
+            return httpx.Response(401)
+        return httpx.Response(200, json={"data": []})
+
+    return httpx.MockTransport(handler)
+
+
+def tenant_configs(tenants: int):
+    return [
+        [ProviderConfig(f"tenant-{t}", name, api_key="sk-test") for name in KNOWN_PROVIDERS]
+        for t in range(tenants)
+    ]
+
+
+async def main(tenants: int, latency_ms: float) -> None:
+    configs = tenant_configs(tenants)
+    client = httpx.AsyncClient(
+        transport=HostLimitedTransport(mock_transport(latency_ms / 1000), 20)
+    )
+
+    sequential = ProviderTester(client, timeout=1.0)
+    started = time.perf_counter()
+    for config in configs[0]:
+        await sequential.test(config)
+    print(f"one tenant, sequential: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    tester = ProviderTester(client, timeout=1.0)
+    started = time.perf_counter()
+    await tester.test_all(configs[0])
+    print(f"one tenant, concurrent: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    tester = ProviderTester(client, timeout=1.0)
+    started = time.perf_counter()
+    await asyncio.gather(*(tester.test_all(c) for c in configs))
+    elapsed = time.perf_counter() - started
+    calls = tester.stats()["calls"]
+    print(f"{tenants} tenants concurrently (20 per host): {elapsed * 1000:.0f} ms, {calls} calls")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(tester.test_all(c) for c in configs))
+    elapsed = time.perf_counter() - started
+    print(f"repeat within result TTL: {elapsed * 1000:.1f} ms, {tester.stats()['cached']} cached")
+    await client.aclose()
+
+    hang = httpx.AsyncClient(
+        transport=mock_transport(latency_ms / 1000, hang_host="api.openai.com")
+    )
+    tester = ProviderTester(hang, timeout=0.2, breakers=CircuitBreakerRegistry(5, 30.0))
+    started = time.perf_counter()
+    results = []
+    for batch in configs[:20]:
+        results.extend(await tester.test_all(batch, force=True))
+    elapsed = time.perf_counter() - started
+    statuses = [r.status for r in results if r.provider == "openai"]
+    print(
+        f"hanging upstream, 20 tenants one after another: {elapsed * 1000:.0f} ms; "
+        f"openai timeouts {statuses.count('timeout')},"
+        f" circuit_open {statuses.count('circuit_open')}"
+    )
+    await hang.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.tenants, args.latency_ms))
@@ -0,0 +1,89 @@
+"""
+Bulk Quota Evaluation Benchmark
+
+Checks every quota of N tenants by looping over ``Tenant.is_quota_exceeded``
+and with the vectorized evaluator (including building the limit matrix from
+the tenants), and verifies both produce the same answer.
+
+Usage: python -m benchmarks.bench_quota_evaluator [--tenants N]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from src.domain.entities.tenant import TIER_POLICIES, Tenant, TenantStatus, TenantTier
+from src.domain.services.quota_evaluator import (
+    QUOTA_TYPES,
+    exceeded_mask,
+    limits_matrix,
+    tier_limits_matrix,
+)
+
+
+def main(n: int) -> None:
+    rng = random.Random(42)
+    tenants = []
+    for i in range(n):
+        tier = rng.choice(list(TenantTier))
+        policy = TIER_POLICIES[tier]
+        tenants.append(
+            Tenant(
+                name=f"tenant-{i}",
+                status=TenantStatus.ACTIVE,
+                tier=tier,
+                max_users=policy.max_users,
+                max_requests_per_month=policy.max_requests_per_month,
+                max_storage_gb=policy.max_storage_gb,
+            )
+        )
+    usage = np.random.default_rng(42).integers(0, 150_000, size=(n, len(QUOTA_TYPES)))
+
+    started = time.perf_counter()
+    rows = usage.tolist()
+    looped = [
+        [tenant.is_quota_exceeded(quota_type, used) for quota_type, used in zip(QUOTA_TYPES, row)]
+        for tenant, row in zip(tenants, rows)
+    ]
+    loop_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    limits = limits_matrix(tenants)
+    build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    mask = exceeded_mask(usage, limits)
+    mask_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    tier_limits = tier_limits_matrix(tenant.tier for tenant in tenants)
+    tier_s = time.perf_counter() - started
+
+    assert np.array_equal(mask, np.array(looped))
+    assert np.array_equal(tier_limits, limits)
+
+    checks = n * len(QUOTA_TYPES)
+    print(f"{n:,} tenants x {len(QUOTA_TYPES)} quotas ({int(mask.sum()):,} exceeded):")
+    print(
+        f"  is_quota_exceeded loop:     {loop_s * 1000:8.1f} ms"
+        f"  ({checks / loop_s:>14,.0f} checks/s)"
+    )
+    print(f"  limits_matrix:              {build_s * 1000:8.1f} ms")
+    print(f"  tier_limits_matrix:         {tier_s * 1000:8.1f} ms")
+    print(
+        f"  exceeded_mask:              {mask_s * 1000:8.1f} ms"
+        f"  ({checks / mask_s:>14,.0f} checks/s)"
+    )
+    print(
+        f"  mask vs loop: {loop_s / mask_s:.0f}x,"
+        f" matrix + mask vs loop: {loop_s / (build_s + mask_s):.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.tenants)
@@ -0,0 +1,80 @@
+"""
+Rate Limiter Benchmark
+
+Measures limiter decisions/sec for each strategy with the in-process limiter
+and, when --redis-url is given, through the Redis Lua scripts.
+
+Usage: python -m benchmarks.bench_ratelimit [--decisions N] [--keys K] [--redis-url URL]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.infrastructure.ratelimit.limiter import (
+    LocalRateLimiter,
+    RateLimit,
+    RateLimiter,
+    RateLimitStrategy,
+)
+
+LIMITS = [RateLimit(limit=600, window_ms=60_000), RateLimit(limit=10_000, window_ms=3_600_000)]
+
+
+def bench_local(strategy: RateLimitStrategy, decisions: int, keys: int) -> float:
+    limiter = LocalRateLimiter(LIMITS, strategy)
+    started = time.perf_counter()
+    for i in range(decisions):
+        limiter.hit(f"tenant-{i % keys}:GET:/v1/tenants/{{tenant_id}}")
+    return decisions / (time.perf_counter() - started)
+
+
+async def bench_redis(
+    redis: Redis,
+    strategy: RateLimitStrategy,
+    decisions: int,
+    keys: int,
+    concurrency: int,
+) -> float:
+    limiter = RateLimiter(redis, LIMITS, strategy, timeout=1.0)
+    remaining = decisions
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await limiter.hit(f"tenant-{remaining % keys}:GET:/v1/tenants/{{tenant_id}}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    if limiter.fallbacks:
+        print(f"  warning: {limiter.fallbacks} decisions fell back to the local limiter")
+    return decisions / elapsed
+
+
+async def main(decisions: int, keys: int, concurrency: int, redis_url: Optional[str]) -> None:
+    for strategy in RateLimitStrategy:
+        print(f"local/{strategy.value}: {bench_local(strategy, decisions, keys):,.0f} decisions/s")
+
+    if redis_url:
+        redis = Redis.from_url(redis_url, max_connections=concurrency)
+        try:
+            for strategy in RateLimitStrategy:
+                rate = await bench_redis(redis, strategy, decisions, keys, concurrency)
+                print(f"redis/{strategy.value}: {rate:,.0f} decisions/s")
+        finally:
+            await redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=200000)
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.decisions, args.keys, args.concurrency, args.redis_url))
@@ -0,0 +1,96 @@
+"""
+Tenant Repository Benchmark
+
+Runs against the Postgres at DATABASE_URL (e.g. the docker-compose service or
+a throwaway container) and compares single-row against bulk operations, with
+prepared statement caching on and off. The tenants table is created if needed
+and the rows written by the benchmark are deleted afterwards.
+
+Usage: python -m benchmarks.bench_repository [--tenants N] [--lookups N]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.adapters.outbound.persistence.models import Base, TenantModel
+from src.adapters.outbound.persistence.tenant_repository import SqlAlchemyTenantRepository
+from src.domain.entities.tenant import Tenant
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import build_engine, pool_stats, warm_up
+
+
+async def run(cache_size: int, tenants: int, lookups: int, concurrency: int) -> None:
+    settings.DATABASE_STATEMENT_CACHE_SIZE = cache_size
+    engine = build_engine(
+        settings.DATABASE_URL, pool_size=concurrency, max_overflow=0, pool_timeout=30
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    await warm_up(engine, concurrency)
+
+    repository = SqlAlchemyTenantRepository(async_sessionmaker(engine, expire_on_commit=False))
+    batch = [Tenant(name=f"bench-{cache_size}-{i}") for i in range(tenants)]
+    ids = [tenant.id for tenant in batch]
+
+    try:
+        started = time.perf_counter()
+        await repository.upsert_many(batch)
+        bulk = time.perf_counter() - started
+
+        sample = batch[: min(500, tenants)]
+        started = time.perf_counter()
+        for tenant in sample:
+            await repository.save(tenant)
+        single = (time.perf_counter() - started) / len(sample) * tenants
+
+        remaining = lookups
+        peak_saturation = 0.0
+
+        async def reader() -> None:
+            nonlocal remaining, peak_saturation
+            while remaining > 0:
+                remaining -= 1
+                await repository.get_by_id(random.choice(ids))
+                peak_saturation = max(peak_saturation, pool_stats(engine)["saturation"])
+
+        started = time.perf_counter()
+        await asyncio.gather(*(reader() for _ in range(concurrency)))
+        point_rate = lookups / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for start in range(0, tenants, 500):
+            await repository.get_many(ids[start : start + 500])
+        get_many_rate = tenants / (time.perf_counter() - started)
+
+        print(f"statement cache {cache_size}:")
+        print(
+            f"  upsert_many {tenants} rows: {bulk * 1000:.0f} ms"
+            f" (save() loop est. {single * 1000:.0f} ms)"
+        )
+        print(
+            f"  get_by_id: {point_rate:,.0f} lookups/s, peak pool saturation {peak_saturation:.0%}"
+        )
+        print(f"  get_many(500): {get_many_rate:,.0f} rows/s")
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(delete(TenantModel).where(TenantModel.id.in_(ids)))
+        await engine.dispose()
+
+
+async def main(tenants: int, lookups: int, concurrency: int) -> None:
+    for cache_size in (0, 500):
+        await run(cache_size, tenants, lookups, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.tenants, args.lookups, args.concurrency))
@@ -0,0 +1,508 @@
+"""
+Route Benchmark Suite
+
+Drives every v1 router of the real app - health, auth, tenants, users,
+quotas and providers - with its repositories, Redis, NATS and provider
+APIs replaced by the local stand-ins in ``benchmarks._standins``.
+
+Each endpoint is measured under every middleware configuration:
+
+- ``full``: the stack ``create_app()`` builds (CORS, compression, the
+  request pipeline with metrics and access log)
+- ``lean``: the same stack with metrics and access log disabled
+- ``minimal``: only the request pipeline (the routers need its tenant
+  context), without metrics and access log
+
+and over two transports: ``asgi`` calls the app in-process, ``socket``
+sends real HTTP/1.1 requests to a uvicorn server (uvloop, httptools) in a
+child process. Both report RPS and p50/p95/p99 latency; ``asgi`` also
+reports the peak and retained Python allocations per request
+(tracemalloc, measured in a separate sequential pass).
+
+Results go to ``--output`` as JSON. With ``--baseline`` the run is
+compared against an earlier results file, and the exit status is 1 if
+any endpoint lost more than ``--threshold`` of its RPS or gained as much
+p95 latency.
+
+Usage: python -m benchmarks.bench_routes [--requests N] [--concurrency C]
+           [--configs full,lean,minimal] [--transports asgi,socket] [--only tenants]
+           [--output results.json] [--baseline previous.json] [--threshold 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks._asgi import build_scope, call_app
+from benchmarks._standins import LOGIN_PASSWORD, StandIns, login_email, tenant_id, user_id
+from benchmarks.bench_startup import git_commit
+from src.infrastructure.config.settings import settings
+from src.infrastructure.serialization.encoder import dumps
+
+# Middleware configuration -> (settings overrides, keep only the request pipeline)
+CONFIGS: Dict[str, Tuple[Dict[str, Any], bool]] = {
+    "full": ({}, False),
+    "lean": ({"ENABLE_METRICS": False, "ACCESS_LOG_ENABLED": False}, False),
+    "minimal": ({"ENABLE_METRICS": False, "ACCESS_LOG_ENABLED": False}, True),
+}
+TRANSPORTS = ("asgi", "socket")
+
+# Sent with every request; httpx decodes both
+ACCEPT_ENCODING = "br, gzip"
+
+# (headers, body) of one prepared request
+Prepared = Tuple[Dict[str, str], bytes]
+
+
+@dataclass(frozen=True)
+class Case:
+    """One endpoint and how to build the i-th request to it"""
+
+    router: str
+    name: str
+    method: str
+    path: str
+    prepare: Callable[[int], Prepared]
+    expected: int = 200
+
+
+def _tenant_headers(i: int, tenants: int) -> Dict[str, str]:
+    return {"X-Tenant-Id": str(tenant_id(i % tenants))}
+
+
+def _json(i: int, tenants: int, body: Dict[str, Any], **headers: str) -> Prepared:
+    return {**_tenant_headers(i, tenants), "Content-Type": "application/json", **headers}, dumps(
+        body
+    )
+
+
+def build_cases(tenants: int) -> List[Case]:
+    """Every benchmarked endpoint; token-consuming requests get fresh tokens each"""
+    from src.infrastructure.security.tokens import get_token_service
+
+    tokens = get_token_service()
+
+    def issue(i: int):
+        # Refresh reloads the user, so tokens belong to each tenant's login user
+        return tokens.issue(str(user_id(i % tenants)), str(tenant_id(i % tenants)), role="admin")
+
+    def plain(i: int) -> Prepared:
+        return _tenant_headers(i, tenants), b""
+
+    # Admin tokens are only verified, never revoked, so one per tenant will do
+    admin_tokens = [issue(i).access_token for i in range(tenants)]
+
+    def admin(i: int) -> Prepared:
+        return {
+            **_tenant_headers(i, tenants),
+            "Authorization": f"Bearer {admin_tokens[i % tenants]}",
+        }, b""
+
+    def no_tenant(i: int) -> Prepared:
+        return {}, b""
+
+    operator_token = tokens.issue("bench-operator", role="platform_admin").access_token
+
+    def operator(i: int) -> Prepared:
+        return {"Authorization": f"Bearer {operator_token}"}, b""
+
+    return [
+        Case("health", "live", "GET", "/health/live", no_tenant),
+        Case("health", "ready", "GET", "/health/ready", no_tenant),
+        Case("health", "status", "GET", "/health/", no_tenant),
+        Case(
+            "auth",
+            "login",
+            "POST",
+            "/v1/auth/login",
+            lambda i: _json(
+                i, tenants, {"email": login_email(i % tenants), "password": LOGIN_PASSWORD}
+            ),
+        ),
+        Case(
+            "auth",
+            "refresh",
+            "POST",
+            "/v1/auth/refresh",
+            lambda i: _json(i, tenants, {"refresh_token": issue(i).refresh_token}),
+        ),
+        Case(
+            "auth",
+            "logout",
+            "POST",
+            "/v1/auth/logout",
+            lambda i: _json(i, tenants, {}, Authorization=f"Bearer {issue(i).access_token}"),
+        ),
+        Case("tenants", "list", "GET", "/v1/tenants/?limit=50", operator),
+        Case("tenants", "export", "GET", "/v1/tenants/export", operator),
+        Case("tenants", "get", "GET", f"/v1/tenants/{tenant_id(0)}", plain),
+        Case("users", "list", "GET", "/v1/users/?limit=50", admin),
+        Case("users", "export", "GET", "/v1/users/export", admin),
+        Case(
+            "users",
+            "create",
+            "POST",
+            "/v1/users/",
+            lambda i: _json(
+                i,
+                tenants,
+                {"email": f"new-{i}-{time.monotonic_ns()}@example.com", "password": LOGIN_PASSWORD},
+                Authorization=f"Bearer {admin_tokens[i % tenants]}",
+            ),
+            expected=201,
+        ),
+        Case("quotas", "get", "GET", "/v1/quotas/", plain),
+        Case("quotas", "usage", "GET", "/v1/quotas/usage", plain),
+        Case("providers", "list", "GET", "/v1/providers/", admin),
+        Case("providers", "test", "POST", "/v1/providers/openai/test", admin),
+    ]
+
+
+def build_app(config: str, standins: StandIns) -> FastAPI:
+    """The app as ``create_app()`` builds it, under a middleware configuration"""
+    from src.infrastructure.fastapi.middleware.pipeline import RequestPipelineMiddleware
+    from src.infrastructure.observability.access_log import close_access_log, init_access_log
+    from src.main import create_app
+
+    overrides, pipeline_only = CONFIGS[config]
+    for name, value in {"ENABLE_METRICS": True, "ACCESS_LOG_ENABLED": True, **overrides}.items():
+        setattr(settings, name, value)
+    close_access_log()
+    init_access_log(standins.log_stream)
+
+    app = create_app()
+    if pipeline_only:
+        app.user_middleware = [m for m in app.user_middleware if m.cls is RequestPipelineMiddleware]
+    standins.install(app)
+    return app
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int) -> Dict[str, float]:
+    ordered = sorted(latencies)
+
+    def pct(p: float) -> float:
+        return round(
+            ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000, 3
+        )
+
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "errors": errors,
+    }
+
+
+async def drive(
+    send: Callable[[int], Any], requests: int, concurrency: int, expected: int
+) -> Dict[str, float]:
+    """Issue the prepared requests 0..requests-1, ``concurrency`` in flight"""
+    latencies: List[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index, errors
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            status = await send(index)
+            latencies.append(time.perf_counter() - started)
+            if status != expected:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def bench_asgi(
+    app: FastAPI, case: Case, requests: int, concurrency: int, warmup: int, alloc_requests: int
+) -> Dict[str, float]:
+    total = warmup + requests + alloc_requests
+    prepared = [case.prepare(i) for i in range(total)]
+    path, _, query = case.path.partition("?")
+    scopes = [
+        build_scope(case.method, path, {**headers, "Accept-Encoding": ACCEPT_ENCODING}, query)
+        for headers, _ in prepared
+    ]
+
+    def send(offset: int) -> Callable[[int], Any]:
+        async def call(index: int) -> int:
+            return await call_app(app, scopes[offset + index], prepared[offset + index][1])
+
+        return call
+
+    await drive(send(0), warmup, concurrency, case.expected)
+    result = await drive(send(warmup), requests, concurrency, case.expected)
+
+    # Allocations per request, sequentially so they are not shared between requests
+    call = send(warmup + requests)
+    peaks, retained = [], []
+    tracemalloc.start()
+    try:
+        for index in range(alloc_requests):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await call(index)
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+    if alloc_requests:
+        result["alloc_peak_kib"] = round(statistics.mean(peaks) / 1024, 1)
+        result["alloc_retained_b"] = round(statistics.mean(retained))
+    return result
+
+
+async def bench_socket(
+    base_url: str, case: Case, requests: int, concurrency: int, warmup: int
+) -> Dict[str, float]:
+    prepared = [case.prepare(i) for i in range(warmup + requests)]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+
+        def send(offset: int) -> Callable[[int], Any]:
+            async def call(index: int) -> int:
+                headers, body = prepared[offset + index]
+                response = await client.request(
+                    case.method,
+                    case.path,
+                    headers={**headers, "Accept-Encoding": ACCEPT_ENCODING},
+                    content=body or None,
+                )
+                return response.status_code
+
+            return call
+
+        await drive(send(0), warmup, concurrency, case.expected)
+        return await drive(send(warmup), requests, concurrency, case.expected)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve(config: str, port: int, tenants: int, users: int) -> None:
+    """Child process: the app with stand-ins behind uvicorn"""
+    import uvicorn
+
+    async def run() -> None:
+        standins = StandIns(tenants, users)
+        await standins.start()
+        app = build_app(config, standins)
+        server = uvicorn.Server(
+            uvicorn.Config(
+                app,
+                host="127.0.0.1",
+                port=port,
+                loop="uvloop",
+                http="httptools",
+                lifespan="off",
+                access_log=False,
+                log_level="warning",
+            )
+        )
+        try:
+            await server.serve()
+        finally:
+            await standins.close()
+
+    uvicorn.Config(None, loop="uvloop").setup_event_loop()
+    asyncio.run(run())
+
+
+async def start_server(config: str, tenants: int, users: int) -> Tuple[subprocess.Popen, str]:
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_routes",
+            "--serve",
+            config,
+            "--port",
+            str(port),
+            "--tenants",
+            str(tenants),
+            "--users",
+            str(users),
+        ]
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health/live")).status_code == 200:
+                    return process, base_url
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Benchmark server did not start")
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float
+) -> List[str]:
+    """Regressions of ``results`` against ``baseline``, as printable lines"""
+    previous = {(r["config"], r["transport"], r["endpoint"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get((result["config"], result["transport"], result["endpoint"]))
+        if old is None:
+            continue
+        label = f"{result['endpoint']} [{result['config']}/{result['transport']}]"
+        if result["rps"] < old["rps"] * (1 - threshold):
+            regressions.append(f"{label}: {old['rps']} -> {result['rps']} rps")
+        if result["p95_ms"] > old["p95_ms"] * (1 + threshold):
+            regressions.append(f"{label}: p95 {old['p95_ms']} -> {result['p95_ms']} ms")
+    return regressions
+
+
+def report(result: Dict[str, Any]) -> None:
+    allocations = ""
+    if "alloc_peak_kib" in result:
+        allocations = (
+            f"  {result['alloc_peak_kib']:7.1f} KiB peak {result['alloc_retained_b']:6} B kept"
+        )
+    errors = f"  {result['errors']} unexpected statuses" if result["errors"] else ""
+    print(
+        f"  {result['endpoint']:18} {result['rps']:9.1f} rps  p50 {result['p50_ms']:7.2f}  "
+        f"p95 {result['p95_ms']:7.2f}  p99 {result['p99_ms']:7.2f} ms{allocations}{errors}"
+    )
+
+
+async def main(args: argparse.Namespace) -> int:
+    standins = StandIns(args.tenants, args.users)
+    await standins.start()
+    cases = [c for c in build_cases(args.tenants) if not args.only or c.router in args.only]
+    results: List[Dict[str, Any]] = []
+
+    try:
+        for config in args.configs:
+            for transport in args.transports:
+                print(f"{config} / {transport}:")
+                process = None
+                if transport == "socket":
+                    process, base_url = await start_server(config, args.tenants, args.users)
+                else:
+                    app = build_app(config, standins)
+                try:
+                    for case in cases:
+                        if transport == "asgi":
+                            result = await bench_asgi(
+                                app,
+                                case,
+                                args.requests,
+                                args.concurrency,
+                                args.warmup,
+                                args.alloc_requests,
+                            )
+                        else:
+                            result = await bench_socket(
+                                base_url, case, args.requests, args.concurrency, args.warmup
+                            )
+                        result = {
+                            "endpoint": f"{case.router}.{case.name}",
+                            "config": config,
+                            "transport": transport,
+                            **result,
+                        }
+                        results.append(result)
+                        report(result)
+                        standins.reset()
+                finally:
+                    if process is not None:
+                        process.terminate()
+                        process.wait()
+    finally:
+        await standins.close()
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(
+                {
+                    "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "commit": git_commit(),
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "requests": args.requests,
+                    "concurrency": args.concurrency,
+                    "results": results,
+                },
+                fh,
+                indent=2,
+            )
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = compare(results, baseline["results"], args.threshold)
+        print(
+            f"against {args.baseline} ({baseline.get('commit', 'unknown')}),"
+            f" threshold {args.threshold:.0%}:"
+        )
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        if regressions:
+            return 1
+        print("  no regressions")
+    return 0
+
+
+def _names(value: str) -> Sequence[str]:
+    return tuple(name for name in value.split(",") if name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument(
+        "--alloc-requests", type=int, default=200, help="Requests traced for allocations"
+    )
+    parser.add_argument("--tenants", type=int, default=100)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--configs", type=_names, default=tuple(CONFIGS))
+    parser.add_argument("--transports", type=_names, default=TRANSPORTS)
+    parser.add_argument(
+        "--only", type=_names, default=(), help="Routers to benchmark, e.g. tenants,users"
+    )
+    parser.add_argument("--output", default="", help="Write the results to this JSON file")
+    parser.add_argument(
+        "--baseline", default="", help="Results file of an earlier run to compare against"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Tolerated RPS loss / p95 gain"
+    )
+    parser.add_argument("--serve", default="", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.tenants, args.users)
+    else:
+        sys.exit(asyncio.run(main(args)))
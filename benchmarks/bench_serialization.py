@@ -0,0 +1,93 @@
+"""
+Entity Serialization Benchmark
+
+Compares the previous response path - ``to_dict()``, FastAPI's
+``jsonable_encoder`` and the stdlib ``json`` module - against encoding the
+entities straight to bytes with the orjson-based encoder, for a single tenant
+and for a list of tenants.
+
+Usage: python -m benchmarks.bench_serialization [--entities N] [--seconds S]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import Any, Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from src.domain.entities.tenant import Tenant, TenantStatus, TenantTier
+from src.infrastructure.fastapi.responses import FastJSONResponse
+from src.infrastructure.serialization.encoder import dumps
+
+
+def make_tenants(n: int) -> List[Tenant]:
+    return [
+        Tenant(
+            name=f"Tenant {i}",
+            status=TenantStatus.ACTIVE,
+            tier=TenantTier.PRO,
+            organization_name=f"Organization {i}",
+            primary_contact_email=f"admin@tenant{i}.example.com",
+            settings={"region": "eu-west-1", "sso": {"provider": "okta"}},
+            features=["sso", "audit_logs"],
+            activated_at=datetime.utcnow(),
+        )
+        for i in range(n)
+    ]
+
+
+def measure(fn: Callable[[], Any], seconds: float) -> float:
+    """Calls per second of ``fn`` over roughly ``seconds``"""
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(10):
+            fn()
+        calls += 10
+    return calls / (time.perf_counter() - started)
+
+
+def main(entities: int, seconds: float) -> None:
+    tenants = make_tenants(entities)
+    tenant = tenants[0]
+
+    cases = {
+        "single": (lambda: {"tenant": tenant.to_dict()}, lambda: {"tenant": tenant}),
+        f"list[{entities}]": (
+            lambda: {"tenants": [t.to_dict() for t in tenants]},
+            lambda: {"tenants": tenants},
+        ),
+    }
+
+    for name, (legacy_content, fast_content) in cases.items():
+        assert json.loads(dumps(fast_content())) == json.loads(json.dumps(legacy_content()))
+
+        to_dict_json = measure(lambda: json.dumps(legacy_content()).encode(), seconds)
+        fastapi_path = measure(
+            lambda: JSONResponse(jsonable_encoder(legacy_content())).body, seconds
+        )
+        default_class = measure(
+            lambda: FastJSONResponse(jsonable_encoder(legacy_content())).body, seconds
+        )
+        direct = measure(lambda: FastJSONResponse(fast_content()).body, seconds)
+
+        print(f"{name}:")
+        print(f"  to_dict + json.dumps:                 {to_dict_json:>12,.0f} ops/s")
+        print(f"  to_dict + jsonable_encoder + json:    {fastapi_path:>12,.0f} ops/s")
+        print(f"  to_dict + jsonable_encoder + orjson:  {default_class:>12,.0f} ops/s")
+        print(
+            f"  entity -> FastJSONResponse (direct):  {direct:>12,.0f} ops/s"
+            f"  ({direct / fastapi_path:.1f}x FastAPI path)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+    main(args.entities, args.seconds)
@@ -0,0 +1,100 @@
+"""
+Cold Start Benchmark
+
+Starts fresh interpreters and measures the time from process spawn to
+the first 200 on /health/live, split into interpreter start plus
+``import src.main``, the lifespan startup and the first request. Runs
+eager and lazy router loading; in lazy mode it also measures the first
+request to a router that is imported on demand.
+
+Dependencies that are down slow the lifespan startup (e.g. the NATS
+connect timeout), so compare runs made in the same environment. Pass
+--history to append the medians as a JSON line, to track cold start
+across commits.
+
+Usage: python -m benchmarks.bench_startup [--runs N] [--history startup.jsonl]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+CHILD = """
+import json, sys, time
+spawned = float(sys.argv[1])
+imported_at = time.time()
+from src.main import app
+imported = time.time()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    started = time.time()
+    assert client.get("/health/live").status_code == 200
+    served = time.time()
+    client.get("/v1/tenants/probe")
+    lazy_hit = time.time()
+print(json.dumps({
+    "import_ms": (imported - spawned) * 1000,
+    "startup_ms": (started - imported) * 1000,
+    "first_request_ms": (served - started) * 1000,
+    "total_ms": (served - spawned) * 1000,
+    "first_router_hit_ms": (lazy_hit - served) * 1000,
+}))
+"""
+
+PHASES = ("import_ms", "startup_ms", "first_request_ms", "total_ms", "first_router_hit_ms")
+
+
+def run_once(lazy: bool) -> Dict[str, float]:
+    env = {**os.environ, "LAZY_ROUTERS": str(lazy).lower()}
+    spawned = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, repr(spawned)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main(runs: int, history: str) -> None:
+    record = {"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": git_commit(), "runs": runs}
+    for lazy in (False, True):
+        samples: List[Dict[str, float]] = [run_once(lazy) for _ in range(runs)]
+        medians = {
+            phase: round(statistics.median(s[phase] for s in samples), 1) for phase in PHASES
+        }
+        mode = "lazy" if lazy else "eager"
+        record[mode] = medians
+        print(
+            f"{mode:5}: total {medians['total_ms']:.0f} ms = import {medians['import_ms']:.0f} "
+            f"+ startup {medians['startup_ms']:.0f} "
+            f"+ first request {medians['first_request_ms']:.1f}; "
+            f"first /v1/tenants hit {medians['first_router_hit_ms']:.1f} ms"
+        )
+
+    if history:
+        with open(history, "a") as fh:
+            fh.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--history", default="", help="Append the medians to this JSON lines file")
+    args = parser.parse_args()
+    main(args.runs, args.history)
@@ -0,0 +1,113 @@
+"""
+Tenant Memory Footprint Benchmark
+
+Measures, with tracemalloc, the memory allocated to build N tenants from
+row-like data using the slotted Tenant entity and the previous ``__dict__``
+layout with per-instance settings dicts and feature lists. Row values
+(strings, UUIDs, datetimes) exist before measuring starts and are shared by
+both layouts, so the figures are the per-entity overhead.
+
+Usage: python -m benchmarks.bench_tenant_memory [--tenants 10000 100000]
+"""
+
+import argparse
+import dataclasses
+import gc
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+from uuid import uuid4
+
+from src.domain.entities.tenant import Tenant, TenantStatus, TenantTier
+
+FEATURE_COMBINATIONS = [
+    [],
+    ["sso"],
+    ["sso", "audit_logs"],
+    ["sso", "audit_logs", "custom_models", "byok"],
+]
+
+# The pre-slots layout: same fields, a __dict__ per instance, a list of
+# features and a settings dict per tenant
+LegacyTenant = dataclasses.make_dataclass(
+    "LegacyTenant",
+    [
+        (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+        for f in dataclasses.fields(Tenant)
+    ],
+)
+
+
+def rows(n: int) -> List[Dict[str, Any]]:
+    """Row-like tenant attributes; strings are rebuilt per row as a DB driver would"""
+    rng = random.Random(42)
+    base = datetime(2024, 1, 1)
+    return [
+        {
+            "id": uuid4(),
+            "name": f"Tenant {i}",
+            "slug": f"tenant-{i}",
+            "status": TenantStatus.ACTIVE,
+            "tier": rng.choice(list(TenantTier)),
+            "organization_name": f"Organization {i}",
+            "primary_contact_email": f"admin@tenant{i}.example.com",
+            "features": "|".join(rng.choice(FEATURE_COMBINATIONS)),
+            "settings": {"region": "eu-west-1"} if i % 10 == 0 else {},
+            "created_at": base + timedelta(seconds=i),
+            "updated_at": base + timedelta(seconds=i),
+        }
+        for i in range(n)
+    ]
+
+
+def measure(build: Callable[[Dict[str, Any]], Any], data: List[Dict[str, Any]]) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    tenants = [build(row) for row in data]
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    hits = sum("byok" in tenant.features for tenant in tenants)
+    lookup = time.perf_counter() - started
+    del tenants
+    return {"bytes": current, "build_s": elapsed, "lookup_s": lookup, "hits": hits}
+
+
+def build_slotted(row: Dict[str, Any]) -> Tenant:
+    features = row["features"].split("|") if row["features"] else []
+    return Tenant(**{**row, "features": features, "settings": dict(row["settings"])})
+
+
+def build_legacy(row: Dict[str, Any]) -> Any:
+    features = row["features"].split("|") if row["features"] else []
+    return LegacyTenant(**{**row, "features": features, "settings": dict(row["settings"])})
+
+
+def main(sizes: List[int]) -> None:
+    for n in sizes:
+        data = rows(n)
+        legacy = measure(build_legacy, data)
+        slotted = measure(build_slotted, data)
+        assert legacy["hits"] == slotted["hits"]
+
+        print(f"{n:,} tenants:")
+        for name, result in (("__dict__ + list/dict", legacy), ("slotted + shared", slotted)):
+            print(
+                f"  {name:<22} {result['bytes'] / 2**20:8.1f} MiB"
+                f"  ({result['bytes'] / n:5.0f} B/tenant)"
+                f"  build {result['build_s'] * 1000:6.0f} ms"
+                f"  feature lookups {result['lookup_s'] * 1000:5.1f} ms"
+            )
+        print(f"  saved {1 - slotted['bytes'] / legacy['bytes']:.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    main(args.tenants)
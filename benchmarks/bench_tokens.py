@@ -0,0 +1,117 @@
+"""
+Token Verification Benchmark
+
+Measures verifications/sec for HS256 tokens issued by the service and RS256
+tokens verified against a JWKS file:
+- jose baseline: ``jwt.decode`` with the raw key, parsed on every call
+- cold: TokenService with prepared keys, every token seen for the first time
+- warm: the same tokens again, answered from the decoded-claims cache
+
+Usage: python -m benchmarks.bench_tokens [--tokens N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from typing import Awaitable, Callable, List
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from src.infrastructure.security.keys import KeyRing
+from src.infrastructure.security.tokens import TokenService
+
+SECRET = "benchmark-secret-key-with-enough-entropy"
+
+
+async def rate(verify: Callable[[str], Awaitable[object]], tokens: List[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for token in tokens:
+            await verify(token)
+    return rounds * len(tokens) / (time.perf_counter() - started)
+
+
+def report(name: str, baseline: float, cold: float, warm: float) -> None:
+    print(f"{name}:")
+    print(f"  jose.decode baseline: {baseline:>12,.0f} verifications/s")
+    print(f"  cold (prepared key):  {cold:>12,.0f} verifications/s")
+    print(
+        f"  warm (claims cache):  {warm:>12,.0f} verifications/s  ({warm / baseline:.0f}x baseline)"
+    )
+
+
+async def bench_hs256(n: int, rounds: int) -> None:
+    service = TokenService(KeyRing(SECRET, "HS256"), cache_size=n)
+    tokens = [service.issue(f"user-{i}", "tenant-1").access_token for i in range(n)]
+
+    async def baseline(token: str) -> object:
+        return jwt.decode(token, SECRET, algorithms=["HS256"])
+
+    base = await rate(baseline, tokens, 1)
+    cold = await rate(service.verify, tokens, 1)
+    warm = await rate(service.verify, tokens, rounds)
+    report("HS256 (issued locally)", base, cold, warm)
+
+
+async def bench_rs256(n: int, rounds: int) -> None:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    public_jwk = {**jwk.construct(public_pem, "RS256").to_dict(), "kid": "bench", "use": "sig"}
+
+    signing_key = jwk.construct(private_pem, "RS256")
+    now = int(time.time())
+    tokens = [
+        jwt.encode(
+            {"sub": f"user-{i}", "iat": now, "exp": now + 3600},
+            signing_key,
+            algorithm="RS256",
+            headers={"kid": "bench"},
+        )
+        for i in range(n)
+    ]
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json") as jwks_file:
+        json.dump({"keys": [public_jwk]}, jwks_file)
+        jwks_file.flush()
+        keys = KeyRing(SECRET, "HS256", jwks_source=jwks_file.name)
+        await keys.reload()
+
+    service = TokenService(keys, cache_size=n)
+    jwks = {"keys": [public_jwk]}
+
+    async def baseline(token: str) -> object:
+        return jwt.decode(token, jwks, algorithms=["RS256"])
+
+    base = await rate(baseline, tokens, 1)
+    cold = await rate(service.verify, tokens, 1)
+    warm = await rate(service.verify, tokens, rounds)
+    report("RS256 (JWKS)", base, cold, warm)
+
+
+async def main(n: int, rounds: int) -> None:
+    await bench_hs256(n, rounds)
+    await bench_rs256(n, rounds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.tokens, args.rounds))
@@ -0,0 +1,79 @@
+"""
+Tracing Overhead Benchmark
+
+Runs the request pipeline with tracing off, with every new trace dropped at
+the head, with ratio sampling plus the tail keep rule, and with every trace
+sampled. Spans go through the batch span processor to an in-memory
+exporter. A last run sends failing requests with a head ratio of 0 to check
+the tail rule keeps every errored trace.
+
+Usage: python -m benchmarks.bench_tracing [--requests N] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+
+from fastapi import Response
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from benchmarks._asgi import build_scope, run
+from benchmarks.bench_middleware import build_app
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability import tracing
+
+SCENARIOS = (
+    # name, tracing enabled, head ratio, tail rule
+    ("tracing_off", False, 0.0, False),
+    ("head_ratio_0", True, 0.0, False),
+    ("head_ratio_0.1_with_tail", True, 0.1, True),
+    ("head_ratio_1", True, 1.0, False),
+)
+
+
+def build_traced_app():
+    app = build_app(pipeline=True)
+
+    @app.get("/v1/fail")
+    async def fail():
+        return Response(status_code=500)
+
+    return app
+
+
+def configure(enabled: bool, ratio: float, tail: bool) -> InMemorySpanExporter:
+    settings.ENABLE_TRACING = enabled
+    settings.TRACING_SAMPLE_RATIO = ratio
+    settings.TRACING_TAIL_LATENCY_MS = 1000.0 if tail else 0.0
+    settings.TRACING_TAIL_KEEP_ERRORS = tail
+    exporter = InMemorySpanExporter()
+    tracing.init_tracing(exporter)
+    return exporter
+
+
+async def main(requests: int, concurrency: int) -> None:
+    settings.ENABLE_METRICS = False
+    scope = build_scope("GET", "/v1/tenants/acme", headers={"X-Tenant-Id": "acme"})
+
+    for name, enabled, ratio, tail in SCENARIOS:
+        exporter = configure(enabled, ratio, tail)
+        app = build_traced_app()
+        await run(app, scope, requests=min(requests, 500), concurrency=concurrency)  # warm-up
+        result = await run(app, scope, requests=requests, concurrency=concurrency)
+        tracing.close_tracing()
+        print(name, result.summary(), f"exported_spans={len(exporter.get_finished_spans())}")
+
+    errors = min(requests, 1000)
+    exporter = configure(True, 0.0, True)
+    fail_scope = build_scope("GET", "/v1/fail", headers={"X-Tenant-Id": "acme"})
+    await run(build_traced_app(), fail_scope, requests=errors, concurrency=concurrency)
+    tracing.close_tracing()
+    traces = {span.context.trace_id for span in exporter.get_finished_spans()}
+    print(f"tail rule: {len(traces)} of {errors} failed requests kept at head ratio 0")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,323 @@
+"""
+Batch Upload Helpers for REST Endpoints
+
+A batch is uploaded as NDJSON, CSV or a JSON array. The body is spooled
+first (in memory, on disk past BATCH_SPOOL_MEMORY_BYTES), then parsed,
+validated and written one chunk at a time, and a result per row is
+streamed back as NDJSON.
+"""
+
+import asyncio
+import csv
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Set, Tuple, TypeVar, Union
+from uuid import UUID
+
+import orjson
+from fastapi import HTTPException, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from src.adapters.inbound.rest.pagination import NDJSON_MEDIA_TYPE
+from src.infrastructure.config.settings import settings
+from src.infrastructure.serialization.encoder import dumps
+
+T = TypeVar("T")
+
+CSV_MEDIA_TYPE = "text/csv"
+JSON_MEDIA_TYPE = "application/json"
+UPLOAD_MEDIA_TYPES = (NDJSON_MEDIA_TYPE, CSV_MEDIA_TYPE, JSON_MEDIA_TYPE)
+
+READ_SIZE = 65536
+# Validation hands the event loop back this often, so a chunk does not stall other requests
+YIELD_EVERY_ROWS = 100
+
+RowErrors = List[Dict[str, str]]
+# What ``write`` reports per item: the id created, or why the row was rejected
+RowResult = Union[UUID, RowErrors]
+Row = Union[Dict[str, Any], "MalformedRow"]
+
+_END = object()
+
+
+class MalformedRow(ValueError):
+    """An uploaded row that could not be parsed"""
+
+
+class RowRejected(ValueError):
+    """Raised by a row validator to reject a row with field-level errors"""
+
+    def __init__(self, errors: "RowErrors") -> None:
+        super().__init__("; ".join(error["message"] for error in errors))
+        self.errors = errors
+
+
+def row_errors(field: str, message: str) -> RowErrors:
+    """Errors of a row rejected for a single reason"""
+    return [{"field": field, "message": message}]
+
+
+def batch_openapi() -> Dict[str, Any]:
+    """``openapi_extra`` documenting a batch upload body"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}},
+                CSV_MEDIA_TYPE: {"schema": {"type": "string"}},
+                JSON_MEDIA_TYPE: {"schema": {"type": "array", "items": {"type": "object"}}},
+            },
+        },
+    }
+
+
+def validation_errors(exc: ValidationError) -> RowErrors:
+    """Flatten pydantic errors to ``{"field", "message"}`` pairs"""
+    return [
+        {"field": ".".join(str(part) for part in error["loc"]), "message": error["msg"]}
+        for error in exc.errors()
+    ]
+
+
+async def upload_rows(request: Request) -> AsyncIterator[Row]:
+    """
+    Spool the request body, then return an iterator over its rows
+
+    Rows are dicts of field values; rows that cannot be parsed come through
+    as MalformedRow so that they are reported in place. Unsupported media
+    types get 415 and oversized bodies 413, before any result is streamed.
+    """
+    media_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+    if media_type not in UPLOAD_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Upload one of: {', '.join(UPLOAD_MEDIA_TYPES)}",
+        )
+
+    # The body is read in full before the response starts: the response polls
+    # the connection for a disconnect, and clients that upload everything
+    # before reading would stall against results they have not read yet
+    upload = UploadFile(SpooledTemporaryFile(max_size=settings.BATCH_SPOOL_MEMORY_BYTES))
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > settings.BATCH_MAX_UPLOAD_BYTES:
+            await upload.close()
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Batch uploads are limited to {settings.BATCH_MAX_UPLOAD_BYTES} bytes",
+            )
+        await upload.write(chunk)
+    await upload.seek(0)
+
+    if media_type == JSON_MEDIA_TYPE:
+        rows = _json_rows(await _json_array(upload))
+    elif media_type == CSV_MEDIA_TYPE:
+        rows = _csv_rows(_line_batches(upload))
+    else:
+        rows = _ndjson_rows(_line_batches(upload))
+    return _closing(rows, upload)
+
+
+async def _closing(rows: AsyncIterator[Row], upload: UploadFile) -> AsyncIterator[Row]:
+    try:
+        async for row in rows:
+            yield row
+    finally:
+        await upload.close()
+
+
+async def _line_batches(upload: UploadFile) -> AsyncIterator[List[bytes]]:
+    """Lines of the upload, without terminators, a block at a time"""
+    pending = b""
+    while True:
+        block = await upload.read(READ_SIZE)
+        if not block:
+            break
+        lines = (pending + block).split(b"\n")
+        pending = lines.pop()
+        yield lines
+    if pending:
+        yield [pending]
+
+
+async def _ndjson_rows(batches: AsyncIterator[List[bytes]]) -> AsyncIterator[Row]:
+    async for lines in batches:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                row = orjson.loads(line)
+            except orjson.JSONDecodeError as exc:
+                yield MalformedRow(f"Invalid JSON: {exc}")
+                continue
+            yield row if isinstance(row, dict) else MalformedRow("Expected a JSON object")
+
+
+async def _csv_rows(batches: AsyncIterator[List[bytes]]) -> AsyncIterator[Row]:
+    """
+    CSV rows keyed by the header row; empty fields are left out, so that
+    they take their defaults
+    """
+    header = None
+    open_record = None
+    async for lines in batches:
+        records = []
+        for line in lines:
+            text = line.decode("utf-8", errors="replace").rstrip("\r")
+            if open_record is not None:
+                text = open_record + "\n" + text
+                open_record = None
+            # An odd number of quotes leaves a quoted field open across lines
+            if text.count('"') % 2:
+                open_record = text
+            elif text.strip():
+                records.append(text)
+
+        for values in csv.reader(records):
+            if header is None:
+                header = [name.strip().lstrip("\ufeff") for name in values]
+            elif len(values) != len(header):
+                yield MalformedRow(f"Expected {len(header)} fields, got {len(values)}")
+            else:
+                yield {name: value for name, value in zip(header, values) if value != ""}
+
+    if open_record is not None:
+        yield MalformedRow("Unterminated quoted field")
+
+
+async def _json_array(upload: UploadFile) -> List[Any]:
+    """Parse a JSON array upload whole, so meant for small batches"""
+    try:
+        rows = orjson.loads(await upload.read())
+    except orjson.JSONDecodeError as exc:
+        await upload.close()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON: {exc}")
+    if not isinstance(rows, list):
+        await upload.close()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Expected a JSON array")
+    return rows
+
+
+async def _json_rows(rows: List[Any]) -> AsyncIterator[Row]:
+    for row in rows:
+        yield row if isinstance(row, dict) else MalformedRow("Expected a JSON object")
+
+
+async def _read_ahead(items: AsyncIterator[T]) -> AsyncIterator[T]:
+    """Iterate over items while the next one is already being produced"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    async def produce() -> None:
+        try:
+            async for item in items:
+                await queue.put(item)
+            await queue.put(_END)
+        except Exception as exc:
+            await queue.put(exc)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+
+
+async def _validated_chunks(
+    rows: AsyncIterator[Row],
+    validate: Callable[[Dict[str, Any]], Tuple[str, T]],
+) -> AsyncIterator[Tuple[List[Tuple[int, RowErrors]], List[Tuple[int, T]], bool]]:
+    """
+    Chunks of (rejected rows, accepted items, whether the row limit was hit),
+    with rows numbered from 1
+    """
+    seen: Set[str] = set()
+    rejected: List[Tuple[int, RowErrors]] = []
+    accepted: List[Tuple[int, T]] = []
+    number = 0
+    async for row in rows:
+        number += 1
+        if number % YIELD_EVERY_ROWS == 0:
+            await asyncio.sleep(0)
+        if number > settings.BATCH_MAX_ROWS:
+            yield rejected, accepted, True
+            return
+
+        try:
+            if isinstance(row, MalformedRow):
+                raise row
+            key, item = validate(row)
+        except ValidationError as exc:
+            rejected.append((number, validation_errors(exc)))
+        except RowRejected as exc:
+            rejected.append((number, exc.errors))
+        except ValueError as exc:
+            rejected.append((number, row_errors("row", str(exc))))
+        else:
+            if key in seen:
+                rejected.append((number, row_errors("row", f"Duplicate of an earlier row: {key}")))
+            else:
+                seen.add(key)
+                accepted.append((number, item))
+
+        if len(rejected) + len(accepted) >= settings.BATCH_CHUNK_SIZE:
+            yield rejected, accepted, False
+            rejected, accepted = [], []
+    yield rejected, accepted, False
+
+
+def batch_response(
+    rows: AsyncIterator[Row],
+    validate: Callable[[Dict[str, Any]], Tuple[str, T]],
+    write: Callable[[List[T]], Awaitable[List[RowResult]]],
+    errors_only: bool = False,
+) -> StreamingResponse:
+    """
+    Validate and write uploaded rows a chunk at a time, streaming the results
+
+    ``validate`` turns a row into a key that must be unique within the batch
+    (e.g. the email) and an item, raising ValidationError, RowRejected or
+    ValueError for bad rows. ``write`` stores a chunk of items and returns a result for each.
+    The next chunk is validated while the previous one is written.
+
+    Each row gets a line, ``{"row": n, "id": ...}`` or ``{"row": n, "errors":
+    [...]}`` (only the latter with ``errors_only``), in upload order within a
+    chunk; a ``{"summary": ...}`` line comes last.
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        created = failed = 0
+        truncated = False
+        async for rejected, accepted, truncated in _read_ahead(_validated_chunks(rows, validate)):
+            results = await write([item for _, item in accepted]) if accepted else []
+            outcomes = rejected + [
+                (number, result) for (number, _), result in zip(accepted, results)
+            ]
+            outcomes.sort(key=lambda outcome: outcome[0])
+
+            out = []
+            for number, result in outcomes:
+                if isinstance(result, UUID):
+                    created += 1
+                    if not errors_only:
+                        out.append(dumps({"row": number, "id": result}))
+                else:
+                    failed += 1
+                    out.append(dumps({"row": number, "errors": result}))
+            if out:
+                yield b"\n".join(out) + b"\n"
+
+        summary = {"rows": created + failed, "created": created, "failed": failed}
+        if truncated:
+            summary[
+                "truncated"
+            ] = f"Rows after the first {settings.BATCH_MAX_ROWS} were not processed"
+        yield dumps({"summary": summary}) + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,176 @@
+"""
+FastAPI Dependencies Wiring Ports to Adapters
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.outbound.persistence.provider_repository import SqlAlchemyProviderConfigRepository
+from src.adapters.outbound.persistence.tenant_repository import SqlAlchemyTenantRepository
+from src.adapters.outbound.persistence.user_repository import SqlAlchemyUserRepository
+from src.domain.entities.user import UserRole
+from src.domain.ports.repositories.provider_repository import ProviderConfigRepository
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.domain.ports.repositories.user_repository import UserRepository
+from src.infrastructure.cache import provider_cache
+from src.infrastructure.cache.provider_cache import ProviderConfigCache
+from src.infrastructure.database.session import get_session_factory
+from src.infrastructure.database.tenant_router import get_tenant_session_factory
+from src.infrastructure.providers import connectivity
+from src.infrastructure.providers.connectivity import ProviderTester
+from src.infrastructure.security import passwords
+from src.infrastructure.security.encryption import get_secret_box
+from src.infrastructure.security.passwords import PasswordService
+from src.infrastructure.security.tokens import Claims, InvalidTokenError, get_token_service
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def get_tenant_repository() -> TenantRepository:
+    """Tenant repository on the control-plane database"""
+    session_factory = get_session_factory()
+    if session_factory is None:
+        raise RuntimeError("Database is not initialized")
+    return SqlAlchemyTenantRepository(session_factory)
+
+
+def get_current_tenant_id(request: Request) -> UUID:
+    """
+    Id of the tenant the request is made on behalf of
+
+    Taken from the resolved tenant; while tenants are not validated, the
+    X-Tenant-Id header must then hold the id itself.
+    """
+    tenant = getattr(request.state, "tenant", None)
+    if tenant is not None:
+        return tenant.id
+    try:
+        return UUID(getattr(request.state, "tenant_id", None) or "")
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Tenant context required"
+        )
+
+
+def get_user_repository(
+    tenant_id: UUID = Depends(get_current_tenant_id),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_tenant_session_factory),
+) -> UserRepository:
+    """User repository scoped to the current tenant, on its database"""
+    return SqlAlchemyUserRepository(session_factory, tenant_id)
+
+
+def get_provider_repository() -> ProviderConfigRepository:
+    """Provider configuration repository on the control-plane database"""
+    session_factory = get_session_factory()
+    if session_factory is None:
+        raise RuntimeError("Database is not initialized")
+    return SqlAlchemyProviderConfigRepository(session_factory, get_secret_box())
+
+
+def get_provider_cache() -> ProviderConfigCache:
+    """Provider configuration cache"""
+    cache = provider_cache.get_provider_cache()
+    if cache is None:
+        raise RuntimeError("Provider config cache is not initialized")
+    return cache
+
+
+def get_provider_tester() -> ProviderTester:
+    """Provider connectivity tester"""
+    tester = connectivity.get_provider_tester()
+    if tester is None:
+        raise RuntimeError("Provider tester is not initialized")
+    return tester
+
+
+def get_password_service() -> PasswordService:
+    """Password hashing service"""
+    service = passwords.get_password_service()
+    if service is None:
+        raise RuntimeError("Password service is not started")
+    return service
+
+
+async def get_token_claims(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> Claims:
+    """
+    Verify the bearer token and return its claims, whichever tenant it is bound to
+
+    The claims are also stored on ``request.state.claims``.
+    """
+    service = get_token_service()
+    if service is None:
+        raise RuntimeError("Token service is not initialized")
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        claims = await service.verify(credentials.credentials)
+    except InvalidTokenError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(exc),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    request.state.claims = claims
+    return claims
+
+
+async def get_current_claims(
+    request: Request, claims: Claims = Depends(get_token_claims)
+) -> Claims:
+    """
+    Verify the bearer token and return its claims
+
+    Only tokens bound (``tid``) to the tenant the request is made for are
+    accepted; tokens bound to no tenant are for the platform routes.
+    """
+    if claims.get("tid") != str(get_current_tenant_id(request)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Token not issued for this tenant"
+        )
+    return claims
+
+
+# Roles allowed to manage a tenant's users and providers
+ADMIN_ROLES = frozenset({UserRole.OWNER.value, UserRole.ADMIN.value})
+
+# Role of platform operators, who manage tenants themselves; their tokens
+# come from the identity provider and are bound to no tenant
+PLATFORM_ADMIN_ROLE = "platform_admin"
+
+
+async def require_admin(claims: Claims = Depends(get_current_claims)) -> Claims:
+    """
+    Verify the bearer token, like ``get_current_claims``, and require the
+    owner or admin role
+    """
+    if claims.get("role") not in ADMIN_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Owner or admin role required"
+        )
+    return claims
+
+
+async def require_platform_admin(claims: Claims = Depends(get_token_claims)) -> Claims:
+    """
+    Verify the bearer token and require the platform operator role on a
+    token bound to no tenant
+    """
+    if claims.get("role") != PLATFORM_ADMIN_ROLE or "tid" in claims:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Platform operator role required"
+        )
+    return claims
@@ -0,0 +1,57 @@
+"""
+Cursor Pagination and Streaming Helpers for REST Endpoints
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from src.domain.ports.repositories.pagination import Cursor
+from src.infrastructure.serialization.encoder import dumps
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def encode_cursor(cursor: Optional[Cursor]) -> Optional[str]:
+    """Encode a (created_at, id) position as an opaque URL-safe token"""
+    if cursor is None:
+        return None
+    created_at, row_id = cursor
+    raw = json.dumps([created_at.isoformat(), str(row_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Cursor]:
+    """Decode a token produced by ``encode_cursor``"""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def ndjson_response(items: AsyncIterator[Any], filename: str) -> StreamingResponse:
+    """
+    Stream items (e.g. domain entities) as newline-delimited JSON, one line per item
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for item in items:
+            yield dumps(item) + b"\n"
+
+    return StreamingResponse(
+        lines(),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
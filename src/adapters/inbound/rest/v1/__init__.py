@@ -1,7 +1,20 @@
 """
 REST API v1 Adapters
+
+Routers are listed in a manifest rather than imported here, so that in
+lazy mode a router module is only imported on its first request.
 """
 
-from . import health, tenants, auth, quotas, providers, users
+from src.infrastructure.fastapi.routing import RouterSpec
+
+ROUTERS = (
+    RouterSpec(f"{__name__}.health", "/health", ("health",), eager=True),
+    RouterSpec(f"{__name__}.metrics", "/metrics", ("observability",), enabled_by="ENABLE_METRICS"),
+    RouterSpec(f"{__name__}.auth", "/v1/auth", ("authentication",)),
+    RouterSpec(f"{__name__}.tenants", "/v1/tenants", ("tenants",)),
+    RouterSpec(f"{__name__}.users", "/v1/users", ("users",)),
+    RouterSpec(f"{__name__}.quotas", "/v1/quotas", ("quotas",)),
+    RouterSpec(f"{__name__}.providers", "/v1/providers", ("providers",)),
+)
 
-__all__ = ["health", "tenants", "auth", "quotas", "providers", "users"]
\ No newline at end of file
+__all__ = ["ROUTERS"]
@@ -2,24 +2,194 @@
 Authentication Endpoints
 """
 
-from fastapi import APIRouter, status
+import logging
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel
+
+from src.adapters.inbound.rest.dependencies import (
+    get_current_tenant_id,
+    get_password_service,
+    get_token_claims,
+    get_user_repository,
+)
+from src.domain.ports.repositories.user_repository import UserRepository
+from src.infrastructure.nats.client import get_nats
+from src.infrastructure.security.passwords import PasswordService, PasswordServiceBusyError
+from src.infrastructure.security.tokens import (
+    REFRESH_TOKEN,
+    Claims,
+    InvalidTokenError,
+    TokenService,
+    get_token_service,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Claims managed by the token service; everything else is carried over on refresh
+RESERVED_CLAIMS = frozenset({"sub", "tid", "iat", "nbf", "exp", "jti", "type", "iss", "aud"})
+
+
+class LoginRequest(BaseModel):
+    """Credentials of a user of the current tenant"""
+
+    email: str
+    password: str
+
+
+class RefreshRequest(BaseModel):
+    """Refresh token to exchange for a new token pair"""
+
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """Optional refresh token to revoke along with the access token"""
+
+    refresh_token: Optional[str] = None
+
+
+def _token_service() -> TokenService:
+    service = get_token_service()
+    if service is None:
+        raise RuntimeError("Token service is not initialized")
+    return service
+
+
+def _token_response(
+    service: TokenService,
+    subject: str,
+    tenant_id: Optional[str],
+    **claims: Any,
+) -> Dict[str, Any]:
+    tokens = service.issue(subject, tenant_id, **claims)
+    return {
+        "access_token": tokens.access_token,
+        "refresh_token": tokens.refresh_token,
+        "token_type": tokens.token_type,
+        "expires_in": tokens.expires_in,
+    }
+
 
 @router.post("/login", status_code=status.HTTP_200_OK)
-async def login():
-    """Login endpoint - TODO: Implement"""
-    return {"message": "Login endpoint - To be implemented"}
+async def login(
+    body: LoginRequest,
+    tenant_id: UUID = Depends(get_current_tenant_id),
+    repository: UserRepository = Depends(get_user_repository),
+    passwords: PasswordService = Depends(get_password_service),
+):
+    """
+    Authenticate a user of the current tenant and issue a token pair
+
+    Only users of the tenant the request is made for may sign in. Hashes
+    made with outdated bcrypt parameters are upgraded on success.
+    """
+    user = await repository.get_by_email(body.email.strip().lower())
+    try:
+        valid, new_hash = await passwords.verify(
+            body.password, user.password_hash if user else None
+        )
+    except PasswordServiceBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        )
+    if user is None or not valid or not user.is_active or user.tenant_id != tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if new_hash is not None:
+        user.password_hash = new_hash
+    user.record_login()
+    await repository.save(user)
+
+    return _token_response(_token_service(), str(user.id), str(tenant_id), role=user.role.value)
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
-async def logout():
-    """Logout endpoint - TODO: Implement"""
-    return {"message": "Logout endpoint - To be implemented"}
+async def logout(
+    body: Optional[LogoutRequest] = None,
+    claims: Claims = Depends(get_token_claims),
+):
+    """
+    Revoke the caller's access token and, if given, their refresh token
+    """
+    service = _token_service()
+    nc = get_nats()
+    await service.revoke(claims, nc)
+
+    if body is not None and body.refresh_token:
+        try:
+            refresh_claims = await service.verify(body.refresh_token, REFRESH_TOKEN)
+        except InvalidTokenError:
+            refresh_claims = None
+        if refresh_claims is not None and refresh_claims.get("sub") == claims.get("sub"):
+            await service.revoke(refresh_claims, nc)
+
+    return {"message": "Logged out"}
 
 
 @router.post("/refresh", status_code=status.HTTP_200_OK)
-async def refresh_token():
-    """Refresh token endpoint - TODO: Implement"""
-    return {"message": "Refresh token endpoint - To be implemented"}
\ No newline at end of file
+async def refresh_token(
+    body: RefreshRequest,
+    tenant_id: UUID = Depends(get_current_tenant_id),
+    repository: UserRepository = Depends(get_user_repository),
+):
+    """
+    Exchange a refresh token for a new token pair; the old refresh token is revoked
+
+    The user is reloaded so a disabled user cannot refresh and role changes
+    take effect. A refresh token is exchanged at most once, even when
+    replayed concurrently against several replicas.
+    """
+    service = _token_service()
+    try:
+        claims = await service.verify(body.refresh_token, REFRESH_TOKEN)
+    except InvalidTokenError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(exc),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        user_id = UUID(str(claims.get("sub")))
+    except ValueError:
+        user_id = None
+    user = None
+    if user_id is not None and claims.get("tid") == str(tenant_id):
+        user = await repository.get_by_id(user_id)
+    if user is None or not user.is_active or user.tenant_id != tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        revoked = await service.revoke_once(claims, get_nats())
+    except Exception as exc:
+        logger.warning("Could not revoke refresh token: %r", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Token store unavailable",
+            headers={"Retry-After": "1"},
+        )
+    if not revoked:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    extra = {k: v for k, v in claims.items() if k not in RESERVED_CLAIMS}
+    extra["role"] = user.role.value
+    return _token_response(service, str(user.id), str(tenant_id), **extra)
@@ -3,14 +3,18 @@ Health Check Endpoints
 """
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Dict
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 from pydantic import BaseModel
 
+NOT_STARTED = b'{"status":"not_ready","reason":"starting"}'
+STALE = b'{"status":"not_ready","reason":"health checks are stale"}'
+
 
 class HealthResponse(BaseModel):
     """Health check response model"""
+
     status: str
     service: str
     version: str
@@ -26,26 +30,33 @@ router = APIRouter()
     response_model=HealthResponse,
     status_code=status.HTTP_200_OK,
     summary="Health Check",
-    description="Check if the service is healthy and running"
+    description="Check if the service is healthy and running",
 )
 async def health_check() -> HealthResponse:
     """
-    Perform health check on the service and its dependencies
+    Report the service and dependency health from the latest background probe round
     """
+    from src.infrastructure.cache.tenant_resolver import get_tenant_resolver
     from src.infrastructure.config.settings import settings
+    from src.infrastructure.database.session import pool_stats
+    from src.infrastructure.database.tenant_router import get_tenant_engines
+    from src.infrastructure.observability.health import get_health_monitor
+
+    monitor = get_health_monitor()
+    tenant_engines = get_tenant_engines()
+    resolver = get_tenant_resolver()
 
-    checks = {
-        "database": "healthy",  # TODO: Implement actual DB check
-        "redis": "healthy",     # TODO: Implement actual Redis check
-        "nats": "healthy"       # TODO: Implement actual NATS check
-    }
+    checks: Dict[str, Any] = monitor.snapshot.to_dict() if monitor else {}
+    checks["database_pool"] = pool_stats()
+    checks["tenant_pools"] = tenant_engines.stats() if tenant_engines else {}
+    checks["tenant_cache"] = resolver.stats() if resolver else {}
 
     return HealthResponse(
-        status="healthy",
+        status=monitor.snapshot.status if monitor else "unknown",
         service=settings.SERVICE_NAME,
         version=settings.SERVICE_VERSION,
         timestamp=datetime.utcnow().isoformat(),
-        checks=checks
+        checks=checks,
     )
 
 
@@ -53,35 +64,37 @@ async def health_check() -> HealthResponse:
     "/ready",
     status_code=status.HTTP_200_OK,
     summary="Readiness Check",
-    description="Check if the service is ready to accept requests"
+    description="Check if the service is ready to accept requests",
+    responses={503: {"description": "A required dependency is unhealthy"}},
 )
-async def readiness_check() -> Dict[str, str]:
+async def readiness_check() -> Response:
     """
-    Check if the service is ready to handle requests
+    Serve the readiness result cached by the health monitor
+
+    Never touches a dependency: probes run in the background, so this is
+    a constant-time read however often it is polled.
     """
-    # TODO: Implement actual readiness checks
-    # - Database migrations completed
-    # - Redis connection established
-    # - NATS connection established
-    # - Required services available
+    from src.infrastructure.observability.health import get_health_monitor
+
+    monitor = get_health_monitor()
+    if monitor is None:
+        return Response(content=NOT_STARTED, status_code=503, media_type="application/json")
 
-    return {
-        "status": "ready",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    snapshot = monitor.snapshot
+    if not monitor.ready:
+        body = snapshot.readiness_body if not snapshot.ready else STALE
+        return Response(content=body, status_code=503, media_type="application/json")
+    return Response(content=snapshot.readiness_body, media_type="application/json")
 
 
 @router.get(
     "/live",
     status_code=status.HTTP_200_OK,
     summary="Liveness Check",
-    description="Check if the service is alive"
+    description="Check if the service is alive",
 )
 async def liveness_check() -> Dict[str, str]:
     """
     Simple liveness check for Kubernetes probes
     """
-    return {
-        "status": "alive",
-        "timestamp": datetime.utcnow().isoformat()
-    }
\ No newline at end of file
+    return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
@@ -0,0 +1,16 @@
+"""
+Prometheus Metrics Endpoint
+"""
+
+from fastapi import APIRouter, Response, status
+
+from src.infrastructure.observability.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("", status_code=status.HTTP_200_OK, include_in_schema=False)
+def metrics():
+    """Prometheus scrape endpoint (sync: reading multiprocess files runs in the threadpool)"""
+    content, content_type = render_metrics()
+    return Response(content=content, headers={"Content-Type": content_type})
@@ -2,37 +2,166 @@
 LLM Provider Configuration Endpoints
 """
 
-from fastapi import APIRouter, status
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
+
+from src.adapters.inbound.rest.dependencies import (
+    get_current_claims,
+    get_provider_cache,
+    get_provider_repository,
+    get_provider_tester,
+    require_admin,
+)
+from src.domain.entities.provider import KNOWN_PROVIDERS, ProviderConfig
+from src.domain.ports.repositories.provider_repository import ProviderConfigRepository
+from src.infrastructure.cache.provider_cache import ProviderConfigCache
+from src.infrastructure.nats.client import get_nats
+from src.infrastructure.providers.connectivity import ProviderTester
 
 router = APIRouter()
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
-async def list_providers():
-    """List configured LLM providers - TODO: Implement"""
-    return {
-        "providers": [
-            {"name": "openai", "enabled": False},
-            {"name": "anthropic", "enabled": False},
-            {"name": "google", "enabled": False},
-            {"name": "groq", "enabled": False}
-        ]
-    }
+class ProviderConfigRequest(BaseModel):
+    """Provider settings; omit ``api_key`` to keep the stored one"""
+
+    enabled: bool = True
+    api_key: Optional[str] = None
+    base_url: Optional[str] = None
+    default_model: Optional[str] = None
+    models: List[str] = []
+    settings: Dict[str, Any] = {}
+
+
+def _tenant_id(request: Request) -> str:
+    tenant_id = getattr(request.state, "tenant_id", None)
+    if not tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Tenant context required"
+        )
+    return str(request.state.tenant.id) if hasattr(request.state, "tenant") else tenant_id
+
+
+def _known_provider(provider: str) -> str:
+    provider = provider.lower()
+    if provider not in KNOWN_PROVIDERS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown provider {provider!r}"
+        )
+    return provider
+
+
+@router.get("/", status_code=status.HTTP_200_OK, dependencies=[Depends(get_current_claims)])
+async def list_providers(
+    request: Request, cache: ProviderConfigCache = Depends(get_provider_cache)
+):
+    """
+    List the LLM providers and the current tenant's configuration of each
+    """
+    configs = await cache.get_all(_tenant_id(request))
+    providers = []
+    for name in KNOWN_PROVIDERS:
+        config = configs.get(name)
+        if config is None:
+            providers.append({"name": name, "enabled": False, "has_api_key": False})
+        else:
+            providers.append({"name": name, **config.to_dict()})
+    return {"providers": providers}
+
+
+@router.put("/{provider}", status_code=status.HTTP_200_OK, dependencies=[Depends(require_admin)])
+async def configure_provider(
+    provider: str,
+    body: ProviderConfigRequest,
+    request: Request,
+    repository: ProviderConfigRepository = Depends(get_provider_repository),
+    cache: ProviderConfigCache = Depends(get_provider_cache),
+):
+    """
+    Create or update the current tenant's configuration of a provider
+
+    The API key is encrypted before it is stored and is never returned.
+    """
+    provider = _known_provider(provider)
+    tenant_id = _tenant_id(request)
+
+    existing = {c.provider: c for c in await repository.list_for_tenant(tenant_id)}.get(provider)
+    config = ProviderConfig(
+        tenant_id=tenant_id,
+        provider=provider,
+        enabled=body.enabled,
+        api_key=body.api_key
+        if body.api_key is not None
+        else (existing.api_key if existing else None),
+        base_url=body.base_url,
+        default_model=body.default_model,
+        models=body.models,
+        settings=body.settings,
+    )
+    if existing is not None:
+        config.created_at = existing.created_at
+
+    await repository.save(config)
+    await cache.invalidate(tenant_id, get_nats())
+    return config.to_dict()
+
 
+@router.delete(
+    "/{provider}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_admin)]
+)
+async def remove_provider(
+    provider: str,
+    request: Request,
+    repository: ProviderConfigRepository = Depends(get_provider_repository),
+    cache: ProviderConfigCache = Depends(get_provider_cache),
+):
+    """
+    Remove the current tenant's configuration of a provider
+    """
+    provider = _known_provider(provider)
+    tenant_id = _tenant_id(request)
 
-@router.put("/{provider}", status_code=status.HTTP_200_OK)
-async def configure_provider(provider: str):
-    """Configure LLM provider - TODO: Implement"""
-    return {"provider": provider, "message": "Configuration - To be implemented"}
+    if not await repository.delete(tenant_id, provider):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Provider is not configured"
+        )
+    await cache.invalidate(tenant_id, get_nats())
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.delete("/{provider}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_provider(provider: str):
-    """Remove provider configuration - TODO: Implement"""
-    return None
+@router.post("/test", status_code=status.HTTP_200_OK, dependencies=[Depends(require_admin)])
+async def test_providers(
+    request: Request,
+    force: bool = Query(False, description="Test again even if a recent result exists"),
+    cache: ProviderConfigCache = Depends(get_provider_cache),
+    tester: ProviderTester = Depends(get_provider_tester),
+):
+    """
+    Test every enabled provider of the current tenant concurrently
+    """
+    configs = await cache.get_all(_tenant_id(request))
+    results = await tester.test_all((c for c in configs.values() if c.enabled), force)
+    return {"results": [result.to_dict() for result in results]}
 
 
-@router.post("/{provider}/test", status_code=status.HTTP_200_OK)
-async def test_provider(provider: str):
-    """Test provider connection - TODO: Implement"""
-    return {"provider": provider, "status": "pending", "message": "Test - To be implemented"}
\ No newline at end of file
+@router.post(
+    "/{provider}/test", status_code=status.HTTP_200_OK, dependencies=[Depends(require_admin)]
+)
+async def test_provider(
+    provider: str,
+    request: Request,
+    force: bool = Query(False, description="Test again even if a recent result exists"),
+    cache: ProviderConfigCache = Depends(get_provider_cache),
+    tester: ProviderTester = Depends(get_provider_tester),
+):
+    """
+    Test the current tenant's credentials for a provider
+    """
+    provider = _known_provider(provider)
+    config = await cache.get(_tenant_id(request), provider)
+    if config is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Provider is not configured"
+        )
+    return (await tester.test(config, force)).to_dict()
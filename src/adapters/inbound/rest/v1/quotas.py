@@ -2,19 +2,43 @@
 Quota Management Endpoints
 """
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, HTTPException, Request, status
+
+from src.infrastructure.metering.quota_meter import METERED_QUOTAS, current_period, get_quota_meter
 
 router = APIRouter()
 
 
+def _tenant_id(request: Request) -> str:
+    tenant_id = getattr(request.state, "tenant_id", None)
+    if not tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Tenant context required"
+        )
+    return str(request.state.tenant.id) if hasattr(request.state, "tenant") else tenant_id
+
+
+def _usage(tenant_id: str) -> dict:
+    meter = get_quota_meter()
+    if meter is None:
+        return {quota_type: 0 for quota_type in METERED_QUOTAS}
+    return {quota_type: meter.usage(tenant_id, quota_type) for quota_type in METERED_QUOTAS}
+
+
 @router.get("/", status_code=status.HTTP_200_OK)
-async def get_quotas():
-    """Get tenant quotas - TODO: Implement"""
+async def get_quotas(request: Request):
+    """Get tenant quotas"""
+    tenant_id = _tenant_id(request)
+    tenant = getattr(request.state, "tenant", None)
+    usage = _usage(tenant_id)
+
     return {
         "quotas": {
-            "users": {"used": 0, "limit": 10},
-            "requests": {"used": 0, "limit": 10000},
-            "storage": {"used": 0, "limit": 10}
+            quota_type: {
+                "used": usage[quota_type],
+                "limit": tenant.quota_limit(quota_type) if tenant else None,
+            }
+            for quota_type in METERED_QUOTAS
         }
     }
 
@@ -26,13 +50,6 @@ async def update_quotas():
 
 
 @router.get("/usage", status_code=status.HTTP_200_OK)
-async def get_usage():
-    """Get current usage - TODO: Implement"""
-    return {
-        "usage": {
-            "users": 0,
-            "requests": 0,
-            "storage": 0
-        },
-        "period": "current_month"
-    }
\ No newline at end of file
+async def get_usage(request: Request):
+    """Get current usage"""
+    return {"usage": _usage(_tenant_id(request)), "period": current_period()}
@@ -2,15 +2,140 @@
 Tenant Management Endpoints
 """
 
-from fastapi import APIRouter, status
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from pydantic import BaseModel, Field, field_validator
+
+from src.adapters.inbound.rest.batch import (
+    RowRejected,
+    RowResult,
+    batch_openapi,
+    batch_response,
+    row_errors,
+    upload_rows,
+)
+from src.adapters.inbound.rest.dependencies import get_tenant_repository, require_platform_admin
+from src.adapters.inbound.rest.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    ndjson_response,
+)
+from src.domain.entities.tenant import TIER_POLICIES, Tenant, TenantTier
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.infrastructure.cache.tenant_resolver import get_tenant_resolver
+from src.infrastructure.fastapi.responses import FastJSONResponse
+from src.infrastructure.nats.client import get_nats
 
 router = APIRouter()
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
-async def list_tenants():
-    """List all tenants - TODO: Implement"""
-    return {"tenants": [], "total": 0}
+class BatchTenantRow(BaseModel):
+    """One row of a tenant batch upload; tenants are created pending activation"""
+
+    name: str = Field(min_length=1, max_length=255)
+    slug: Optional[str] = Field(default=None, max_length=255, pattern=r"^[\w-]+$")
+    tier: TenantTier = TenantTier.FREE
+    organization_name: str = Field(default="", max_length=255)
+    organization_domain: Optional[str] = Field(default=None, max_length=255)
+    organization_size: Optional[str] = Field(default=None, max_length=64)
+    primary_contact_email: str = Field(default="", max_length=320)
+    primary_contact_name: Optional[str] = Field(default=None, max_length=255)
+    billing_email: Optional[str] = Field(default=None, max_length=320)
+    features: List[Annotated[str, Field(max_length=64)]] = Field(default_factory=list)
+
+    @field_validator("features", mode="before")
+    @classmethod
+    def split_features(cls, value: Any) -> Any:
+        """CSV uploads list features separated by semicolons"""
+        if isinstance(value, str):
+            return [feature.strip() for feature in value.split(";") if feature.strip()]
+        return value
+
+
+@router.get("/", status_code=status.HTTP_200_OK, dependencies=[Depends(require_platform_admin)])
+async def list_tenants(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    include_total: bool = Query(False, description="Include an approximate total count"),
+    repository: TenantRepository = Depends(get_tenant_repository),
+):
+    """
+    List tenants one page at a time in creation order
+
+    Pass ``next_cursor`` back as ``cursor`` to get the following page; it is
+    null on the last page. ``total`` is a planner estimate, not an exact count.
+    """
+    page = await repository.list_page(limit, decode_cursor(cursor))
+    total = await repository.count_estimate() if include_total else None
+    return FastJSONResponse(
+        {
+            "tenants": page.items,
+            "next_cursor": encode_cursor(page.next_cursor),
+            "total": total,
+        }
+    )
+
+
+@router.get(
+    "/export", status_code=status.HTTP_200_OK, dependencies=[Depends(require_platform_admin)]
+)
+async def export_tenants(repository: TenantRepository = Depends(get_tenant_repository)):
+    """
+    Stream every tenant as newline-delimited JSON
+    """
+    return ndjson_response(repository.stream_all(), "tenants.ndjson")
+
+
+@router.post(
+    ":batch",
+    status_code=status.HTTP_200_OK,
+    openapi_extra=batch_openapi(),
+    dependencies=[Depends(require_platform_admin)],
+)
+async def create_tenants_batch(
+    request: Request,
+    errors_only: bool = Query(False, description="Only stream lines for rejected rows"),
+    repository: TenantRepository = Depends(get_tenant_repository),
+):
+    """
+    Create tenants from an NDJSON, CSV or JSON array upload
+
+    Quotas follow the tier. Rows are written with multi-row inserts; taken
+    slugs are reported, not updated.
+    """
+
+    def validate(row: Dict[str, Any]) -> Tuple[str, Tenant]:
+        body = BatchTenantRow.model_validate(row)
+        policy = TIER_POLICIES[body.tier]
+        tenant = Tenant(
+            **body.model_dump(exclude={"slug", "features"}),
+            slug=body.slug or "",
+            features=frozenset(body.features),
+            max_users=policy.max_users,
+            max_requests_per_month=policy.max_requests_per_month,
+            max_storage_gb=policy.max_storage_gb,
+        )
+        if not tenant.slug:
+            raise RowRejected(row_errors("slug", "Cannot derive a slug from the name; set one"))
+        return tenant.slug, tenant
+
+    async def write(tenants: List[Tenant]) -> List[RowResult]:
+        inserted = await repository.insert_new(tenants)
+        resolver = get_tenant_resolver()
+        if resolver is not None and inserted:
+            # New ids and slugs may be cached as unknown tenants
+            await resolver.publish_invalidation(
+                get_nats(), [tenant for tenant in tenants if tenant.id in inserted]
+            )
+        return [
+            tenant.id if tenant.id in inserted else row_errors("slug", "Slug already taken")
+            for tenant in tenants
+        ]
+
+    return batch_response(await upload_rows(request), validate, write, errors_only)
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
@@ -34,4 +159,4 @@ async def update_tenant(tenant_id: str):
 @router.delete("/{tenant_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_tenant(tenant_id: str):
     """Delete tenant - TODO: Implement"""
-    return None
\ No newline at end of file
+    return None
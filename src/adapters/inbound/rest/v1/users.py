@@ -2,21 +2,212 @@
 User Management Endpoints
 """
 
-from fastapi import APIRouter, status
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, Field
+
+from src.adapters.inbound.rest.batch import (
+    RowRejected,
+    RowResult,
+    batch_openapi,
+    batch_response,
+    row_errors,
+    upload_rows,
+)
+from src.adapters.inbound.rest.dependencies import (
+    get_current_tenant_id,
+    get_password_service,
+    get_user_repository,
+    require_admin,
+)
+from src.adapters.inbound.rest.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    ndjson_response,
+)
+from src.domain.entities.user import User, UserRole
+from src.domain.ports.repositories.user_repository import EmailTakenError, UserRepository
+from src.infrastructure.fastapi.responses import FastJSONResponse
+from src.infrastructure.metering.quota_meter import get_quota_meter
+from src.infrastructure.security.passwords import (
+    PasswordPolicyError,
+    PasswordService,
+    PasswordServiceBusyError,
+    password_policy_violations,
+)
 
 router = APIRouter()
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
-async def list_users():
-    """List users - TODO: Implement"""
-    return {"users": [], "total": 0}
+class CreateUserRequest(BaseModel):
+    """New user of the current tenant"""
+
+    email: str
+    password: str
+    full_name: Optional[str] = None
+    role: UserRole = UserRole.MEMBER
+
+
+class BatchUserRow(BaseModel):
+    """One row of a user batch upload; users without a password sign in through SSO"""
+
+    email: str = Field(max_length=320, pattern=r"^[^@\s]+@[^@\s]+$")
+    password: Optional[str] = None
+    full_name: Optional[str] = Field(default=None, max_length=255)
+    role: UserRole = UserRole.MEMBER
+
+
+@router.get("/", status_code=status.HTTP_200_OK, dependencies=[Depends(require_admin)])
+async def list_users(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    include_total: bool = Query(False, description="Include an approximate total count"),
+    repository: UserRepository = Depends(get_user_repository),
+):
+    """
+    List the current tenant's users one page at a time in creation order
+    """
+    page = await repository.list_page(limit, decode_cursor(cursor))
+    total = await repository.count_estimate() if include_total else None
+    return FastJSONResponse(
+        {
+            "users": page.items,
+            "next_cursor": encode_cursor(page.next_cursor),
+            "total": total,
+        }
+    )
+
+
+@router.get("/export", status_code=status.HTTP_200_OK, dependencies=[Depends(require_admin)])
+async def export_users(repository: UserRepository = Depends(get_user_repository)):
+    """
+    Stream every user of the current tenant as newline-delimited JSON
+    """
+    return ndjson_response(repository.stream_all(), "users.ndjson")
+
+
+@router.post(
+    ":batch",
+    status_code=status.HTTP_200_OK,
+    openapi_extra=batch_openapi(),
+    dependencies=[Depends(require_admin)],
+)
+async def create_users_batch(
+    request: Request,
+    errors_only: bool = Query(False, description="Only stream lines for rejected rows"),
+    tenant_id: UUID = Depends(get_current_tenant_id),
+    repository: UserRepository = Depends(get_user_repository),
+    passwords: PasswordService = Depends(get_password_service),
+):
+    """
+    Create users of the current tenant from an NDJSON, CSV or JSON array upload
 
+    Rows are checked against the password policy as they are validated,
+    passwords are hashed in the password worker pool a chunk at a time, and
+    users are written with COPY. Existing emails are reported, not updated,
+    and so are rows past the tenant's user quota.
+    """
+    tenant = getattr(request.state, "tenant", None)
+    meter = get_quota_meter()
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_user():
-    """Create user - TODO: Implement"""
-    return {"message": "User creation - To be implemented"}
+    def validate(row: Dict[str, Any]) -> Tuple[str, Tuple[User, Optional[str]]]:
+        body = BatchUserRow.model_validate(row)
+        if body.password is not None:
+            violations = password_policy_violations(body.password)
+            if violations:
+                raise RowRejected(
+                    [{"field": "password", "message": violation} for violation in violations]
+                )
+        user = User(tenant_id=tenant_id, email=body.email, full_name=body.full_name, role=body.role)
+        return user.email, (user, body.password)
+
+    async def write(items: List[Tuple[User, Optional[str]]]) -> List[RowResult]:
+        results: List[Optional[RowResult]] = [None] * len(items)
+        headroom = (
+            meter.headroom(tenant, "users") if meter is not None and tenant is not None else None
+        )
+        if headroom is not None:
+            for index in range(headroom, len(items)):
+                results[index] = row_errors("row", "User quota exceeded")
+
+        with_password = [
+            index
+            for index, (_, password) in enumerate(items)
+            if password is not None and results[index] is None
+        ]
+        try:
+            hashes = await passwords.hash_many([items[index][1] for index in with_password])
+        except PasswordServiceBusyError as exc:
+            # Users without a password are still written
+            for index in with_password:
+                results[index] = row_errors("password", str(exc))
+        else:
+            for index, password_hash in zip(with_password, hashes):
+                items[index][0].password_hash = password_hash
+
+        pending = [user for (user, _), result in zip(items, results) if result is None]
+        inserted = await repository.insert_new(pending)
+        if meter is not None and inserted:
+            meter.record(str(tenant_id), "users", len(inserted))
+        return [
+            result
+            if result is not None
+            else user.id
+            if user.id in inserted
+            else row_errors("email", "Email already registered")
+            for (user, _), result in zip(items, results)
+        ]
+
+    return batch_response(await upload_rows(request), validate, write, errors_only)
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_admin)])
+async def create_user(
+    body: CreateUserRequest,
+    request: Request,
+    tenant_id: UUID = Depends(get_current_tenant_id),
+    repository: UserRepository = Depends(get_user_repository),
+    passwords: PasswordService = Depends(get_password_service),
+):
+    """
+    Create a user of the current tenant
+
+    The password is checked against the password policy before it is hashed.
+    """
+    tenant = getattr(request.state, "tenant", None)
+    meter = get_quota_meter()
+    if meter is not None and tenant is not None and meter.is_quota_exceeded(tenant, "users"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User quota exceeded")
+
+    user = User(tenant_id=tenant_id, email=body.email, full_name=body.full_name, role=body.role)
+    if await repository.get_by_email(user.email) is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
+
+    try:
+        user.password_hash = await passwords.hash(body.password)
+    except PasswordPolicyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={"password": exc.violations},
+        )
+    except PasswordServiceBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        )
+
+    try:
+        await repository.save(user)
+    except EmailTakenError:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
+    if meter is not None:
+        meter.record(str(tenant_id), "users")
+    return FastJSONResponse(user, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{user_id}", status_code=status.HTTP_200_OK)
@@ -31,7 +222,21 @@ async def update_user(user_id: str):
     return {"user_id": user_id, "message": "To be implemented"}
 
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(user_id: str):
-    """Delete user - TODO: Implement"""
-    return None
\ No newline at end of file
+@router.delete(
+    "/{user_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_admin)]
+)
+async def delete_user(
+    user_id: UUID,
+    tenant_id: UUID = Depends(get_current_tenant_id),
+    repository: UserRepository = Depends(get_user_repository),
+):
+    """
+    Delete a user of the current tenant, freeing a place in its user quota
+    """
+    if not await repository.delete(user_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    meter = get_quota_meter()
+    if meter is not None:
+        meter.record(str(tenant_id), "users", -1)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
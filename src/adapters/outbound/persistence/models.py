@@ -0,0 +1,139 @@
+"""
+SQLAlchemy Persistence Models
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    """Declarative base for control-plane tables"""
+
+
+class TenantBase(DeclarativeBase):
+    """Declarative base for tables living in each tenant database"""
+
+
+class TenantModel(Base):
+    """Tenant row; mapped to and from the Tenant domain entity"""
+
+    __tablename__ = "tenants"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(255))
+    slug: Mapped[str] = mapped_column(String(255), unique=True)
+    status: Mapped[str] = mapped_column(String(32), index=True)
+    tier: Mapped[str] = mapped_column(String(32))
+
+    organization_name: Mapped[str] = mapped_column(String(255), default="")
+    organization_domain: Mapped[Optional[str]] = mapped_column(String(255))
+    organization_size: Mapped[Optional[str]] = mapped_column(String(64))
+
+    primary_contact_email: Mapped[str] = mapped_column(String(320), default="")
+    primary_contact_name: Mapped[Optional[str]] = mapped_column(String(255))
+    billing_email: Mapped[Optional[str]] = mapped_column(String(320))
+
+    settings: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+    features: Mapped[List[str]] = mapped_column(ARRAY(String(64)), default=list)
+
+    max_users: Mapped[int] = mapped_column(Integer)
+    max_requests_per_month: Mapped[int] = mapped_column(BigInteger)
+    max_storage_gb: Mapped[int] = mapped_column(Integer)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+    activated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    suspended_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_tenants_created_at_id", "created_at", "id"),
+    )
+
+
+class TenantUsageModel(Base):
+    """Aggregated quota usage per tenant, quota type and billing period"""
+
+    __tablename__ = "tenant_usage"
+
+    tenant_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    quota_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    period: Mapped[str] = mapped_column(String(16), primary_key=True)
+    used: Mapped[int] = mapped_column(BigInteger, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class ProviderConfigModel(Base):
+    """Tenant LLM provider settings; ``api_key`` holds AES-GCM ciphertext"""
+
+    __tablename__ = "provider_configs"
+
+    tenant_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    provider: Mapped[str] = mapped_column(String(32), primary_key=True)
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True)
+    api_key: Mapped[Optional[bytes]] = mapped_column(LargeBinary)
+    base_url: Mapped[Optional[str]] = mapped_column(String(2048))
+    default_model: Mapped[Optional[str]] = mapped_column(String(255))
+    models: Mapped[List[str]] = mapped_column(ARRAY(String(255)), default=list)
+    settings: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+class OutboxEventModel(Base):
+    """Domain event written with the change that raised it, awaiting relay to NATS"""
+
+    __tablename__ = "event_outbox"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(64))
+    aggregate_id: Mapped[str] = mapped_column(String(64))
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    # Set while a relay publishes the row; an expired claim is taken over
+    claimed_until: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    __table_args__ = (
+        # Relay order; rows are deleted once published, so the index stays small
+        Index("ix_event_outbox_created_at", "created_at"),
+    )
+
+
+class UserModel(TenantBase):
+    """User row in a tenant database; mapped to and from the User entity"""
+
+    __tablename__ = "users"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    tenant_id: Mapped[UUID] = mapped_column()
+    email: Mapped[str] = mapped_column(String(320))
+    full_name: Mapped[Optional[str]] = mapped_column(String(255))
+    role: Mapped[str] = mapped_column(String(32))
+    status: Mapped[str] = mapped_column(String(32))
+    password_hash: Mapped[Optional[str]] = mapped_column(String(255))
+
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+    last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    __table_args__ = (
+        # Databases may be shared by several tenants, so emails are unique per tenant
+        UniqueConstraint("tenant_id", "email", name="uq_users_tenant_id_email"),
+        # Keyset pagination order within a tenant
+        Index("ix_users_tenant_id_created_at_id", "tenant_id", "created_at", "id"),
+    )
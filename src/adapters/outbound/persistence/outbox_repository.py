@@ -0,0 +1,124 @@
+"""
+SQLAlchemy Event Outbox Adapter
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import DateTime, delete, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.outbound.persistence.models import OutboxEventModel
+from src.domain.entities.events import DomainEvent
+from src.domain.ports.repositories.outbox_repository import EventOutbox, OutboxMessage, Publisher
+from src.infrastructure.serialization.encoder import dumps
+
+# Five columns per row, far below Postgres' bind parameter cap
+INSERT_CHUNK_SIZE = 1000
+
+# Advisory lock held by the replica currently relaying the outbox
+RELAY_LOCK_ID = 0x6F7574626F78  # "outbox"
+
+
+def event_to_row(event: DomainEvent) -> Dict[str, Any]:
+    """Map a domain event to outbox column values, encoding it once"""
+    return {
+        "id": event.id,
+        "event_type": event.type,
+        "aggregate_id": event.aggregate_id,
+        "payload": dumps(event),
+        "created_at": event.occurred_at,
+    }
+
+
+async def add_events(session: AsyncSession, events: Sequence[DomainEvent]) -> None:
+    """
+    Store events within a caller-managed transaction, so they are committed
+    (or rolled back) together with the change that raised them
+    """
+    for start in range(0, len(events), INSERT_CHUNK_SIZE):
+        rows = [event_to_row(event) for event in events[start : start + INSERT_CHUNK_SIZE]]
+        await session.execute(insert(OutboxEventModel), rows)
+
+
+class SqlAlchemyEventOutbox(EventOutbox):
+    """
+    Event outbox in the control-plane Postgres database
+
+    A batch is claimed in a short transaction that stamps its rows with a
+    lease (``claimed_until``) and commits before anything is published;
+    delivered rows are then deleted, and the rest released, in a second
+    short transaction, so no transaction stays open while the broker is
+    waited on. An advisory lock serializes claiming, and no batch is
+    claimed while another one's lease runs, so one replica relays at a
+    time and events leave in creation order. If a relay dies mid-batch,
+    its lease expires and the rows are published again (at-least-once);
+    the broker drops the duplicates by event id.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        lease_seconds: float = 60.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._lease = timedelta(seconds=lease_seconds)
+        table = OutboxEventModel.__table__
+        self._table = table
+        self._lock = select(func.pg_try_advisory_xact_lock(RELAY_LOCK_ID))
+        self._now = func.timezone("utc", func.now(), type_=DateTime)
+        self._in_flight = select(exists().where(table.c.claimed_until > self._now))
+        self._pending = select(table.c.id).order_by(table.c.created_at)
+        self._returning = (
+            table.c.id,
+            table.c.event_type,
+            table.c.aggregate_id,
+            table.c.payload,
+            table.c.created_at,
+        )
+
+    async def relay_batch(self, limit: int, publish: Publisher) -> int:
+        messages = await self._claim(limit)
+        if not messages:
+            return 0
+
+        delivered: List[UUID] = []
+        try:
+            delivered = list(await publish(messages))
+        finally:
+            await self._settle(messages, delivered)
+        return len(delivered)
+
+    async def _claim(self, limit: int) -> List[OutboxMessage]:
+        table = self._table
+        async with self._session_factory() as session:
+            async with session.begin():
+                if not await session.scalar(self._lock) or await session.scalar(self._in_flight):
+                    return []
+                result = await session.execute(
+                    update(table)
+                    .where(table.c.id.in_(self._pending.limit(limit)))
+                    .values(claimed_until=self._now + self._lease)
+                    .returning(*self._returning)
+                )
+                rows = sorted(result, key=lambda row: row.created_at)
+        return [OutboxMessage(*row[:4]) for row in rows]
+
+    async def _settle(self, messages: Sequence[OutboxMessage], delivered: Sequence[UUID]) -> None:
+        """Delete the delivered rows and release the claim on the rest"""
+        table = self._table
+        done = set(delivered)
+        undelivered = [message.id for message in messages if message.id not in done]
+        async with self._session_factory() as session:
+            async with session.begin():
+                if done:
+                    await session.execute(delete(table).where(table.c.id.in_(done)))
+                if undelivered:
+                    await session.execute(
+                        update(table).where(table.c.id.in_(undelivered)).values(claimed_until=None)
+                    )
+
+    async def pending(self) -> int:
+        async with self._session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(OutboxEventModel))
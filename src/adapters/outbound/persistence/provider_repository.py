@@ -0,0 +1,106 @@
+"""
+SQLAlchemy Provider Configuration Repository Adapter
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.outbound.persistence.models import ProviderConfigModel
+from src.domain.entities.provider import ProviderConfig
+from src.domain.ports.repositories.provider_repository import ProviderConfigRepository
+from src.infrastructure.security.encryption import SecretBox
+
+_COLUMNS = [column.name for column in ProviderConfigModel.__table__.columns]
+_UPDATABLE_COLUMNS = [
+    name for name in _COLUMNS if name not in ("tenant_id", "provider", "created_at")
+]
+
+
+def secret_context(tenant_id: str, provider: str) -> str:
+    """Associated data binding an encrypted API key to its tenant and provider"""
+    return f"{tenant_id}:{provider}"
+
+
+def config_to_row(config: ProviderConfig, box: SecretBox) -> Dict[str, Any]:
+    """Map a ProviderConfig entity to column values, encrypting the API key"""
+    api_key = None
+    if config.api_key:
+        api_key = box.encrypt(config.api_key, secret_context(config.tenant_id, config.provider))
+    return {
+        "tenant_id": config.tenant_id,
+        "provider": config.provider,
+        "enabled": config.enabled,
+        "api_key": api_key,
+        "base_url": config.base_url,
+        "default_model": config.default_model,
+        "models": list(config.models),
+        "settings": dict(config.settings),
+        "created_at": config.created_at,
+        "updated_at": config.updated_at,
+    }
+
+
+def row_to_config(row: Any, box: SecretBox) -> ProviderConfig:
+    """Map a ProviderConfigModel row to a ProviderConfig entity, decrypting the API key"""
+    api_key = None
+    if row.api_key:
+        api_key = box.decrypt(bytes(row.api_key), secret_context(row.tenant_id, row.provider))
+    return ProviderConfig(
+        tenant_id=row.tenant_id,
+        provider=row.provider,
+        enabled=row.enabled,
+        api_key=api_key,
+        base_url=row.base_url,
+        default_model=row.default_model,
+        models=row.models or (),
+        settings=row.settings or {},
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+class SqlAlchemyProviderConfigRepository(ProviderConfigRepository):
+    """
+    Provider configurations in the control-plane database with API keys
+    stored as AES-GCM ciphertext
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], box: SecretBox) -> None:
+        self._session_factory = session_factory
+        self._box = box
+        self._select = select(*ProviderConfigModel.__table__.columns)
+
+    async def list_for_tenant(self, tenant_id: str) -> List[ProviderConfig]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                self._select.where(ProviderConfigModel.tenant_id == tenant_id).order_by(
+                    ProviderConfigModel.provider
+                )
+            )
+            return [row_to_config(row, self._box) for row in result]
+
+    async def save(self, config: ProviderConfig) -> None:
+        config.updated_at = datetime.utcnow()
+        statement = insert(ProviderConfigModel).values(config_to_row(config, self._box))
+        statement = statement.on_conflict_do_update(
+            index_elements=[ProviderConfigModel.tenant_id, ProviderConfigModel.provider],
+            set_={name: statement.excluded[name] for name in _UPDATABLE_COLUMNS},
+        )
+        async with self._session_factory() as session:
+            async with session.begin():
+                await session.execute(statement)
+
+    async def delete(self, tenant_id: str, provider: str) -> bool:
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    delete(ProviderConfigModel).where(
+                        ProviderConfigModel.tenant_id == tenant_id,
+                        ProviderConfigModel.provider == provider,
+                    )
+                )
+        return result.rowcount > 0
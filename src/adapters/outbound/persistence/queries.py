@@ -0,0 +1,78 @@
+"""
+Shared Query Helpers for Persistence Adapters
+"""
+
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+
+from sqlalchemy import ColumnElement, Select, Table, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.ports.repositories.pagination import Cursor, Page
+
+T = TypeVar("T")
+
+
+async def keyset_page(
+    session: AsyncSession,
+    statement: Select,
+    table: Table,
+    limit: int,
+    after: Optional[Cursor],
+    mapper: Callable[[Any], T],
+) -> Page[T]:
+    """
+    Fetch one page in (created_at, id) order using a row-value comparison,
+    which the (created_at, id) index answers without scanning skipped rows
+    """
+    order = (table.c.created_at, table.c.id)
+    if after is not None:
+        statement = statement.where(tuple_(*order) > tuple_(*after))
+    # One extra row tells whether another page exists
+    statement = statement.order_by(*order).limit(limit + 1)
+
+    rows = (await session.execute(statement)).all()
+    items = [mapper(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = (last.created_at, last.id)
+    return Page(items=items, next_cursor=next_cursor)
+
+
+async def stream_rows(
+    session: AsyncSession,
+    statement: Select,
+    table: Table,
+    batch_size: int,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over a query through a server-side cursor, ``batch_size`` rows
+    at a time, so memory stays flat regardless of the result size
+    """
+    statement = statement.order_by(table.c.created_at, table.c.id)
+    result = await session.stream(statement.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        for row in partition:
+            yield row
+
+
+async def count_estimate(
+    session: AsyncSession, table: Table, where: Optional[ColumnElement] = None
+) -> int:
+    """
+    Read the planner's row estimate instead of running COUNT(*)
+
+    Falls back to an exact count for tables that were never analyzed. The
+    planner keeps no estimate per filter, so rows matching ``where`` are
+    counted exactly; it should be answered by an index.
+    """
+    if where is not None:
+        return await session.scalar(select(func.count()).select_from(table).where(where))
+
+    estimate = await session.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"),
+        {"name": table.name},
+    )
+    if estimate is None or estimate < 0:
+        return await session.scalar(select(func.count()).select_from(table))
+    return int(estimate)
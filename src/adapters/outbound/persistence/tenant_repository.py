@@ -0,0 +1,177 @@
+"""
+SQLAlchemy Tenant Repository Adapter
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.outbound.persistence.models import TenantModel
+from src.adapters.outbound.persistence.outbox_repository import add_events
+from src.adapters.outbound.persistence.queries import count_estimate, keyset_page, stream_rows
+from src.domain.entities.tenant import Tenant, TenantStatus, TenantTier
+from src.domain.ports.repositories.pagination import Cursor, Page
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+
+# Postgres caps a statement at 32767 bind parameters; 20 columns per row
+UPSERT_CHUNK_SIZE = 1000
+
+_COLUMNS = [column.name for column in TenantModel.__table__.columns]
+_UPDATABLE_COLUMNS = [name for name in _COLUMNS if name not in ("id", "created_at")]
+
+
+def tenant_to_row(tenant: Tenant) -> Dict[str, Any]:
+    """Map a Tenant entity to column values"""
+    return {
+        "id": tenant.id,
+        "name": tenant.name,
+        "slug": tenant.slug,
+        "status": tenant.status.value,
+        "tier": tenant.tier.value,
+        "organization_name": tenant.organization_name,
+        "organization_domain": tenant.organization_domain,
+        "organization_size": tenant.organization_size,
+        "primary_contact_email": tenant.primary_contact_email,
+        "primary_contact_name": tenant.primary_contact_name,
+        "billing_email": tenant.billing_email,
+        "settings": dict(tenant.settings),
+        "features": sorted(tenant.features),
+        "max_users": tenant.max_users,
+        "max_requests_per_month": tenant.max_requests_per_month,
+        "max_storage_gb": tenant.max_storage_gb,
+        "created_at": tenant.created_at,
+        "updated_at": tenant.updated_at,
+        "activated_at": tenant.activated_at,
+        "suspended_at": tenant.suspended_at,
+    }
+
+
+def row_to_tenant(row: Any) -> Tenant:
+    """Map a TenantModel (or a row with the same columns) to a Tenant entity"""
+    return Tenant(
+        id=row.id,
+        name=row.name,
+        slug=row.slug,
+        status=TenantStatus(row.status),
+        tier=TenantTier(row.tier),
+        organization_name=row.organization_name,
+        organization_domain=row.organization_domain,
+        organization_size=row.organization_size,
+        primary_contact_email=row.primary_contact_email,
+        primary_contact_name=row.primary_contact_name,
+        billing_email=row.billing_email,
+        settings=row.settings or {},
+        features=row.features or (),
+        max_users=row.max_users,
+        max_requests_per_month=row.max_requests_per_month,
+        max_storage_gb=row.max_storage_gb,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        activated_at=row.activated_at,
+        suspended_at=row.suspended_at,
+    )
+
+
+class SqlAlchemyTenantRepository(TenantRepository):
+    """
+    Tenant repository backed by the control-plane Postgres database
+
+    Reads select plain column tuples rather than ORM instances, skipping
+    identity-map bookkeeping; writes are multi-row INSERT ... ON CONFLICT.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self._select = select(*TenantModel.__table__.columns)
+
+    async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        async with self._session_factory() as session:
+            result = await session.execute(self._select.where(TenantModel.id == tenant_id))
+            row = result.first()
+        return row_to_tenant(row) if row else None
+
+    async def get_by_slug(self, slug: str) -> Optional[Tenant]:
+        async with self._session_factory() as session:
+            result = await session.execute(self._select.where(TenantModel.slug == slug))
+            row = result.first()
+        return row_to_tenant(row) if row else None
+
+    async def get_many(self, tenant_ids: Sequence[UUID]) -> List[Tenant]:
+        if not tenant_ids:
+            return []
+        async with self._session_factory() as session:
+            result = await session.execute(self._select.where(TenantModel.id.in_(tenant_ids)))
+            return [row_to_tenant(row) for row in result]
+
+    async def list_page(self, limit: int, after: Optional[Cursor] = None) -> Page[Tenant]:
+        async with self._session_factory() as session:
+            return await keyset_page(
+                session, self._select, TenantModel.__table__, limit, after, row_to_tenant
+            )
+
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[Tenant]:
+        async with self._session_factory() as session:
+            async for row in stream_rows(session, self._select, TenantModel.__table__, batch_size):
+                yield row_to_tenant(row)
+
+    async def count_estimate(self) -> int:
+        async with self._session_factory() as session:
+            return await count_estimate(session, TenantModel.__table__)
+
+    async def save(self, tenant: Tenant) -> None:
+        await self.upsert_many([tenant])
+
+    async def upsert_many(self, tenants: Sequence[Tenant]) -> int:
+        if not tenants:
+            return 0
+        async with self._session_factory() as session:
+            async with session.begin():
+                await self.upsert_in(session, tenants)
+        return len(tenants)
+
+    async def insert_new(self, tenants: Sequence[Tenant]) -> Set[UUID]:
+        inserted: Set[UUID] = set()
+        if not tenants:
+            return inserted
+        async with self._session_factory() as session:
+            async with session.begin():
+                for start in range(0, len(tenants), UPSERT_CHUNK_SIZE):
+                    rows = [
+                        tenant_to_row(tenant)
+                        for tenant in tenants[start : start + UPSERT_CHUNK_SIZE]
+                    ]
+                    # No conflict target: a taken id or slug both skip the row
+                    statement = insert(TenantModel).values(rows).on_conflict_do_nothing()
+                    result = await session.execute(statement.returning(TenantModel.id))
+                    inserted.update(result.scalars())
+
+                events = [
+                    event
+                    for tenant in tenants
+                    if tenant.id in inserted
+                    for event in tenant.pull_events()
+                ]
+                if events:
+                    await add_events(session, events)
+        return inserted
+
+    async def upsert_in(self, session: AsyncSession, tenants: Sequence[Tenant]) -> None:
+        """
+        Upsert tenants within a caller-managed transaction, together with
+        the domain events they raised (transactional outbox)
+        """
+        for start in range(0, len(tenants), UPSERT_CHUNK_SIZE):
+            rows = [tenant_to_row(tenant) for tenant in tenants[start : start + UPSERT_CHUNK_SIZE]]
+            statement = insert(TenantModel).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[TenantModel.id],
+                set_={name: statement.excluded[name] for name in _UPDATABLE_COLUMNS},
+            )
+            await session.execute(statement)
+
+        events = [event for tenant in tenants for event in tenant.pull_events()]
+        if events:
+            await add_events(session, events)
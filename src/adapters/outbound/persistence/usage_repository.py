@@ -0,0 +1,73 @@
+"""
+SQLAlchemy Usage Repository Adapter
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.outbound.persistence.models import TenantUsageModel
+from src.domain.ports.repositories.usage_repository import UsageRepository
+
+# Postgres caps a statement at 32767 bind parameters; 5 columns per row
+UPSERT_CHUNK_SIZE = 5000
+
+
+class SqlAlchemyUsageRepository(UsageRepository):
+    """
+    Accumulates metered usage into ``tenant_usage`` with one multi-row upsert
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def add_usage(self, period: str, deltas: Dict[Tuple[str, str], int]) -> None:
+        if not deltas:
+            return
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "tenant_id": tenant_id,
+                "quota_type": quota_type,
+                "period": period,
+                "used": delta,
+                "updated_at": now,
+            }
+            for (tenant_id, quota_type), delta in deltas.items()
+        ]
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                    statement = insert(TenantUsageModel).values(
+                        rows[start : start + UPSERT_CHUNK_SIZE]
+                    )
+                    statement = statement.on_conflict_do_update(
+                        index_elements=["tenant_id", "quota_type", "period"],
+                        set_={
+                            "used": TenantUsageModel.used + statement.excluded.used,
+                            "updated_at": statement.excluded.updated_at,
+                        },
+                    )
+                    await session.execute(statement)
+
+    async def get_usage(
+        self, period: str, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], int]:
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        statement = select(
+            TenantUsageModel.tenant_id, TenantUsageModel.quota_type, TenantUsageModel.used
+        ).where(
+            TenantUsageModel.period == period,
+            tuple_(TenantUsageModel.tenant_id, TenantUsageModel.quota_type).in_(keys),
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(statement)
+        return {(row.tenant_id, row.quota_type): row.used for row in result}
@@ -0,0 +1,159 @@
+"""
+SQLAlchemy User Repository Adapter
+"""
+
+from typing import Any, AsyncIterator, Dict, Optional, Sequence, Set
+from uuid import UUID
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.outbound.persistence.models import UserModel
+from src.adapters.outbound.persistence.queries import count_estimate, keyset_page, stream_rows
+from src.domain.entities.user import User, UserRole, UserStatus
+from src.domain.ports.repositories.pagination import Cursor, Page
+from src.domain.ports.repositories.user_repository import EmailTakenError, UserRepository
+
+_COLUMNS = [column.name for column in UserModel.__table__.columns]
+_UPDATABLE_COLUMNS = [name for name in _COLUMNS if name not in ("id", "created_at")]
+
+# Bulk inserts are staged here with COPY, then moved over in one statement
+_STAGING_TABLE = "users_import"
+_COLUMN_LIST = ", ".join(_COLUMNS)
+_CREATE_STAGING = text(
+    f"CREATE TEMPORARY TABLE {_STAGING_TABLE} (LIKE {UserModel.__tablename__}) ON COMMIT DROP"
+)
+_INSERT_STAGED = text(
+    f"INSERT INTO {UserModel.__tablename__} ({_COLUMN_LIST}) "
+    f"SELECT {_COLUMN_LIST} FROM {_STAGING_TABLE} ON CONFLICT DO NOTHING RETURNING id"
+)
+
+
+def user_to_row(user: User) -> Dict[str, Any]:
+    """Map a User entity to column values"""
+    return {
+        "id": user.id,
+        "tenant_id": user.tenant_id,
+        "email": user.email,
+        "full_name": user.full_name,
+        "role": user.role.value,
+        "status": user.status.value,
+        "password_hash": user.password_hash,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+        "last_login_at": user.last_login_at,
+    }
+
+
+def row_to_user(row: Any) -> User:
+    """Map a UserModel (or a row with the same columns) to a User entity"""
+    return User(
+        id=row.id,
+        tenant_id=row.tenant_id,
+        email=row.email,
+        full_name=row.full_name,
+        role=UserRole(row.role),
+        status=UserStatus(row.status),
+        password_hash=row.password_hash,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        last_login_at=row.last_login_at,
+    )
+
+
+class SqlAlchemyUserRepository(UserRepository):
+    """
+    User repository for one tenant; every query is filtered by its id, as a
+    tenant database may be shared with other tenants
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], tenant_id: UUID) -> None:
+        self._session_factory = session_factory
+        self._tenant_id = tenant_id
+        self._in_tenant = UserModel.tenant_id == tenant_id
+        self._select = select(*UserModel.__table__.columns).where(self._in_tenant)
+
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        async with self._session_factory() as session:
+            result = await session.execute(self._select.where(UserModel.id == user_id))
+            row = result.first()
+        return row_to_user(row) if row else None
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                self._select.where(UserModel.email == email.strip().lower())
+            )
+            row = result.first()
+        return row_to_user(row) if row else None
+
+    async def save(self, user: User) -> None:
+        self._check_tenant([user])
+        statement = insert(UserModel).values(user_to_row(user))
+        statement = statement.on_conflict_do_update(
+            index_elements=[UserModel.id],
+            set_={name: statement.excluded[name] for name in _UPDATABLE_COLUMNS},
+            # Never take over another tenant's row with the same id
+            where=UserModel.tenant_id == statement.excluded.tenant_id,
+        )
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    await session.execute(statement)
+        except IntegrityError as exc:
+            # Lost a race against another request creating the same email
+            if "uq_users_tenant_id_email" in str(exc.orig):
+                raise EmailTakenError(f"Email already registered: {user.email}") from exc
+            raise
+
+    async def delete(self, user_id: UUID) -> bool:
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    delete(UserModel).where(self._in_tenant, UserModel.id == user_id)
+                )
+        return result.rowcount > 0
+
+    async def insert_new(self, users: Sequence[User]) -> Set[UUID]:
+        """
+        COPY the users into a temporary table, then insert them with
+        ON CONFLICT DO NOTHING, which skips taken ids and emails
+        """
+        inserted: Set[UUID] = set()
+        if not users:
+            return inserted
+        self._check_tenant(users)
+        records = [tuple(row[name] for name in _COLUMNS) for row in map(user_to_row, users)]
+        async with self._session_factory() as session:
+            async with session.begin():
+                # Through the session first, so that the COPY runs inside its transaction
+                await session.execute(_CREATE_STAGING)
+                connection = await session.connection()
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    _STAGING_TABLE, records=records, columns=_COLUMNS
+                )
+                result = await session.execute(_INSERT_STAGED)
+                inserted.update(result.scalars())
+        return inserted
+
+    async def list_page(self, limit: int, after: Optional[Cursor] = None) -> Page[User]:
+        async with self._session_factory() as session:
+            return await keyset_page(
+                session, self._select, UserModel.__table__, limit, after, row_to_user
+            )
+
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[User]:
+        async with self._session_factory() as session:
+            async for row in stream_rows(session, self._select, UserModel.__table__, batch_size):
+                yield row_to_user(row)
+
+    async def count_estimate(self) -> int:
+        async with self._session_factory() as session:
+            return await count_estimate(session, UserModel.__table__, self._in_tenant)
+
+    def _check_tenant(self, users: Sequence[User]) -> None:
+        if any(user.tenant_id != self._tenant_id for user in users):
+            raise ValueError(f"Users must belong to tenant {self._tenant_id}")
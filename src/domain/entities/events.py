@@ -0,0 +1,41 @@
+"""
+Domain Events - Core Domain Model
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Mapping
+from uuid import UUID, uuid4
+
+# Tenant lifecycle event types
+TENANT_ACTIVATED = "tenant.activated"
+TENANT_SUSPENDED = "tenant.suspended"
+TENANT_REACTIVATED = "tenant.reactivated"
+TENANT_ARCHIVED = "tenant.archived"
+TENANT_TIER_CHANGED = "tenant.tier_changed"
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """
+    Something that happened to an aggregate, published to other services
+
+    ``id`` is unique per event and doubles as the broker's deduplication
+    key, so an event delivered twice is recognisable as the same event.
+    """
+
+    type: str
+    aggregate_id: str
+    data: Mapping[str, Any] = field(default_factory=dict)
+    id: UUID = field(default_factory=uuid4)
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert event to dictionary"""
+        return {
+            "id": str(self.id),
+            "type": self.type,
+            "aggregate_id": self.aggregate_id,
+            "data": dict(self.data),
+            "occurred_at": self.occurred_at.isoformat(),
+        }
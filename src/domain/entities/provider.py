@@ -0,0 +1,59 @@
+"""
+Provider Configuration Entity - Core Domain Model
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# LLM providers a tenant can configure
+KNOWN_PROVIDERS = ("openai", "anthropic", "google", "groq")
+
+
+@dataclass
+class ProviderConfig:
+    """
+    A tenant's settings for one LLM provider
+
+    This is a pure domain model with no framework dependencies
+    """
+
+    tenant_id: str
+    provider: str
+    enabled: bool = True
+
+    # Credentials (never serialized; encrypted at rest by the adapters)
+    api_key: Optional[str] = field(default=None, repr=False, metadata={"serialize": False})
+
+    base_url: Optional[str] = None
+    default_model: Optional[str] = None
+    models: Tuple[str, ...] = ()
+    settings: Mapping[str, Any] = field(default_factory=dict)
+
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    def __post_init__(self):
+        """Post-initialization normalization"""
+        self.provider = self.provider.lower()
+        self.models = tuple(self.models)
+
+    @property
+    def has_api_key(self) -> bool:
+        """Check if an API key is configured"""
+        return bool(self.api_key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation without the API key"""
+        return {
+            "tenant_id": self.tenant_id,
+            "provider": self.provider,
+            "enabled": self.enabled,
+            "has_api_key": self.has_api_key,
+            "base_url": self.base_url,
+            "default_model": self.default_model,
+            "models": list(self.models),
+            "settings": dict(self.settings),
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
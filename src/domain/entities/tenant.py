@@ -2,15 +2,28 @@
 Tenant Entity - Core Domain Model
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from uuid import UUID, uuid4
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+from uuid import UUID, uuid4
+
+from src.domain.entities.events import (
+    TENANT_ACTIVATED,
+    TENANT_ARCHIVED,
+    TENANT_REACTIVATED,
+    TENANT_SUSPENDED,
+    TENANT_TIER_CHANGED,
+    DomainEvent,
+)
 
 
 class TenantStatus(Enum):
     """Tenant status enumeration"""
+
     PENDING = "pending"
     ACTIVE = "active"
     SUSPENDED = "suspended"
@@ -19,18 +32,80 @@ class TenantStatus(Enum):
 
 class TenantTier(Enum):
     """Tenant subscription tier"""
+
     FREE = "free"
     PRO = "pro"
     ENTERPRISE = "enterprise"
 
 
-@dataclass
+# Quota type -> tenant attribute holding its limit (-1 means unlimited)
+QUOTA_LIMIT_FIELDS: Dict[str, str] = {
+    "users": "max_users",
+    "requests": "max_requests_per_month",
+    "storage": "max_storage_gb",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TierPolicy:
+    """Quota limits granted by a subscription tier (-1 means unlimited)"""
+
+    max_users: int
+    max_requests_per_month: int
+    max_storage_gb: int
+
+    def quota_limit(self, quota_type: str) -> int:
+        """Get the limit for a quota type (0 if unknown)"""
+        limit_field = QUOTA_LIMIT_FIELDS.get(quota_type)
+        return getattr(self, limit_field) if limit_field else 0
+
+
+# Quotas granted by each tier, built once and shared read-only
+TIER_POLICIES: Mapping[TenantTier, TierPolicy] = MappingProxyType(
+    {
+        TenantTier.FREE: TierPolicy(max_users=10, max_requests_per_month=10000, max_storage_gb=10),
+        TenantTier.PRO: TierPolicy(max_users=50, max_requests_per_month=100000, max_storage_gb=100),
+        TenantTier.ENTERPRISE: TierPolicy(
+            max_users=-1, max_requests_per_month=-1, max_storage_gb=1000
+        ),
+    }
+)
+
+
+# Feature combinations kept shared; features come from client input, so the
+# cache is bounded and rare combinations are simply not shared
+FEATURE_SET_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=FEATURE_SET_CACHE_SIZE)
+def _shared_features(features: FrozenSet[str]) -> FrozenSet[str]:
+    return frozenset(map(sys.intern, features))
+
+
+def intern_features(features: Iterable[str]) -> FrozenSet[str]:
+    """
+    Get the shared frozenset for a combination of features
+
+    Tenants mostly use a handful of feature combinations, so every tenant
+    with the same features references one set of interned strings.
+    """
+    return _shared_features(frozenset(features))
+
+
+@dataclass(slots=True)
 class Tenant:
     """
     Tenant entity representing an organization using the platform
 
-    This is a pure domain model with no framework dependencies
+    This is a pure domain model with no framework dependencies. Instances are
+    slotted and share their feature set with other tenants, so whole tenant
+    tables can be cached per worker. Settings are a dict of each tenant's
+    own.
+
+    Lifecycle changes record domain events; repositories persist them in
+    the same transaction as the tenant (see ``pull_events``).
     """
+
     id: UUID = field(default_factory=uuid4)
     name: str = ""
     slug: str = ""
@@ -49,12 +124,12 @@ class Tenant:
 
     # Configuration
     settings: Dict[str, Any] = field(default_factory=dict)
-    features: List[str] = field(default_factory=list)
+    features: FrozenSet[str] = frozenset()
 
-    # Quotas
-    max_users: int = 10
-    max_requests_per_month: int = 10000
-    max_storage_gb: int = 10
+    # Quotas (FREE tier defaults)
+    max_users: int = TIER_POLICIES[TenantTier.FREE].max_users
+    max_requests_per_month: int = TIER_POLICIES[TenantTier.FREE].max_requests_per_month
+    max_storage_gb: int = TIER_POLICIES[TenantTier.FREE].max_storage_gb
 
     # Metadata
     created_at: datetime = field(default_factory=datetime.utcnow)
@@ -62,6 +137,11 @@ class Tenant:
     activated_at: Optional[datetime] = None
     suspended_at: Optional[datetime] = None
 
+    # Events raised since the tenant was last saved (shared empty tuple until then)
+    _events: Tuple[DomainEvent, ...] = field(
+        default=(), init=False, repr=False, compare=False, metadata={"serialize": False}
+    )
+
     def __post_init__(self):
         """Post-initialization validation and setup"""
         if not self.slug and self.name:
@@ -70,13 +150,16 @@ class Tenant:
         if not self.billing_email:
             self.billing_email = self.primary_contact_email
 
+        self.features = intern_features(self.features)
+
     def _generate_slug(self, name: str) -> str:
         """Generate URL-safe slug from name"""
         import re
+
         slug = name.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
-        return slug.strip('-')
+        slug = re.sub(r"[^\w\s-]", "", slug)
+        slug = re.sub(r"[-\s]+", "-", slug)
+        return slug.strip("-")
 
     def activate(self) -> None:
         """Activate the tenant"""
@@ -86,6 +169,7 @@ class Tenant:
         self.status = TenantStatus.ACTIVE
         self.activated_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
+        self._raise(TENANT_ACTIVATED, tier=self.tier.value)
 
     def suspend(self, reason: Optional[str] = None) -> None:
         """Suspend the tenant"""
@@ -98,6 +182,7 @@ class Tenant:
 
         if reason:
             self.settings["suspension_reason"] = reason
+        self._raise(TENANT_SUSPENDED, reason=reason)
 
     def reactivate(self) -> None:
         """Reactivate a suspended tenant"""
@@ -110,14 +195,17 @@ class Tenant:
 
         # Remove suspension reason if exists
         self.settings.pop("suspension_reason", None)
+        self._raise(TENANT_REACTIVATED)
 
     def archive(self) -> None:
         """Archive the tenant (soft delete)"""
         if self.status == TenantStatus.ARCHIVED:
             raise ValueError("Tenant is already archived")
 
+        previous_status = self.status
         self.status = TenantStatus.ARCHIVED
         self.updated_at = datetime.utcnow()
+        self._raise(TENANT_ARCHIVED, previous_status=previous_status.value)
 
     def update_tier(self, new_tier: TenantTier) -> None:
         """Update tenant subscription tier"""
@@ -129,52 +217,56 @@ class Tenant:
         self.updated_at = datetime.utcnow()
 
         # Update quotas based on tier
-        if new_tier == TenantTier.FREE:
-            self.max_users = 10
-            self.max_requests_per_month = 10000
-            self.max_storage_gb = 10
-        elif new_tier == TenantTier.PRO:
-            self.max_users = 50
-            self.max_requests_per_month = 100000
-            self.max_storage_gb = 100
-        elif new_tier == TenantTier.ENTERPRISE:
-            self.max_users = -1  # Unlimited
-            self.max_requests_per_month = -1  # Unlimited
-            self.max_storage_gb = 1000
+        policy = TIER_POLICIES[new_tier]
+        self.max_users = policy.max_users
+        self.max_requests_per_month = policy.max_requests_per_month
+        self.max_storage_gb = policy.max_storage_gb
 
         # Log tier change
         self.settings["tier_history"] = self.settings.get("tier_history", [])
-        self.settings["tier_history"].append({
-            "from": old_tier.value,
-            "to": new_tier.value,
-            "changed_at": datetime.utcnow().isoformat()
-        })
+        self.settings["tier_history"].append(
+            {
+                "from": old_tier.value,
+                "to": new_tier.value,
+                "changed_at": datetime.utcnow().isoformat(),
+            }
+        )
+        self._raise(TENANT_TIER_CHANGED, **{"from": old_tier.value, "to": new_tier.value})
 
     def add_feature(self, feature: str) -> None:
         """Add a feature to the tenant"""
         if feature not in self.features:
-            self.features.append(feature)
+            self.features = intern_features(self.features | {feature})
             self.updated_at = datetime.utcnow()
 
     def remove_feature(self, feature: str) -> None:
         """Remove a feature from the tenant"""
         if feature in self.features:
-            self.features.remove(feature)
+            self.features = intern_features(self.features - {feature})
             self.updated_at = datetime.utcnow()
 
     def has_feature(self, feature: str) -> bool:
         """Check if tenant has a specific feature"""
         return feature in self.features
 
+    def pull_events(self) -> List[DomainEvent]:
+        """Take the events raised since the last call, leaving none pending"""
+        events = list(self._events)
+        self._events = ()
+        return events
+
+    def _raise(self, event_type: str, **data: Any) -> None:
+        """Record a domain event about this tenant"""
+        self._events = (*self._events, DomainEvent(event_type, str(self.id), data))
+
+    def quota_limit(self, quota_type: str) -> int:
+        """Get the limit for a quota type (-1 for unlimited, 0 if unknown)"""
+        limit_field = QUOTA_LIMIT_FIELDS.get(quota_type)
+        return getattr(self, limit_field) if limit_field else 0
+
     def is_quota_exceeded(self, quota_type: str, current_usage: int) -> bool:
         """Check if a quota has been exceeded"""
-        quota_map = {
-            "users": self.max_users,
-            "requests": self.max_requests_per_month,
-            "storage": self.max_storage_gb
-        }
-
-        max_allowed = quota_map.get(quota_type, 0)
+        max_allowed = self.quota_limit(quota_type)
         if max_allowed == -1:  # Unlimited
             return False
 
@@ -194,13 +286,13 @@ class Tenant:
             "primary_contact_email": self.primary_contact_email,
             "primary_contact_name": self.primary_contact_name,
             "billing_email": self.billing_email,
-            "settings": self.settings,
-            "features": self.features,
+            "settings": dict(self.settings),
+            "features": sorted(self.features),
             "max_users": self.max_users,
             "max_requests_per_month": self.max_requests_per_month,
             "max_storage_gb": self.max_storage_gb,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "activated_at": self.activated_at.isoformat() if self.activated_at else None,
-            "suspended_at": self.suspended_at.isoformat() if self.suspended_at else None
-        }
\ No newline at end of file
+            "suspended_at": self.suspended_at.isoformat() if self.suspended_at else None,
+        }
@@ -0,0 +1,84 @@
+"""
+User Entity - Core Domain Model
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+
+class UserStatus(Enum):
+    """User status enumeration"""
+
+    INVITED = "invited"
+    ACTIVE = "active"
+    DISABLED = "disabled"
+
+
+class UserRole(Enum):
+    """User role within a tenant"""
+
+    OWNER = "owner"
+    ADMIN = "admin"
+    MEMBER = "member"
+
+
+@dataclass
+class User:
+    """
+    User entity representing a member of a tenant organization
+
+    This is a pure domain model with no framework dependencies
+    """
+
+    id: UUID = field(default_factory=uuid4)
+    tenant_id: Optional[UUID] = None
+    email: str = ""
+    full_name: Optional[str] = None
+    role: UserRole = UserRole.MEMBER
+    status: UserStatus = UserStatus.ACTIVE
+
+    # Credentials (never serialized)
+    password_hash: Optional[str] = field(default=None, repr=False, metadata={"serialize": False})
+
+    # Metadata
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    last_login_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        """Post-initialization normalization"""
+        self.email = self.email.strip().lower()
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the user may sign in"""
+        return self.status == UserStatus.ACTIVE
+
+    def disable(self) -> None:
+        """Disable the user"""
+        if self.status == UserStatus.DISABLED:
+            raise ValueError("User is already disabled")
+
+        self.status = UserStatus.DISABLED
+        self.updated_at = datetime.utcnow()
+
+    def record_login(self) -> None:
+        """Record a successful sign-in"""
+        self.last_login_at = datetime.utcnow()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert entity to dictionary"""
+        return {
+            "id": str(self.id),
+            "tenant_id": str(self.tenant_id) if self.tenant_id else None,
+            "email": self.email,
+            "full_name": self.full_name,
+            "role": self.role.value,
+            "status": self.status.value,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "last_login_at": self.last_login_at.isoformat() if self.last_login_at else None,
+        }
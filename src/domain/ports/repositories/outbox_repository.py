@@ -0,0 +1,46 @@
+"""
+Event Outbox Port
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, Sequence
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxMessage:
+    """A stored domain event: its id, type, aggregate and encoded payload"""
+
+    id: UUID
+    event_type: str
+    aggregate_id: str
+    payload: bytes
+
+
+# Publishes claimed messages and returns the ids that were delivered
+Publisher = Callable[[Sequence[OutboxMessage]], Awaitable[Iterable[UUID]]]
+
+
+class EventOutbox(ABC):
+    """
+    Domain events stored alongside the changes that raised them
+
+    Events are written by the repositories in the transaction of the
+    change; a relay later claims and publishes them.
+    """
+
+    @abstractmethod
+    async def relay_batch(self, limit: int, publish: Publisher) -> int:
+        """
+        Claim up to ``limit`` pending messages in creation order, publish
+        them and remove those that were delivered, returning how many were
+
+        Only one relay publishes at a time; while another holds the outbox
+        this returns 0. Messages that were not delivered stay pending for a
+        later batch. No transaction is held open while publishing.
+        """
+
+    @abstractmethod
+    async def pending(self) -> int:
+        """Get the number of messages waiting to be published"""
@@ -0,0 +1,21 @@
+"""
+Keyset Pagination Types
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+# Position of the last row of a page in (created_at, id) order
+Cursor = Tuple[datetime, UUID]
+
+
+@dataclass
+class Page(Generic[T]):
+    """A page of results and the cursor to continue after it"""
+
+    items: List[T]
+    next_cursor: Optional[Cursor] = None
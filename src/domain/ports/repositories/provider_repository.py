@@ -0,0 +1,26 @@
+"""
+Provider Configuration Repository Port
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domain.entities.provider import ProviderConfig
+
+
+class ProviderConfigRepository(ABC):
+    """
+    Persistence interface for tenants' provider configurations
+    """
+
+    @abstractmethod
+    async def list_for_tenant(self, tenant_id: str) -> List[ProviderConfig]:
+        """Get every provider configured for a tenant"""
+
+    @abstractmethod
+    async def save(self, config: ProviderConfig) -> None:
+        """Insert or update a provider configuration"""
+
+    @abstractmethod
+    async def delete(self, tenant_id: str, provider: str) -> bool:
+        """Delete a provider configuration, returning whether it existed"""
@@ -0,0 +1,58 @@
+"""
+Tenant Repository Port
+"""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional, Sequence, Set
+from uuid import UUID
+
+from src.domain.entities.tenant import Tenant
+from src.domain.ports.repositories.pagination import Cursor, Page
+
+
+class TenantRepository(ABC):
+    """
+    Persistence interface for Tenant entities
+
+    Adapters implement this port; the domain and application layers only
+    depend on it.
+    """
+
+    @abstractmethod
+    async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        """Get a tenant by its identifier"""
+
+    @abstractmethod
+    async def get_by_slug(self, slug: str) -> Optional[Tenant]:
+        """Get a tenant by its URL-safe slug"""
+
+    @abstractmethod
+    async def get_many(self, tenant_ids: Sequence[UUID]) -> List[Tenant]:
+        """Get several tenants in one round-trip; unknown ids are skipped"""
+
+    @abstractmethod
+    async def save(self, tenant: Tenant) -> None:
+        """Insert or update a single tenant"""
+
+    @abstractmethod
+    async def upsert_many(self, tenants: Sequence[Tenant]) -> int:
+        """Insert or update tenants in bulk, returning the number written"""
+
+    @abstractmethod
+    async def insert_new(self, tenants: Sequence[Tenant]) -> Set[UUID]:
+        """
+        Insert tenants in bulk, skipping those whose id or slug is taken;
+        returns the ids of the tenants inserted
+        """
+
+    @abstractmethod
+    async def list_page(self, limit: int, after: Optional[Cursor] = None) -> Page[Tenant]:
+        """List tenants in (created_at, id) order, starting after a cursor"""
+
+    @abstractmethod
+    def stream_all(self, batch_size: int = 500) -> AsyncIterator[Tenant]:
+        """Iterate over every tenant without loading them all in memory"""
+
+    @abstractmethod
+    async def count_estimate(self) -> int:
+        """Get an approximate number of tenants"""
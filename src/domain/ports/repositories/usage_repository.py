@@ -0,0 +1,27 @@
+"""
+Usage Repository Port
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Tuple
+
+
+class UsageRepository(ABC):
+    """
+    Durable store for aggregated per-tenant quota usage
+    """
+
+    @abstractmethod
+    async def add_usage(self, period: str, deltas: Dict[Tuple[str, str], int]) -> None:
+        """
+        Add usage deltas keyed by (tenant_id, quota_type) for a billing period
+        """
+
+    @abstractmethod
+    async def get_usage(
+        self, period: str, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], int]:
+        """
+        Get the stored usage of (tenant_id, quota_type) keys for a billing
+        period; keys without any usage are left out
+        """
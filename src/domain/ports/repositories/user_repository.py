@@ -0,0 +1,58 @@
+"""
+User Repository Port
+"""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional, Sequence, Set
+from uuid import UUID
+
+from src.domain.entities.user import User
+from src.domain.ports.repositories.pagination import Cursor, Page
+
+
+class EmailTakenError(ValueError):
+    """Raised when saving a user whose email another user of the tenant has"""
+
+
+class UserRepository(ABC):
+    """
+    Persistence interface for the User entities of one tenant
+
+    Users of other tenants are never returned, even where tenants share a
+    database; writing a user of another tenant is a ValueError.
+    """
+
+    @abstractmethod
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        """Get a user by its identifier"""
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get a user by (normalized) email address"""
+
+    @abstractmethod
+    async def save(self, user: User) -> None:
+        """Insert or update a single user; raises EmailTakenError on a taken email"""
+
+    @abstractmethod
+    async def delete(self, user_id: UUID) -> bool:
+        """Delete a user; returns False if the tenant has no such user"""
+
+    @abstractmethod
+    async def insert_new(self, users: Sequence[User]) -> Set[UUID]:
+        """
+        Insert users in bulk, skipping those whose id or email (within the
+        tenant) is taken; returns the ids of the users inserted
+        """
+
+    @abstractmethod
+    async def list_page(self, limit: int, after: Optional[Cursor] = None) -> Page[User]:
+        """List users in (created_at, id) order, starting after a cursor"""
+
+    @abstractmethod
+    def stream_all(self, batch_size: int = 500) -> AsyncIterator[User]:
+        """Iterate over every user without loading them all in memory"""
+
+    @abstractmethod
+    async def count_estimate(self) -> int:
+        """Get an approximate number of users"""
@@ -0,0 +1,98 @@
+"""
+Bulk Quota Evaluation
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.entities.tenant import QUOTA_LIMIT_FIELDS, TIER_POLICIES, Tenant, TenantTier
+
+# Column order of the limit and usage matrices
+QUOTA_TYPES: Tuple[str, ...] = tuple(QUOTA_LIMIT_FIELDS)
+
+UNLIMITED = -1
+
+_TIERS: Tuple[TenantTier, ...] = tuple(TIER_POLICIES)
+
+
+def _limit_getter(quota_types: Sequence[str]) -> Callable[[Any], Tuple[int, ...]]:
+    unknown = [quota_type for quota_type in quota_types if quota_type not in QUOTA_LIMIT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown quota types: {', '.join(unknown)}")
+
+    getter = attrgetter(*(QUOTA_LIMIT_FIELDS[quota_type] for quota_type in quota_types))
+    if len(quota_types) == 1:
+        # attrgetter with a single attribute returns the bare value
+        return lambda obj: (getter(obj),)
+    return getter
+
+
+def _tier_matrix(quota_types: Sequence[str]) -> np.ndarray:
+    getter = _limit_getter(quota_types)
+    rows = [getter(TIER_POLICIES[tier]) for tier in _TIERS]
+    matrix = np.array(rows, dtype=np.int64).reshape(len(_TIERS), len(quota_types))
+    matrix.setflags(write=False)
+    return matrix
+
+
+# Tier x quota type limits, in _TIERS and QUOTA_TYPES order
+TIER_LIMITS = _tier_matrix(QUOTA_TYPES)
+
+
+def limits_matrix(
+    tenants: Sequence[Tenant], quota_types: Sequence[str] = QUOTA_TYPES
+) -> np.ndarray:
+    """
+    Build the N x M matrix of tenant limits for the given quota types
+    """
+    getter = _limit_getter(quota_types)
+    values = np.fromiter(
+        (limit for tenant in tenants for limit in getter(tenant)),
+        dtype=np.int64,
+        count=len(tenants) * len(quota_types),
+    )
+    return values.reshape(len(tenants), len(quota_types))
+
+
+def tier_limits_matrix(tiers: Iterable[TenantTier]) -> np.ndarray:
+    """
+    Build the N x M matrix of default limits for tenants on the given tiers,
+    in QUOTA_TYPES order, by indexing the precomputed tier table
+    """
+    index = {tier: i for i, tier in enumerate(_TIERS)}
+    return TIER_LIMITS[np.fromiter(map(index.__getitem__, tiers), dtype=np.intp)]
+
+
+def exceeded_mask(usage: np.ndarray, limits: np.ndarray) -> np.ndarray:
+    """
+    Get the N x M boolean mask of exceeded quotas
+
+    Matches ``Tenant.is_quota_exceeded`` element-wise: a quota is exceeded
+    once usage reaches its limit, and a limit of -1 is never exceeded.
+    """
+    usage = np.asarray(usage)
+    limits = np.asarray(limits)
+    if usage.shape != limits.shape:
+        raise ValueError(f"Usage shape {usage.shape} does not match limits shape {limits.shape}")
+    return (limits != UNLIMITED) & (usage >= limits)
+
+
+def exceeded_tenants(
+    tenants: Sequence[Tenant],
+    usage: np.ndarray,
+    quota_types: Sequence[str] = QUOTA_TYPES,
+) -> List[Tuple[Tenant, List[str]]]:
+    """
+    List the tenants over any quota with the quota types they exceed
+    """
+    mask = exceeded_mask(usage, limits_matrix(tenants, quota_types))
+    rows, columns = np.nonzero(mask)
+
+    result: List[Tuple[Tenant, List[str]]] = []
+    for row, column in zip(rows.tolist(), columns.tolist()):
+        if not result or result[-1][0] is not tenants[row]:
+            result.append((tenants[row], []))
+        result[-1][1].append(quota_types[column])
+    return result
@@ -0,0 +1,351 @@
+"""
+Provider Configuration Cache
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from nats.aio.client import Client as NATS
+from nats.aio.msg import Msg
+from nats.aio.subscription import Subscription
+from redis.asyncio import Redis
+
+from src.domain.entities.provider import ProviderConfig
+from src.domain.ports.repositories.provider_repository import ProviderConfigRepository
+from src.infrastructure.config.settings import settings
+from src.infrastructure.security.encryption import SecretBox
+from src.infrastructure.serialization.encoder import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_INVALIDATION_SUBJECT = "platform.providers.invalidate"
+
+ProviderConfigs = Mapping[str, ProviderConfig]
+
+# KEYS[1]: version counter, KEYS[2]: data key prefix (same {tenant} hash slot)
+# ARGV[1]: version the caller already holds
+# Returns {version} if unchanged, else {version, data or nil}
+_READ_SCRIPT = """
+local version = redis.call('GET', KEYS[1]) or '0'
+if version == ARGV[1] then
+    return {version}
+end
+return {version, redis.call('GET', KEYS[2] .. version) or false}
+"""
+
+
+@dataclass
+class _CacheEntry:
+    configs: ProviderConfigs
+    version: Optional[str]
+    expires_at: float
+
+
+class ProviderConfigCache:
+    """
+    Two-tier cache of each tenant's provider configurations
+
+    - L1 is a bounded in-process LRU fresh for ``ttl`` seconds
+    - L2 is Redis, under a key suffixed with the tenant's config version;
+      a write bumps the version (INCR), so every replica's next L2 read
+      sees the new version and no stale fill can overwrite newer data
+    - an expired L1 entry is revalidated in one round-trip that only
+      transfers the data if the version moved
+    - concurrent misses for a tenant share a single load
+    - writes also drop L1 on every replica through NATS; without NATS,
+      other replicas converge within ``ttl``
+
+    API keys stay encrypted in Redis and are decrypted on L1 fill. Returned
+    configs are shared and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        repository: ProviderConfigRepository,
+        box: SecretBox,
+        redis: Optional[Redis] = None,
+        ttl: float = 5.0,
+        l2_ttl: float = 300.0,
+        max_entries: int = 10000,
+        cooldown: float = 5.0,
+        key_prefix: str = "providers",
+    ) -> None:
+        self._repository = repository
+        self._box = box
+        self._redis = redis
+        self._ttl = ttl
+        self._l2_ttl = l2_ttl
+        self._max_entries = max_entries
+        self._cooldown = cooldown
+        self._key_prefix = key_prefix
+        self._degraded_until = 0.0
+        self._script = redis.register_script(_READ_SCRIPT) if redis is not None else None
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._loading: Dict[str, "asyncio.Task[ProviderConfigs]"] = {}
+        self._subscription: Optional[Subscription] = None
+
+        self.hits = 0
+        self.l2_hits = 0
+        self.revalidations = 0
+        self.loads = 0
+        self.redis_errors = 0
+
+    async def get_all(self, tenant_id: str) -> ProviderConfigs:
+        """
+        Get a tenant's provider configurations keyed by provider name
+        """
+        entry = self._entries.get(tenant_id)
+        if entry is not None and time.monotonic() < entry.expires_at:
+            self._entries.move_to_end(tenant_id)
+            self.hits += 1
+            return entry.configs
+
+        task = self._loading.get(tenant_id)
+        if task is None:
+            task = asyncio.create_task(self._load(tenant_id, entry))
+            self._loading[tenant_id] = task
+        # Shielded: a cancelled caller must not cancel the load other callers share
+        return await asyncio.shield(task)
+
+    async def get(self, tenant_id: str, provider: str) -> Optional[ProviderConfig]:
+        """
+        Get a tenant's configuration for one provider
+        """
+        return (await self.get_all(tenant_id)).get(provider)
+
+    async def invalidate(self, tenant_id: str, nc: Optional[NATS] = None) -> None:
+        """
+        Invalidate a tenant's configurations everywhere after a write
+
+        Bumps the Redis version, drops the local entry and asks the other
+        replicas to drop theirs.
+        """
+        self._drop(tenant_id)
+
+        if self._redis is not None:
+            try:
+                await self._redis.incr(self._version_key(tenant_id))
+            except Exception as exc:
+                logger.warning("Provider config version bump failed for %s: %r", tenant_id, exc)
+                self.redis_errors += 1
+
+        if nc is not None:
+            payload = json.dumps({"tenant_id": tenant_id})
+            await nc.publish(PROVIDER_INVALIDATION_SUBJECT, payload.encode())
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache hit/miss counters
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "l2_hits": self.l2_hits,
+            "revalidations": self.revalidations,
+            "loads": self.loads,
+            "redis_errors": self.redis_errors,
+        }
+
+    async def subscribe(self, nc: NATS) -> None:
+        """
+        Listen for invalidations published by other replicas
+        """
+        self._subscription = await nc.subscribe(
+            PROVIDER_INVALIDATION_SUBJECT,
+            cb=self._on_invalidation,
+        )
+
+    async def close(self) -> None:
+        """
+        Unsubscribe and cancel in-flight loads
+        """
+        if self._subscription is not None:
+            await self._subscription.unsubscribe()
+            self._subscription = None
+        for task in list(self._loading.values()):
+            task.cancel()
+        self._loading.clear()
+
+    async def _load(self, tenant_id: str, stale: Optional[_CacheEntry]) -> ProviderConfigs:
+        task = asyncio.current_task()
+        try:
+            configs, version = await self._read_through(tenant_id, stale)
+        finally:
+            # An invalidation during the load unregisters this task
+            registered = self._loading.get(tenant_id) is task
+            if registered:
+                del self._loading[tenant_id]
+
+        if registered:
+            self._store(tenant_id, _CacheEntry(configs, version, time.monotonic() + self._ttl))
+        return configs
+
+    async def _read_through(
+        self,
+        tenant_id: str,
+        stale: Optional[_CacheEntry],
+    ) -> Tuple[ProviderConfigs, Optional[str]]:
+        if self._script is None or time.monotonic() < self._degraded_until:
+            return await self._load_from_repository(tenant_id), None
+
+        known = stale.version if stale is not None else None
+        try:
+            reply = await self._script(
+                keys=[self._version_key(tenant_id), self._data_prefix(tenant_id)],
+                args=[known or ""],
+            )
+        except Exception as exc:
+            self._degrade(exc)
+            return await self._load_from_repository(tenant_id), None
+
+        version = reply[0].decode() if isinstance(reply[0], bytes) else str(reply[0])
+        if len(reply) == 1:
+            self.revalidations += 1
+            return stale.configs, version
+
+        if reply[1] is not None:
+            try:
+                configs = self._decode(reply[1])
+            except (ValueError, KeyError) as exc:
+                # e.g. written with a previous ENCRYPTION_KEY; reload below
+                logger.warning("Discarding unreadable provider configs for %s: %r", tenant_id, exc)
+            else:
+                self.l2_hits += 1
+                return configs, version
+
+        configs = await self._load_from_repository(tenant_id)
+        try:
+            await self._redis.set(
+                self._data_prefix(tenant_id) + version,
+                self._encode(configs),
+                ex=int(self._l2_ttl),
+            )
+        except Exception as exc:
+            self._degrade(exc)
+        return configs, version
+
+    def _degrade(self, exc: Exception) -> None:
+        logger.warning("Provider config cache falling back to the database: %r", exc)
+        self.redis_errors += 1
+        self._degraded_until = time.monotonic() + self._cooldown
+
+    async def _load_from_repository(self, tenant_id: str) -> ProviderConfigs:
+        self.loads += 1
+        configs = await self._repository.list_for_tenant(tenant_id)
+        return MappingProxyType({config.provider: config for config in configs})
+
+    def _encode(self, configs: ProviderConfigs) -> bytes:
+        items: List[Dict[str, Any]] = []
+        for config in configs.values():
+            item = config.to_dict()
+            item["api_key"] = None
+            if config.api_key:
+                ciphertext = self._box.encrypt(config.api_key, self._context(config))
+                item["api_key"] = base64.b64encode(ciphertext).decode()
+            items.append(item)
+        return dumps(items)
+
+    def _decode(self, data: bytes) -> ProviderConfigs:
+        configs = {}
+        for item in loads(data):
+            config = ProviderConfig(
+                tenant_id=item["tenant_id"],
+                provider=item["provider"],
+                enabled=item["enabled"],
+                base_url=item["base_url"],
+                default_model=item["default_model"],
+                models=item["models"],
+                settings=item["settings"],
+                created_at=datetime.fromisoformat(item["created_at"]),
+                updated_at=datetime.fromisoformat(item["updated_at"]),
+            )
+            if item["api_key"]:
+                ciphertext = base64.b64decode(item["api_key"])
+                config.api_key = self._box.decrypt(ciphertext, self._context(config))
+            configs[config.provider] = config
+        return MappingProxyType(configs)
+
+    @staticmethod
+    def _context(config: ProviderConfig) -> str:
+        return f"cache:{config.tenant_id}:{config.provider}"
+
+    def _version_key(self, tenant_id: str) -> str:
+        return f"{self._key_prefix}:{{{tenant_id}}}:version"
+
+    def _data_prefix(self, tenant_id: str) -> str:
+        return f"{self._key_prefix}:{{{tenant_id}}}:v"
+
+    def _drop(self, tenant_id: str) -> None:
+        self._entries.pop(tenant_id, None)
+        # A load already in flight may have read the old data
+        self._loading.pop(tenant_id, None)
+
+    def _store(self, tenant_id: str, entry: _CacheEntry) -> None:
+        self._entries[tenant_id] = entry
+        self._entries.move_to_end(tenant_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def _on_invalidation(self, msg: Msg) -> None:
+        try:
+            tenant_id = json.loads(msg.data)["tenant_id"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed provider invalidation: %r", msg.data)
+            return
+        self._drop(str(tenant_id))
+
+
+_cache: Optional[ProviderConfigCache] = None
+
+
+async def init_provider_cache(
+    repository: ProviderConfigRepository,
+    box: SecretBox,
+    redis: Optional[Redis] = None,
+    nc: Optional[NATS] = None,
+) -> ProviderConfigCache:
+    """
+    Create the process-wide provider config cache and subscribe to invalidations
+    """
+    global _cache
+
+    _cache = ProviderConfigCache(
+        repository,
+        box,
+        redis,
+        ttl=settings.PROVIDER_CACHE_TTL_SECONDS,
+        l2_ttl=settings.PROVIDER_CACHE_L2_TTL_SECONDS,
+        max_entries=settings.PROVIDER_CACHE_MAX_ENTRIES,
+    )
+
+    if nc is not None:
+        await _cache.subscribe(nc)
+
+    return _cache
+
+
+async def close_provider_cache() -> None:
+    """
+    Tear down the process-wide provider config cache
+    """
+    global _cache
+
+    if _cache is not None:
+        await _cache.close()
+    _cache = None
+
+
+def get_provider_cache() -> Optional[ProviderConfigCache]:
+    """
+    Get the process-wide provider config cache, or None if not initialized
+    """
+    return _cache
@@ -0,0 +1,332 @@
+"""
+Tenant Resolution Cache
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from nats.aio.client import Client as NATS
+from nats.aio.msg import Msg
+from nats.aio.subscription import Subscription
+
+from src.domain.entities.tenant import Tenant
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.infrastructure.config.settings import settings
+from src.infrastructure.nats.outbox_relay import EVENT_SUBJECT_PREFIX
+from src.infrastructure.observability.metrics import (
+    tenant_cache_evictions_total,
+    tenant_cache_invalidations_total,
+    tenant_cache_lookups_total,
+    tenant_cache_refresh_failures_total,
+)
+
+logger = logging.getLogger(__name__)
+
+TENANT_INVALIDATION_SUBJECT = "platform.tenants.invalidate"
+# Lifecycle events relayed from the outbox (activation, suspension, tier changes...)
+TENANT_EVENTS_SUBJECT = f"{EVENT_SUBJECT_PREFIX}.tenant.>"
+
+_HIT = tenant_cache_lookups_total.labels("hit")
+_NEGATIVE_HIT = tenant_cache_lookups_total.labels("negative_hit")
+_STALE_HIT = tenant_cache_lookups_total.labels("stale_hit")
+_MISS = tenant_cache_lookups_total.labels("miss")
+
+
+@dataclass
+class _CacheEntry:
+    """
+    Cached lookup result; ``tenant`` is None for unknown tenants. Once
+    stale, it is not refreshed again before ``retry_at``.
+    """
+
+    tenant: Optional[Tenant]
+    expires_at: float
+    retry_at: float = 0.0
+
+
+class TenantResolver:
+    """
+    Resolves the tenant header/subdomain value to a Tenant entity
+
+    Lookups are served from a bounded in-process LRU:
+    - known tenants are cached for ``ttl`` seconds, then served stale for up
+      to ``stale_ttl`` more while a background task refreshes them; after a
+      failed refresh the next one waits ``refresh_retry`` seconds
+    - unknown tenants are cached for ``negative_ttl`` seconds so that bogus
+      headers do not reach the database
+    - concurrent misses for the same key share a single repository call
+    - entries are dropped when a replica publishes an invalidation or a
+      tenant lifecycle event is relayed; lookups then in flight are not cached
+    """
+
+    def __init__(
+        self,
+        repository: TenantRepository,
+        max_entries: int = 10000,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        stale_ttl: float = 300.0,
+        refresh_retry: float = 5.0,
+    ) -> None:
+        self._repository = repository
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._stale_ttl = stale_ttl
+        self._refresh_retry = refresh_retry
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._loading: Dict[str, "asyncio.Task[Optional[Tenant]]"] = {}
+        self._subscriptions: List[Subscription] = []
+
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.stale_hits = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.refresh_failures = 0
+
+    async def resolve(self, key: str) -> Optional[Tenant]:
+        """
+        Get the tenant for a header or subdomain value (id or slug)
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+            if now < entry.expires_at:
+                if entry.tenant is None:
+                    self.negative_hits += 1
+                    _NEGATIVE_HIT.inc()
+                else:
+                    self.hits += 1
+                    _HIT.inc()
+                return entry.tenant
+
+            if entry.tenant is not None and now < entry.expires_at + self._stale_ttl:
+                # Serve stale and refresh in the background
+                self.stale_hits += 1
+                _STALE_HIT.inc()
+                if now >= entry.retry_at:
+                    self._schedule_load(key).add_done_callback(_log_refresh_failure)
+                return entry.tenant
+
+        self.misses += 1
+        _MISS.inc()
+        # Shielded: a cancelled caller must not cancel the load other callers share
+        return await asyncio.shield(self._schedule_load(key))
+
+    def invalidate(self, *keys: str) -> None:
+        """
+        Drop cached entries for the given ids/slugs
+        """
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+                tenant_cache_invalidations_total.inc()
+            # A load already in flight may have read the old tenant: it must not be cached
+            self._loading.pop(key, None)
+
+    def invalidate_tenant(self, tenant_id: str) -> None:
+        """
+        Drop every cached entry of a tenant, whether keyed by id or by slug
+
+        Loads by slug in flight are dropped too, as they may be for this tenant.
+        """
+        self.invalidate(
+            tenant_id,
+            *(
+                key
+                for key, entry in self._entries.items()
+                if entry.tenant is not None and str(entry.tenant.id) == tenant_id
+            ),
+            *(key for key in self._loading if not _is_id(key)),
+        )
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache hit/miss counters
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+            "stale_hits": self.stale_hits,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "refresh_failures": self.refresh_failures,
+        }
+
+    async def subscribe(self, nc: NATS) -> None:
+        """
+        Listen for invalidations published by other replicas, and for tenant
+        lifecycle events; no queue group, as every replica holds a cache
+        """
+        self._subscriptions = [
+            await nc.subscribe(TENANT_INVALIDATION_SUBJECT, cb=self._on_invalidation),
+            await nc.subscribe(TENANT_EVENTS_SUBJECT, cb=self._on_event),
+        ]
+
+    async def unsubscribe(self) -> None:
+        """Stop listening for invalidations"""
+        for subscription in self._subscriptions:
+            await subscription.unsubscribe()
+        self._subscriptions = []
+
+    async def publish_invalidation(self, nc: Optional[NATS], tenants: Sequence[Tenant]) -> None:
+        """
+        Invalidate tenants locally and on every other replica
+
+        Call this after persisting new tenants (their ids and slugs may be
+        cached as unknown) or any change that affects request admission.
+        Lifecycle changes also arrive as events, but only once relayed.
+        """
+        keys = [key for tenant in tenants for key in (str(tenant.id), tenant.slug) if key]
+        self.invalidate(*keys)
+
+        if nc is not None and keys:
+            await nc.publish(TENANT_INVALIDATION_SUBJECT, json.dumps({"keys": keys}).encode())
+
+    async def close(self) -> None:
+        """
+        Unsubscribe and cancel in-flight background refreshes
+        """
+        await self.unsubscribe()
+        for task in list(self._loading.values()):
+            task.cancel()
+        self._loading.clear()
+
+    def _schedule_load(self, key: str) -> "asyncio.Task[Optional[Tenant]]":
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key))
+            self._loading[key] = task
+        return task
+
+    async def _load(self, key: str) -> Optional[Tenant]:
+        task = asyncio.current_task()
+        try:
+            tenant = await self._fetch(key)
+        except Exception:
+            stale = self._entries.get(key)
+            if stale is not None and stale.tenant is not None:
+                logger.warning(
+                    "Tenant refresh failed for %s, serving stale entry", key, exc_info=True
+                )
+                # Back off, so that an outage does not cost a failing query per request
+                stale.retry_at = time.monotonic() + self._refresh_retry
+                self.refresh_failures += 1
+                tenant_cache_refresh_failures_total.inc()
+                return stale.tenant
+            raise
+        finally:
+            # Unregistered by an invalidation while in flight: the result is served, not cached
+            registered = self._loading.get(key) is task
+            if registered:
+                del self._loading[key]
+
+        if registered:
+            ttl = self._ttl if tenant is not None else self._negative_ttl
+            self._store(key, _CacheEntry(tenant=tenant, expires_at=time.monotonic() + ttl))
+        return tenant
+
+    async def _fetch(self, key: str) -> Optional[Tenant]:
+        if not _is_id(key):
+            return await self._repository.get_by_slug(key)
+        return await self._repository.get_by_id(UUID(key))
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            tenant_cache_evictions_total.inc()
+
+    async def _on_invalidation(self, msg: Msg) -> None:
+        try:
+            payload = json.loads(msg.data)
+        except ValueError:
+            logger.warning("Ignoring malformed tenant invalidation: %r", msg.data)
+            return
+
+        self.invalidate(*(str(key) for key in payload.get("keys", ())))
+
+    async def _on_event(self, msg: Msg) -> None:
+        try:
+            self.invalidate_tenant(str(json.loads(msg.data)["aggregate_id"]))
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring malformed tenant event on %s: %r", msg.subject, exc)
+
+
+def _is_id(key: str) -> bool:
+    """Whether a lookup key is a tenant id rather than a slug"""
+    try:
+        UUID(key)
+    except ValueError:
+        return False
+    return True
+
+
+def _log_refresh_failure(task: "asyncio.Task[Optional[Tenant]]") -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background tenant refresh failed", exc_info=task.exception())
+
+
+_resolver: Optional[TenantResolver] = None
+
+
+async def init_tenant_resolver(
+    repository: TenantRepository,
+    nc: Optional[NATS] = None,
+) -> TenantResolver:
+    """
+    Create the process-wide tenant resolver and subscribe to invalidations
+    """
+    global _resolver
+
+    _resolver = TenantResolver(
+        repository,
+        max_entries=settings.TENANT_CACHE_MAX_ENTRIES,
+        ttl=settings.TENANT_CACHE_TTL_SECONDS,
+        negative_ttl=settings.TENANT_CACHE_NEGATIVE_TTL_SECONDS,
+        stale_ttl=settings.TENANT_CACHE_STALE_TTL_SECONDS,
+        refresh_retry=settings.TENANT_CACHE_REFRESH_RETRY_SECONDS,
+    )
+
+    if nc is not None:
+        await _resolver.subscribe(nc)
+
+    return _resolver
+
+
+async def close_tenant_resolver() -> None:
+    """
+    Tear down the process-wide tenant resolver
+    """
+    global _resolver
+
+    if _resolver is not None:
+        await _resolver.close()
+    _resolver = None
+
+
+def get_tenant_resolver() -> Optional[TenantResolver]:
+    """
+    Get the process-wide tenant resolver, or None if tenants are not validated
+    """
+    return _resolver
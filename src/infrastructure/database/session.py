@@ -0,0 +1,156 @@
+"""
+Async Database Engine and Session Management
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.tracing import instrument_engine
+
+logger = logging.getLogger(__name__)
+
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def build_engine(
+    url: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+) -> AsyncEngine:
+    """
+    Create an asyncpg engine with prepared statement caching enabled, traced
+    when tracing is on
+    """
+    engine = create_async_engine(
+        url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        echo=False,
+        connect_args={
+            # SQLAlchemy's per-connection cache of asyncpg prepared statements
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            # asyncpg's own statement cache for raw driver queries
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "server_settings": {"application_name": settings.SERVICE_NAME},
+        },
+    )
+    instrument_engine(engine)
+    return engine
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open ``connections`` pooled connections concurrently so the first
+    requests do not pay for TCP/TLS/auth handshakes
+
+    Returns the number of connections that were opened.
+    """
+
+    async def _open():
+        connection = await engine.connect()
+        await connection.execute(text("SELECT 1"))
+        return connection
+
+    results = await asyncio.gather(*(_open() for _ in range(connections)), return_exceptions=True)
+    opened = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning("Database warm-up connection failed: %r", result)
+        else:
+            opened += 1
+            await result.close()
+    return opened
+
+
+async def init_database() -> AsyncEngine:
+    """
+    Create the shared engine and session factory and warm up the pool
+    """
+    global _engine, _session_factory
+
+    _engine = build_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    )
+    _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
+
+    warm = min(settings.DATABASE_POOL_WARMUP, settings.DATABASE_POOL_SIZE)
+    if warm > 0:
+        opened = await warm_up(_engine, warm)
+        logger.info("Database pool warmed up with %d/%d connections", opened, warm)
+
+    return _engine
+
+
+async def close_database() -> None:
+    """
+    Dispose of the shared engine and close every pooled connection
+    """
+    global _engine, _session_factory
+
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+
+def get_engine() -> Optional[AsyncEngine]:
+    """
+    Get the shared engine, or None if the database is not initialized
+    """
+    return _engine
+
+
+def get_session_factory() -> Optional[async_sessionmaker[AsyncSession]]:
+    """
+    Get the shared session factory, or None if the database is not initialized
+    """
+    return _session_factory
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency yielding a session that is closed after the request
+    """
+    if _session_factory is None:
+        raise RuntimeError("Database is not initialized")
+
+    async with _session_factory() as session:
+        yield session
+
+
+def pool_stats(engine: Optional[AsyncEngine] = None) -> Dict[str, Any]:
+    """
+    Get connection pool usage, including saturation as a 0-1 ratio
+    """
+    engine = engine or _engine
+    if engine is None:
+        return {}
+
+    pool = engine.sync_engine.pool
+    capacity = pool.size() + max(0, getattr(pool, "_max_overflow", 0))
+    checked_out = pool.checkedout()
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": max(0, pool.overflow()),
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 4) if capacity else 0.0,
+    }
@@ -0,0 +1,389 @@
+"""
+Tenant-aware Database Connection Routing
+"""
+
+import asyncio
+import logging
+import re
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Callable, Dict, Optional, Set
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.domain.entities.tenant import Tenant
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import build_engine, get_engine, pool_stats
+
+logger = logging.getLogger(__name__)
+
+TenantLocator = Callable[[str, Optional[Tenant]], str]
+
+# SQLSTATE invalid_catalog_name: the database does not exist
+MISSING_DATABASE_SQLSTATE = "3D000"
+
+
+class TenantPoolExhaustedError(RuntimeError):
+    """Raised when no tenant pool can be opened without exceeding the global cap"""
+
+
+class TenantDatabaseMissingError(RuntimeError):
+    """Raised when a tenant's database has not been created on its server"""
+
+
+def _is_missing_database(exc: Optional[BaseException]) -> bool:
+    # asyncpg raises its own error on connect; statements wrap it in a DBAPIError
+    while exc is not None:
+        if getattr(exc, "sqlstate", None) == MISSING_DATABASE_SQLSTATE:
+            return True
+        exc = getattr(exc, "orig", None) or exc.__cause__
+    return False
+
+
+def locate_tenant_database(tenant_id: str, tenant: Optional[Tenant] = None) -> str:
+    """
+    Resolve the database URL holding a tenant's data
+
+    An entry in TENANT_DATABASE_URLS, by tenant id or slug, pins the tenant
+    to a specific placement; it is kept server-side, as the URL carries
+    credentials. Otherwise, with ``database_per_tenant`` isolation, the
+    tenant gets its own database on the DATABASE_URL server (tenants whose
+    database has not been created yet stay in the shared database, see
+    TenantEngineRegistry); any other strategy keeps every tenant in the
+    shared database.
+    """
+    pinned = settings.TENANT_DATABASE_URLS
+    if pinned:
+        keys = (str(tenant.id), tenant.slug) if tenant is not None else (tenant_id,)
+        url = next((pinned[key] for key in keys if key in pinned), None)
+        if url:
+            return url
+
+    if settings.TENANT_ISOLATION != "database_per_tenant":
+        return settings.DATABASE_URL
+
+    key = tenant.id.hex if tenant is not None else re.sub(r"[^a-z0-9_]", "_", tenant_id.lower())
+    database = settings.TENANT_DATABASE_NAME_TEMPLATE.format(tenant=key)
+    return (
+        make_url(settings.DATABASE_URL).set(database=database).render_as_string(hide_password=False)
+    )
+
+
+@dataclass
+class _TenantPool:
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    capacity: int
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class TenantEngineRegistry:
+    """
+    Lazily created, bounded connection pools keyed by tenant database
+
+    - pools are created on first use and keyed by database URL, so tenants
+      co-located in the same database share one pool (and tenants in the
+      shared DATABASE_URL database use the main engine)
+    - a located database that does not exist, and is not pinned in
+      TENANT_DATABASE_URLS, is not provisioned: its tenants use the shared
+      database until this process restarts
+    - the summed capacity of all tenant pools never exceeds
+      ``max_connections``; when a new pool does not fit, the least recently
+      used idle pools are disposed first
+    - pools idle for ``idle_timeout`` seconds are closed by a background sweep
+    - a pool dropped while its session factory is still held (e.g. by a
+      streaming response) keeps its capacity reserved, and is disposed once
+      the last holder lets go of the factory
+    """
+
+    def __init__(
+        self,
+        locator: TenantLocator = locate_tenant_database,
+        shared_engine: Optional[AsyncEngine] = None,
+        pool_size: int = 2,
+        max_overflow: int = 3,
+        pool_timeout: float = 10.0,
+        max_connections: int = 200,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        self._locator = locator
+        self._shared_engine = shared_engine
+        self._shared_factory = (
+            async_sessionmaker(shared_engine, expire_on_commit=False) if shared_engine else None
+        )
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._pool_timeout = pool_timeout
+        self._max_connections = max_connections
+        self._idle_timeout = idle_timeout
+
+        self._pools: "OrderedDict[str, _TenantPool]" = OrderedDict()
+        # Located databases found missing, whose tenants use the shared database
+        self._unprovisioned: Set[str] = set()
+        # Engines of dropped pools whose factories are still held, with their capacity
+        self._retired: Dict[AsyncEngine, int] = {}
+        self._reserved = 0
+        self._lock = asyncio.Lock()
+        self._sweeper: Optional[asyncio.Task] = None
+
+        self.created = 0
+        self.evicted = 0
+
+    async def session_factory_for(
+        self,
+        tenant_id: str,
+        tenant: Optional[Tenant] = None,
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Get a session factory bound to the tenant's database
+        """
+        url = self._locator(tenant_id, tenant)
+        if url in self._unprovisioned:
+            url = settings.DATABASE_URL
+
+        if self._shared_factory is not None and url == settings.DATABASE_URL:
+            return self._shared_factory
+
+        pool = self._pools.get(url)
+        if pool is None:
+            try:
+                pool = await self._open(url)
+            except TenantDatabaseMissingError:
+                if url == settings.DATABASE_URL or url in settings.TENANT_DATABASE_URLS.values():
+                    raise
+                logger.warning(
+                    "Database of tenant %s is not provisioned; using the shared database", tenant_id
+                )
+                self._unprovisioned.add(url)
+                return await self.session_factory_for(tenant_id, tenant)
+        pool.last_used = time.monotonic()
+        self._pools.move_to_end(url)
+        return pool.session_factory
+
+    def start(self) -> None:
+        """Start the idle pool sweeper"""
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+
+    async def close(self) -> None:
+        """
+        Stop the sweeper and dispose of every tenant pool
+        """
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+        async with self._lock:
+            for url in list(self._pools):
+                await self._dispose(url)
+            for engine in list(self._retired):
+                self._reserved -= self._retired.pop(engine)
+                await engine.dispose()
+
+    async def sweep(self) -> int:
+        """
+        Dispose of pools idle for longer than the idle timeout
+        """
+        deadline = time.monotonic() - self._idle_timeout
+        closed = 0
+        async with self._lock:
+            idle = [
+                url
+                for url, pool in self._pools.items()
+                if pool.last_used < deadline and pool.engine.sync_engine.pool.checkedout() == 0
+            ]
+            for url in idle:
+                await self._dispose(url)
+                closed += 1
+        return closed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get registry usage: open pools, reserved capacity and checkouts
+        """
+        checked_out = sum(pool_stats(pool.engine)["checked_out"] for pool in self._pools.values())
+        return {
+            "pools": len(self._pools),
+            "retired_pools": len(self._retired),
+            "reserved_connections": self._reserved,
+            "max_connections": self._max_connections,
+            "checked_out": checked_out,
+            "created": self.created,
+            "evicted": self.evicted,
+            "unprovisioned": len(self._unprovisioned),
+        }
+
+    async def _open(self, url: str) -> _TenantPool:
+        async with self._lock:
+            pool = self._pools.get(url)
+            if pool is not None:
+                return pool
+
+            capacity = self._pool_size + self._max_overflow
+            while self._reserved + capacity > self._max_connections:
+                if not await self._evict_idle():
+                    raise TenantPoolExhaustedError(
+                        f"All {self._max_connections} tenant connections are in use"
+                    )
+
+            engine = build_engine(
+                url,
+                pool_size=self._pool_size,
+                max_overflow=self._max_overflow,
+                pool_timeout=self._pool_timeout,
+            )
+            # Connect once so a database that was never created is told apart
+            # from one that is merely unreachable
+            try:
+                async with engine.connect():
+                    pass
+            except Exception as exc:
+                await engine.dispose()
+                if _is_missing_database(exc):
+                    database = make_url(url).database
+                    raise TenantDatabaseMissingError(f"Database {database} does not exist") from exc
+                raise
+            pool = _TenantPool(
+                engine=engine,
+                session_factory=async_sessionmaker(engine, expire_on_commit=False),
+                capacity=capacity,
+            )
+            self._pools[url] = pool
+            self._reserved += capacity
+            self.created += 1
+            return pool
+
+    async def _evict_idle(self) -> bool:
+        # Least recently used first
+        url = next(
+            (
+                url
+                for url, pool in self._pools.items()
+                if pool.engine.sync_engine.pool.checkedout() == 0
+            ),
+            None,
+        )
+        if url is None:
+            return False
+        await self._dispose(url)
+        self.evicted += 1
+        return True
+
+    async def _dispose(self, url: str) -> None:
+        """
+        Drop a pool; callers must not keep a reference to it, or its factory
+        counts as held
+        """
+        pool = self._pools.pop(url)
+        engine, capacity = pool.engine, pool.capacity
+        factory = weakref.ref(pool.session_factory)
+        del pool
+
+        held = factory()
+        if held is None:
+            self._reserved -= capacity
+            await engine.dispose()
+            return
+
+        self._retired[engine] = capacity
+        weakref.finalize(held, self._release, engine, asyncio.get_running_loop()).atexit = False
+
+    def _release(self, engine: AsyncEngine, loop: asyncio.AbstractEventLoop) -> None:
+        # Runs when the last holder drops a retired pool's factory, in any thread
+        capacity = self._retired.pop(engine, None)
+        if capacity is None:
+            return
+        self._reserved -= capacity
+        if not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(engine.dispose(), loop)
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(max(1.0, self._idle_timeout / 4))
+            try:
+                closed = await self.sweep()
+                if closed:
+                    logger.info("Closed %d idle tenant pools", closed)
+            except Exception:
+                logger.exception("Tenant pool sweep failed")
+
+
+_registry: Optional[TenantEngineRegistry] = None
+
+
+def init_tenant_engines() -> TenantEngineRegistry:
+    """
+    Create the process-wide tenant engine registry
+    """
+    global _registry
+
+    _registry = TenantEngineRegistry(
+        shared_engine=get_engine(),
+        pool_size=settings.TENANT_POOL_SIZE,
+        max_overflow=settings.TENANT_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        max_connections=settings.TENANT_DB_MAX_CONNECTIONS,
+        idle_timeout=settings.TENANT_POOL_IDLE_SECONDS,
+    )
+    _registry.start()
+    return _registry
+
+
+async def close_tenant_engines() -> None:
+    """
+    Dispose of every tenant pool
+    """
+    global _registry
+
+    if _registry is not None:
+        await _registry.close()
+    _registry = None
+
+
+def get_tenant_engines() -> Optional[TenantEngineRegistry]:
+    """
+    Get the process-wide tenant engine registry, or None if not initialized
+    """
+    return _registry
+
+
+async def get_tenant_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
+    """
+    FastAPI dependency resolving the session factory for the current tenant
+
+    The tenant comes from ``request.state`` as set by the request pipeline.
+    Use this rather than ``get_tenant_session`` when a session must outlive
+    the endpoint call, e.g. inside a streaming response.
+    """
+    tenant_id = getattr(request.state, "tenant_id", None)
+    if not tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Tenant context required"
+        )
+    if _registry is None:
+        raise RuntimeError("Tenant databases are not initialized")
+
+    try:
+        return await _registry.session_factory_for(
+            tenant_id,
+            getattr(request.state, "tenant", None),
+        )
+    except TenantPoolExhaustedError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
+
+
+async def get_tenant_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency yielding a session on the current tenant's database
+    """
+    session_factory = await get_tenant_session_factory(request)
+    async with session_factory() as session:
+        yield session
@@ -0,0 +1,310 @@
+"""
+Content-Negotiated Response Compression
+"""
+
+import asyncio
+import logging
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Compression levels per encoding; bulk exports trade ratio for throughput
+DEFAULT_LEVELS: Dict[str, int] = {"zstd": 3, "br": 2, "gzip": 6}
+MEDIA_TYPE_LEVELS: Dict[str, Dict[str, int]] = {
+    "application/x-ndjson": {"zstd": 1, "br": 1, "gzip": 1},
+    "text/csv": {"zstd": 1, "br": 1, "gzip": 1},
+}
+
+# Media types worth compressing; anything else (images, archives, already
+# compressed downloads) passes through untouched
+COMPRESSIBLE_MEDIA_TYPES = frozenset(
+    {
+        "application/json",
+        "application/problem+json",
+        "application/x-ndjson",
+        "application/javascript",
+        "application/xml",
+        "application/vnd.oai.openapi+json",
+        "image/svg+xml",
+    }
+)
+# Server-sent events must reach the client as they are written
+INCOMPRESSIBLE_TEXT_TYPES = frozenset({"text/event-stream"})
+
+
+class _ZlibStream:
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    def __init__(self, level: int) -> None:
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int) -> None:
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return obj.compress(data) + obj.flush()
+
+
+def _brotli(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def _zstd(data: bytes, level: int) -> bytes:
+    # Compressors are not thread-safe, and bodies may be compressed in threads
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+# Encoding -> (one-shot compress, streaming encoder factory)
+CODECS: Dict[str, tuple] = {"gzip": (_gzip, _ZlibStream)}
+if brotli is not None:
+    CODECS["br"] = (_brotli, _BrotliStream)
+if zstandard is not None:
+    CODECS["zstd"] = (_zstd, _ZstdStream)
+
+
+def available_encodings(preferred: Sequence[str]) -> List[str]:
+    """Filter a preference list to the encodings whose libraries are installed"""
+    encodings = [name for name in preferred if name in CODECS]
+    for name in preferred:
+        if name not in CODECS:
+            logger.warning("Response compression with %r disabled: library not installed", name)
+    return encodings
+
+
+@lru_cache(maxsize=512)
+def negotiate(accept_encoding: str, preferred: Sequence[str]) -> Optional[str]:
+    """
+    Pick the encoding for an ``Accept-Encoding`` value
+
+    The client's highest q-value wins; ties go to the server preference
+    order. ``*`` covers encodings not listed and ``q=0`` refuses one.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip()] = quality
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for name in preferred:
+        weight = weights.get(name, wildcard)
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+def compressible(content_type: str) -> bool:
+    """Check whether a response of this content type is worth compressing"""
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type.startswith("text/"):
+        return media_type not in INCOMPRESSIBLE_TEXT_TYPES
+    return media_type in COMPRESSIBLE_MEDIA_TYPES or media_type.endswith("+json")
+
+
+def compression_level(encoding: str, content_type: str) -> int:
+    """Level for an encoding and content type"""
+    media_type = content_type.partition(";")[0].strip().lower()
+    return MEDIA_TYPE_LEVELS.get(media_type, DEFAULT_LEVELS).get(encoding, DEFAULT_LEVELS[encoding])
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing responses with zstd, brotli or gzip
+
+    The encoding is negotiated from ``Accept-Encoding`` and the level
+    depends on the content type. Responses already carrying a
+    ``Content-Encoding`` or of media types that do not compress are passed
+    through. Streamed responses are buffered only until ``minimum_size``
+    bytes have arrived (shorter ones go out uncompressed), then compressed
+    in blocks of ``flush_size`` input bytes, each flushed to the client, so
+    it is never far behind the producer and small chunks (e.g. NDJSON
+    lines) do not cost a compressor call each. Bodies or blocks of at
+    least ``thread_threshold`` bytes are compressed in a worker thread.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        thread_threshold: int = 256 * 1024,
+        flush_size: int = 64 * 1024,
+        encodings: Sequence[str] = ("zstd", "br", "gzip"),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_threshold = thread_threshold
+        self.flush_size = flush_size
+        self.encodings = tuple(available_encodings(encodings))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        encoding = negotiate(accept_encoding, self.encodings) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressedResponder(self, encoding, send).run(scope, receive)
+
+
+class _CompressedResponder:
+    """Per-request state of CompressionMiddleware"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.level = 0
+        self.buffer: List[bytes] = []
+        self.buffered = 0
+        self.stream = None
+
+    async def run(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.on_send)
+
+    async def on_send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if "content-encoding" in headers or not compressible(content_type):
+                self.passthrough = True
+                await self.send(message)
+                return
+            self.start = message
+            self.level = compression_level(self.encoding, content_type)
+            return
+
+        if self.passthrough or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            await self._send_chunk(body, more_body)
+            return
+
+        self.buffer.append(body)
+        self.buffered += len(body)
+        if more_body and self.buffered < self.middleware.minimum_size:
+            return
+
+        body = b"".join(self.buffer)
+        self.buffer = []
+        self.buffered = 0
+        if not more_body:
+            await self._send_whole(body)
+        else:
+            await self._start_stream(body)
+
+    async def _send_whole(self, body: bytes) -> None:
+        if len(body) < self.middleware.minimum_size:
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": body})
+            return
+
+        compress = CODECS[self.encoding][0]
+        if len(body) >= self.middleware.thread_threshold:
+            compressed = await asyncio.to_thread(compress, body, self.level)
+        else:
+            compressed = compress(body, self.level)
+
+        headers = self._compressed_headers()
+        headers["Content-Length"] = str(len(compressed))
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    async def _start_stream(self, body: bytes) -> None:
+        headers = self._compressed_headers()
+        del headers["Content-Length"]
+        self.stream = CODECS[self.encoding][1](self.level)
+        await self.send(self.start)
+        await self._send_chunk(body, True)
+
+    async def _send_chunk(self, body: bytes, more_body: bool) -> None:
+        self.buffer.append(body)
+        self.buffered += len(body)
+        if more_body and self.buffered < self.middleware.flush_size:
+            return
+
+        data = b"".join(self.buffer)
+        self.buffer = []
+        self.buffered = 0
+        stream = self.stream
+
+        def encode() -> bytes:
+            return stream.compress(data) + (stream.flush() if more_body else stream.finish())
+
+        if len(data) >= self.middleware.thread_threshold:
+            output = await asyncio.to_thread(encode)
+        else:
+            output = encode()
+        await self.send({"type": "http.response.body", "body": output, "more_body": more_body})
+
+    def _compressed_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(scope=self.start)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        return headers
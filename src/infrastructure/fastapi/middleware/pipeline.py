@@ -0,0 +1,218 @@
+"""
+Request Pipeline Middleware
+"""
+
+import logging
+import time
+import uuid
+from typing import Any, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.domain.entities.tenant import TenantStatus
+from src.infrastructure.cache.tenant_resolver import get_tenant_resolver
+from src.infrastructure.config.settings import settings
+from src.infrastructure.fastapi.middleware.tenant import extract_tenant_id
+from src.infrastructure.fastapi.routing import RouteTemplateResolver
+from src.infrastructure.metering.quota_meter import get_quota_meter
+from src.infrastructure.observability.access_log import get_access_log
+from src.infrastructure.observability.metrics import observe_request, requests_in_progress
+from src.infrastructure.observability.tracing import (
+    end_server_span,
+    get_tracer,
+    start_server_span,
+    traced,
+)
+from src.infrastructure.ratelimit.limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Paths served without tenant validation or rate limiting (probes, metrics and API docs)
+EXEMPT_PATH_PREFIXES = ("/health", "/metrics", "/docs", "/redoc", "/openapi.json")
+
+
+class RequestPipelineMiddleware:
+    """
+    Pure ASGI middleware handling tenant resolution, rate limiting, quota
+    metering, request tracing headers, spans and metrics in a single pass
+    over ``scope``/``send``
+
+    Unlike ``BaseHTTPMiddleware`` it spawns no task and does not re-wrap the
+    response stream, so streaming responses are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.routes = RouteTemplateResolver()
+        self.metrics_enabled = settings.ENABLE_METRICS
+        self.tenant_base_domain = settings.TENANT_BASE_DOMAIN
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        headers = Headers(scope=scope)
+
+        # Generate request ID if not present
+        request_id = headers.get("x-request-id") or str(uuid.uuid4())
+        tenant_id = extract_tenant_id(headers, self.tenant_base_domain)
+
+        # Store request context in request state for use in endpoints
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["tenant_id"] = tenant_id
+
+        status_code = 500
+        extra_headers: List[Tuple[str, str]] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = MutableHeaders(scope=message)
+                response_headers.append("X-Request-Id", request_id)
+                response_headers.append(
+                    "X-Process-Time", str((time.perf_counter_ns() - start_ns) / 1e9)
+                )
+                if tenant_id:
+                    response_headers.append("X-Tenant-Id", tenant_id)
+                for name, value in extra_headers:
+                    response_headers.append(name, value)
+            await send(message)
+
+        if self.metrics_enabled:
+            in_progress = requests_in_progress(scope["method"])
+            in_progress.inc()
+
+        server_span = None
+        tracer = get_tracer()
+        if tracer is not None:
+            server_span = start_server_span(
+                tracer,
+                scope["method"],
+                headers,
+                {
+                    "http.method": scope["method"],
+                    "http.target": scope["path"],
+                    "http.request_id": request_id,
+                    "tenant.id": tenant_id or "",
+                },
+            )
+
+        try:
+            rejection = None
+            if not scope["path"].startswith(EXEMPT_PATH_PREFIXES):
+                rejection = await self._admit(scope, tenant_id, extra_headers)
+
+            if rejection is not None:
+                await rejection(scope, receive, send_wrapper)
+            else:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            if self.metrics_enabled:
+                in_progress.dec()
+            self._record(
+                scope,
+                request_id,
+                status_code,
+                time.perf_counter_ns() - start_ns,
+                server_span,
+            )
+
+    async def _admit(
+        self,
+        scope: Scope,
+        tenant_id: Optional[str],
+        extra_headers: List[Tuple[str, str]],
+    ) -> Optional[Response]:
+        """
+        Validate the tenant and apply rate limits and quotas, returning a
+        rejection response or None if the request may proceed
+        """
+        tenant = None
+
+        # Validate tenant exists and is active
+        resolver = get_tenant_resolver()
+        if tenant_id and resolver is not None:
+            try:
+                with traced("tenant.resolve"):
+                    tenant = await resolver.resolve(tenant_id)
+            except Exception as exc:
+                logger.warning("Tenant lookup failed for %s: %r", tenant_id, exc)
+                return Response(content="Tenant lookup unavailable", status_code=503)
+
+            if tenant is None or tenant.status != TenantStatus.ACTIVE:
+                return Response(content="Invalid or inactive tenant", status_code=403)
+
+            scope["state"]["tenant"] = tenant
+
+        # Rate limit per tenant (or client address) and route
+        limiter = get_rate_limiter()
+        if limiter is not None:
+            if tenant_id:
+                subject = tenant_id
+            else:
+                client = scope.get("client")
+                subject = client[0] if client else "anonymous"
+            with traced("ratelimit.hit"):
+                result = await limiter.hit(
+                    f"{subject}:{scope['method']}:{self.routes.resolve(scope)}"
+                )
+
+            extra_headers.extend(result.headers())
+            if not result.allowed:
+                return Response(content="Rate limit exceeded", status_code=429)
+
+        # Enforce the monthly request quota from the locally metered usage
+        meter = get_quota_meter()
+        if tenant is not None and meter is not None:
+            if meter.is_quota_exceeded(tenant, "requests"):
+                return Response(content="Monthly request quota exceeded", status_code=429)
+            meter.record(str(tenant.id), "requests")
+
+        return None
+
+    def _record(
+        self,
+        scope: Scope,
+        request_id: str,
+        status_code: int,
+        duration_ns: int,
+        server_span: Optional[Tuple[Any, object]] = None,
+    ) -> None:
+        """
+        Record request metrics, the access log and the server span once the
+        response has been fully sent
+        """
+        access_log = get_access_log()
+        if not self.metrics_enabled and access_log is None and server_span is None:
+            return
+
+        # The router stores the matched route in scope; rejected and
+        # unrouted requests fall back to the template resolver
+        route = scope.get("route")
+        template = route.path if route is not None else self.routes.resolve(scope)
+        state = scope["state"]
+
+        if self.metrics_enabled:
+            tenant = state.get("tenant")
+            tier = tenant.tier.value if tenant is not None else "none"
+            observe_request(scope["method"], template, status_code, tier, duration_ns)
+
+        if access_log is not None:
+            access_log.record(
+                request_id,
+                state.get("tenant_id"),
+                scope["method"],
+                scope["path"],
+                template,
+                status_code,
+                duration_ns,
+            )
+
+        if server_span is not None:
+            end_server_span(*server_span, scope["method"], template, status_code)
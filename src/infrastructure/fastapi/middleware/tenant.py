@@ -1,49 +1,29 @@
 """
-Multi-tenancy Middleware
+Multi-tenancy Request Helpers
 """
 
-from typing import Callable
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 
 
-class TenantMiddleware(BaseHTTPMiddleware):
+def extract_tenant_id(headers: Headers, base_domain: Optional[str] = None) -> Optional[str]:
     """
-    Middleware for handling multi-tenancy
-    """
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process the request and extract tenant information
-        """
-        # Extract tenant from headers or subdomain
-        tenant_id = request.headers.get("X-Tenant-Id")
-
-        # If not in header, try to extract from subdomain
-        if not tenant_id:
-            host = request.headers.get("host", "")
-            # Example: tenant1.platform.com -> tenant1
-            if "." in host:
-                tenant_id = host.split(".")[0]
-
-        # Store tenant ID in request state for use in endpoints
-        request.state.tenant_id = tenant_id
+    Extract the tenant identifier from the X-Tenant-Id header or the subdomain
 
-        # TODO: Validate tenant exists and is active
-        # if tenant_id:
-        #     tenant = await get_tenant(tenant_id)
-        #     if not tenant or tenant.status != "active":
-        #         return Response(
-        #             content="Invalid or inactive tenant",
-        #             status_code=403
-        #         )
-
-        # Process request
-        response = await call_next(request)
-
-        # Add tenant ID to response headers
-        if tenant_id:
-            response.headers["X-Tenant-Id"] = tenant_id
-
-        return response
\ No newline at end of file
+    Only a single label directly under ``base_domain`` names a tenant
+    (``tenant1.platform.com`` with base domain ``platform.com``); other hosts,
+    such as IP addresses or the API's own name, carry no tenant.
+    """
+    tenant_id = headers.get("x-tenant-id")
+
+    # If not in header, try to extract from subdomain
+    if not tenant_id and base_domain:
+        host = headers.get("host", "").partition(":")[0].lower()
+        suffix = "." + base_domain.strip(".").lower()
+        if host.endswith(suffix):
+            label = host[: -len(suffix)]
+            if label and "." not in label:
+                tenant_id = label
+
+    return tenant_id or None
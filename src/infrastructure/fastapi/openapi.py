@@ -0,0 +1,59 @@
+"""
+Precomputed OpenAPI Schema
+
+The schema is generated at build time, so serving the docs does not
+import every router or walk every route in a running worker:
+
+    python -m src.infrastructure.fastapi.openapi openapi.json
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+
+from src.infrastructure.fastapi.routing import load_all_routers
+
+
+def generate_schema(app: FastAPI) -> Dict[str, Any]:
+    """Build the schema from every route, importing lazily mounted routers"""
+    load_all_routers(app)
+    return get_openapi(
+        title=app.title,
+        version=app.version,
+        description=app.description,
+        routes=app.routes,
+    )
+
+
+def install_openapi(app: FastAPI, schema_path: Optional[str]) -> None:
+    """
+    Serve the schema from ``schema_path`` when the file exists, falling back
+    to generating it on first use
+    """
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema is None:
+            path = Path(schema_path) if schema_path else None
+            if path is not None and path.is_file():
+                app.openapi_schema = orjson.loads(path.read_bytes())
+            else:
+                app.openapi_schema = generate_schema(app)
+        return app.openapi_schema
+
+    app.openapi = openapi
+
+
+def write_schema(path: str) -> None:
+    """Generate the application's schema and write it to ``path``"""
+    from src.main import create_app
+
+    schema = generate_schema(create_app())
+    Path(path).write_bytes(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
+
+
+if __name__ == "__main__":
+    write_schema(sys.argv[1] if len(sys.argv) > 1 else "openapi.json")
@@ -0,0 +1,23 @@
+"""
+JSON Response Classes
+"""
+
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from src.infrastructure.serialization.encoder import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson
+
+    Used as the application's default response class. Endpoints can also
+    return an instance directly with domain entities in ``content``, which
+    skips FastAPI's ``jsonable_encoder`` pass and ``response_model``
+    validation - only do that for trusted, internally built data.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,146 @@
+"""
+Router Registration and Route Template Resolution
+"""
+
+import importlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+from src.infrastructure.config.settings import settings
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass(frozen=True, slots=True)
+class RouterSpec:
+    """
+    Manifest entry: the module defining a ``router`` and where it is mounted
+
+    ``eager`` routers are imported at startup even in lazy mode (e.g. the
+    probes' health endpoints); ``enabled_by`` names a boolean setting that
+    must be on for the router to be mounted at all.
+    """
+
+    module: str
+    prefix: str
+    tags: Tuple[str, ...] = ()
+    eager: bool = False
+    enabled_by: Optional[str] = None
+
+    def load(self) -> APIRouter:
+        """Import the module and get its router"""
+        return importlib.import_module(self.module).router
+
+
+class LazyRouter(BaseRoute):
+    """
+    Placeholder for a router whose module is imported on the first request
+    under its prefix
+
+    That request imports the module, swaps the placeholder for the real
+    routes and is dispatched again. The import is synchronous, so two
+    requests cannot both load the router.
+    """
+
+    def __init__(self, app: FastAPI, spec: RouterSpec) -> None:
+        self.app = app
+        self.spec = spec
+        self.path = spec.prefix
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if scope["type"] == "http":
+            path = scope["path"]
+            # Custom methods (e.g. /v1/tenants:batch) belong to the prefix's router too
+            if path == self.path or path.startswith((self.path + "/", self.path + ":")):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, **path_params: Any):
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.load()
+        await self.app.router(scope, receive, send)
+
+    def load(self) -> None:
+        """Replace the placeholder with the router's routes, once"""
+        routes = self.app.router.routes
+        if self in routes:
+            routes.remove(self)
+            include_router(self.app, self.spec)
+
+
+def include_router(app: FastAPI, spec: RouterSpec) -> None:
+    """Import a manifest entry's router and mount it"""
+    app.include_router(spec.load(), prefix=spec.prefix, tags=list(spec.tags))
+
+
+def include_routers(app: FastAPI, specs: Iterable[RouterSpec], lazy: bool = False) -> None:
+    """
+    Mount the routers of a manifest, in order
+
+    In lazy mode only eager routers are imported now; the others get a
+    placeholder that imports them on their first request.
+    """
+    for spec in specs:
+        if spec.enabled_by and not getattr(settings, spec.enabled_by):
+            continue
+        if lazy and not spec.eager:
+            app.router.routes.append(LazyRouter(app, spec))
+        else:
+            include_router(app, spec)
+
+
+def load_all_routers(app: FastAPI) -> None:
+    """Import every router still behind a placeholder (e.g. to build the schema)"""
+    for route in list(app.router.routes):
+        if isinstance(route, LazyRouter):
+            route.load()
+
+
+class RouteTemplateResolver:
+    """
+    Maps a request to its route template (e.g. ``/v1/tenants/{tenant_id}``)
+    before routing has run
+
+    Templates keep rate limit keys and metric labels low-cardinality. Results
+    are memoized per (method, path) in a bounded LRU, except prefixes of
+    routers not loaded yet, which resolve to finer templates once loaded.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self._max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    def resolve(self, scope: Scope) -> str:
+        """
+        Get the route template for an HTTP scope
+        """
+        key = (scope["method"], scope["path"])
+        template = self._cache.get(key)
+        if template is not None:
+            self._cache.move_to_end(key)
+            return template
+
+        template, final = self._match(scope)
+        if final:
+            self._cache[key] = template
+            if len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+        return template
+
+    @staticmethod
+    def _match(scope: Scope) -> Tuple[str, bool]:
+        partial = None
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                return route.path, not isinstance(route, LazyRouter)
+            if match is Match.PARTIAL and partial is None:
+                partial = route.path
+        return partial or UNMATCHED_ROUTE, True
@@ -0,0 +1,164 @@
+"""
+Kong Gateway State and Admin API Client
+"""
+
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID, uuid5
+
+import httpx
+
+from src.domain.entities.tenant import Tenant, TenantStatus
+from src.infrastructure.config.settings import settings
+
+# Every entity the platform manages carries this tag; others are left alone
+MANAGED_TAG = "platform-api"
+
+# (entity collection, entity id), e.g. ("consumers", "<tenant id>")
+EntityKey = Tuple[str, str]
+
+# Managed entities of one tenant and the fields the platform sets on them
+TenantState = Dict[EntityKey, Dict[str, Any]]
+
+
+def tenant_state(tenant: Tenant) -> TenantState:
+    """
+    Desired Kong entities for a tenant: a consumer and its rate limits
+
+    Only active tenants get a consumer. Ids are derived from the tenant id,
+    so every write is an idempotent PUT and no id lookup is needed.
+    """
+    if tenant.status is not TenantStatus.ACTIVE:
+        return {}
+
+    consumer_id = str(tenant.id)
+    tags = [MANAGED_TAG, f"tier:{tenant.tier.value}"]
+    config: Dict[str, Any] = {
+        "minute": settings.RATE_LIMIT_PER_MINUTE,
+        "hour": settings.RATE_LIMIT_PER_HOUR,
+        "limit_by": "consumer",
+        "policy": "local",
+    }
+    if tenant.max_requests_per_month != -1:
+        config["month"] = tenant.max_requests_per_month
+
+    plugin_id = str(uuid5(tenant.id, "rate-limiting"))
+    return {
+        ("consumers", consumer_id): {
+            "username": f"tenant-{tenant.slug}",
+            "custom_id": consumer_id,
+            "tags": tags,
+        },
+        ("plugins", plugin_id): {
+            "name": "rate-limiting",
+            "consumer": {"id": consumer_id},
+            "config": config,
+            "tags": tags,
+        },
+    }
+
+
+def entity_owner(collection: str, entity: Dict[str, Any]) -> Optional[str]:
+    """Tenant id owning a managed entity read back from Kong"""
+    if collection == "consumers":
+        return entity.get("custom_id")
+    consumer = entity.get("consumer") or {}
+    return consumer.get("id")
+
+
+def matches(desired: Any, actual: Any) -> bool:
+    """
+    Check that ``actual`` has every value set in ``desired``
+
+    Kong returns entities with defaults and timestamps filled in, so only
+    the fields the platform sets are compared; tags compare as sets.
+    """
+    if isinstance(desired, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and matches(value, actual[key]) for key, value in desired.items()
+        )
+    if isinstance(desired, list):
+        return isinstance(actual, list) and sorted(map(str, desired)) == sorted(map(str, actual))
+    return desired == actual
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """One Admin API write needed to move Kong towards the desired state"""
+
+    tenant_id: str
+    key: EntityKey
+    body: Optional[Dict[str, Any]] = None  # None deletes the entity
+
+    @property
+    def phase(self) -> int:
+        """
+        Apply order: consumers before their plugins are written, plugins
+        before their consumers are deleted
+        """
+        collection = self.key[0]
+        if self.body is not None:
+            return 0 if collection == "consumers" else 1
+        return 2 if collection == "plugins" else 3
+
+
+def diff(tenant_id: str, desired: TenantState, current: TenantState) -> List[Change]:
+    """Writes turning one tenant's current Kong entities into the desired ones"""
+    changes = [
+        Change(tenant_id, key, body)
+        for key, body in desired.items()
+        if key not in current or not matches(body, current[key])
+    ]
+    changes.extend(Change(tenant_id, key) for key in current if key not in desired)
+    return changes
+
+
+class KongAdminClient:
+    """
+    Minimal Kong Admin API client for managed consumers and plugins
+    """
+
+    def __init__(self, client: httpx.AsyncClient, base_url: str) -> None:
+        self._client = client
+        self._base_url = base_url.rstrip("/")
+
+    async def apply(self, change: Change) -> None:
+        """Write one change; deleting an entity that is already gone succeeds"""
+        collection, entity_id = change.key
+        url = f"{self._base_url}/{collection}/{entity_id}"
+        if change.body is None:
+            response = await self._client.delete(url)
+            if response.status_code == 404:
+                return
+        else:
+            response = await self._client.put(url, json=change.body)
+        response.raise_for_status()
+
+    async def list_managed(
+        self, collection: str, page_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every entity of a collection tagged as managed"""
+        params: Dict[str, Any] = {"tags": MANAGED_TAG, "size": page_size}
+        while True:
+            response = await self._client.get(f"{self._base_url}/{collection}", params=params)
+            response.raise_for_status()
+            page = response.json()
+            for entity in page.get("data", ()):
+                yield entity
+            if not page.get("offset"):
+                return
+            params["offset"] = page["offset"]
+
+
+def group_by_tenant(entities: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, TenantState]:
+    """Group managed entities read from Kong by owning tenant"""
+    state: Dict[str, TenantState] = {}
+    for collection, entity in entities:
+        owner = entity_owner(collection, entity) or ""
+        try:
+            owner = str(UUID(owner))
+        except ValueError:
+            # Tagged but not derived from a tenant: keyed by itself so a resync removes it
+            owner = f"orphan:{entity['id']}"
+        state.setdefault(owner, {})[(collection, entity["id"])] = entity
+    return state
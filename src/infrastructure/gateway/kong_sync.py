@@ -0,0 +1,303 @@
+"""
+Kong Reconciliation Worker
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+import httpx
+from nats.aio.client import Client as NATS
+from nats.aio.msg import Msg
+
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.infrastructure.config.settings import settings
+from src.infrastructure.gateway.kong import (
+    Change,
+    KongAdminClient,
+    TenantState,
+    diff,
+    group_by_tenant,
+    tenant_state,
+)
+from src.infrastructure.nats.outbox_relay import EVENT_SUBJECT_PREFIX
+from src.infrastructure.serialization.encoder import loads
+
+logger = logging.getLogger(__name__)
+
+# Tenant lifecycle events mark tenants for the next incremental sync
+TENANT_EVENTS_SUBJECT = f"{EVENT_SUBJECT_PREFIX}.tenant.>"
+KONG_SYNC_QUEUE = "kong-sync"
+
+
+class KongSync:
+    """
+    Keeps Kong consumers and rate-limit plugins in line with the tenants
+
+    The desired entities of each tenant are diffed against a snapshot of
+    what was last written (or read back) from Kong, and only the deltas
+    are applied, at most ``concurrency`` Admin API calls at a time.
+
+    - ``sync_tenants`` reconciles the tenants named by lifecycle events
+    - ``sync_all`` reconciles every tenant against the snapshot
+    - ``resync`` first rereads every managed entity from Kong, repairing
+      drift and deleting managed entities no tenant accounts for
+
+    Writes that fail leave the snapshot untouched, so the next sync
+    retries them.
+    """
+
+    def __init__(
+        self,
+        repository: TenantRepository,
+        admin: KongAdminClient,
+        concurrency: int = 16,
+        interval: float = 60.0,
+        resync_interval: float = 3600.0,
+        debounce: float = 0.5,
+    ) -> None:
+        self._repository = repository
+        self._admin = admin
+        self._concurrency = concurrency
+        self._interval = interval
+        self._resync_interval = resync_interval
+        self._debounce = debounce
+
+        self._snapshot: Dict[str, TenantState] = {}
+        self._dirty: Set[str] = set()
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._subscription = None
+
+        self.writes = 0
+        self.failures = 0
+        self.resyncs = 0
+
+    def mark_dirty(self, tenant_ids: Iterable[str]) -> None:
+        """Queue tenants for the next incremental sync"""
+        self._dirty.update(tenant_ids)
+        self._wake.set()
+
+    async def sync_tenants(self, tenant_ids: Iterable[str]) -> int:
+        """Reconcile the given tenants, returning the number of writes applied"""
+        ids: List[UUID] = []
+        for tenant_id in tenant_ids:
+            try:
+                ids.append(UUID(tenant_id))
+            except ValueError:
+                logger.warning("Ignoring invalid tenant id %r", tenant_id)
+        if not ids:
+            return 0
+
+        async with self._lock:
+            found = {str(tenant.id): tenant for tenant in await self._repository.get_many(ids)}
+            changes: List[Change] = []
+            for tenant_id in map(str, ids):
+                desired = tenant_state(found[tenant_id]) if tenant_id in found else {}
+                changes.extend(diff(tenant_id, desired, self._snapshot.get(tenant_id, {})))
+            return await self._apply(changes)
+
+    async def sync_all(self) -> int:
+        """Reconcile every tenant, returning the number of writes applied"""
+        async with self._lock:
+            changes: List[Change] = []
+            seen: Set[str] = set()
+            async for tenant in self._repository.stream_all():
+                tenant_id = str(tenant.id)
+                seen.add(tenant_id)
+                changes.extend(
+                    diff(tenant_id, tenant_state(tenant), self._snapshot.get(tenant_id, {}))
+                )
+            for tenant_id, current in list(self._snapshot.items()):
+                if tenant_id not in seen:
+                    changes.extend(diff(tenant_id, {}, current))
+            return await self._apply(changes)
+
+    async def resync(self) -> int:
+        """
+        Full declarative resync: replace the snapshot with the managed
+        entities read from Kong, then reconcile every tenant against it
+        """
+        entities = []
+        for collection in ("consumers", "plugins"):
+            async for entity in self._admin.list_managed(collection):
+                entities.append((collection, entity))
+
+        async with self._lock:
+            self._snapshot = group_by_tenant(entities)
+        self.resyncs += 1
+        return await self.sync_all()
+
+    async def _apply(self, changes: List[Change]) -> int:
+        if not changes:
+            return 0
+
+        phases: Dict[int, List[Change]] = defaultdict(list)
+        for change in changes:
+            phases[change.phase].append(change)
+
+        slots = asyncio.Semaphore(self._concurrency)
+        failed: Set[str] = set()
+        errors: List[Exception] = []
+        applied = 0
+
+        async def write(change: Change) -> None:
+            nonlocal applied
+            # A tenant whose consumer could not be written gets no plugins this round
+            if change.tenant_id in failed:
+                return
+            async with slots:
+                try:
+                    await self._admin.apply(change)
+                except httpx.HTTPError as exc:
+                    failed.add(change.tenant_id)
+                    errors.append(exc)
+                    return
+
+            state = self._snapshot.setdefault(change.tenant_id, {})
+            if change.body is None:
+                state.pop(change.key, None)
+                if not state:
+                    del self._snapshot[change.tenant_id]
+            else:
+                state[change.key] = change.body
+            applied += 1
+
+        for phase in sorted(phases):
+            await asyncio.gather(*(write(change) for change in phases[phase]))
+
+        self.writes += applied
+        if errors:
+            self.failures += len(errors)
+            logger.warning(
+                "%d Kong writes failed for %d tenants, retrying on the next sync: %r",
+                len(errors),
+                len(failed),
+                errors[-1],
+            )
+        return applied
+
+    async def subscribe(self, nc: NATS) -> None:
+        """
+        Listen for tenant lifecycle events; the queue group hands each event
+        to one replica
+        """
+        self._subscription = await nc.subscribe(
+            TENANT_EVENTS_SUBJECT, queue=KONG_SYNC_QUEUE, cb=self._on_event
+        )
+
+    async def _on_event(self, msg: Msg) -> None:
+        try:
+            self.mark_dirty([loads(msg.data)["aggregate_id"]])
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring malformed tenant event on %s: %r", msg.subject, exc)
+
+    def start(self) -> None:
+        """Start reconciling in a background task, beginning with a full resync"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def close(self) -> None:
+        """Stop listening for events and stop the background task"""
+        if self._subscription is not None:
+            await self._subscription.unsubscribe()
+            self._subscription = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get sync counters and the number of tenants in the snapshot"""
+        return {
+            "tenants": len(self._snapshot),
+            "writes": self.writes,
+            "failures": self.failures,
+            "resyncs": self.resyncs,
+        }
+
+    async def _run_forever(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_full = loop.time()
+        next_resync = loop.time()
+
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), max(0.0, next_full - loop.time()))
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                if self._wake.is_set():
+                    # Let a burst of events collect into one sync
+                    await asyncio.sleep(self._debounce)
+                    self._wake.clear()
+                    dirty, self._dirty = self._dirty, set()
+                    await self.sync_tenants(dirty)
+
+                now = loop.time()
+                if now >= next_full:
+                    next_full = now + self._interval
+                    if now >= next_resync:
+                        next_resync = now + self._resync_interval
+                        await self.resync()
+                    else:
+                        await self.sync_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Kong sync failed: %r", exc)
+
+
+_sync: Optional[KongSync] = None
+
+
+async def init_kong_sync(
+    repository: TenantRepository,
+    client: httpx.AsyncClient,
+    nc: Optional[NATS],
+) -> Optional[KongSync]:
+    """
+    Start the Kong reconciliation worker if enabled
+
+    Without NATS tenant changes reach Kong on the periodic full sync only.
+    """
+    global _sync
+
+    if not settings.KONG_SYNC_ENABLED:
+        return None
+
+    _sync = KongSync(
+        repository,
+        KongAdminClient(client, settings.KONG_ADMIN_URL),
+        concurrency=settings.KONG_SYNC_CONCURRENCY,
+        interval=settings.KONG_SYNC_INTERVAL_SECONDS,
+        resync_interval=settings.KONG_RESYNC_INTERVAL_SECONDS,
+        debounce=settings.KONG_SYNC_DEBOUNCE_SECONDS,
+    )
+    if nc is not None:
+        await _sync.subscribe(nc)
+    _sync.start()
+    return _sync
+
+
+async def close_kong_sync() -> None:
+    """Stop the Kong reconciliation worker"""
+    global _sync
+
+    if _sync is not None:
+        await _sync.close()
+    _sync = None
+
+
+def get_kong_sync() -> Optional[KongSync]:
+    """
+    Get the Kong reconciliation worker, or None if it is not running
+    """
+    return _sync
@@ -0,0 +1,96 @@
+"""
+Circuit Breaker for Outbound Calls
+"""
+
+import time
+from enum import Enum
+from typing import Dict
+
+
+class CircuitState(Enum):
+    """Circuit breaker state"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream after repeated failures
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are refused for ``reset_timeout`` seconds. Then a single trial
+    call is let through (half-open): success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.state = CircuitState.CLOSED
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may proceed; claims the trial call when half-open
+        """
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            self.state = CircuitState.HALF_OPEN
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call"""
+        self._failures = 0
+        self._trial_in_flight = False
+        self.state = CircuitState.CLOSED
+
+    def abandon(self) -> None:
+        """Give up a claimed call without an outcome, e.g. when it was cancelled"""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold"""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state is CircuitState.HALF_OPEN or self._failures >= self._failure_threshold:
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial call through"""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._reset_timeout - (time.monotonic() - self._opened_at))
+
+
+class CircuitBreakerRegistry:
+    """
+    One lazily created circuit breaker per upstream name
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Get the breaker for an upstream"""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(self._failure_threshold, self._reset_timeout)
+            self._breakers[name] = breaker
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        """Get every breaker's state"""
+        return {name: breaker.state.value for name, breaker in self._breakers.items()}
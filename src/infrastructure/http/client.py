@@ -0,0 +1,102 @@
+"""
+Shared Outbound HTTP Client
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_Origin = Tuple[str, str, Optional[int]]
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Caps concurrent requests per origin on top of another transport
+
+    httpx only bounds the pool as a whole, so one slow upstream could hold
+    every connection; here each scheme/host/port gets ``max_per_host``
+    requests in flight and the rest wait for a slot.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._slots: Dict[_Origin, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = request.url
+        origin = (url.scheme, url.host, url.port)
+        slots = self._slots.get(origin)
+        if slots is None:
+            slots = self._slots[origin] = asyncio.Semaphore(self._max_per_host)
+        async with slots:
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def init_http_client(transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+    """
+    Create the shared client: keep-alive pool, HTTP/2 where the upstream
+    supports it and a per-host concurrency cap
+
+    ``transport`` replaces the network transport, e.g. with an
+    ``httpx.MockTransport`` in tests.
+    """
+    global _client
+
+    http2 = settings.HTTP_CLIENT_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("HTTP/2 disabled for outbound requests: the h2 package is not installed")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=1)
+
+    _client = httpx.AsyncClient(
+        transport=HostLimitedTransport(transport, settings.HTTP_CLIENT_MAX_PER_HOST),
+        timeout=httpx.Timeout(settings.HTTP_CLIENT_TIMEOUT_SECONDS, connect=5.0),
+        headers={"User-Agent": f"{settings.SERVICE_NAME}/{settings.SERVICE_VERSION}"},
+    )
+    return _client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared client and its connection pool
+    """
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+
+
+def get_http_client() -> Optional[httpx.AsyncClient]:
+    """
+    Get the shared client, or None if it has not been initialized
+    """
+    return _client
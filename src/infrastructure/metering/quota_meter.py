@@ -0,0 +1,416 @@
+"""
+Quota Metering Engine
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import DefaultDict, Dict, List, Optional, Set, Tuple
+
+from redis.asyncio import Redis
+
+from src.domain.entities.tenant import Tenant
+from src.domain.ports.repositories.usage_repository import UsageRepository
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Quotas whose usage this service records: requests in the request
+# pipeline, users where users are created and deleted. Storage is not
+# metered here.
+METERED_QUOTAS = ("users", "requests")
+
+# Quotas that reset every billing month; the others are running totals
+PERIODIC_QUOTAS = frozenset({"requests"})
+
+# Running totals are stored under this pseudo-period
+TOTAL_PERIOD = "total"
+
+# Monthly counters are kept a little past the end of their period
+PERIODIC_TTL_SECONDS = 40 * 24 * 3600
+
+# Adds to a usage hash field only if Redis has it, returning nil otherwise
+# so the caller can seed it from durable storage first.
+# KEYS: usage hash; ARGV: field, delta, TTL in seconds (0 to leave as is)
+INCREMENT_EXISTING = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+    return false
+end
+local value = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+if tonumber(ARGV[3]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return value
+"""
+
+UsageKey = Tuple[str, str]
+
+
+def current_period() -> str:
+    """Billing period for monthly quotas, e.g. ``2024-05``"""
+    return datetime.utcnow().strftime("%Y-%m")
+
+
+def _period_end(period: str) -> float:
+    """Epoch time at which a billing period ends"""
+    year, month = map(int, period.split("-"))
+    year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return datetime(year, month, 1, tzinfo=timezone.utc).timestamp()
+
+
+class QuotaMeter:
+    """
+    Per-worker usage meter with batched writes to Redis and Postgres
+
+    ``record`` only bumps an in-memory counter, so it can absorb tens of
+    thousands of increments per second. Every ``flush_interval`` seconds the
+    pending deltas are sent to Redis in one pipeline (HINCRBY), which returns
+    the cluster-wide totals; every ``persist_interval`` seconds the flushed
+    deltas are rolled up into the UsageRepository.
+
+    Checks are answered locally from the last known global total plus this
+    worker's unflushed delta. With W workers each recording at most R
+    increments/sec, a check can therefore under-count by at most
+    ``(W - 1) * R * 2 * flush_interval`` (plus the flush round-trip): up to
+    one interval of increments other workers have not flushed yet, and up to
+    one interval before this worker refreshes its view. A quota may be
+    overshot by that much but usage is never lost - failed flushes are
+    merged back and retried, and totals are exact once every worker has
+    flushed. Deltas count towards the period they were recorded in, even
+    when flushed after it ended.
+
+    A usage field Redis does not have (first use, expiry or a Redis restart)
+    is seeded from the repository before deltas are added to it, so totals
+    continue from the last persisted usage rather than from zero; deltas
+    flushed but not yet persisted when Redis lost them are not recovered.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        repository: Optional[UsageRepository] = None,
+        flush_interval: float = 1.0,
+        persist_interval: float = 30.0,
+        key_prefix: str = "quota",
+    ) -> None:
+        self._redis = redis
+        self._repository = repository
+        self._flush_interval = flush_interval
+        self._persist_interval = persist_interval
+        self._key_prefix = key_prefix
+
+        self._period = current_period()
+        self._period_ends = _period_end(self._period)
+        # Unflushed deltas by the period they were recorded in
+        self._pending: Dict[str, DefaultDict[UsageKey, int]] = {self._period: defaultdict(int)}
+        self._current = self._pending[self._period]
+        self._totals: Dict[UsageKey, int] = {}
+        self._watched: Set[UsageKey] = set()
+        self._unpersisted: DefaultDict[Tuple[str, UsageKey], int] = defaultdict(int)
+        self._last_persist = time.monotonic()
+
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._increment = redis.register_script(INCREMENT_EXISTING) if redis is not None else None
+
+        self.flushes = 0
+        self.flush_failures = 0
+
+    def record(self, tenant_id: str, quota_type: str, amount: int = 1) -> None:
+        """
+        Record usage locally; it is flushed on the next tick
+        """
+        if time.time() >= self._period_ends:
+            self._roll_period()
+        self._current[(tenant_id, quota_type)] += amount
+
+    def usage(self, tenant_id: str, quota_type: str) -> int:
+        """
+        Get the best known usage: last global total plus unflushed local usage
+        """
+        if time.time() >= self._period_ends:
+            self._roll_period()
+        key = (tenant_id, quota_type)
+        self._watched.add(key)
+        return self._totals.get(key, 0) + self._current.get(key, 0)
+
+    def headroom(self, tenant: Tenant, quota_type: str) -> Optional[int]:
+        """
+        Get the remaining allowance for a quota, or None if it is unlimited
+        """
+        limit = tenant.quota_limit(quota_type)
+        if limit == -1:
+            return None
+        return max(0, limit - self.usage(str(tenant.id), quota_type))
+
+    def is_quota_exceeded(self, tenant: Tenant, quota_type: str) -> bool:
+        """
+        Check a tenant quota without a remote round-trip
+        """
+        return tenant.is_quota_exceeded(quota_type, self.usage(str(tenant.id), quota_type))
+
+    def start(self) -> None:
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Stop the flush task, then flush and persist everything still pending
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+        await self.persist()
+
+    async def flush(self) -> None:
+        """
+        Push pending deltas to Redis and refresh the cached global totals
+        """
+        async with self._flush_lock:
+            if time.time() >= self._period_ends:
+                self._roll_period()
+
+            pending = {period: deltas for period, deltas in self._pending.items() if deltas}
+            self._current = defaultdict(int)
+            self._pending = {self._period: self._current}
+            watched, self._watched = self._watched, set()
+            if not pending and not watched:
+                return
+
+            applied: Dict[str, Dict[UsageKey, int]] = pending
+            if self._redis is None:
+                for period, deltas in pending.items():
+                    for key, delta in deltas.items():
+                        if period == self._period or key[1] not in PERIODIC_QUOTAS:
+                            self._totals[key] = self._totals.get(key, 0) + delta
+                self.flushes += 1
+            else:
+                applied = defaultdict(dict)
+                try:
+                    await self._flush_to_redis(pending, watched, applied)
+                except Exception as exc:
+                    logger.warning("Quota flush failed, retrying next tick: %r", exc)
+                    self.flush_failures += 1
+                    for period, deltas in pending.items():
+                        merged = self._pending.setdefault(period, defaultdict(int))
+                        done = applied.get(period, {})
+                        for key, delta in deltas.items():
+                            if key not in done:
+                                merged[key] += delta
+                    self._watched |= watched
+                else:
+                    self.flushes += 1
+
+            for period, deltas in applied.items():
+                for key, delta in deltas.items():
+                    self._unpersisted[(self._period_for(key[1], period), key)] += delta
+
+        if time.monotonic() - self._last_persist >= self._persist_interval:
+            await self.persist()
+
+    async def persist(self) -> None:
+        """
+        Roll flushed deltas up into the durable usage repository
+        """
+        self._last_persist = time.monotonic()
+        if self._repository is None or not self._unpersisted:
+            self._unpersisted.clear()
+            return
+
+        batch, self._unpersisted = self._unpersisted, defaultdict(int)
+        by_period: Dict[str, Dict[UsageKey, int]] = defaultdict(dict)
+        for (period, key), delta in batch.items():
+            by_period[period][key] = delta
+
+        for period, deltas in by_period.items():
+            try:
+                await self._repository.add_usage(period, deltas)
+            except Exception as exc:
+                logger.warning("Quota persistence failed, retrying later: %r", exc)
+                for key, delta in deltas.items():
+                    self._unpersisted[(period, key)] += delta
+
+    async def _flush_to_redis(
+        self,
+        pending: Dict[str, Dict[UsageKey, int]],
+        watched: Set[UsageKey],
+        applied: DefaultDict[str, Dict[UsageKey, int]],
+    ) -> None:
+        """Add the deltas to Redis, noting each one in ``applied`` once it is"""
+        # Increments of each period, then reads of watched keys without any
+        increments: List[Tuple[str, UsageKey, int]] = [
+            (period, key, delta)
+            for period, deltas in pending.items()
+            for key, delta in deltas.items()
+        ]
+        current = pending.get(self._period, {})
+        reads = [key for key in watched if key not in current]
+
+        pipe = self._redis.pipeline(transaction=False)
+        for period, (tenant_id, quota_type), delta in increments:
+            # Queued on the pipeline; awaiting only registers the script with it
+            await self._increment(
+                keys=[self._redis_key(tenant_id, self._period_for(quota_type, period))],
+                args=[quota_type, delta, self._ttl(quota_type)],
+                client=pipe,
+            )
+        for tenant_id, quota_type in reads:
+            pipe.hget(
+                self._redis_key(tenant_id, self._period_for(quota_type, self._period)), quota_type
+            )
+        results = await pipe.execute()
+
+        unseeded = [
+            increment
+            for increment, value in zip(increments, results)
+            if not self._applied(increment, value, applied)
+        ]
+        unread = []
+        for key, value in zip(reads, results[len(increments) :]):
+            if value is None:
+                unread.append(key)
+            else:
+                self._totals[key] = int(value)
+        if unseeded or unread:
+            await self._seed(unseeded, unread, applied)
+
+    async def _seed(
+        self,
+        increments: List[Tuple[str, UsageKey, int]],
+        reads: List[UsageKey],
+        applied: DefaultDict[str, Dict[UsageKey, int]],
+    ) -> None:
+        """
+        Start the usage fields Redis does not have from the repository, then
+        add the deltas that were held back and read the watched fields
+        """
+        fields = {(self._period_for(key[1], period), key) for period, key, _ in increments}
+        fields.update((self._period_for(key[1], self._period), key) for key in reads)
+        stored = await self._stored_usage(fields)
+
+        pipe = self._redis.pipeline(transaction=False)
+        # HSETNX: a field another worker seeded meanwhile is left alone
+        for period, (tenant_id, quota_type) in fields:
+            name = self._redis_key(tenant_id, period)
+            pipe.hsetnx(name, quota_type, stored.get((period, (tenant_id, quota_type)), 0))
+            if quota_type in PERIODIC_QUOTAS:
+                pipe.expire(name, PERIODIC_TTL_SECONDS)
+        for period, (tenant_id, quota_type), delta in increments:
+            pipe.hincrby(
+                self._redis_key(tenant_id, self._period_for(quota_type, period)), quota_type, delta
+            )
+        for tenant_id, quota_type in reads:
+            pipe.hget(
+                self._redis_key(tenant_id, self._period_for(quota_type, self._period)), quota_type
+            )
+        results = await pipe.execute()
+
+        replies = results[len(results) - len(increments) - len(reads) :]
+        for increment, value in zip(increments, replies):
+            self._applied(increment, value, applied)
+        for key, value in zip(reads, replies[len(increments) :]):
+            self._totals[key] = int(value or 0)
+
+    async def _stored_usage(
+        self, fields: Set[Tuple[str, UsageKey]]
+    ) -> Dict[Tuple[str, UsageKey], int]:
+        if self._repository is None:
+            return {}
+        by_period: DefaultDict[str, List[UsageKey]] = defaultdict(list)
+        for period, key in fields:
+            by_period[period].append(key)
+        stored = {}
+        for period, keys in by_period.items():
+            for key, used in (await self._repository.get_usage(period, keys)).items():
+                stored[(period, key)] = used
+        return stored
+
+    def _applied(
+        self,
+        increment: Tuple[str, UsageKey, int],
+        value: Optional[int],
+        applied: DefaultDict[str, Dict[UsageKey, int]],
+    ) -> bool:
+        if value is None:
+            return False
+        period, key, delta = increment
+        applied[period][key] = delta
+        # Running totals are the same in every period; monthly ones of
+        # an earlier period say nothing about the current one
+        if period == self._period or key[1] not in PERIODIC_QUOTAS:
+            self._totals[key] = int(value)
+        return True
+
+    def _roll_period(self) -> None:
+        self._period = current_period()
+        self._period_ends = _period_end(self._period)
+        self._current = self._pending.setdefault(self._period, defaultdict(int))
+        self._totals = {k: v for k, v in self._totals.items() if k[1] not in PERIODIC_QUOTAS}
+
+    def _redis_key(self, tenant_id: str, period: str) -> str:
+        return f"{self._key_prefix}:{{{tenant_id}}}:{period}"
+
+    @staticmethod
+    def _ttl(quota_type: str) -> int:
+        return PERIODIC_TTL_SECONDS if quota_type in PERIODIC_QUOTAS else 0
+
+    @staticmethod
+    def _period_for(quota_type: str, period: str) -> str:
+        return period if quota_type in PERIODIC_QUOTAS else TOTAL_PERIOD
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Unexpected quota flush failure")
+
+
+_meter: Optional[QuotaMeter] = None
+
+
+def init_quota_meter(
+    redis: Optional[Redis],
+    repository: Optional[UsageRepository] = None,
+) -> QuotaMeter:
+    """
+    Create and start the process-wide quota meter
+    """
+    global _meter
+
+    _meter = QuotaMeter(
+        redis,
+        repository,
+        flush_interval=settings.QUOTA_FLUSH_INTERVAL_SECONDS,
+        persist_interval=settings.QUOTA_PERSIST_INTERVAL_SECONDS,
+    )
+    _meter.start()
+    return _meter
+
+
+async def close_quota_meter() -> None:
+    """
+    Flush and stop the process-wide quota meter
+    """
+    global _meter
+
+    if _meter is not None:
+        await _meter.close()
+    _meter = None
+
+
+def get_quota_meter() -> Optional[QuotaMeter]:
+    """
+    Get the process-wide quota meter, or None if metering is not running
+    """
+    return _meter
@@ -0,0 +1,84 @@
+"""
+Alembic Migration Environment
+
+Serves both migration histories: the ``alembic`` section migrates the
+control-plane tables (``Base``), the ``tenant`` section (``alembic --name
+tenant``) the tables of a tenant database (``TenantBase``). Each history
+keeps its own version table, so both can live in the shared database.
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.adapters.outbound.persistence.models import Base, TenantBase
+from src.infrastructure.config.settings import settings
+
+TENANT_SECTION = "tenant"
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+if config.config_ini_section == TENANT_SECTION:
+    target_metadata = TenantBase.metadata
+    version_table = "alembic_version_tenant"
+    # Tenant databases are migrated one at a time: -x database_url=...
+    url = context.get_x_argument(as_dictionary=True).get("database_url", settings.DATABASE_URL)
+else:
+    target_metadata = Base.metadata
+    version_table = "alembic_version"
+    url = settings.DATABASE_URL
+
+if "postgresql://" in url and "+asyncpg" not in url:
+    url = url.replace("postgresql://", "postgresql+asyncpg://")
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Leave tables of the other history alone when autogenerating in a shared database"""
+    return not (type_ == "table" and reflected and compare_to is None)
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting (``alembic upgrade head --sql``)"""
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        version_table=version_table,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        version_table=version_table,
+        include_object=include_object,
+        compare_type=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Run the migrations over an asyncpg connection"""
+    engine = create_async_engine(url, poolclass=pool.NullPool)
+    try:
+        async with engine.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+    finally:
+        await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,28 @@
+"""
+Add claim leases to the event outbox
+
+The relay stamps the rows of a batch with ``claimed_until`` and commits
+before publishing, instead of holding a transaction open meanwhile.
+
+Revision ID: 3f9a6c1e8b47
+Revises: 7c2e41d9a3b5
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "3f9a6c1e8b47"
+down_revision: Union[str, None] = "7c2e41d9a3b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("event_outbox", sa.Column("claimed_until", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("event_outbox", "claimed_until")
@@ -0,0 +1,99 @@
+"""
+Create control-plane tables
+
+Tenants, aggregated quota usage, provider configurations and the event
+outbox, with the indexes their repositories query through.
+
+Revision ID: 7c2e41d9a3b5
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "7c2e41d9a3b5"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tenants",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("slug", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("tier", sa.String(length=32), nullable=False),
+        sa.Column("organization_name", sa.String(length=255), nullable=False),
+        sa.Column("organization_domain", sa.String(length=255), nullable=True),
+        sa.Column("organization_size", sa.String(length=64), nullable=True),
+        sa.Column("primary_contact_email", sa.String(length=320), nullable=False),
+        sa.Column("primary_contact_name", sa.String(length=255), nullable=True),
+        sa.Column("billing_email", sa.String(length=320), nullable=True),
+        sa.Column("settings", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("features", postgresql.ARRAY(sa.String(length=64)), nullable=False),
+        sa.Column("max_users", sa.Integer(), nullable=False),
+        sa.Column("max_requests_per_month", sa.BigInteger(), nullable=False),
+        sa.Column("max_storage_gb", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("activated_at", sa.DateTime(), nullable=True),
+        sa.Column("suspended_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("slug"),
+    )
+    op.create_index("ix_tenants_status", "tenants", ["status"])
+    # Keyset pagination order
+    op.create_index("ix_tenants_created_at_id", "tenants", ["created_at", "id"])
+
+    op.create_table(
+        "tenant_usage",
+        sa.Column("tenant_id", sa.String(length=64), nullable=False),
+        sa.Column("quota_type", sa.String(length=32), nullable=False),
+        sa.Column("period", sa.String(length=16), nullable=False),
+        sa.Column("used", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("tenant_id", "quota_type", "period"),
+    )
+
+    op.create_table(
+        "provider_configs",
+        sa.Column("tenant_id", sa.String(length=64), nullable=False),
+        sa.Column("provider", sa.String(length=32), nullable=False),
+        sa.Column("enabled", sa.Boolean(), nullable=False),
+        sa.Column("api_key", sa.LargeBinary(), nullable=True),
+        sa.Column("base_url", sa.String(length=2048), nullable=True),
+        sa.Column("default_model", sa.String(length=255), nullable=True),
+        sa.Column("models", postgresql.ARRAY(sa.String(length=255)), nullable=False),
+        sa.Column("settings", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("tenant_id", "provider"),
+    )
+
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("aggregate_id", sa.String(length=64), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Relay order
+    op.create_index("ix_event_outbox_created_at", "event_outbox", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_outbox_created_at", table_name="event_outbox")
+    op.drop_table("event_outbox")
+    op.drop_table("provider_configs")
+    op.drop_table("tenant_usage")
+    op.drop_index("ix_tenants_created_at_id", table_name="tenants")
+    op.drop_index("ix_tenants_status", table_name="tenants")
+    op.drop_table("tenants")
@@ -0,0 +1,68 @@
+"""
+NATS Connection Management
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import nats
+from nats.aio.client import Client as NATS
+
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[NATS] = None
+
+
+async def init_nats() -> Optional[NATS]:
+    """
+    Open the shared NATS connection
+
+    A broker outage must not prevent the API from starting, so connection
+    failures are logged and the service runs without NATS until restarted.
+    """
+    global _client
+
+    try:
+        # Reconnects are unbounded once connected, so bound the initial attempt
+        _client = await asyncio.wait_for(
+            nats.connect(
+                settings.NATS_URL,
+                name=settings.SERVICE_NAME,
+                connect_timeout=settings.NATS_CONNECT_TIMEOUT,
+                max_reconnect_attempts=-1,
+                error_cb=_on_error,
+            ),
+            timeout=settings.NATS_CONNECT_TIMEOUT,
+        )
+    except Exception as exc:
+        logger.warning("NATS unavailable at %s: %r", settings.NATS_URL, exc)
+        _client = None
+
+    return _client
+
+
+async def close_nats() -> None:
+    """
+    Drain pending messages and close the shared NATS connection
+    """
+    global _client
+
+    if _client is not None and not _client.is_closed:
+        await _client.drain()
+    _client = None
+
+
+async def _on_error(exc: Exception) -> None:
+    logger.warning("NATS connection error: %s", exc)
+
+
+def get_nats() -> Optional[NATS]:
+    """
+    Get the shared NATS connection, or None if it is not connected
+    """
+    if _client is None or not _client.is_connected:
+        return None
+    return _client
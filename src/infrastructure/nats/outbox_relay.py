@@ -0,0 +1,227 @@
+"""
+Outbox Relay to NATS JetStream
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from nats.aio.client import Client as NATS
+from nats.js import JetStreamContext
+from nats.js.errors import NotFoundError
+
+from src.domain.ports.repositories.outbox_repository import EventOutbox, OutboxMessage
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Events are published to <prefix>.<event type>, e.g. platform.events.tenant.suspended
+EVENT_SUBJECT_PREFIX = "platform.events"
+
+# Longest pause between batches while the broker keeps failing
+MAX_BACKOFF_SECONDS = 10.0
+
+
+class OutboxRelay:
+    """
+    Publishes outbox events to JetStream in the background
+
+    Each batch is published with at most ``max_in_flight`` messages waiting
+    for their JetStream ack. Events of one aggregate are published one after
+    another in creation order, and a failure holds back that aggregate's
+    later events until the next batch, so consumers see each tenant's
+    changes in order. Every message carries its event id as
+    ``Nats-Msg-Id``; JetStream drops a republished event seen within the
+    stream's duplicate window. After a failed batch the stream passed to
+    ``ensure_stream`` is checked again, and created if missing, before the
+    next one, so a stream unavailable at startup or deleted later comes
+    back once the broker allows it.
+    """
+
+    def __init__(
+        self,
+        outbox: EventOutbox,
+        js: JetStreamContext,
+        batch_size: int = 500,
+        max_in_flight: int = 64,
+        poll_interval: float = 0.2,
+        publish_timeout: float = 5.0,
+    ) -> None:
+        self._outbox = outbox
+        self._js = js
+        self._batch_size = batch_size
+        self._max_in_flight = max_in_flight
+        self._poll_interval = poll_interval
+        self._publish_timeout = publish_timeout
+        self._task: Optional[asyncio.Task] = None
+        self._stream: Optional[Tuple[str, float]] = None
+        self._stream_ready = True
+
+        self.published = 0
+        self.duplicates = 0
+        self.failures = 0
+
+    async def ensure_stream(self, name: str, duplicate_window: float) -> None:
+        """Create the events stream unless it already exists"""
+        self._stream = (name, duplicate_window)
+        self._stream_ready = False
+        try:
+            await self._js.stream_info(name)
+        except NotFoundError:
+            await self._js.add_stream(
+                name=name,
+                subjects=[f"{EVENT_SUBJECT_PREFIX}.>"],
+                duplicate_window=duplicate_window,
+            )
+            logger.info("Created JetStream stream %s", name)
+        self._stream_ready = True
+
+    async def relay_once(self) -> int:
+        """Publish one batch, returning the number of events delivered"""
+        return await self._outbox.relay_batch(self._batch_size, self._publish)
+
+    async def _publish(self, messages: Sequence[OutboxMessage]) -> List[UUID]:
+        by_aggregate: Dict[str, List[OutboxMessage]] = defaultdict(list)
+        for message in messages:
+            by_aggregate[message.aggregate_id].append(message)
+
+        slots = asyncio.Semaphore(self._max_in_flight)
+        delivered: List[UUID] = []
+        errors: List[Exception] = []
+
+        async def publish_in_order(queue: List[OutboxMessage]) -> None:
+            for message in queue:
+                async with slots:
+                    try:
+                        ack = await self._js.publish(
+                            f"{EVENT_SUBJECT_PREFIX}.{message.event_type}",
+                            message.payload,
+                            timeout=self._publish_timeout,
+                            headers={"Nats-Msg-Id": str(message.id)},
+                        )
+                    except Exception as exc:
+                        errors.append(exc)
+                        return
+                delivered.append(message.id)
+                if ack.duplicate:
+                    self.duplicates += 1
+                else:
+                    self.published += 1
+
+        await asyncio.gather(*(publish_in_order(queue) for queue in by_aggregate.values()))
+        if errors:
+            self.failures += len(errors)
+            logger.warning(
+                "%d of %d events not published, retrying later: %r",
+                len(messages) - len(delivered),
+                len(messages),
+                errors[-1],
+            )
+        return delivered
+
+    def start(self) -> None:
+        """Start relaying in a background task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._relay_forever())
+
+    async def close(self) -> None:
+        """
+        Stop relaying; a batch cut short is published again once its claim
+        expires, and JetStream deduplicates it
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get delivery counters"""
+        return {
+            "published": self.published,
+            "duplicates": self.duplicates,
+            "failures": self.failures,
+        }
+
+    async def _relay_forever(self) -> None:
+        backoff = self._poll_interval
+        while True:
+            failures = self.failures
+            try:
+                if not self._stream_ready and self._stream is not None:
+                    await self.ensure_stream(*self._stream)
+                delivered = await self.relay_once()
+                healthy = self.failures == failures
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Outbox relay failed: %r", exc)
+                delivered, healthy = 0, False
+
+            if not healthy:
+                # Broker or database trouble: back off instead of spinning, and
+                # check the stream exists before the next batch
+                self._stream_ready = False
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+                continue
+
+            backoff = self._poll_interval
+            if delivered < self._batch_size:
+                # Backlog drained: poll for new events
+                await asyncio.sleep(self._poll_interval)
+
+
+_relay: Optional[OutboxRelay] = None
+
+
+async def init_outbox_relay(outbox: EventOutbox, nc: Optional[NATS]) -> Optional[OutboxRelay]:
+    """
+    Create the events stream and start relaying the outbox
+
+    Without NATS the relay is not started; events stay in the outbox and
+    are published once a replica with a broker connection runs.
+    """
+    global _relay
+
+    if nc is None:
+        logger.warning("Outbox relay not started: NATS is unavailable")
+        return None
+
+    _relay = OutboxRelay(
+        outbox,
+        nc.jetstream(),
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        max_in_flight=settings.OUTBOX_MAX_IN_FLIGHT,
+        poll_interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+        publish_timeout=settings.OUTBOX_PUBLISH_TIMEOUT_SECONDS,
+    )
+    try:
+        await _relay.ensure_stream(
+            settings.EVENTS_STREAM_NAME, settings.EVENTS_DUPLICATE_WINDOW_SECONDS
+        )
+    except Exception as exc:
+        # The relay creates it before its first batch, retrying with backoff
+        logger.warning("JetStream stream %s unavailable: %r", settings.EVENTS_STREAM_NAME, exc)
+    _relay.start()
+    return _relay
+
+
+async def close_outbox_relay() -> None:
+    """Stop the process-wide outbox relay"""
+    global _relay
+
+    if _relay is not None:
+        await _relay.close()
+    _relay = None
+
+
+def get_outbox_relay() -> Optional[OutboxRelay]:
+    """
+    Get the process-wide outbox relay, or None if it is not running
+    """
+    return _relay
@@ -0,0 +1,194 @@
+"""
+Structured Access Logging
+"""
+
+import logging
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueListener
+from typing import IO, Any, Dict, Optional, Tuple
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.metrics import (
+    access_log_dropped_total,
+    access_log_sampled_out_total,
+)
+from src.infrastructure.serialization.encoder import dumps
+
+ACCESS_LOGGER = "platform.access"
+
+ACCESS_FIELDS = ("request_id", "tenant_id", "method", "path", "route", "status", "duration_ms")
+
+# (created, level, values in ACCESS_FIELDS order)
+_Entry = Tuple[float, int, Tuple[Any, ...]]
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line, merging ``record.fields``
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return dumps(entry).decode()
+
+
+def _to_record(entry: _Entry) -> logging.LogRecord:
+    created, level, values = entry
+    record = logging.LogRecord(ACCESS_LOGGER, level, "", 0, "request", None, None)
+    record.created = created
+    record.fields = dict(zip(ACCESS_FIELDS, values))
+    return record
+
+
+class _AccessLogListener(QueueListener):
+    """Queue listener turning queued entries into log records off the request path"""
+
+    def prepare(self, entry: _Entry) -> logging.LogRecord:
+        return _to_record(entry)
+
+
+class AccessLog:
+    """
+    Writes one structured record per served request
+
+    The request path only appends a tuple to a queue; a QueueListener thread
+    builds the log records, formats them as JSON and writes them to
+    ``writer``. Once the queue is more than ``watermark`` full only one in
+    ``sample_every`` successful requests is kept (server errors always are),
+    and when it holds ``queue_size`` entries new ones are dropped. Both are
+    counted in ``sampled_out``/``dropped`` and exported as Prometheus
+    counters, so /metrics shows them across workers.
+    """
+
+    def __init__(
+        self,
+        writer: logging.Handler,
+        queue_size: int = 10000,
+        watermark: float = 0.5,
+        sample_every: int = 10,
+        background: bool = True,
+    ) -> None:
+        self._writer = writer
+        self._max_size = queue_size
+        self._high = max(1, int(queue_size * watermark))
+        self._sample_every = max(1, sample_every)
+        self._seen = 0
+        # SimpleQueue is lock-free for producers; the bound is enforced via qsize()
+        self._queue: "queue.SimpleQueue[_Entry]" = queue.SimpleQueue()
+        self._listener = _AccessLogListener(self._queue, writer) if background else None
+        self._started = False
+
+        self.sampled_out = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        """Start the background writer"""
+        if self._listener is not None and not self._started:
+            self._listener.start()
+            self._started = True
+
+    def close(self) -> None:
+        """Write out everything queued and stop the background writer"""
+        if self._listener is not None and self._started:
+            self._listener.stop()
+            self._started = False
+
+    def record(
+        self,
+        request_id: str,
+        tenant_id: Optional[str],
+        method: str,
+        path: str,
+        route: str,
+        status: int,
+        duration_ns: int,
+    ) -> None:
+        """
+        Log a served request
+        """
+        level = logging.ERROR if status >= 500 else logging.INFO
+        entry = (
+            time.time(),
+            level,
+            (request_id, tenant_id, method, path, route, status, round(duration_ns / 1e6, 3)),
+        )
+
+        if self._listener is None:
+            self._writer.handle(_to_record(entry))
+            return
+
+        size = self._queue.qsize()
+        if size >= self._high and level < logging.ERROR:
+            self._seen += 1
+            if self._seen % self._sample_every:
+                self.sampled_out += 1
+                access_log_sampled_out_total.inc()
+                return
+        if size >= self._max_size:
+            self.dropped += 1
+            access_log_dropped_total.inc()
+            return
+        self._queue.put_nowait(entry)
+
+    def stats(self) -> Dict[str, int]:
+        """Get queue depth, sampling and drop counters"""
+        return {
+            "queued": self._queue.qsize(),
+            "sampled_out": self.sampled_out,
+            "dropped": self.dropped,
+        }
+
+
+_access_log: Optional[AccessLog] = None
+
+
+def init_access_log(stream: Optional[IO[str]] = None) -> Optional[AccessLog]:
+    """
+    Create and start the process-wide access log if it is enabled
+    """
+    global _access_log
+
+    if not settings.ACCESS_LOG_ENABLED:
+        _access_log = None
+        return None
+
+    writer = logging.StreamHandler(stream or sys.stdout)
+    writer.setFormatter(JsonFormatter())
+
+    _access_log = AccessLog(
+        writer,
+        queue_size=settings.ACCESS_LOG_QUEUE_SIZE,
+        watermark=settings.ACCESS_LOG_SAMPLE_WATERMARK,
+        sample_every=settings.ACCESS_LOG_SAMPLE_EVERY,
+    )
+    _access_log.start()
+    return _access_log
+
+
+def close_access_log() -> None:
+    """
+    Flush and stop the process-wide access log
+    """
+    global _access_log
+
+    if _access_log is not None:
+        _access_log.close()
+    _access_log = None
+
+
+def get_access_log() -> Optional[AccessLog]:
+    """
+    Get the process-wide access log, or None if access logging is disabled
+    """
+    return _access_log
@@ -0,0 +1,234 @@
+"""
+Dependency Health Monitoring
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional
+
+from sqlalchemy import text
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import get_engine
+from src.infrastructure.nats.client import get_nats
+from src.infrastructure.redis.client import get_redis
+from src.infrastructure.serialization.encoder import dumps
+
+logger = logging.getLogger(__name__)
+
+HEALTHY = "healthy"
+UNHEALTHY = "unhealthy"
+DEGRADED = "degraded"
+
+# A probe returns normally when the dependency answered and raises otherwise
+Probe = Callable[[], Awaitable[None]]
+
+
+@dataclass(frozen=True, slots=True)
+class CheckResult:
+    """Outcome of one dependency probe"""
+
+    status: str
+    latency_ms: float
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class HealthSnapshot:
+    """
+    Results of the latest probe round with the readiness response prerendered
+    """
+
+    status: str
+    ready: bool
+    checked_at: str
+    checks: Mapping[str, CheckResult]
+    readiness_body: bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Checks as plain dictionaries"""
+        return {
+            name: {"status": r.status, "latency_ms": r.latency_ms, "error": r.error}
+            for name, r in self.checks.items()
+        }
+
+
+async def probe_database() -> None:
+    engine = get_engine()
+    if engine is None:
+        raise RuntimeError("not initialized")
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def probe_redis() -> None:
+    redis = get_redis()
+    if redis is None:
+        raise RuntimeError("not initialized")
+    await redis.ping()
+
+
+async def probe_nats() -> None:
+    nc = get_nats()
+    if nc is None:
+        raise RuntimeError("not connected")
+    # PING/PONG round-trip to the server
+    await nc.flush(timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS)
+
+
+DEFAULT_PROBES: Dict[str, Probe] = {
+    "database": probe_database,
+    "redis": probe_redis,
+    "nats": probe_nats,
+}
+
+
+class HealthMonitor:
+    """
+    Probes dependencies concurrently in the background and serves the cached result
+
+    Every ``interval`` seconds all probes run at once, each bounded by
+    ``timeout``, so a round takes at most ``timeout`` regardless of how many
+    dependencies hang, and each pod sends one probe per dependency per
+    interval however often it is polled. ``snapshot`` is a plain attribute
+    read. The service is ready while every ``required`` check is healthy
+    and the snapshot is no older than ``stale_after`` seconds.
+    """
+
+    def __init__(
+        self,
+        probes: Mapping[str, Probe],
+        required: Iterable[str] = ("database",),
+        interval: float = 5.0,
+        timeout: float = 1.0,
+        stale_after: Optional[float] = None,
+    ) -> None:
+        self._probes = dict(probes)
+        self._required = frozenset(required) & self._probes.keys()
+        self._interval = interval
+        self._timeout = timeout
+        self._stale_after = stale_after if stale_after is not None else 3 * interval + timeout
+        self._refreshed_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+        pending = CheckResult(UNHEALTHY, 0.0, "not checked yet")
+        self.snapshot = self._build({name: pending for name in self._probes})
+
+    @property
+    def ready(self) -> bool:
+        """Whether the required dependencies were healthy in a recent round"""
+        return self.snapshot.ready and time.monotonic() - self._refreshed_at <= self._stale_after
+
+    async def refresh(self) -> HealthSnapshot:
+        """
+        Run every probe concurrently and publish a new snapshot
+        """
+        names = list(self._probes)
+        results = await asyncio.gather(*(self._run(self._probes[name]) for name in names))
+        self.snapshot = self._build(dict(zip(names, results)))
+        self._refreshed_at = time.monotonic()
+        return self.snapshot
+
+    async def start(self) -> None:
+        """Run a first probe round, then keep refreshing in the background"""
+        await self.refresh()
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_forever())
+
+    async def close(self) -> None:
+        """Stop the background refresh"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, probe: Probe) -> CheckResult:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe(), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            error = f"timed out after {self._timeout}s"
+        except Exception as exc:
+            error = repr(exc)
+        else:
+            error = None
+        latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        return CheckResult(UNHEALTHY if error else HEALTHY, latency_ms, error)
+
+    def _build(self, checks: Dict[str, CheckResult]) -> HealthSnapshot:
+        ready = all(checks[name].status == HEALTHY for name in self._required)
+        if not ready:
+            overall = UNHEALTHY
+        elif all(result.status == HEALTHY for result in checks.values()):
+            overall = HEALTHY
+        else:
+            overall = DEGRADED
+
+        checked_at = datetime.now(timezone.utc).isoformat()
+        body = dumps(
+            {
+                "status": "ready" if ready else "not_ready",
+                "timestamp": checked_at,
+                "checks": {name: result.status for name, result in checks.items()},
+            }
+        )
+        return HealthSnapshot(overall, ready, checked_at, checks, body)
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                previous = self.snapshot.status
+                snapshot = await self.refresh()
+                if snapshot.status != previous:
+                    logger.warning(
+                        "Health changed from %s to %s: %r",
+                        previous,
+                        snapshot.status,
+                        snapshot.to_dict(),
+                    )
+            except Exception:
+                logger.exception("Health refresh failed")
+
+
+_monitor: Optional[HealthMonitor] = None
+
+
+async def init_health_monitor(probes: Optional[Mapping[str, Probe]] = None) -> HealthMonitor:
+    """
+    Create the process-wide health monitor and run its first probe round
+    """
+    global _monitor
+
+    _monitor = HealthMonitor(
+        probes or DEFAULT_PROBES,
+        required=settings.HEALTH_REQUIRED_CHECKS,
+        interval=settings.HEALTH_CHECK_INTERVAL_SECONDS,
+        timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+    )
+    await _monitor.start()
+    return _monitor
+
+
+async def close_health_monitor() -> None:
+    """
+    Stop the process-wide health monitor
+    """
+    global _monitor
+
+    if _monitor is not None:
+        await _monitor.close()
+    _monitor = None
+
+
+def get_health_monitor() -> Optional[HealthMonitor]:
+    """
+    Get the process-wide health monitor, or None if it is not running
+    """
+    return _monitor
@@ -0,0 +1,129 @@
+"""
+Prometheus Metrics
+"""
+
+import os
+from typing import Dict, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Set by the process manager before the workers import prometheus_client; the
+# workers then write their samples to files in this directory
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+HTTP_LABELS = ("method", "route", "status", "tier")
+
+# Request latencies are mostly a few milliseconds; the defaults start at 5 ms
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    HTTP_LABELS,
+    buckets=LATENCY_BUCKETS,
+)
+
+http_requests_total = Counter(
+    "http_requests_total",
+    "HTTP requests by route template",
+    HTTP_LABELS,
+)
+
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being served",
+    ("method",),
+    multiprocess_mode="livesum",
+)
+
+access_log_sampled_out_total = Counter(
+    "access_log_sampled_out_total",
+    "Access log records skipped by load sampling",
+)
+
+access_log_dropped_total = Counter(
+    "access_log_dropped_total",
+    "Access log records dropped because the queue was full",
+)
+
+tenant_cache_lookups_total = Counter(
+    "tenant_cache_lookups_total",
+    "Tenant resolver lookups by outcome (hit, negative_hit, stale_hit, miss)",
+    ("result",),
+)
+
+tenant_cache_evictions_total = Counter(
+    "tenant_cache_evictions_total",
+    "Tenant resolver entries evicted to stay within the size bound",
+)
+
+tenant_cache_invalidations_total = Counter(
+    "tenant_cache_invalidations_total",
+    "Tenant resolver entries dropped by invalidations and lifecycle events",
+)
+
+tenant_cache_refresh_failures_total = Counter(
+    "tenant_cache_refresh_failures_total",
+    "Background tenant refreshes that failed while a stale entry was served",
+)
+
+_Labels = Tuple[str, str, str, str]
+_children: Dict[_Labels, Tuple[Histogram, Counter]] = {}
+_in_progress: Dict[str, Gauge] = {}
+
+
+def requests_in_progress(method: str) -> Gauge:
+    """Get the (memoized) in-progress gauge for an HTTP method"""
+    gauge = _in_progress.get(method)
+    if gauge is None:
+        gauge = _in_progress[method] = http_requests_in_progress.labels(method)
+    return gauge
+
+
+def observe_request(method: str, route: str, status: int, tier: str, duration_ns: int) -> None:
+    """
+    Record one served request
+
+    Labelled children are memoized, so steady-state cost is a dict lookup
+    plus the histogram and counter updates. ``route`` must be a template
+    (``/v1/tenants/{tenant_id}``), never a raw path.
+    """
+    key = (method, route, str(status), tier)
+    children = _children.get(key)
+    if children is None:
+        children = _children[key] = (
+            http_request_duration_seconds.labels(*key),
+            http_requests_total.labels(*key),
+        )
+    children[0].observe(duration_ns / 1e9)
+    children[1].inc()
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render the exposition text, aggregated across worker processes in
+    multiprocess mode, and its content type
+    """
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """
+    Drop the live gauge samples of an exited worker (call from the process manager)
+    """
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        multiprocess.mark_process_dead(pid)
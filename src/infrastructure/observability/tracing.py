@@ -0,0 +1,361 @@
+"""
+Distributed Tracing
+"""
+
+import logging
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from opentelemetry import context as otel_context
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.propagate import extract
+from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_VERSION, Resource
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import SpanContext, SpanKind, StatusCode, TraceFlags
+from opentelemetry.util.types import Attributes
+
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "platform-api"
+
+_NO_SPAN = nullcontext()
+
+
+class _RecordOnly(Sampler):
+    """Record spans without sampling them, so the tail rule can still keep the trace"""
+
+    def should_sample(
+        self,
+        parent_context: Optional[Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Attributes = None,
+        links: Optional[Sequence[trace.Link]] = None,
+        trace_state: Optional[trace.TraceState] = None,
+    ) -> SamplingResult:
+        parent = trace.get_current_span(parent_context).get_span_context()
+        return SamplingResult(
+            Decision.RECORD_ONLY,
+            attributes,
+            parent.trace_state if parent.is_valid else trace_state,
+        )
+
+    def get_description(self) -> str:
+        return "RecordOnly"
+
+
+class HeadSampler(Sampler):
+    """
+    Ratio-based head sampler whose unsampled traces are recorded, not dropped
+
+    Sampled traces are exported as usual; the rest are recorded only and
+    handed to TailKeepProcessor, which keeps slow or failed ones. Upstream
+    decisions from a remote parent are honored as-is.
+    """
+
+    def __init__(self, ratio: float) -> None:
+        self._ratio = TraceIdRatioBased(ratio)
+        self._record_only = _RecordOnly()
+
+    def should_sample(
+        self,
+        parent_context: Optional[Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Attributes = None,
+        links: Optional[Sequence[trace.Link]] = None,
+        trace_state: Optional[trace.TraceState] = None,
+    ) -> SamplingResult:
+        result = self._ratio.should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision is Decision.DROP:
+            return self._record_only.should_sample(
+                parent_context, trace_id, name, kind, attributes, links, trace_state
+            )
+        return result
+
+    def get_description(self) -> str:
+        return f"HeadSampler{{{self._ratio.get_description()}}}"
+
+
+def build_sampler(ratio: float, tail: bool) -> Sampler:
+    """
+    Build the parent-based sampler: a ratio on new traces and, if the tail
+    rule is enabled, recording of the traces the ratio leaves out
+    """
+    if not tail:
+        return ParentBased(TraceIdRatioBased(ratio))
+    return ParentBased(HeadSampler(ratio), local_parent_not_sampled=_RecordOnly())
+
+
+class TailKeepProcessor(SpanProcessor):
+    """
+    Keeps traces the head sampler left out if they turn out slow or failed
+
+    Spans of unsampled traces are buffered by trace until the local root
+    span ends. The trace is then forwarded to ``delegate`` (marked sampled)
+    if the root took at least ``latency_ms`` or any span has an error
+    status, and discarded otherwise. At most ``max_traces`` traces of at
+    most ``max_spans`` spans each are buffered; the oldest are discarded
+    first. Sampled spans go straight to ``delegate``.
+    """
+
+    def __init__(
+        self,
+        delegate: SpanProcessor,
+        latency_ms: float = 1000.0,
+        keep_errors: bool = True,
+        max_traces: int = 2048,
+        max_spans: int = 256,
+    ) -> None:
+        self._delegate = delegate
+        self._latency_ns = int(latency_ms * 1e6) if latency_ms > 0 else None
+        self._keep_errors = keep_errors
+        self._max_traces = max_traces
+        self._max_spans = max_spans
+        self._pending: "OrderedDict[int, List[ReadableSpan]]" = OrderedDict()
+
+        self.kept = 0
+        self.discarded = 0
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        self._delegate.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context.trace_flags.sampled:
+            self._delegate.on_end(span)
+            return
+
+        trace_id = span.context.trace_id
+        spans = self._pending.get(trace_id)
+        if spans is None:
+            spans = self._pending[trace_id] = []
+            if len(self._pending) > self._max_traces:
+                self._pending.popitem(last=False)
+                self.discarded += 1
+        if len(spans) < self._max_spans:
+            spans.append(span)
+
+        if span.parent is not None and not span.parent.is_remote:
+            return
+
+        # Local root ended: decide for the whole trace
+        del self._pending[trace_id]
+        if self._keep(span, spans):
+            self.kept += 1
+            for pending in spans:
+                self._delegate.on_end(_as_sampled(pending))
+        else:
+            self.discarded += 1
+
+    def shutdown(self) -> None:
+        self._pending.clear()
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._delegate.force_flush(timeout_millis)
+
+    def _keep(self, root: ReadableSpan, spans: List[ReadableSpan]) -> bool:
+        if self._latency_ns is not None and root.end_time - root.start_time >= self._latency_ns:
+            return True
+        return self._keep_errors and any(s.status.status_code is StatusCode.ERROR for s in spans)
+
+
+def _as_sampled(span: ReadableSpan) -> ReadableSpan:
+    """Copy of a recorded span with the sampled flag set, as exporters only send sampled spans"""
+    ctx = span.context
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            ctx.trace_id,
+            ctx.span_id,
+            ctx.is_remote,
+            TraceFlags(ctx.trace_flags | TraceFlags.SAMPLED),
+            ctx.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+def _engine_tracer(tracer_provider: TracerProvider, engine: Any) -> None:
+    from opentelemetry.instrumentation.sqlalchemy import __version__ as version
+    from opentelemetry.instrumentation.sqlalchemy.engine import EngineTracer
+    from opentelemetry.metrics import get_meter
+
+    connections_usage = get_meter(TRACER_NAME, version).create_up_down_counter(
+        "db.client.connections.usage", unit="connections"
+    )
+    EngineTracer(
+        tracer_provider.get_tracer(EngineTracer.__module__, version), engine, connections_usage
+    )
+
+
+def _otlp_exporter(endpoint: str) -> SpanExporter:
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    return OTLPSpanExporter(endpoint=endpoint)
+
+
+_provider: Optional[TracerProvider] = None
+_tracer: Optional[trace.Tracer] = None
+
+
+def init_tracing(exporter: Optional[SpanExporter] = None) -> Optional[trace.Tracer]:
+    """
+    Create the process-wide tracer provider if tracing is enabled
+
+    Spans are exported through a BatchSpanProcessor to ``exporter`` or, by
+    default, to the OTLP endpoint. Without either, tracing stays off.
+    """
+    global _provider, _tracer
+
+    if not settings.ENABLE_TRACING:
+        return None
+
+    if exporter is None:
+        if not settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+            logger.info("Tracing disabled: OTEL_EXPORTER_OTLP_ENDPOINT is not set")
+            return None
+        try:
+            exporter = _otlp_exporter(settings.OTEL_EXPORTER_OTLP_ENDPOINT)
+        except ImportError as exc:
+            logger.warning("Tracing disabled, OTLP exporter unavailable: %r", exc)
+            return None
+
+    tail = settings.TRACING_TAIL_LATENCY_MS > 0 or settings.TRACING_TAIL_KEEP_ERRORS
+    processor: SpanProcessor = BatchSpanProcessor(
+        exporter,
+        max_queue_size=settings.TRACING_EXPORT_QUEUE_SIZE,
+        schedule_delay_millis=settings.TRACING_EXPORT_DELAY_MS,
+    )
+    if tail:
+        processor = TailKeepProcessor(
+            processor,
+            latency_ms=settings.TRACING_TAIL_LATENCY_MS,
+            keep_errors=settings.TRACING_TAIL_KEEP_ERRORS,
+        )
+
+    _provider = TracerProvider(
+        sampler=build_sampler(settings.TRACING_SAMPLE_RATIO, tail),
+        resource=Resource.create(
+            {
+                SERVICE_NAME: settings.SERVICE_NAME,
+                SERVICE_VERSION: settings.SERVICE_VERSION,
+                "deployment.environment": settings.ENVIRONMENT,
+            }
+        ),
+    )
+    _provider.add_span_processor(processor)
+    _tracer = _provider.get_tracer(TRACER_NAME, settings.SERVICE_VERSION)
+    return _tracer
+
+
+def close_tracing() -> None:
+    """
+    Export the remaining spans and shut the tracer provider down
+    """
+    global _provider, _tracer
+
+    if _provider is not None:
+        _provider.shutdown()
+    _provider = None
+    _tracer = None
+
+
+def instrument_engine(engine: Any) -> None:
+    """
+    Emit a client span per statement run on a SQLAlchemy engine (sync or
+    async) while tracing is on; a no-op otherwise
+    """
+    if _provider is None:
+        return
+    try:
+        _engine_tracer(_provider, getattr(engine, "sync_engine", engine))
+    except ImportError as exc:
+        logger.warning("SQLAlchemy instrumentation unavailable: %r", exc)
+
+
+def get_tracer() -> Optional[trace.Tracer]:
+    """
+    Get the process-wide tracer, or None if tracing is off
+    """
+    return _tracer
+
+
+def traced(
+    name: str, attributes: Optional[Dict[str, Any]] = None, kind: SpanKind = SpanKind.INTERNAL
+):
+    """
+    Context manager running a block in a child span of the current trace,
+    e.g. around a database, Redis or NATS call (with ``SpanKind.CLIENT``);
+    a shared no-op when tracing is off
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.start_as_current_span(name, kind=kind, attributes=attributes)
+
+
+def start_server_span(
+    tracer: trace.Tracer,
+    method: str,
+    carrier: Mapping[str, str],
+    attributes: Dict[str, Any],
+) -> Tuple[trace.Span, object]:
+    """
+    Start a server span continuing any trace in the ``carrier`` headers and
+    make it current; returns (span, token) for ``end_server_span``
+    """
+    propagated = "traceparent" in carrier or "baggage" in carrier
+    span = tracer.start_span(
+        method,
+        context=extract(carrier) if propagated else None,
+        kind=SpanKind.SERVER,
+        attributes=attributes,
+    )
+    token = otel_context.attach(trace.set_span_in_context(span))
+    return span, token
+
+
+def end_server_span(
+    span: trace.Span,
+    token: object,
+    method: str,
+    route: str,
+    status_code: int,
+) -> None:
+    """
+    Name the server span after the route template, record the status and end it
+    """
+    otel_context.detach(token)
+    if span.is_recording():
+        span.update_name(f"{method} {route}")
+        span.set_attribute("http.route", route)
+        span.set_attribute("http.status_code", status_code)
+        if status_code >= 500:
+            span.set_status(StatusCode.ERROR)
+    span.end()
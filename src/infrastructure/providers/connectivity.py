@@ -0,0 +1,225 @@
+"""
+LLM Provider Connectivity Testing
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from src.domain.entities.provider import ProviderConfig
+from src.infrastructure.config.settings import settings
+from src.infrastructure.http.circuit_breaker import CircuitBreakerRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URLS = {
+    "openai": "https://api.openai.com/v1",
+    "anthropic": "https://api.anthropic.com/v1",
+    "google": "https://generativelanguage.googleapis.com/v1beta",
+    "groq": "https://api.groq.com/openai/v1",
+}
+
+# Test outcomes
+OK = "ok"
+UNAUTHORIZED = "unauthorized"
+ERROR = "error"
+TIMEOUT = "timeout"
+CIRCUIT_OPEN = "circuit_open"
+MISSING_API_KEY = "missing_api_key"
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderTestResult:
+    """Outcome of a connectivity test against a provider's model listing"""
+
+    provider: str
+    status: str
+    latency_ms: float
+    checked_at: datetime
+    http_status: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation"""
+        return {
+            "provider": self.provider,
+            "status": self.status,
+            "latency_ms": self.latency_ms,
+            "http_status": self.http_status,
+            "error": self.error,
+            "checked_at": self.checked_at.isoformat(),
+        }
+
+
+# Config updated_at, monotonic test time and result
+_Tested = Tuple[datetime, float, ProviderTestResult]
+
+
+def probe_request(config: ProviderConfig) -> Tuple[str, Dict[str, str]]:
+    """
+    Build the cheapest authenticated call for a provider: listing its models
+    """
+    base_url = (config.base_url or DEFAULT_BASE_URLS.get(config.provider, "")).rstrip("/")
+    if config.provider == "anthropic":
+        headers = {"x-api-key": config.api_key or "", "anthropic-version": "2023-06-01"}
+    elif config.provider == "google":
+        headers = {"x-goog-api-key": config.api_key or ""}
+    else:
+        headers = {"Authorization": f"Bearer {config.api_key}"}
+    return f"{base_url}/models", headers
+
+
+class ProviderTester:
+    """
+    Tests tenants' provider credentials concurrently over the shared client
+
+    Every test is bounded by ``timeout``. Timeouts, transport errors and 5xx
+    answers count against a circuit breaker per upstream base URL; while it
+    is open, tests of that upstream are answered without a call. Rejected
+    credentials (401/403) are the tenant's problem and do not trip it.
+    The latest result per tenant and provider is kept for ``result_ttl``
+    seconds, or until the provider config changes.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        timeout: float = 5.0,
+        result_ttl: float = 30.0,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+        max_results: int = 10000,
+    ) -> None:
+        self._client = client
+        self._timeout = timeout
+        self._result_ttl = result_ttl
+        self._breakers = breakers or CircuitBreakerRegistry()
+        self._max_results = max_results
+        self._results: "OrderedDict[Tuple[str, str], _Tested]" = OrderedDict()
+
+        self.calls = 0
+        self.cached = 0
+
+    async def test(self, config: ProviderConfig, force: bool = False) -> ProviderTestResult:
+        """
+        Test one provider configuration, reusing a recent result unless ``force``
+        """
+        key = (config.tenant_id, config.provider)
+        if not force:
+            cached = self._results.get(key)
+            if (
+                cached is not None
+                and cached[0] == config.updated_at
+                and time.monotonic() - cached[1] < self._result_ttl
+            ):
+                self.cached += 1
+                return cached[2]
+
+        result = await self._run(config)
+        self._results[key] = (config.updated_at, time.monotonic(), result)
+        self._results.move_to_end(key)
+        while len(self._results) > self._max_results:
+            self._results.popitem(last=False)
+        return result
+
+    async def test_all(
+        self,
+        configs: Iterable[ProviderConfig],
+        force: bool = False,
+    ) -> List[ProviderTestResult]:
+        """
+        Test several provider configurations concurrently
+        """
+        return list(await asyncio.gather(*(self.test(config, force) for config in configs)))
+
+    def latest(self, tenant_id: str, provider: str) -> Optional[ProviderTestResult]:
+        """Get the last result for a tenant's provider, however old"""
+        cached = self._results.get((tenant_id, provider))
+        return cached[2] if cached is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get call counters and circuit states"""
+        return {"calls": self.calls, "cached": self.cached, "circuits": self._breakers.states()}
+
+    async def _run(self, config: ProviderConfig) -> ProviderTestResult:
+        started = time.perf_counter()
+
+        def result(status: str, http_status: Optional[int] = None, error: Optional[str] = None):
+            latency_ms = round((time.perf_counter() - started) * 1000, 3)
+            return ProviderTestResult(
+                config.provider, status, latency_ms, datetime.utcnow(), http_status, error
+            )
+
+        if not config.api_key:
+            return result(MISSING_API_KEY)
+
+        url, headers = probe_request(config)
+        breaker = self._breakers.get(url)
+        if not breaker.allow():
+            return result(CIRCUIT_OPEN, error=f"retry in {breaker.retry_after():.0f}s")
+
+        self.calls += 1
+        try:
+            response = await asyncio.wait_for(
+                self._client.get(url, headers=headers, timeout=self._timeout),
+                timeout=self._timeout,
+            )
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            breaker.record_failure()
+            return result(TIMEOUT, error=f"no answer within {self._timeout}s")
+        except httpx.HTTPError as exc:
+            breaker.record_failure()
+            return result(ERROR, error=repr(exc))
+        except asyncio.CancelledError:
+            breaker.abandon()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+            return result(ERROR, response.status_code, f"upstream answered {response.status_code}")
+
+        breaker.record_success()
+        if response.status_code in (401, 403):
+            return result(UNAUTHORIZED, response.status_code, "credentials rejected")
+        if response.status_code >= 400:
+            return result(ERROR, response.status_code, f"upstream answered {response.status_code}")
+        return result(OK, response.status_code)
+
+
+_tester: Optional[ProviderTester] = None
+
+
+def init_provider_tester(client: httpx.AsyncClient) -> ProviderTester:
+    """
+    Create the process-wide provider tester on the shared HTTP client
+    """
+    global _tester
+
+    _tester = ProviderTester(
+        client,
+        timeout=settings.PROVIDER_TEST_TIMEOUT_SECONDS,
+        result_ttl=settings.PROVIDER_TEST_RESULT_TTL_SECONDS,
+        breakers=CircuitBreakerRegistry(
+            failure_threshold=settings.PROVIDER_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.PROVIDER_CIRCUIT_RESET_SECONDS,
+        ),
+    )
+    return _tester
+
+
+def close_provider_tester() -> None:
+    """Drop the process-wide provider tester"""
+    global _tester
+    _tester = None
+
+
+def get_provider_tester() -> Optional[ProviderTester]:
+    """
+    Get the process-wide provider tester, or None if not initialized
+    """
+    return _tester
@@ -0,0 +1,300 @@
+"""
+Distributed Rate Limiter
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Sequence, Tuple
+
+from redis.asyncio import Redis
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.ratelimit import scripts
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitStrategy(Enum):
+    """Rate limiting algorithm"""
+
+    SLIDING_WINDOW = "sliding_window"
+    TOKEN_BUCKET = "token_bucket"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A request budget of ``limit`` per ``window_ms`` milliseconds"""
+
+    limit: int
+    window_ms: int
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of a rate limit check for the most restrictive limit"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_ms: int
+    retry_after_ms: int = 0
+
+    def headers(self) -> List[Tuple[str, str]]:
+        """
+        Build the standard RateLimit-* (and Retry-After) response headers
+        """
+        headers = [
+            ("RateLimit-Limit", str(self.limit)),
+            ("RateLimit-Remaining", str(self.remaining)),
+            ("RateLimit-Reset", str(math.ceil(self.reset_ms / 1000))),
+        ]
+        if not self.allowed:
+            headers.append(("Retry-After", str(max(1, math.ceil(self.retry_after_ms / 1000)))))
+        return headers
+
+
+class LocalRateLimiter:
+    """
+    In-process limiter using the same algorithms as the Redis scripts
+
+    Used as a fallback when Redis is slow or unavailable. Budgets are then
+    enforced per worker rather than cluster-wide.
+    """
+
+    def __init__(
+        self,
+        limits: Sequence[RateLimit],
+        strategy: RateLimitStrategy = RateLimitStrategy.SLIDING_WINDOW,
+        max_keys: int = 100000,
+    ) -> None:
+        self.limits = tuple(limits)
+        self.strategy = strategy
+        self._max_keys = max_keys
+        # Sliding window: key -> [window_start, current, previous] per limit
+        # Token bucket: key -> [tokens, ts] per limit
+        self._state: "OrderedDict[str, List[List[float]]]" = OrderedDict()
+
+    def hit(self, key: str, now_ms: Optional[int] = None) -> RateLimitResult:
+        """
+        Check and consume one request for ``key``
+        """
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+
+        state = self._state.get(key)
+        if state is None:
+            state = self._new_state(now_ms)
+            self._state[key] = state
+            if len(self._state) > self._max_keys:
+                self._state.popitem(last=False)
+        else:
+            self._state.move_to_end(key)
+
+        if self.strategy is RateLimitStrategy.TOKEN_BUCKET:
+            return self._token_bucket(state, now_ms)
+        return self._sliding_window(state, now_ms)
+
+    def _new_state(self, now_ms: int) -> List[List[float]]:
+        if self.strategy is RateLimitStrategy.TOKEN_BUCKET:
+            return [[float(rl.limit), float(now_ms)] for rl in self.limits]
+        return [[now_ms - now_ms % rl.window_ms, 0, 0] for rl in self.limits]
+
+    def _sliding_window(self, state: List[List[float]], now_ms: int) -> RateLimitResult:
+        allowed = True
+        best: Optional[Tuple[int, int, int]] = None
+        retry_after = 0
+
+        for rl, counters in zip(self.limits, state):
+            window_start = now_ms - now_ms % rl.window_ms
+            if window_start != counters[0]:
+                # Roll the window; anything older than one window is dropped
+                adjacent = window_start - counters[0] == rl.window_ms
+                counters[2] = counters[1] if adjacent else 0
+                counters[1] = 0
+                counters[0] = window_start
+
+            current, previous = counters[1], counters[2]
+            elapsed = now_ms - window_start
+            estimate = previous * (rl.window_ms - elapsed) / rl.window_ms + current
+
+            if estimate + 1 > rl.limit:
+                allowed = False
+                wait = rl.window_ms - elapsed
+                if current + 1 <= rl.limit and previous > 0:
+                    wait = (
+                        math.ceil(rl.window_ms * (1 - (rl.limit - 1 - current) / previous))
+                        - elapsed
+                    )
+                retry_after = max(retry_after, wait)
+
+            remaining = max(0, math.floor(rl.limit - estimate - 1))
+            if best is None or remaining < best[1]:
+                best = (rl.limit, remaining, rl.window_ms - elapsed)
+
+        if allowed:
+            for counters in state:
+                counters[1] += 1
+
+        limit, remaining, reset_ms = best
+        return RateLimitResult(allowed, limit, remaining if allowed else 0, reset_ms, retry_after)
+
+    def _token_bucket(self, state: List[List[float]], now_ms: int) -> RateLimitResult:
+        allowed = True
+        best: Optional[Tuple[int, int, int]] = None
+        retry_after = 0
+
+        for rl, bucket in zip(self.limits, state):
+            tokens = min(rl.limit, bucket[0] + max(0, now_ms - bucket[1]) * rl.limit / rl.window_ms)
+            bucket[0], bucket[1] = tokens, now_ms
+
+            if tokens < 1:
+                allowed = False
+                retry_after = max(retry_after, math.ceil((1 - tokens) * rl.window_ms / rl.limit))
+
+            remaining = max(0, math.floor(tokens - 1))
+            if best is None or remaining < best[1]:
+                best = (
+                    rl.limit,
+                    remaining,
+                    math.ceil((rl.limit - tokens + 1) * rl.window_ms / rl.limit),
+                )
+
+        if allowed:
+            for bucket in state:
+                bucket[0] -= 1
+
+        limit, remaining, reset_ms = best
+        return RateLimitResult(allowed, limit, remaining if allowed else 0, reset_ms, retry_after)
+
+
+class RateLimiter:
+    """
+    Redis-backed rate limiter shared by every replica
+
+    Each decision is a single EVALSHA of a Lua script. If Redis errors or
+    does not answer within ``timeout`` seconds, decisions fall back to a
+    LocalRateLimiter for ``cooldown`` seconds before Redis is retried.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        limits: Sequence[RateLimit],
+        strategy: RateLimitStrategy = RateLimitStrategy.SLIDING_WINDOW,
+        timeout: float = 0.05,
+        cooldown: float = 5.0,
+        prefix: str = "rl",
+    ) -> None:
+        self.limits = tuple(limits)
+        self.strategy = strategy
+        self._redis = redis
+        self._timeout = timeout
+        self._cooldown = cooldown
+        self._prefix = prefix
+        self._degraded_until = 0.0
+        self._local = LocalRateLimiter(self.limits, strategy)
+        self._args: List[int] = []
+        for rl in self.limits:
+            self._args.extend((rl.window_ms, rl.limit))
+
+        self._script = None
+        if redis is not None:
+            source = (
+                scripts.TOKEN_BUCKET
+                if strategy is RateLimitStrategy.TOKEN_BUCKET
+                else scripts.SLIDING_WINDOW
+            )
+            self._script = redis.register_script(source)
+
+        self.fallbacks = 0
+
+    @property
+    def degraded(self) -> bool:
+        """Whether decisions are currently made by the local fallback"""
+        return time.monotonic() < self._degraded_until
+
+    async def hit(self, key: str) -> RateLimitResult:
+        """
+        Check and consume one request for ``key``
+        """
+        now_ms = int(time.time() * 1000)
+
+        if self._script is None or self.degraded:
+            return self._local.hit(key, now_ms)
+
+        try:
+            allowed, limit, remaining, reset_ms, retry_after = await asyncio.wait_for(
+                self._script(keys=self._keys(key, now_ms), args=[now_ms, *self._args]),
+                timeout=self._timeout,
+            )
+        except Exception as exc:
+            logger.warning("Rate limiter falling back to local mode: %r", exc)
+            self.fallbacks += 1
+            self._degraded_until = time.monotonic() + self._cooldown
+            return self._local.hit(key, now_ms)
+
+        return RateLimitResult(bool(allowed), limit, remaining, reset_ms, retry_after)
+
+    def _keys(self, key: str, now_ms: int) -> List[str]:
+        # The {key} hash tag keeps every counter for a key on one cluster slot
+        base = f"{self._prefix}:{{{key}}}"
+        if self.strategy is RateLimitStrategy.TOKEN_BUCKET:
+            return [f"{base}:{rl.window_ms}" for rl in self.limits]
+
+        keys = []
+        for rl in self.limits:
+            window_start = now_ms - now_ms % rl.window_ms
+            keys.append(f"{base}:{rl.window_ms}:{window_start}")
+            keys.append(f"{base}:{rl.window_ms}:{window_start - rl.window_ms}")
+        return keys
+
+
+def configured_limits() -> List[RateLimit]:
+    """
+    Build the request budgets from RATE_LIMIT_PER_MINUTE/RATE_LIMIT_PER_HOUR
+    """
+    return [
+        RateLimit(limit=settings.RATE_LIMIT_PER_MINUTE, window_ms=60_000),
+        RateLimit(limit=settings.RATE_LIMIT_PER_HOUR, window_ms=3_600_000),
+    ]
+
+
+_limiter: Optional[RateLimiter] = None
+
+
+def init_rate_limiter(redis: Optional[Redis]) -> Optional[RateLimiter]:
+    """
+    Create the process-wide rate limiter if rate limiting is enabled
+    """
+    global _limiter
+
+    if not settings.RATE_LIMIT_ENABLED:
+        _limiter = None
+        return None
+
+    _limiter = RateLimiter(
+        redis,
+        configured_limits(),
+        strategy=RateLimitStrategy(settings.RATE_LIMIT_STRATEGY),
+        timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_MS / 1000,
+        cooldown=settings.RATE_LIMIT_FALLBACK_COOLDOWN_SECONDS,
+    )
+    return _limiter
+
+
+def close_rate_limiter() -> None:
+    """Drop the process-wide rate limiter"""
+    global _limiter
+    _limiter = None
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Get the process-wide rate limiter, or None if rate limiting is disabled
+    """
+    return _limiter
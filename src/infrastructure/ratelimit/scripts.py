@@ -0,0 +1,103 @@
+"""
+Rate Limiter Lua Scripts
+
+Each script evaluates every configured limit for a key and, only if all of
+them allow the request, consumes from each - in a single round-trip.
+
+ARGV layout shared by both scripts: now_ms, then (window_ms, limit) pairs.
+Both return {allowed, limit, remaining, reset_ms, retry_after_ms} where
+``limit``/``remaining``/``reset_ms`` describe the most restrictive limit.
+"""
+
+# KEYS: (current window counter, previous window counter) per limit
+SLIDING_WINDOW = """
+local now = tonumber(ARGV[1])
+local allowed = 1
+local best_limit, best_remaining, best_reset = 0, -1, 0
+local retry_after = 0
+
+for i = 1, #KEYS / 2 do
+    local window = tonumber(ARGV[i * 2])
+    local limit = tonumber(ARGV[i * 2 + 1])
+    local current = tonumber(redis.call('GET', KEYS[i * 2 - 1]) or '0')
+    local previous = tonumber(redis.call('GET', KEYS[i * 2]) or '0')
+    local elapsed = now % window
+    local estimate = previous * (window - elapsed) / window + current
+
+    if estimate + 1 > limit then
+        allowed = 0
+        local wait = window - elapsed
+        if current + 1 <= limit and previous > 0 then
+            wait = math.ceil(window * (1 - (limit - 1 - current) / previous)) - elapsed
+        end
+        retry_after = math.max(retry_after, wait)
+    end
+
+    local remaining = math.max(0, math.floor(limit - estimate - 1))
+    if best_remaining < 0 or remaining < best_remaining then
+        best_limit, best_remaining, best_reset = limit, remaining, window - elapsed
+    end
+end
+
+if allowed == 1 then
+    for i = 1, #KEYS / 2 do
+        redis.call('INCR', KEYS[i * 2 - 1])
+        redis.call('PEXPIRE', KEYS[i * 2 - 1], tonumber(ARGV[i * 2]) * 2)
+    end
+else
+    best_remaining = 0
+end
+
+return {allowed, best_limit, best_remaining, best_reset, retry_after}
+"""
+
+# KEYS: one bucket hash (tokens, ts) per limit
+TOKEN_BUCKET = """
+local now = tonumber(ARGV[1])
+local allowed = 1
+local best_limit, best_remaining, best_reset = 0, -1, 0
+local retry_after = 0
+local levels = {}
+
+for i = 1, #KEYS do
+    local window = tonumber(ARGV[i * 2])
+    local limit = tonumber(ARGV[i * 2 + 1])
+    local bucket = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local tokens = tonumber(bucket[1])
+    local ts = tonumber(bucket[2])
+
+    if tokens == nil then
+        tokens = limit
+    else
+        tokens = math.min(limit, tokens + math.max(0, now - ts) * limit / window)
+    end
+    levels[i] = tokens
+
+    if tokens < 1 then
+        allowed = 0
+        retry_after = math.max(retry_after, math.ceil((1 - tokens) * window / limit))
+    end
+
+    local remaining = math.max(0, math.floor(tokens - 1))
+    if best_remaining < 0 or remaining < best_remaining then
+        best_limit, best_remaining = limit, remaining
+        best_reset = math.ceil((limit - tokens + 1) * window / limit)
+    end
+end
+
+for i = 1, #KEYS do
+    local window = tonumber(ARGV[i * 2])
+    local tokens = levels[i]
+    if allowed == 1 then
+        tokens = tokens - 1
+    end
+    redis.call('HSET', KEYS[i], 'tokens', tostring(tokens), 'ts', now)
+    redis.call('PEXPIRE', KEYS[i], window)
+end
+
+if allowed == 0 then
+    best_remaining = 0
+end
+
+return {allowed, best_limit, best_remaining, best_reset, retry_after}
+"""
@@ -0,0 +1,62 @@
+"""
+Redis Connection Management
+"""
+
+import logging
+from typing import Optional
+
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[Redis] = None
+
+
+async def init_redis() -> Redis:
+    """
+    Create the shared Redis client backed by a bounded connection pool
+
+    When every connection is in use, callers wait up to REDIS_POOL_TIMEOUT
+    for one to be released rather than failing with "Too many connections".
+    Connections are opened lazily, so an unreachable Redis is only logged;
+    callers are expected to degrade gracefully until it comes back.
+    """
+    global _client
+
+    pool = BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_POOL_SIZE,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        health_check_interval=30,
+    )
+    # from_pool hands the pool to the client, so aclose() disconnects it too
+    _client = Redis.from_pool(pool)
+
+    try:
+        await _client.ping()
+    except Exception as exc:
+        logger.warning("Redis unavailable at %s: %r", settings.REDIS_URL, exc)
+
+    return _client
+
+
+async def close_redis() -> None:
+    """
+    Close the shared Redis client and its connection pool
+    """
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+
+
+def get_redis() -> Optional[Redis]:
+    """
+    Get the shared Redis client, or None if it has not been initialized
+    """
+    return _client
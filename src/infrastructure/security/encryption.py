@@ -0,0 +1,71 @@
+"""
+Encryption of Secrets at Rest
+"""
+
+import os
+from functools import lru_cache
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from src.infrastructure.config.settings import settings
+
+# Leading byte of every ciphertext, so the scheme can be rotated later
+FORMAT_VERSION = b"\x01"
+NONCE_SIZE = 12
+
+
+class DecryptionError(ValueError):
+    """Raised when a ciphertext is malformed, tampered with or bound to another context"""
+
+
+class SecretBox:
+    """
+    AES-256-GCM encryption of short secrets such as provider API keys
+
+    The key is derived from ``secret`` with HKDF. Each ciphertext is bound
+    to a ``context`` string (e.g. ``tenant:provider``) passed as associated
+    data, so it cannot be copied to another row and still decrypt.
+    Layout: version byte, 12-byte random nonce, ciphertext and tag.
+    """
+
+    def __init__(self, secret: str) -> None:
+        key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"platform-api secrets v1",
+        ).derive(secret.encode())
+        self._aead = AESGCM(key)
+
+    def encrypt(self, plaintext: str, context: str) -> bytes:
+        """
+        Encrypt a secret bound to ``context``
+        """
+        nonce = os.urandom(NONCE_SIZE)
+        return (
+            FORMAT_VERSION + nonce + self._aead.encrypt(nonce, plaintext.encode(), context.encode())
+        )
+
+    def decrypt(self, ciphertext: bytes, context: str) -> str:
+        """
+        Decrypt a secret encrypted for ``context``
+        """
+        if len(ciphertext) <= 1 + NONCE_SIZE or ciphertext[:1] != FORMAT_VERSION:
+            raise DecryptionError("Unsupported ciphertext format")
+        nonce = ciphertext[1 : 1 + NONCE_SIZE]
+        try:
+            plaintext = self._aead.decrypt(nonce, ciphertext[1 + NONCE_SIZE :], context.encode())
+        except InvalidTag:
+            raise DecryptionError("Ciphertext failed authentication") from None
+        return plaintext.decode()
+
+
+@lru_cache(maxsize=1)
+def get_secret_box() -> SecretBox:
+    """
+    Get the SecretBox keyed by ENCRYPTION_KEY
+    """
+    return SecretBox(settings.ENCRYPTION_KEY)
@@ -0,0 +1,158 @@
+"""
+JWT Signing and Verification Keys
+"""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from jose import jwk
+from jose.backends.base import Key
+
+from src.infrastructure.http.client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Algorithms accepted for JWKS keys; HMAC is only ever used with the local secret
+ASYMMETRIC_ALGORITHMS = frozenset({"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"})
+
+_DEFAULT_ALGORITHMS = {"RSA": "RS256", "EC": "ES256"}
+
+
+class KeyRing:
+    """
+    Prepared JOSE keys, parsed once instead of on every token verification
+
+    - the local key (JWT_SECRET_KEY/JWT_ALGORITHM) signs the tokens this
+      service issues and verifies tokens without a ``kid``
+    - keys published as a JWKS, from a local file or an HTTPS endpoint, verify
+      tokens by ``kid``; the set is reloaded every ``refresh_interval``
+      seconds and when an unknown ``kid`` shows up (at most once per
+      ``min_refresh_interval``), so identity provider key rotation needs no
+      restart
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        algorithm: str,
+        jwks_source: Optional[str] = None,
+        refresh_interval: float = 300.0,
+        min_refresh_interval: float = 30.0,
+    ) -> None:
+        self.algorithm = algorithm
+        self.signing_key: Key = jwk.construct(secret, algorithm)
+        self._jwks_source = jwks_source
+        self._refresh_interval = refresh_interval
+        self._min_refresh_interval = min_refresh_interval
+
+        self._jwks: Dict[str, Tuple[Key, str]] = {}
+        self._loaded_at = 0.0
+        self._loading: Optional[asyncio.Task] = None
+        self._refresher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Load the JWKS and keep refreshing it in the background"""
+        if self._jwks_source is None:
+            return
+        await self.reload()
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_forever())
+
+    async def close(self) -> None:
+        """Stop the background refresh"""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+
+    def key_for(self, kid: Optional[str], algorithm: str) -> Optional[Key]:
+        """
+        Get the prepared key for a token header, or None if it is not known
+        """
+        if kid is None:
+            return self.signing_key if algorithm == self.algorithm else None
+
+        entry = self._jwks.get(kid)
+        if entry is None or entry[1] != algorithm:
+            return None
+        return entry[0]
+
+    async def refresh_for(self, kid: str) -> None:
+        """
+        Reload the JWKS after seeing an unknown ``kid``, unless it was just loaded
+        """
+        if self._jwks_source is None or kid in self._jwks:
+            return
+        if time.monotonic() - self._loaded_at < self._min_refresh_interval:
+            return
+        await self.reload()
+
+    async def reload(self) -> int:
+        """
+        Load the JWKS, sharing one load between concurrent callers
+        """
+        if self._loading is None:
+            self._loading = asyncio.create_task(self._load())
+        try:
+            return await asyncio.shield(self._loading)
+        finally:
+            if self._loading is not None and self._loading.done():
+                self._loading = None
+
+    async def _load(self) -> int:
+        self._loaded_at = time.monotonic()
+        try:
+            document = await self._fetch()
+            keys = self._parse(document)
+        except Exception as exc:
+            logger.warning(
+                "Could not load JWKS from %s, keeping %d keys: %r",
+                self._jwks_source,
+                len(self._jwks),
+                exc,
+            )
+            return len(self._jwks)
+
+        self._jwks = keys
+        return len(keys)
+
+    async def _fetch(self) -> Dict[str, Any]:
+        source = self._jwks_source
+        if source.startswith(("https://", "http://")):
+            client = get_http_client()
+            if client is not None:
+                response = await client.get(source, timeout=5.0)
+            else:
+                async with httpx.AsyncClient(timeout=5.0) as client:
+                    response = await client.get(source)
+            response.raise_for_status()
+            return response.json()
+        return json.loads(await asyncio.to_thread(Path(source).read_text))
+
+    @staticmethod
+    def _parse(document: Dict[str, Any]) -> Dict[str, Tuple[Key, str]]:
+        keys: Dict[str, Tuple[Key, str]] = {}
+        for data in document.get("keys", []):
+            if data.get("use", "sig") != "sig" or "kid" not in data:
+                continue
+            algorithm = data.get("alg") or _DEFAULT_ALGORITHMS.get(data.get("kty"))
+            if algorithm not in ASYMMETRIC_ALGORITHMS:
+                continue
+            try:
+                keys[data["kid"]] = (jwk.construct(data, algorithm), algorithm)
+            except Exception as exc:
+                logger.warning("Skipping unusable JWKS key %s: %r", data["kid"], exc)
+        return keys
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            await self.reload()
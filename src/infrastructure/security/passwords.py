@@ -0,0 +1,234 @@
+"""
+Password Hashing Service
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from passlib.context import CryptContext
+
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_BYTES = 72
+
+
+class PasswordPolicyError(ValueError):
+    """Raised when a password does not satisfy the password policy"""
+
+    def __init__(self, violations: List[str]) -> None:
+        super().__init__("; ".join(violations))
+        self.violations = violations
+
+
+class PasswordServiceBusyError(RuntimeError):
+    """Raised when too many hashing jobs are already queued"""
+
+
+def password_policy_violations(password: str) -> List[str]:
+    """
+    Check a password against the PASSWORD_* policy settings
+    """
+    violations = []
+    if len(password) < settings.PASSWORD_MIN_LENGTH:
+        violations.append(f"must be at least {settings.PASSWORD_MIN_LENGTH} characters")
+    if len(password.encode()) > BCRYPT_MAX_BYTES:
+        violations.append(f"must be at most {BCRYPT_MAX_BYTES} bytes")
+    if settings.PASSWORD_REQUIRE_UPPERCASE and not re.search(r"[A-Z]", password):
+        violations.append("must contain an uppercase letter")
+    if settings.PASSWORD_REQUIRE_LOWERCASE and not re.search(r"[a-z]", password):
+        violations.append("must contain a lowercase letter")
+    if settings.PASSWORD_REQUIRE_NUMBERS and not re.search(r"[0-9]", password):
+        violations.append("must contain a number")
+    if settings.PASSWORD_REQUIRE_SPECIAL and not re.search(r"[^A-Za-z0-9]", password):
+        violations.append("must contain a special character")
+    return violations
+
+
+@lru_cache(maxsize=None)
+def _context(rounds: int) -> CryptContext:
+    return CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds, deprecated="auto")
+
+
+# Executed in the worker processes, hence module-level and picklable
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _hash_many(passwords: List[str], rounds: int) -> List[str]:
+    context = _context(rounds)
+    return [context.hash(password) for password in passwords]
+
+
+def _verify_and_update(
+    password: str, password_hash: str, rounds: int
+) -> Tuple[bool, Optional[str]]:
+    return _context(rounds).verify_and_update(password, password_hash)
+
+
+class PasswordService:
+    """
+    Hashes and verifies passwords in a process pool
+
+    bcrypt holds the CPU for hundreds of milliseconds per call, so running it
+    on the event loop (or in threads, contending on the GIL) would stall
+    every other request in the worker. Jobs run in ``workers`` processes; at
+    most ``max_pending`` may be queued or running, and callers that cannot
+    get a slot within ``queue_timeout`` seconds get PasswordServiceBusyError
+    instead of piling up behind the pool.
+
+    Bulk hashing sends ``bulk_job_size`` passwords per job and keeps at most
+    one job per worker in flight, so a large import neither pays a
+    round-trip per password nor queues logins behind all of its jobs.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_pending: int = 32,
+        queue_timeout: float = 2.0,
+        rounds: int = 12,
+        bulk_job_size: int = 8,
+    ) -> None:
+        self._workers = workers
+        self._bulk_job_size = bulk_job_size
+        self._queue_timeout = queue_timeout
+        self._rounds = rounds
+        self._slots = asyncio.Semaphore(max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._dummy_hash: Optional[str] = None
+
+        self.rejected = 0
+
+    def start(self) -> None:
+        """Start the worker processes"""
+        if self._executor is None:
+            # spawn: forking a process with a running event loop and open sockets is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    async def close(self) -> None:
+        """Stop the worker processes, dropping queued jobs"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def hash(self, password: str) -> str:
+        """
+        Validate a new password against the policy, then hash it
+        """
+        violations = password_policy_violations(password)
+        if violations:
+            raise PasswordPolicyError(violations)
+        return await self._run(_hash, password, self._rounds)
+
+    async def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        """
+        Hash passwords already checked with ``password_policy_violations``,
+        in order
+        """
+        size = self._bulk_job_size
+        jobs = [list(passwords[start : start + size]) for start in range(0, len(passwords), size)]
+        in_flight = asyncio.Semaphore(self._workers)
+
+        async def run(job: List[str]) -> List[str]:
+            async with in_flight:
+                return await self._run(_hash_many, job, self._rounds)
+
+        hashed = await asyncio.gather(*(run(job) for job in jobs))
+        return [password_hash for part in hashed for password_hash in part]
+
+    async def verify(
+        self, password: str, password_hash: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password, returning whether it matches and, if the hash was
+        made with outdated parameters, a replacement hash to store
+
+        With no hash (unknown user) a dummy hash is checked so that the
+        response time does not reveal whether the account exists.
+        """
+        if password_hash is None:
+            if self._dummy_hash is None:
+                self._dummy_hash = await self._run(_hash, "dummy-password", self._rounds)
+            await self._run(_verify_and_update, password, self._dummy_hash, self._rounds)
+            return False, None
+
+        try:
+            return await self._run(_verify_and_update, password, password_hash, self._rounds)
+        except ValueError:
+            logger.warning("Unrecognized password hash format")
+            return False, None
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self._executor is None:
+            raise RuntimeError("Password service is not started")
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self._queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise PasswordServiceBusyError("Too many concurrent password operations")
+
+        loop = asyncio.get_running_loop()
+        try:
+            try:
+                return await loop.run_in_executor(self._executor, fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed): replace the pool and retry once
+                logger.warning("Password worker pool broke, restarting it")
+                await self.close()
+                self.start()
+                return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._slots.release()
+
+
+_service: Optional[PasswordService] = None
+
+
+def init_password_service() -> PasswordService:
+    """
+    Create and start the process-wide password service
+    """
+    global _service
+
+    _service = PasswordService(
+        workers=settings.PASSWORD_HASH_WORKERS,
+        max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+        queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+        rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+        bulk_job_size=settings.PASSWORD_HASH_BULK_JOB_SIZE,
+    )
+    _service.start()
+    return _service
+
+
+async def close_password_service() -> None:
+    """
+    Stop the process-wide password service
+    """
+    global _service
+
+    if _service is not None:
+        await _service.close()
+    _service = None
+
+
+def get_password_service() -> Optional[PasswordService]:
+    """
+    Get the process-wide password service, or None if it is not started
+    """
+    return _service
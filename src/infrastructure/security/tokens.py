@@ -0,0 +1,325 @@
+"""
+JWT Issuance and Verification
+"""
+
+import hashlib
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from jose import JWTError, jwt
+from nats.aio.client import Client as NATS
+from nats.aio.msg import Msg
+from nats.aio.subscription import Subscription
+from redis.asyncio import Redis
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.security.keys import KeyRing
+
+logger = logging.getLogger(__name__)
+
+TOKEN_REVOCATION_SUBJECT = "platform.auth.revoked"
+
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+
+Claims = Dict[str, Any]
+
+
+class InvalidTokenError(Exception):
+    """Raised when a token is malformed, expired, revoked or of the wrong type"""
+
+
+@dataclass(frozen=True)
+class TokenPair:
+    """Access and refresh tokens issued together"""
+
+    access_token: str
+    refresh_token: str
+    expires_in: int
+    token_type: str = "bearer"
+
+
+class TokenService:
+    """
+    Issues tokens and verifies them with a decoded-claims cache
+
+    A verified token's claims are cached by SHA-256 of the token until its
+    ``exp``, so repeated requests with the same token skip signature checks
+    and claim parsing; raw tokens are never kept in memory. Revoked token ids
+    (``jti``) live in a local dict checked on every hit, mirrored to Redis
+    (consulted on cache misses, for replicas that started after a revocation)
+    and broadcast over NATS to the other replicas.
+    """
+
+    def __init__(
+        self,
+        keys: KeyRing,
+        redis: Optional[Redis] = None,
+        access_ttl: int = 1800,
+        refresh_ttl: int = 7 * 86400,
+        cache_size: int = 10000,
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        leeway: int = 0,
+        key_prefix: str = "revoked",
+    ) -> None:
+        self.keys = keys
+        self._redis = redis
+        self._access_ttl = access_ttl
+        self._refresh_ttl = refresh_ttl
+        self._cache_size = cache_size
+        self._issuer = issuer
+        self._audience = audience
+        self._options = {"verify_aud": audience is not None, "leeway": leeway}
+        self._key_prefix = key_prefix
+
+        self._cache: "OrderedDict[bytes, Tuple[Claims, float]]" = OrderedDict()
+        self._revoked: Dict[str, float] = {}
+        self._next_prune = 1024
+        self._subscription: Optional[Subscription] = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def issue(self, subject: str, tenant_id: Optional[str] = None, **claims: Any) -> TokenPair:
+        """
+        Issue an access/refresh token pair signed with the local key
+        """
+        now = int(time.time())
+        base: Claims = {"sub": subject, "iat": now, **claims}
+        if tenant_id:
+            base["tid"] = tenant_id
+        if self._issuer:
+            base["iss"] = self._issuer
+        if self._audience:
+            base["aud"] = self._audience
+
+        return TokenPair(
+            access_token=self._sign(base, ACCESS_TOKEN, now + self._access_ttl),
+            refresh_token=self._sign(base, REFRESH_TOKEN, now + self._refresh_ttl),
+            expires_in=self._access_ttl,
+        )
+
+    async def verify(self, token: str, token_type: str = ACCESS_TOKEN) -> Claims:
+        """
+        Verify a token and return its claims (shared - do not mutate)
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        entry = self._cache.get(digest)
+        if entry is not None:
+            claims, expires_at = entry
+            if time.time() < expires_at and claims.get("jti") not in self._revoked:
+                self.hits += 1
+                self._cache.move_to_end(digest)
+                return self._check_type(claims, token_type)
+            del self._cache[digest]
+
+        self.misses += 1
+        claims = await self._decode(token)
+        if await self._is_revoked(claims.get("jti")):
+            raise InvalidTokenError("Token has been revoked")
+        self._check_type(claims, token_type)
+
+        if isinstance(claims.get("exp"), (int, float)):
+            self._cache[digest] = (claims, float(claims["exp"]))
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return claims
+
+    async def revoke(self, claims: Claims, nc: Optional[NATS] = None) -> None:
+        """
+        Revoke a token until it expires, here and on every other replica
+        """
+        jti = claims.get("jti")
+        if not jti:
+            return
+        expires_at = float(claims.get("exp") or time.time() + self._refresh_ttl)
+        self._add_revoked(jti, expires_at)
+
+        ttl = int(expires_at - time.time()) + 1
+        if self._redis is not None and ttl > 0:
+            try:
+                await self._redis.set(f"{self._key_prefix}:{jti}", 1, ex=ttl)
+            except Exception as exc:
+                logger.warning("Could not persist token revocation %s: %r", jti, exc)
+
+        if nc is not None:
+            payload = json.dumps({"jti": jti, "exp": expires_at})
+            await nc.publish(TOKEN_REVOCATION_SUBJECT, payload.encode())
+
+    async def revoke_once(self, claims: Claims, nc: Optional[NATS] = None) -> bool:
+        """
+        Revoke a token unless it already was, atomically across replicas
+
+        Returns False if the token had already been revoked (here or, with
+        Redis, on any replica). Redis errors are raised, as the outcome is
+        then unknown.
+        """
+        jti = claims.get("jti")
+        if not jti or jti in self._revoked:
+            return False
+        expires_at = float(claims.get("exp") or time.time() + self._refresh_ttl)
+        self._add_revoked(jti, expires_at)
+
+        ttl = int(expires_at - time.time()) + 1
+        if self._redis is not None and ttl > 0:
+            try:
+                claimed = await self._redis.set(f"{self._key_prefix}:{jti}", 1, ex=ttl, nx=True)
+            except Exception:
+                self._revoked.pop(jti, None)
+                raise
+            if not claimed:
+                return False
+
+        if nc is not None:
+            payload = json.dumps({"jti": jti, "exp": expires_at})
+            await nc.publish(TOKEN_REVOCATION_SUBJECT, payload.encode())
+        return True
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        """Check the local revocation set"""
+        return jti is not None and jti in self._revoked
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache and revocation counters"""
+        return {
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revoked": len(self._revoked),
+        }
+
+    async def subscribe(self, nc: NATS) -> None:
+        """
+        Listen for revocations published by other replicas
+        """
+        self._subscription = await nc.subscribe(TOKEN_REVOCATION_SUBJECT, cb=self._on_revocation)
+
+    async def close(self) -> None:
+        """
+        Stop listening for revocations and stop refreshing keys
+        """
+        if self._subscription is not None:
+            await self._subscription.unsubscribe()
+            self._subscription = None
+        await self.keys.close()
+
+    def _sign(self, claims: Claims, token_type: str, expires_at: int) -> str:
+        payload = {**claims, "type": token_type, "exp": expires_at, "jti": uuid.uuid4().hex}
+        return jwt.encode(payload, self.keys.signing_key, algorithm=self.keys.algorithm)
+
+    async def _decode(self, token: str) -> Claims:
+        try:
+            header = jwt.get_unverified_header(token)
+            kid, algorithm = header.get("kid"), header.get("alg")
+            key = self.keys.key_for(kid, algorithm)
+            if key is None and kid is not None:
+                await self.keys.refresh_for(kid)
+                key = self.keys.key_for(kid, algorithm)
+            if key is None:
+                raise InvalidTokenError("Unknown signing key")
+
+            return jwt.decode(
+                token,
+                key,
+                algorithms=[algorithm],
+                audience=self._audience,
+                issuer=self._issuer,
+                options=self._options,
+            )
+        except JWTError as exc:
+            raise InvalidTokenError(str(exc)) from exc
+
+    @staticmethod
+    def _check_type(claims: Claims, token_type: str) -> Claims:
+        # Tokens from an external identity provider carry no type: treat them as access tokens
+        if claims.get("type", ACCESS_TOKEN) != token_type:
+            raise InvalidTokenError(f"Expected a {token_type} token")
+        return claims
+
+    async def _is_revoked(self, jti: Optional[str]) -> bool:
+        if jti is None:
+            return False
+        if jti in self._revoked:
+            return True
+        if self._redis is None:
+            return False
+        try:
+            return bool(await self._redis.exists(f"{self._key_prefix}:{jti}"))
+        except Exception as exc:
+            logger.warning("Revocation lookup failed, using local set only: %r", exc)
+            return False
+
+    def _add_revoked(self, jti: str, expires_at: float) -> None:
+        self._revoked[jti] = expires_at
+        if len(self._revoked) >= self._next_prune:
+            now = time.time()
+            self._revoked = {k: exp for k, exp in self._revoked.items() if exp > now}
+            self._next_prune = max(1024, 2 * len(self._revoked))
+
+    async def _on_revocation(self, msg: Msg) -> None:
+        try:
+            payload = json.loads(msg.data)
+            self._add_revoked(str(payload["jti"]), float(payload["exp"]))
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed token revocation: %r", msg.data)
+
+
+_service: Optional[TokenService] = None
+
+
+async def init_token_service(
+    redis: Optional[Redis] = None,
+    nc: Optional[NATS] = None,
+) -> TokenService:
+    """
+    Create the process-wide token service, load JWKS keys and subscribe to revocations
+    """
+    global _service
+
+    keys = KeyRing(
+        settings.JWT_SECRET_KEY,
+        settings.JWT_ALGORITHM,
+        jwks_source=settings.JWT_JWKS_SOURCE,
+        refresh_interval=settings.JWT_JWKS_REFRESH_SECONDS,
+    )
+    await keys.start()
+
+    _service = TokenService(
+        keys,
+        redis,
+        access_ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        refresh_ttl=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400,
+        cache_size=settings.JWT_CLAIMS_CACHE_SIZE,
+        issuer=settings.JWT_ISSUER,
+        audience=settings.JWT_AUDIENCE,
+        leeway=settings.JWT_LEEWAY_SECONDS,
+    )
+
+    if nc is not None:
+        await _service.subscribe(nc)
+
+    return _service
+
+
+async def close_token_service() -> None:
+    """
+    Tear down the process-wide token service
+    """
+    global _service
+
+    if _service is not None:
+        await _service.close()
+    _service = None
+
+
+def get_token_service() -> Optional[TokenService]:
+    """
+    Get the process-wide token service, or None if it is not initialized
+    """
+    return _service
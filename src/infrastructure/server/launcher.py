@@ -0,0 +1,147 @@
+"""
+Production Server Launcher
+
+Runs the app under gunicorn with uvicorn workers:
+
+    python -m src.infrastructure.server.launcher
+"""
+
+import gc
+import importlib.util
+import math
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Optional
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+from src.infrastructure.config.settings import settings
+
+APP = "src.main:app"
+# By import path: run with -m, this module is __main__ in the master
+WORKER_CLASS = "src.infrastructure.server.launcher.PlatformWorker"
+
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+
+class PlatformWorker(UvicornWorker):
+    """
+    Uvicorn worker pinned to uvloop and httptools
+
+    On SIGTERM the worker stops accepting, gives in-flight requests up to
+    SHUTDOWN_DRAIN_SECONDS, then runs the lifespan shutdown that closes
+    the pools.
+    """
+
+    CONFIG_KWARGS: Dict[str, Any] = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on",
+        "timeout_graceful_shutdown": settings.SHUTDOWN_DRAIN_SECONDS,
+    }
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: the cgroup quota if set, else the affinity mask"""
+    cpus = len(os.sched_getaffinity(0))
+    try:
+        with open(CGROUP_CPU_MAX) as fh:
+            quota, period = fh.read().split()
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+
+
+def worker_count() -> int:
+    """Number of workers: WEB_CONCURRENCY, else one per available CPU"""
+    return settings.WEB_CONCURRENCY or available_cpus()
+
+
+def require_fast_runtime() -> None:
+    """
+    Fail before forking if uvloop or httptools is missing, rather than
+    letting the workers fall back to asyncio and h11
+    """
+    missing = [name for name in ("uvloop", "httptools") if importlib.util.find_spec(name) is None]
+    if missing:
+        raise RuntimeError(
+            f"Production server requires {', '.join(missing)}; install uvicorn[standard]"
+        )
+
+
+def prepare_metrics_dir() -> str:
+    """
+    Point prometheus_client at an empty multiprocess directory
+
+    Must run before the app, and so prometheus_client, is imported.
+    Samples left by an earlier run are removed.
+    """
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+    else:
+        path = os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="prometheus-")
+    return path
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """Gunicorn hook: drop the live gauge samples of a worker that exited"""
+    from src.infrastructure.observability.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
+
+
+def gunicorn_options() -> Dict[str, Any]:
+    """Gunicorn configuration derived from the settings"""
+    return {
+        "bind": f"{settings.HOST}:{settings.PORT}",
+        "workers": worker_count(),
+        "worker_class": WORKER_CLASS,
+        # Import the app in the master so workers share its memory copy-on-write
+        "preload_app": True,
+        "max_requests": settings.WORKER_MAX_REQUESTS,
+        "max_requests_jitter": settings.WORKER_MAX_REQUESTS_JITTER,
+        "timeout": settings.WORKER_TIMEOUT_SECONDS,
+        "graceful_timeout": settings.SHUTDOWN_TIMEOUT_SECONDS,
+        "keepalive": settings.WORKER_KEEPALIVE_SECONDS,
+        "loglevel": settings.LOG_LEVEL.lower(),
+        # Requests are logged by the access log middleware
+        "accesslog": None,
+        "child_exit": child_exit,
+    }
+
+
+class PlatformServer(BaseApplication):
+    """Gunicorn application configured from the settings rather than the command line"""
+
+    def __init__(self, app_path: str = APP, options: Optional[Dict[str, Any]] = None) -> None:
+        self._app_path = app_path
+        self._options = options or gunicorn_options()
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self._options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Any:
+        module, _, attribute = self._app_path.partition(":")
+        app = getattr(importlib.import_module(module), attribute)
+        # Keep the collector from touching, and so copying, the preloaded objects in every worker
+        gc.collect()
+        gc.freeze()
+        return app
+
+
+def main() -> None:
+    require_fast_runtime()
+    prepare_metrics_dir()
+    PlatformServer().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,20 +8,36 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 
+from src.adapters.inbound.rest.v1 import ROUTERS
+from src.adapters.outbound.persistence.outbox_repository import SqlAlchemyEventOutbox
+from src.adapters.outbound.persistence.provider_repository import SqlAlchemyProviderConfigRepository
+from src.adapters.outbound.persistence.tenant_repository import SqlAlchemyTenantRepository
+from src.adapters.outbound.persistence.usage_repository import SqlAlchemyUsageRepository
+from src.infrastructure.cache.provider_cache import close_provider_cache, init_provider_cache
+from src.infrastructure.cache.tenant_resolver import close_tenant_resolver, init_tenant_resolver
 from src.infrastructure.config.settings import settings
-from src.infrastructure.fastapi.middleware.logging import LoggingMiddleware
-from src.infrastructure.fastapi.middleware.metrics import MetricsMiddleware
-from src.infrastructure.fastapi.middleware.tenant import TenantMiddleware
-from src.adapters.inbound.rest.v1 import (
-    health,
-    tenants,
-    auth,
-    quotas,
-    providers,
-    users
-)
+from src.infrastructure.database.session import close_database, get_session_factory, init_database
+from src.infrastructure.database.tenant_router import close_tenant_engines, init_tenant_engines
+from src.infrastructure.fastapi.middleware.compression import CompressionMiddleware
+from src.infrastructure.fastapi.middleware.pipeline import RequestPipelineMiddleware
+from src.infrastructure.fastapi.openapi import install_openapi
+from src.infrastructure.fastapi.responses import FastJSONResponse
+from src.infrastructure.fastapi.routing import include_routers
+from src.infrastructure.gateway.kong_sync import close_kong_sync, init_kong_sync
+from src.infrastructure.http.client import close_http_client, init_http_client
+from src.infrastructure.metering.quota_meter import close_quota_meter, init_quota_meter
+from src.infrastructure.nats.client import close_nats, init_nats
+from src.infrastructure.nats.outbox_relay import close_outbox_relay, init_outbox_relay
+from src.infrastructure.observability.access_log import close_access_log, init_access_log
+from src.infrastructure.observability.health import close_health_monitor, init_health_monitor
+from src.infrastructure.observability.tracing import close_tracing, init_tracing
+from src.infrastructure.providers.connectivity import close_provider_tester, init_provider_tester
+from src.infrastructure.ratelimit.limiter import close_rate_limiter, init_rate_limiter
+from src.infrastructure.redis.client import close_redis, init_redis
+from src.infrastructure.security.encryption import get_secret_box
+from src.infrastructure.security.passwords import close_password_service, init_password_service
+from src.infrastructure.security.tokens import close_token_service, init_token_service
 
 
 @asynccontextmanager
@@ -31,29 +47,74 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
     # Startup
     print(f"Starting {settings.SERVICE_NAME} v{settings.SERVICE_VERSION}")
+    init_access_log()
+    init_tracing()
 
     # Initialize database connections
-    # await init_database()
+    await init_database()
+    init_tenant_engines()
+    tenant_repository = SqlAlchemyTenantRepository(get_session_factory())
 
     # Initialize Redis
-    # await init_redis()
+    redis = await init_redis()
+    init_rate_limiter(redis)
+    init_quota_meter(redis, SqlAlchemyUsageRepository(get_session_factory()))
+
+    # Shared outbound HTTP client
+    http_client = init_http_client()
+    init_provider_tester(http_client)
 
     # Initialize NATS
-    # await init_nats()
+    nc = await init_nats()
+    await init_tenant_resolver(tenant_repository, nc)
+    await init_provider_cache(
+        SqlAlchemyProviderConfigRepository(get_session_factory(), get_secret_box()),
+        get_secret_box(),
+        redis,
+        nc,
+    )
+    await init_token_service(redis, nc)
+    await init_outbox_relay(
+        SqlAlchemyEventOutbox(get_session_factory(), settings.OUTBOX_CLAIM_LEASE_SECONDS), nc
+    )
+    await init_kong_sync(tenant_repository, http_client, nc)
+
+    # Start password hashing workers
+    init_password_service()
+
+    # Start probing dependencies for the health endpoints
+    await init_health_monitor()
 
     yield
 
     # Shutdown
     print(f"Shutting down {settings.SERVICE_NAME}")
 
-    # Close database connections
-    # await close_database()
+    await close_health_monitor()
+    await close_password_service()
 
     # Close Redis
-    # await close_redis()
+    await close_quota_meter()
+    close_rate_limiter()
+    await close_redis()
 
     # Close NATS
-    # await close_nats()
+    await close_kong_sync()
+    await close_outbox_relay()
+    await close_token_service()
+    await close_provider_cache()
+    await close_tenant_resolver()
+    await close_nats()
+
+    close_provider_tester()
+    await close_http_client()
+
+    # Close database connections
+    await close_tenant_engines()
+    await close_database()
+
+    close_tracing()
+    close_access_log()
 
 
 def create_app() -> FastAPI:
@@ -66,11 +127,22 @@ def create_app() -> FastAPI:
         version=settings.SERVICE_VERSION,
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
-        openapi_url="/openapi.json" if settings.DEBUG else None,
-        lifespan=lifespan
+        openapi_url="/openapi.json" if settings.DEBUG or settings.OPENAPI_ENABLED else None,
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan,
+    )
+
+    # Add middleware; the last added is outermost
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        thread_threshold=settings.COMPRESSION_THREAD_THRESHOLD_BYTES,
+        flush_size=settings.COMPRESSION_STREAM_FLUSH_BYTES,
+        encodings=settings.COMPRESSION_ENCODINGS,
     )
+    app.add_middleware(RequestPipelineMiddleware)
 
-    # Add middleware
+    # Outside the pipeline, so its rejections carry CORS headers and preflights skip it
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
@@ -79,47 +151,11 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
-    app.add_middleware(MetricsMiddleware)
-    app.add_middleware(LoggingMiddleware)
-    app.add_middleware(TenantMiddleware)
+    # Include routers; in lazy mode most are imported on their first request
+    include_routers(app, ROUTERS, lazy=settings.LAZY_ROUTERS)
 
-    # Include routers
-    app.include_router(
-        health.router,
-        prefix="/health",
-        tags=["health"]
-    )
-
-    app.include_router(
-        auth.router,
-        prefix="/v1/auth",
-        tags=["authentication"]
-    )
-
-    app.include_router(
-        tenants.router,
-        prefix="/v1/tenants",
-        tags=["tenants"]
-    )
-
-    app.include_router(
-        users.router,
-        prefix="/v1/users",
-        tags=["users"]
-    )
-
-    app.include_router(
-        quotas.router,
-        prefix="/v1/quotas",
-        tags=["quotas"]
-    )
-
-    app.include_router(
-        providers.router,
-        prefix="/v1/providers",
-        tags=["providers"]
-    )
+    if app.openapi_url is not None:
+        install_openapi(app, settings.OPENAPI_SCHEMA_PATH)
 
     return app
 
@@ -129,10 +165,11 @@ app = create_app()
 
 if __name__ == "__main__":
     import uvicorn
+
     uvicorn.run(
         "src.main:app",
-        host="0.0.0.0",
-        port=8082,
+        host=settings.HOST,
+        port=settings.PORT,
         reload=settings.DEBUG,
-        log_level=settings.LOG_LEVEL.lower()
-    )
\ No newline at end of file
+        log_level=settings.LOG_LEVEL.lower(),
+    )
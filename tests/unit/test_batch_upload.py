@@ -0,0 +1,280 @@
+"""
+Batch upload parsing tests: NDJSON, CSV and JSON array bodies through
+upload_rows and batch_response on a minimal app
+"""
+
+from typing import Any, Dict, List, Tuple
+from uuid import UUID, uuid4
+
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI, Request
+from pydantic import BaseModel, field_validator
+
+from src.adapters.inbound.rest.batch import RowRejected, batch_response, row_errors, upload_rows
+from src.infrastructure.config.settings import settings
+
+
+class Member(BaseModel):
+    email: str
+    role: str = "member"
+
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, value: str) -> str:
+        if "@" not in value or " " in value:
+            raise ValueError("Invalid email")
+        return value
+
+
+def validate(row: Dict[str, Any]) -> Tuple[str, Member]:
+    member = Member(**row)
+    if member.role == "owner":
+        raise RowRejected(row_errors("role", "Owners cannot be uploaded"))
+    return member.email.lower(), member
+
+
+class Store:
+    """Writes members, refusing emails listed in ``taken``"""
+
+    def __init__(self) -> None:
+        self.members: List[Member] = []
+        self.chunks: List[int] = []
+        self.taken = set()
+
+    async def write(self, members: List[Member]) -> List[Any]:
+        self.chunks.append(len(members))
+        results = []
+        for member in members:
+            if member.email in self.taken:
+                results.append(row_errors("email", "Email already registered"))
+            else:
+                self.members.append(member)
+                results.append(uuid4())
+        return results
+
+
+@pytest.fixture
+def store():
+    return Store()
+
+
+@pytest.fixture
+async def client(store):
+    app = FastAPI()
+
+    @app.post("/members:batch")
+    async def upload(request: Request, errors_only: bool = False):
+        return batch_response(await upload_rows(request), validate, store.write, errors_only)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    def set_limits(**values) -> None:
+        for name, value in values.items():
+            monkeypatch.setattr(settings, name, value)
+
+    return set_limits
+
+
+async def post(
+    client: httpx.AsyncClient, body: bytes, media_type: str, **params
+) -> List[Dict[str, Any]]:
+    response = await client.post(
+        "/members:batch", content=body, params=params, headers={"Content-Type": media_type}
+    )
+    assert response.status_code == 200, response.text
+    return [orjson.loads(line) for line in response.content.splitlines()]
+
+
+def ndjson(*rows: Any) -> bytes:
+    return b"".join(orjson.dumps(row) + b"\n" for row in rows)
+
+
+def outcome(line: Dict[str, Any]) -> str:
+    return "created" if "id" in line else line["errors"][0]["field"]
+
+
+async def test_ndjson_rows_are_reported_in_order(client, store):
+    body = ndjson({"email": "a@example.com"}, {"email": "b@example.com", "role": "admin"}) + b"\n\n"
+
+    lines = await post(client, body, "application/x-ndjson")
+
+    assert [line["row"] for line in lines[:-1]] == [1, 2]
+    assert all(UUID(line["id"]) for line in lines[:-1])
+    assert lines[-1] == {"summary": {"rows": 2, "created": 2, "failed": 0}}
+    assert [member.role for member in store.members] == ["member", "admin"]
+
+
+async def test_malformed_ndjson_rows_are_rejected_in_place(client, store):
+    body = b"\n".join(
+        [
+            b'{"email": "a@example.com"}',
+            b'{"email": "b@example.com"',
+            b'["c@example.com"]',
+            b'{"email": "not an email"}',
+            b'{"email": "owner@example.com", "role": "owner"}',
+            b'{"email": "e@example.com"}',
+        ]
+    )
+
+    lines = await post(client, body, "application/x-ndjson")
+
+    assert [(line["row"], outcome(line)) for line in lines[:-1]] == [
+        (1, "created"),
+        (2, "row"),
+        (3, "row"),
+        (4, "email"),
+        (5, "role"),
+        (6, "created"),
+    ]
+    assert lines[1]["errors"][0]["message"].startswith("Invalid JSON")
+    assert lines[2]["errors"] == row_errors("row", "Expected a JSON object")
+    assert lines[-1]["summary"] == {"rows": 6, "created": 2, "failed": 4}
+
+
+async def test_rows_spanning_read_blocks(client, store, limits):
+    limits(BATCH_MAX_ROWS=5000, BATCH_CHUNK_SIZE=100)
+    rows = [{"email": f"user{i}@example.com", "role": "x" * 50} for i in range(3000)]
+
+    lines = await post(client, ndjson(*rows), "application/x-ndjson", errors_only="true")
+
+    assert lines == [{"summary": {"rows": 3000, "created": 3000, "failed": 0}}]
+    assert [member.email for member in store.members] == [row["email"] for row in rows]
+    assert set(store.chunks) == {100}
+
+
+async def test_csv_rows_are_keyed_by_the_header(client, store):
+    body = (
+        "﻿email,role\r\n"
+        "a@example.com,admin\r\n"
+        "b@example.com,\r\n"
+        "c@example.com\r\n"
+        '"d@example.com","multi\nline"\r\n'
+        "e@example.com,admin,extra\r\n"
+    ).encode()
+
+    lines = await post(client, body, "text/csv")
+
+    assert [(line["row"], outcome(line)) for line in lines[:-1]] == [
+        (1, "created"),
+        (2, "created"),
+        (3, "row"),
+        (4, "created"),
+        (5, "row"),
+    ]
+    assert lines[2]["errors"] == row_errors("row", "Expected 2 fields, got 1")
+    assert [member.role for member in store.members] == ["admin", "member", "multi\nline"]
+
+
+async def test_unterminated_csv_quote_is_reported(client, store):
+    body = b'email,role\na@example.com,admin\nb@example.com,"open\n'
+
+    lines = await post(client, body, "text/csv")
+
+    assert lines[1]["errors"] == row_errors("row", "Unterminated quoted field")
+    assert lines[-1]["summary"] == {"rows": 2, "created": 1, "failed": 1}
+
+
+async def test_json_array_rows(client, store):
+    body = orjson.dumps([{"email": "a@example.com"}, "b@example.com", {"email": "c@example.com"}])
+
+    lines = await post(client, body, "application/json")
+
+    assert [(line["row"], outcome(line)) for line in lines[:-1]] == [
+        (1, "created"),
+        (2, "row"),
+        (3, "created"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "body, detail",
+    [
+        (b'[{"email": "a@example.com"}', "Invalid JSON"),
+        (b'{"email": "a@example.com"}', "Expected a JSON array"),
+    ],
+)
+async def test_invalid_json_array_is_refused(client, store, body, detail):
+    response = await client.post(
+        "/members:batch", content=body, headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith(detail)
+    assert store.chunks == []
+
+
+async def test_unsupported_media_type_and_oversized_bodies(client, store, limits):
+    response = await client.post(
+        "/members:batch", content=b"email", headers={"Content-Type": "text/plain"}
+    )
+    assert response.status_code == 415
+
+    limits(BATCH_MAX_UPLOAD_BYTES=100)
+    body = ndjson(*({"email": f"user{i}@example.com"} for i in range(10)))
+    response = await client.post(
+        "/members:batch", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 413
+    assert store.chunks == []
+
+
+async def test_duplicate_rows_are_rejected(client, store):
+    body = ndjson(
+        {"email": "a@example.com"},
+        {"email": "A@example.com", "role": "admin"},
+        {"email": "b@example.com"},
+    )
+
+    lines = await post(client, body, "application/x-ndjson")
+
+    assert lines[1] == {
+        "row": 2,
+        "errors": row_errors("row", "Duplicate of an earlier row: a@example.com"),
+    }
+    assert lines[-1]["summary"] == {"rows": 3, "created": 2, "failed": 1}
+
+
+async def test_duplicates_are_found_across_chunks(client, store, limits):
+    limits(BATCH_CHUNK_SIZE=2)
+    body = ndjson(*({"email": f"user{i % 3}@example.com"} for i in range(7)))
+
+    lines = await post(client, body, "application/x-ndjson", errors_only="true")
+
+    assert [line["row"] for line in lines[:-1]] == [4, 5, 6, 7]
+    assert lines[-1]["summary"] == {"rows": 7, "created": 3, "failed": 4}
+
+
+async def test_write_rejections_are_reported(client, store):
+    store.taken.add("b@example.com")
+
+    lines = await post(
+        client,
+        ndjson({"email": "a@example.com"}, {"email": "b@example.com"}),
+        "application/x-ndjson",
+    )
+
+    assert lines[1] == {"row": 2, "errors": row_errors("email", "Email already registered")}
+    assert lines[-1]["summary"] == {"rows": 2, "created": 1, "failed": 1}
+
+
+async def test_rows_past_the_limit_are_truncated(client, store, limits):
+    limits(BATCH_MAX_ROWS=3, BATCH_CHUNK_SIZE=2)
+    body = ndjson(*({"email": f"user{i}@example.com"} for i in range(5)))
+
+    lines = await post(client, body, "application/x-ndjson")
+
+    assert [line["row"] for line in lines[:-1]] == [1, 2, 3]
+    assert lines[-1]["summary"] == {
+        "rows": 3,
+        "created": 3,
+        "failed": 0,
+        "truncated": "Rows after the first 3 were not processed",
+    }
+    assert len(store.members) == 3
@@ -0,0 +1,119 @@
+"""
+Bearer token dependencies: authentication, roles and tenant binding
+"""
+
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+from src.adapters.inbound.rest.dependencies import (
+    get_current_claims,
+    require_admin,
+    require_platform_admin,
+)
+from src.infrastructure.fastapi.middleware.pipeline import RequestPipelineMiddleware
+from src.infrastructure.security import tokens as token_module
+from src.infrastructure.security.keys import KeyRing
+from src.infrastructure.security.tokens import TokenService
+
+TENANT_ID = str(uuid4())
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = TokenService(KeyRing("dependency-test-secret", "HS256"))
+    monkeypatch.setattr(token_module, "_service", service)
+    return service
+
+
+@pytest.fixture
+async def client(service):
+    app = FastAPI()
+    app.add_middleware(RequestPipelineMiddleware)
+
+    @app.get("/member")
+    async def member(claims=Depends(get_current_claims)):
+        return {"sub": claims["sub"]}
+
+    @app.get("/admin")
+    async def admin(claims=Depends(require_admin)):
+        return {"sub": claims["sub"]}
+
+    @app.get("/operator")
+    async def operator(claims=Depends(require_platform_admin)):
+        return {"sub": claims["sub"]}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test", headers={"X-Tenant-Id": TENANT_ID}
+    ) as client:
+        yield client
+
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def access(service: TokenService, role: str, tenant_id=TENANT_ID) -> dict:
+    return bearer(service.issue("user-1", tenant_id, role=role).access_token)
+
+
+@pytest.mark.parametrize("path", ["/member", "/admin", "/operator"])
+async def test_missing_token_is_unauthorized(client, path):
+    response = await client.get(path)
+
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+@pytest.mark.parametrize("path", ["/member", "/admin"])
+async def test_invalid_tokens_are_unauthorized(client, service, path):
+    refresh = service.issue("user-1", TENANT_ID, role="owner").refresh_token
+    foreign = TokenService(KeyRing("another-secret", "HS256")).issue(
+        "user-1", TENANT_ID, role="owner"
+    )
+
+    for headers in (bearer("not-a-jwt"), bearer(refresh), bearer(foreign.access_token)):
+        assert (await client.get(path, headers=headers)).status_code == 401
+
+
+async def test_revoked_token_is_unauthorized(client, service):
+    token = service.issue("user-1", TENANT_ID, role="owner").access_token
+    await service.revoke(await service.verify(token))
+
+    assert (await client.get("/admin", headers=bearer(token))).status_code == 401
+
+
+@pytest.mark.parametrize("role, status", [("owner", 200), ("admin", 200), ("member", 403)])
+async def test_admin_role_required(client, service, role, status):
+    response = await client.get("/admin", headers=access(service, role))
+
+    assert response.status_code == status
+    assert (await client.get("/member", headers=access(service, role))).status_code == 200
+
+
+@pytest.mark.parametrize("path", ["/member", "/admin"])
+@pytest.mark.parametrize("tenant_id", [str(uuid4()), None])
+async def test_token_of_another_tenant_is_forbidden(client, service, path, tenant_id):
+    response = await client.get(path, headers=access(service, "owner", tenant_id))
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Token not issued for this tenant"
+
+
+async def test_tenant_routes_need_a_tenant(client, service):
+    response = await client.get("/admin", headers={**access(service, "owner"), "X-Tenant-Id": ""})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "role, tenant_id, status",
+    [("platform_admin", None, 200), ("platform_admin", TENANT_ID, 403), ("owner", None, 403)],
+)
+async def test_platform_operator_role_required(client, service, role, tenant_id, status):
+    response = await client.get("/operator", headers=access(service, role, tenant_id))
+
+    assert response.status_code == status
@@ -0,0 +1,287 @@
+"""
+Kong sync tests, against a mock Kong Admin API
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+
+from src.domain.entities.tenant import Tenant, TenantTier
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.infrastructure.gateway.kong import MANAGED_TAG, Change, KongAdminClient, diff, tenant_state
+from src.infrastructure.gateway.kong_sync import KongSync
+from src.infrastructure.serialization.encoder import dumps
+
+ADMIN_URL = "http://kong-admin.test"
+
+
+class MockKongAdmin:
+    """
+    In-memory consumers and plugins behind the Admin API endpoints the sync
+    uses; entities read back carry Kong-style defaults and timestamps
+    """
+
+    def __init__(self) -> None:
+        self.entities: Dict[str, Dict[str, Dict[str, Any]]] = {"consumers": {}, "plugins": {}}
+        self.writes: List[Tuple[str, str, str]] = []
+        self.failing: Set[str] = set()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.strip("/").split("/")
+        collection = self.entities[parts[0]]
+
+        if request.method == "GET":
+            tag = request.url.params.get("tags")
+            size = int(request.url.params.get("size", 100))
+            offset = int(request.url.params.get("offset", 0))
+            matching = [e for e in collection.values() if tag in e.get("tags", ())]
+            more = offset + size < len(matching)
+            return httpx.Response(
+                200,
+                json={
+                    "data": matching[offset : offset + size],
+                    "offset": str(offset + size) if more else None,
+                },
+            )
+
+        entity_id = parts[1]
+        self.writes.append((request.method, parts[0], entity_id))
+        if entity_id in self.failing:
+            return httpx.Response(503, json={"message": "unavailable"})
+        if request.method == "DELETE":
+            if collection.pop(entity_id, None) is None:
+                return httpx.Response(404)
+            return httpx.Response(204)
+
+        body = json.loads(request.content)
+        if parts[0] == "plugins":
+            if body["consumer"]["id"] not in self.entities["consumers"]:
+                return httpx.Response(400, json={"message": "consumer does not exist"})
+            body["config"] = {"second": None, "fault_tolerant": True, **body["config"]}
+        collection[entity_id] = {"id": entity_id, "created_at": 1700000000, **body}
+        return httpx.Response(200, json=collection[entity_id])
+
+    def keys(self) -> Set[Tuple[str, str]]:
+        return {
+            (name, entity_id) for name, entities in self.entities.items() for entity_id in entities
+        }
+
+
+class InMemoryTenantRepository(TenantRepository):
+    """The tenant lookups the sync uses"""
+
+    def __init__(self, tenants: Sequence[Tenant]) -> None:
+        self.tenants = {tenant.id: tenant for tenant in tenants}
+
+    async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        return self.tenants.get(tenant_id)
+
+    async def get_by_slug(self, slug: str) -> Optional[Tenant]:
+        return next((t for t in self.tenants.values() if t.slug == slug), None)
+
+    async def get_many(self, tenant_ids: Sequence[UUID]) -> List[Tenant]:
+        return [self.tenants[i] for i in tenant_ids if i in self.tenants]
+
+    async def save(self, tenant: Tenant) -> None:
+        self.tenants[tenant.id] = tenant
+
+    async def upsert_many(self, tenants: Sequence[Tenant]) -> int:
+        raise NotImplementedError
+
+    async def insert_new(self, tenants: Sequence[Tenant]) -> Set[UUID]:
+        raise NotImplementedError
+
+    async def list_page(self, limit, after=None):
+        raise NotImplementedError
+
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[Tenant]:
+        for tenant in list(self.tenants.values()):
+            yield tenant
+
+    async def count_estimate(self) -> int:
+        return len(self.tenants)
+
+
+def active_tenant(name: str) -> Tenant:
+    tenant = Tenant(name=name)
+    tenant.activate()
+    tenant.pull_events()
+    return tenant
+
+
+def desired_keys(repository: InMemoryTenantRepository) -> Set[Tuple[str, str]]:
+    keys = set()
+    for tenant in repository.tenants.values():
+        keys.update(tenant_state(tenant))
+    return keys
+
+
+@pytest.fixture
+def kong():
+    return MockKongAdmin()
+
+
+@pytest.fixture
+async def admin(kong):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(kong.handle)) as client:
+        yield KongAdminClient(client, ADMIN_URL)
+
+
+@pytest.fixture
+def repository():
+    return InMemoryTenantRepository([active_tenant(f"Tenant {i}") for i in range(3)])
+
+
+@pytest.fixture
+def sync(repository, admin):
+    return KongSync(repository, admin, concurrency=4)
+
+
+def test_only_active_tenants_get_entities():
+    tenant = Tenant(name="Pending")
+    assert tenant_state(tenant) == {}
+
+    tenant.activate()
+    state = tenant_state(tenant)
+    assert set(state) == {
+        ("consumers", str(tenant.id)),
+        ("plugins", next(k[1] for k in state if k[0] == "plugins")),
+    }
+    assert all(MANAGED_TAG in body["tags"] for body in state.values())
+
+
+def test_diff_ignores_fields_kong_fills_in():
+    tenant = active_tenant("Acme")
+    desired = tenant_state(tenant)
+    current = {
+        key: {"id": key[1], "created_at": 1700000000, **body, "tags": list(reversed(body["tags"]))}
+        for key, body in desired.items()
+    }
+    assert diff(str(tenant.id), desired, current) == []
+
+    changes = diff(str(tenant.id), {}, current)
+    assert sorted(change.phase for change in changes) == [2, 3]
+    assert all(change.body is None for change in changes)
+
+
+async def test_sync_all_creates_consumers_before_their_plugins(sync, kong, repository):
+    assert await sync.sync_all() == 6
+
+    assert kong.keys() == desired_keys(repository)
+    assert [collection for _, collection, _ in kong.writes] == ["consumers"] * 3 + ["plugins"] * 3
+    assert sync.stats() == {"tenants": 3, "writes": 6, "failures": 0, "resyncs": 0}
+
+
+async def test_unchanged_tenants_cause_no_calls(sync, kong):
+    await sync.sync_all()
+    kong.writes.clear()
+
+    assert await sync.sync_all() == 0
+    assert kong.writes == []
+
+
+async def test_sync_tenants_writes_only_changed_entities(sync, kong, repository):
+    await sync.sync_all()
+    kong.writes.clear()
+    tenant = next(iter(repository.tenants.values()))
+    tenant.update_tier(TenantTier.ENTERPRISE)
+
+    writes = await sync.sync_tenants([str(tenant.id), str(uuid4()), "not-a-uuid"])
+
+    assert writes == len(kong.writes) > 0
+    assert all(method == "PUT" for method, _, _ in kong.writes)
+    assert {entity_id for _, _, entity_id in kong.writes} <= {
+        key[1] for key in tenant_state(tenant)
+    }
+    plugin = next(
+        e for e in kong.entities["plugins"].values() if e["consumer"]["id"] == str(tenant.id)
+    )
+    assert "month" not in plugin["config"]
+
+
+async def test_suspended_tenants_lose_plugins_before_consumers(sync, kong, repository):
+    await sync.sync_all()
+    kong.writes.clear()
+    tenant = next(iter(repository.tenants.values()))
+    tenant.suspend()
+
+    assert await sync.sync_tenants([str(tenant.id)]) == 2
+
+    assert [(method, collection) for method, collection, _ in kong.writes] == [
+        ("DELETE", "plugins"),
+        ("DELETE", "consumers"),
+    ]
+    assert kong.keys() == desired_keys(repository)
+    assert sync.stats()["tenants"] == 2
+
+
+async def test_deleting_an_entity_already_gone_succeeds(admin, kong):
+    await admin.apply(Change(str(uuid4()), ("consumers", str(uuid4()))))
+    assert kong.writes[0][0] == "DELETE"
+
+
+async def test_failed_writes_are_retried_on_the_next_sync(sync, kong, repository):
+    failing = next(iter(repository.tenants.values()))
+    kong.failing.add(str(failing.id))
+
+    assert await sync.sync_all() == 4
+
+    # No plugin is written for a tenant whose consumer failed
+    assert str(failing.id) not in {
+        plugin["consumer"]["id"] for plugin in kong.entities["plugins"].values()
+    }
+    assert sync.stats()["failures"] == 1
+
+    kong.failing.clear()
+    assert await sync.sync_all() == 2
+    assert kong.keys() == desired_keys(repository)
+
+
+async def test_resync_repairs_drift(sync, kong, repository):
+    await sync.sync_all()
+    lost = next(iter(repository.tenants.values()))
+    del kong.entities["consumers"][str(lost.id)]
+    stray = str(uuid4())
+    kong.entities["consumers"][stray] = {"id": stray, "username": "stray", "tags": [MANAGED_TAG]}
+    unmanaged = str(uuid4())
+    kong.entities["consumers"][unmanaged] = {"id": unmanaged, "username": "manual", "tags": []}
+
+    # The snapshot still believes Kong is in sync
+    assert await sync.sync_all() == 0
+
+    assert await sync.resync() == 2
+    assert kong.keys() == desired_keys(repository) | {("consumers", unmanaged)}
+    assert sync.stats()["resyncs"] == 1
+
+
+async def test_list_managed_follows_pages(admin, kong):
+    for i in range(5):
+        kong.entities["consumers"][str(i)] = {"id": str(i), "tags": [MANAGED_TAG]}
+    kong.entities["consumers"]["other"] = {"id": "other", "tags": ["someone-else"]}
+
+    ids = [entity["id"] async for entity in admin.list_managed("consumers", page_size=2)]
+
+    assert ids == ["0", "1", "2", "3", "4"]
+
+
+async def test_tenant_events_mark_tenants_dirty(sync, kong, repository):
+    tenant = next(iter(repository.tenants.values()))
+
+    await sync._on_event(
+        SimpleNamespace(
+            subject="platform.events.tenant.activated",
+            data=dumps(
+                {
+                    "aggregate_id": str(tenant.id),
+                }
+            ),
+        )
+    )
+    await sync._on_event(SimpleNamespace(subject="platform.events.tenant.activated", data=b"{oops"))
+
+    assert sync._dirty == {str(tenant.id)}
+    assert await sync.sync_tenants(sync._dirty) == 2
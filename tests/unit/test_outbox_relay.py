@@ -0,0 +1,311 @@
+"""
+Outbox relay tests, against an in-memory outbox and a stub JetStream, plus
+one against a real nats-server that is skipped when none is running
+"""
+
+import asyncio
+from typing import Dict, List, Set
+from uuid import UUID, uuid4
+
+import pytest
+from nats.errors import NoRespondersError
+from nats.errors import TimeoutError as NatsTimeoutError
+from nats.js.api import PubAck
+from nats.js.errors import NotFoundError
+
+from src.domain.ports.repositories.outbox_repository import EventOutbox, OutboxMessage, Publisher
+from src.infrastructure.config.settings import settings
+from src.infrastructure.nats.outbox_relay import EVENT_SUBJECT_PREFIX, OutboxRelay
+
+
+class InMemoryOutbox(EventOutbox):
+    """Pending messages in creation order; delivered ones are removed"""
+
+    def __init__(self) -> None:
+        self.messages: List[OutboxMessage] = []
+
+    def add(self, aggregate_id: str, event_type: str = "tenant.updated") -> OutboxMessage:
+        message = OutboxMessage(
+            uuid4(), event_type, aggregate_id, f"{aggregate_id}:{len(self.messages)}".encode()
+        )
+        self.messages.append(message)
+        return message
+
+    async def relay_batch(self, limit: int, publish: Publisher) -> int:
+        delivered = set(await publish(self.messages[:limit]))
+        self.messages = [message for message in self.messages if message.id not in delivered]
+        return len(delivered)
+
+    async def pending(self) -> int:
+        return len(self.messages)
+
+
+class StubJetStream:
+    """
+    Stores published messages per stream, deduplicating on Nats-Msg-Id like
+    JetStream does within its duplicate window
+    """
+
+    def __init__(self) -> None:
+        self.streams: Dict[str, dict] = {}
+        self.stored: List[OutboxMessage] = []
+        self.seen: Set[str] = set()
+        self.failing: Set[UUID] = set()
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # Like JetStream, refuse requests while down and publishes without a stream
+        self.down = False
+        self.require_stream = False
+
+    async def stream_info(self, name: str) -> dict:
+        if self.down:
+            raise NoRespondersError()
+        if name not in self.streams:
+            raise NotFoundError()
+        return self.streams[name]
+
+    async def add_stream(self, name: str, **config) -> dict:
+        if self.down:
+            raise NoRespondersError()
+        self.streams[name] = config
+        return config
+
+    async def publish(
+        self, subject: str, payload: bytes, timeout: float, headers: Dict[str, str]
+    ) -> PubAck:
+        if self.down or (self.require_stream and not self.streams):
+            raise NoRespondersError()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        msg_id = headers["Nats-Msg-Id"]
+        if UUID(msg_id) in self.failing:
+            raise NatsTimeoutError()
+        if msg_id in self.seen:
+            return PubAck(stream="EVENTS", seq=len(self.stored), duplicate=True)
+        self.seen.add(msg_id)
+        event_type = subject[len(EVENT_SUBJECT_PREFIX) + 1 :]
+        self.stored.append(
+            OutboxMessage(UUID(msg_id), event_type, payload.decode().split(":")[0], payload)
+        )
+        return PubAck(stream="EVENTS", seq=len(self.stored))
+
+    def aggregate(self, aggregate_id: str) -> List[bytes]:
+        return [message.payload for message in self.stored if message.aggregate_id == aggregate_id]
+
+
+@pytest.fixture
+def outbox():
+    return InMemoryOutbox()
+
+
+@pytest.fixture
+def js():
+    return StubJetStream()
+
+
+async def test_publishes_events_to_their_subjects(outbox, js):
+    created = outbox.add("tenant-a", "tenant.created")
+    suspended = outbox.add("tenant-b", "tenant.suspended")
+    relay = OutboxRelay(outbox, js)
+
+    assert await relay.relay_once() == 2
+
+    assert {message.id: message.event_type for message in js.stored} == {
+        created.id: "tenant.created",
+        suspended.id: "tenant.suspended",
+    }
+    assert await outbox.pending() == 0
+    assert relay.stats() == {"published": 2, "duplicates": 0, "failures": 0}
+
+
+async def test_keeps_creation_order_per_aggregate(outbox, js):
+    js.delay = 0.001
+    expected = {aggregate: [] for aggregate in ("a", "b", "c")}
+    for i in range(30):
+        message = outbox.add("abc"[i % 3])
+        expected[message.aggregate_id].append(message.payload)
+
+    await OutboxRelay(outbox, js, max_in_flight=8).relay_once()
+
+    for aggregate, payloads in expected.items():
+        assert js.aggregate(aggregate) == payloads
+
+
+async def test_bounds_publishes_in_flight(outbox, js):
+    js.delay = 0.01
+    for i in range(40):
+        outbox.add(f"tenant-{i}")
+
+    assert await OutboxRelay(outbox, js, max_in_flight=4).relay_once() == 40
+    assert js.max_in_flight == 4
+
+
+async def test_failure_holds_back_the_aggregates_later_events(outbox, js):
+    first = outbox.add("a")
+    failing = outbox.add("a")
+    held = outbox.add("a")
+    other = outbox.add("b")
+    js.failing.add(failing.id)
+    relay = OutboxRelay(outbox, js)
+
+    assert await relay.relay_once() == 2
+
+    assert [message.id for message in js.stored] in ([first.id, other.id], [other.id, first.id])
+    assert outbox.messages == [failing, held]
+    assert relay.failures == 1
+
+    # The broker recovers: the rest follows, still in order
+    js.failing.clear()
+    assert await relay.relay_once() == 2
+    assert js.aggregate("a") == [first.payload, failing.payload, held.payload]
+    assert await outbox.pending() == 0
+
+
+async def test_republished_events_are_deduplicated(outbox, js):
+    message = outbox.add("a")
+    relay = OutboxRelay(outbox, js)
+    await relay.relay_once()
+
+    # A batch whose claim expired after publishing is claimed again
+    outbox.messages.append(message)
+    assert await relay.relay_once() == 1
+
+    assert js.stored == [message]
+    assert relay.stats() == {"published": 1, "duplicates": 1, "failures": 0}
+
+
+async def test_relay_batches_are_limited(outbox, js):
+    for i in range(5):
+        outbox.add(f"tenant-{i}")
+    relay = OutboxRelay(outbox, js, batch_size=2)
+
+    assert [await relay.relay_once() for _ in range(4)] == [2, 2, 1, 0]
+
+
+async def test_ensure_stream_creates_it_once(js):
+    relay = OutboxRelay(InMemoryOutbox(), js)
+
+    await relay.ensure_stream("EVENTS", duplicate_window=120)
+    js.streams["EVENTS"]["marker"] = True
+    await relay.ensure_stream("EVENTS", duplicate_window=120)
+
+    assert js.streams["EVENTS"] == {
+        "subjects": [f"{EVENT_SUBJECT_PREFIX}.>"],
+        "duplicate_window": 120,
+        "marker": True,
+    }
+
+
+async def test_background_relay_drains_after_the_broker_recovers(outbox, js):
+    message = outbox.add("a")
+    js.failing.add(message.id)
+    relay = OutboxRelay(outbox, js, poll_interval=0.01)
+    relay.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert relay.failures >= 1
+        assert await outbox.pending() == 1
+
+        js.failing.clear()
+        later = outbox.add("a")
+        for _ in range(100):
+            if not outbox.messages:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await relay.close()
+
+    assert [stored.id for stored in js.stored] == [message.id, later.id]
+
+
+async def drained(outbox: InMemoryOutbox) -> None:
+    for _ in range(200):
+        if not outbox.messages:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_background_relay_creates_a_stream_missing_at_startup(outbox, js):
+    js.down = js.require_stream = True
+    message = outbox.add("a")
+    relay = OutboxRelay(outbox, js, poll_interval=0.01)
+    with pytest.raises(NoRespondersError):
+        await relay.ensure_stream("EVENTS", duplicate_window=120)
+
+    relay.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert await outbox.pending() == 1
+
+        js.down = False
+        await drained(outbox)
+    finally:
+        await relay.close()
+
+    assert "EVENTS" in js.streams
+    assert js.stored == [message]
+
+
+async def test_background_relay_recreates_a_deleted_stream(outbox, js):
+    js.require_stream = True
+    relay = OutboxRelay(outbox, js, poll_interval=0.01)
+    await relay.ensure_stream("EVENTS", duplicate_window=120)
+    relay.start()
+    try:
+        del js.streams["EVENTS"]
+        message = outbox.add("a")
+        await drained(outbox)
+    finally:
+        await relay.close()
+
+    assert js.streams["EVENTS"]["duplicate_window"] == 120
+    assert js.stored == [message]
+    assert relay.failures >= 1
+
+
+@pytest.fixture
+async def jetstream():
+    """JetStream of a nats-server at NATS_URL; skipped when none is running"""
+    import nats
+
+    try:
+        nc = await asyncio.wait_for(
+            nats.connect(settings.NATS_URL, connect_timeout=1, allow_reconnect=False), timeout=2
+        )
+    except Exception as exc:
+        pytest.skip(f"No nats-server at {settings.NATS_URL}: {exc!r}")
+    stream = f"TEST_EVENTS_{uuid4().hex[:8]}"
+    js = nc.jetstream()
+    try:
+        yield js, stream
+    finally:
+        try:
+            await js.delete_stream(stream)
+        finally:
+            await nc.close()
+
+
+async def test_relays_to_a_real_jetstream(jetstream, outbox):
+    js, stream = jetstream
+    relay = OutboxRelay(outbox, js)
+    try:
+        await relay.ensure_stream(stream, duplicate_window=120)
+    except Exception as exc:
+        pytest.skip(f"JetStream unavailable: {exc!r}")
+    first = outbox.add("a", "tenant.created")
+    second = outbox.add("a", "tenant.updated")
+
+    assert await relay.relay_once() == 2
+    outbox.messages.append(first)
+    assert await relay.relay_once() == 1
+
+    info = await js.stream_info(stream)
+    assert info.state.messages == 2
+    assert relay.stats() == {"published": 2, "duplicates": 1, "failures": 0}
+    stored = await js.get_msg(stream, info.state.last_seq)
+    assert stored.data == second.payload
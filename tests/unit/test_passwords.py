@@ -0,0 +1,88 @@
+"""
+Password service tests: hashing in the worker pool keeps the event loop free
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.security.passwords import (
+    PasswordPolicyError,
+    PasswordService,
+    PasswordServiceBusyError,
+    _context,
+)
+
+PASSWORD = "Login-password-1"
+ROUNDS = 8
+
+
+async def max_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Worst delay, beyond ``interval``, of a ticker on the event loop"""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+@pytest.fixture
+async def service():
+    service = PasswordService(workers=2, max_pending=64, rounds=ROUNDS)
+    service.start()
+    yield service
+    await service.close()
+
+
+async def test_event_loop_lag_stays_flat_during_a_login_burst(service):
+    password_hash = await service.hash(PASSWORD)
+    # Warm up: spawn both workers before measuring
+    await asyncio.gather(*(service.verify(PASSWORD, password_hash) for _ in range(2)))
+    started = time.perf_counter()
+    _context(ROUNDS).verify(PASSWORD, password_hash)
+    on_loop = time.perf_counter() - started
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(max_loop_lag(stop))
+    results = await asyncio.gather(
+        *(
+            service.verify(PASSWORD if i % 2 else "Wrong-password-1", password_hash)
+            for i in range(16)
+        )
+    )
+    stop.set()
+    lag = await ticker
+
+    assert [valid for valid, _ in results] == [bool(i % 2) for i in range(16)]
+    # One verification on the loop would stall it for its whole duration
+    assert lag < 0.05
+    assert lag < on_loop / 2
+
+
+async def test_unknown_users_cost_a_verification_too(service):
+    assert await service.verify(PASSWORD, None) == (False, None)
+
+
+async def test_weak_passwords_are_refused_before_hashing(service):
+    with pytest.raises(PasswordPolicyError) as error:
+        await service.hash("short")
+
+    assert "must be at least" in str(error.value)
+
+
+async def test_callers_past_the_queue_bound_are_turned_away():
+    service = PasswordService(workers=1, max_pending=1, queue_timeout=0.01, rounds=ROUNDS)
+    service.start()
+    try:
+        password_hash = await service.hash(PASSWORD)
+        results = await asyncio.gather(
+            *(service.verify(PASSWORD, password_hash) for _ in range(3)),
+            return_exceptions=True,
+        )
+    finally:
+        await service.close()
+
+    assert sum(isinstance(result, PasswordServiceBusyError) for result in results) == 2
+    assert service.rejected == 2
@@ -0,0 +1,132 @@
+"""
+Repository writes against Postgres (COPY, ON CONFLICT, the outbox claim)
+
+Runs in a throwaway schema of the database at TEST_DATABASE_URL, or
+DATABASE_URL; skipped when no server is reachable.
+"""
+
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.adapters.outbound.persistence.models import Base, TenantBase
+from src.adapters.outbound.persistence.outbox_repository import SqlAlchemyEventOutbox
+from src.adapters.outbound.persistence.tenant_repository import SqlAlchemyTenantRepository
+from src.adapters.outbound.persistence.usage_repository import SqlAlchemyUsageRepository
+from src.adapters.outbound.persistence.user_repository import SqlAlchemyUserRepository
+from src.domain.entities.tenant import Tenant
+from src.domain.entities.user import User
+from src.infrastructure.config.settings import settings
+
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL", settings.DATABASE_URL)
+
+
+@pytest.fixture
+async def session_factory():
+    schema = f"test_{uuid4().hex[:12]}"
+    admin = create_async_engine(DATABASE_URL)
+    try:
+        async with asyncio.timeout(3):
+            async with admin.begin() as connection:
+                await connection.execute(text(f"CREATE SCHEMA {schema}"))
+    except Exception as exc:
+        await admin.dispose()
+        pytest.skip(f"No Postgres at {DATABASE_URL}: {exc!r}")
+
+    engine = create_async_engine(
+        DATABASE_URL, connect_args={"server_settings": {"search_path": schema}}
+    )
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.run_sync(TenantBase.metadata.create_all)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+        async with admin.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin.dispose()
+
+
+async def test_user_copy_insert_skips_taken_rows_and_stays_in_its_tenant(session_factory):
+    tenant_id, other_id = uuid4(), uuid4()
+    users = SqlAlchemyUserRepository(session_factory, tenant_id)
+    first = User(tenant_id=tenant_id, email="a@example.com")
+    second = User(tenant_id=tenant_id, email="b@example.com")
+    assert await users.insert_new([first, second]) == {first.id, second.id}
+
+    taken_email = User(tenant_id=tenant_id, email="a@example.com")
+    new = User(tenant_id=tenant_id, email="c@example.com")
+    assert await users.insert_new([taken_email, second, new]) == {new.id}
+
+    others = SqlAlchemyUserRepository(session_factory, other_id)
+    assert await others.get_by_id(first.id) is None
+    assert await others.delete(first.id) is False
+    assert await users.delete(first.id) is True
+    assert {user.id for user in (await users.list_page(10)).items} == {second.id, new.id}
+
+
+async def test_tenant_insert_skips_taken_slugs_and_stores_events(session_factory):
+    tenants = SqlAlchemyTenantRepository(session_factory)
+    outbox = SqlAlchemyEventOutbox(session_factory)
+    acme = Tenant(name="Acme")
+    acme.activate()
+    clash = Tenant(name="ACME")
+    clash.activate()
+
+    assert await tenants.insert_new([acme]) == {acme.id}
+    assert await tenants.insert_new([clash]) == set()
+
+    stored = await tenants.get_by_slug("acme")
+    assert stored.id == acme.id
+    stored.settings["region"] = "eu-west-1"
+    await tenants.save(stored)
+    assert (await tenants.get_by_id(acme.id)).settings == {"region": "eu-west-1"}
+    assert await outbox.pending() == 1
+
+
+async def test_outbox_claims_commit_before_publishing(session_factory):
+    tenants = SqlAlchemyTenantRepository(session_factory)
+    outbox = SqlAlchemyEventOutbox(session_factory, lease_seconds=60)
+    created = [Tenant(name=f"Tenant {i}") for i in range(3)]
+    for tenant in created:
+        tenant.activate()
+    await tenants.insert_new(created)
+
+    async def publish(messages):
+        # The claim is committed: another relay sees the batch in flight
+        assert await outbox.relay_batch(10, publish_nothing) == 0
+        return [messages[0].id]
+
+    async def publish_nothing(messages):
+        return []
+
+    assert await outbox.relay_batch(10, publish) == 1
+    assert await outbox.pending() == 2
+
+    # Undelivered rows were released, so the next batch takes them at once
+    delivered = set()
+
+    async def publish_all(messages):
+        delivered.update(message.aggregate_id for message in messages)
+        return [message.id for message in messages]
+
+    assert await outbox.relay_batch(10, publish_all) == 2
+    assert len(delivered) == 2
+    assert await outbox.pending() == 0
+
+
+async def test_usage_accumulates_and_reads_back(session_factory):
+    usage = SqlAlchemyUsageRepository(session_factory)
+    tenant = str(uuid4())
+
+    await usage.add_usage("2026-10", {(tenant, "requests"): 5})
+    await usage.add_usage("2026-10", {(tenant, "requests"): 2})
+
+    assert await usage.get_usage("2026-10", [(tenant, "requests"), (tenant, "users")]) == {
+        (tenant, "requests"): 7
+    }
@@ -0,0 +1,239 @@
+"""
+Provider connectivity tester and circuit breaker tests, against provider
+APIs answered by an httpx.MockTransport
+"""
+
+import asyncio
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from src.domain.entities.provider import ProviderConfig
+from src.infrastructure.http import circuit_breaker
+from src.infrastructure.http.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from src.infrastructure.providers.connectivity import (
+    CIRCUIT_OPEN,
+    ERROR,
+    MISSING_API_KEY,
+    OK,
+    TIMEOUT,
+    UNAUTHORIZED,
+    ProviderTester,
+    probe_request,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    # Only the breakers' clock: the event loop keeps the real one
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+class Upstream:
+    """Provider APIs answering every request with ``status`` (or raising ``error``)"""
+
+    def __init__(self, status: int = 200, error: Exception = None, delay: float = 0.0) -> None:
+        self.status = status
+        self.error = error
+        self.delay = delay
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return httpx.Response(self.status, json={"data": []})
+
+
+@pytest.fixture
+def upstream():
+    return Upstream()
+
+
+@pytest.fixture
+async def client(upstream):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        yield client
+
+
+def config(provider: str = "openai", tenant_id: str = "tenant-a", **kwargs) -> ProviderConfig:
+    return ProviderConfig(tenant_id, provider, api_key=kwargs.pop("api_key", "sk-test"), **kwargs)
+
+
+def test_probe_request_authenticates_per_provider():
+    url, headers = probe_request(config("anthropic"))
+    assert url == "https://api.anthropic.com/v1/models"
+    assert headers["x-api-key"] == "sk-test"
+
+    url, headers = probe_request(config("openai", base_url="https://llm.internal/v1/"))
+    assert url == "https://llm.internal/v1/models"
+    assert headers["Authorization"] == "Bearer sk-test"
+
+
+@pytest.mark.parametrize(
+    "status, outcome",
+    [(200, OK), (401, UNAUTHORIZED), (403, UNAUTHORIZED), (404, ERROR), (503, ERROR)],
+)
+async def test_outcome_follows_the_upstream_status(client, upstream, status, outcome):
+    upstream.status = status
+
+    result = await ProviderTester(client).test(config())
+
+    assert result.status == outcome
+    assert result.http_status == status
+    assert len(upstream.requests) == 1
+
+
+async def test_missing_api_key_is_not_sent_upstream(client, upstream):
+    result = await ProviderTester(client).test(config(api_key=None))
+
+    assert result.status == MISSING_API_KEY
+    assert upstream.requests == []
+
+
+async def test_transport_errors_and_timeouts(client, upstream):
+    upstream.error = httpx.ConnectError("connection refused")
+    assert (await ProviderTester(client).test(config())).status == ERROR
+
+    upstream.error = None
+    upstream.delay = 1.0
+    result = await ProviderTester(client, timeout=0.05).test(config())
+    assert result.status == TIMEOUT
+
+
+async def test_recent_results_are_reused_until_the_config_changes(client, upstream):
+    tester = ProviderTester(client, result_ttl=60)
+    provider = config()
+
+    first = await tester.test(provider)
+    assert await tester.test(provider) is first
+    assert tester.cached == 1
+
+    provider.updated_at += timedelta(seconds=1)
+    assert await tester.test(provider) is not first
+    assert await tester.test(provider, force=True) is not first
+    assert len(upstream.requests) == 3
+
+
+async def test_all_runs_tests_concurrently(client, upstream):
+    upstream.delay = 0.1
+    tester = ProviderTester(client)
+    configs = [config(tenant_id=f"tenant-{i}") for i in range(20)]
+
+    started = asyncio.get_running_loop().time()
+    results = await tester.test_all(configs)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert [result.status for result in results] == [OK] * 20
+    assert elapsed < 1.0
+
+
+async def test_circuit_opens_after_upstream_failures(client, upstream, clock):
+    upstream.status = 502
+    tester = ProviderTester(
+        client, breakers=CircuitBreakerRegistry(failure_threshold=3, reset_timeout=30)
+    )
+
+    results = [await tester.test(config(tenant_id=f"tenant-{i}")) for i in range(5)]
+
+    assert [result.status for result in results] == [
+        ERROR,
+        ERROR,
+        ERROR,
+        CIRCUIT_OPEN,
+        CIRCUIT_OPEN,
+    ]
+    assert len(upstream.requests) == 3
+    assert tester.stats()["circuits"] == {"https://api.openai.com/v1/models": "open"}
+    # Other upstreams are unaffected
+    upstream.status = 200
+    assert (await tester.test(config("groq"))).status == OK
+
+
+async def test_rejected_credentials_do_not_open_the_circuit(client, upstream, clock):
+    upstream.status = 401
+    tester = ProviderTester(client, breakers=CircuitBreakerRegistry(failure_threshold=2))
+
+    results = [await tester.test(config(tenant_id=f"tenant-{i}")) for i in range(4)]
+
+    assert {result.status for result in results} == {UNAUTHORIZED}
+    assert len(upstream.requests) == 4
+
+
+async def test_circuit_closes_after_a_successful_trial(client, upstream, clock):
+    upstream.status = 500
+    tester = ProviderTester(
+        client, breakers=CircuitBreakerRegistry(failure_threshold=1, reset_timeout=30)
+    )
+    assert (await tester.test(config(tenant_id="a"))).status == ERROR
+    assert (await tester.test(config(tenant_id="b"))).status == CIRCUIT_OPEN
+
+    clock.now += 31
+    upstream.status = 200
+    assert (await tester.test(config(tenant_id="c"))).status == OK
+    assert (await tester.test(config(tenant_id="d"))).status == OK
+    assert tester.stats()["circuits"] == {"https://api.openai.com/v1/models": "closed"}
+
+
+def test_half_open_circuit_lets_a_single_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 10
+
+    clock.now += 10
+    assert breaker.allow()
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert not breaker.allow()
+
+    # A failed trial opens the circuit again at once
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_abandoned_trial_frees_the_half_open_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+
+    assert breaker.allow()
+    breaker.abandon()
+    assert breaker.allow()
+
+
+async def test_cancelled_test_releases_the_trial(client, upstream, clock):
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=10)
+    tester = ProviderTester(client, breakers=breakers)
+    upstream.status = 500
+    await tester.test(config(tenant_id="a"))
+    clock.now += 10
+
+    upstream.delay = 10
+    task = asyncio.create_task(tester.test(config(tenant_id="b")))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breakers.get("https://api.openai.com/v1/models").allow()
@@ -0,0 +1,164 @@
+"""
+Quota meter flushes to Redis (fakeredis with Lua), seeded from durable usage
+"""
+
+import asyncio
+from typing import Dict, Tuple
+from uuid import uuid4
+
+import fakeredis.aioredis
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.adapters.inbound.rest import dependencies
+from src.adapters.inbound.rest.v1 import users
+from src.domain.ports.repositories.usage_repository import UsageRepository
+from src.infrastructure.fastapi.middleware.pipeline import RequestPipelineMiddleware
+from src.infrastructure.metering import quota_meter
+from src.infrastructure.metering.quota_meter import TOTAL_PERIOD, QuotaMeter, current_period
+from src.infrastructure.security import tokens as token_module
+from src.infrastructure.security.keys import KeyRing
+from src.infrastructure.security.tokens import TokenService
+
+TENANT = str(uuid4())
+
+
+class StoredUsage(UsageRepository):
+    def __init__(self, usage: Dict[Tuple[str, Tuple[str, str]], int]) -> None:
+        self.usage = dict(usage)
+        self.lookups = 0
+        self.failing = False
+
+    async def add_usage(self, period, deltas):
+        for key, delta in deltas.items():
+            self.usage[(period, key)] = self.usage.get((period, key), 0) + delta
+
+    async def get_usage(self, period, keys):
+        self.lookups += 1
+        if self.failing:
+            raise ConnectionError("database down")
+        return {key: self.usage[(period, key)] for key in keys if (period, key) in self.usage}
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis()
+
+
+@pytest.fixture
+def stored():
+    return StoredUsage(
+        {
+            (TOTAL_PERIOD, (TENANT, "users")): 7,
+            (current_period(), (TENANT, "requests")): 100,
+        }
+    )
+
+
+async def field(redis, period: str, quota_type: str) -> int:
+    return int(await redis.hget(f"quota:{{{TENANT}}}:{period}", quota_type))
+
+
+async def test_missing_fields_are_seeded_from_stored_usage(redis, stored):
+    meter = QuotaMeter(redis, stored)
+    meter.record(TENANT, "users")
+    meter.usage(TENANT, "requests")
+
+    await meter.flush()
+
+    assert meter.usage(TENANT, "users") == 8
+    assert meter.usage(TENANT, "requests") == 100
+    assert await field(redis, TOTAL_PERIOD, "users") == 8
+    assert await field(redis, current_period(), "requests") == 100
+    assert await redis.ttl(f"quota:{{{TENANT}}}:{current_period()}") > 0
+
+
+async def test_fields_in_redis_are_not_seeded_again(redis, stored):
+    await redis.hset(f"quota:{{{TENANT}}}:{TOTAL_PERIOD}", "users", 3)
+    meter = QuotaMeter(redis, stored)
+    meter.record(TENANT, "users")
+
+    await meter.flush()
+
+    assert meter.usage(TENANT, "users") == 4
+    assert stored.lookups == 0
+
+
+async def test_workers_seeding_at_once_count_the_stored_usage_once(redis, stored):
+    meters = [QuotaMeter(redis, stored) for _ in range(4)]
+    for meter in meters:
+        meter.record(TENANT, "users")
+
+    await asyncio.gather(*(meter.flush() for meter in meters))
+
+    assert await field(redis, TOTAL_PERIOD, "users") == 11
+
+
+async def test_failed_seeding_retries_only_the_held_back_deltas(redis, stored):
+    await redis.hset(f"quota:{{{TENANT}}}:{current_period()}", "requests", 50)
+    meter = QuotaMeter(redis, stored)
+    meter.record(TENANT, "requests")
+    meter.record(TENANT, "users")
+    stored.failing = True
+
+    await meter.flush()
+    assert meter.flush_failures == 1
+    assert await field(redis, current_period(), "requests") == 51
+
+    stored.failing = False
+    await meter.flush()
+
+    assert await field(redis, current_period(), "requests") == 51
+    assert await field(redis, TOTAL_PERIOD, "users") == 8
+    await meter.persist()
+    assert stored.usage[(current_period(), (TENANT, "requests"))] == 101
+    assert stored.usage[(TOTAL_PERIOD, (TENANT, "users"))] == 8
+
+
+async def test_deleted_users_free_their_quota(redis, stored):
+    meter = QuotaMeter(redis, stored)
+    meter.record(TENANT, "users", 2)
+    await meter.flush()
+    meter.record(TENANT, "users", -1)
+
+    assert meter.usage(TENANT, "users") == 8
+    await meter.flush()
+    await meter.persist()
+    assert await field(redis, TOTAL_PERIOD, "users") == 8
+    assert stored.usage[(TOTAL_PERIOD, (TENANT, "users"))] == 8
+
+
+class OneUser:
+    def __init__(self) -> None:
+        self.user_id = uuid4()
+
+    async def delete(self, user_id):
+        if user_id != self.user_id:
+            return False
+        self.user_id = None
+        return True
+
+
+async def test_delete_route_decrements_the_users_total(monkeypatch):
+    service = TokenService(KeyRing("quota-test-secret", "HS256"))
+    monkeypatch.setattr(token_module, "_service", service)
+    meter = QuotaMeter(None)
+    monkeypatch.setattr(quota_meter, "_meter", meter)
+    repository = OneUser()
+    user_id = repository.user_id
+
+    app = FastAPI()
+    app.add_middleware(RequestPipelineMiddleware)
+    app.include_router(users.router, prefix="/v1/users")
+    app.dependency_overrides[dependencies.get_user_repository] = lambda: repository
+    token = service.issue(str(uuid4()), TENANT, role="admin").access_token
+    headers = {"X-Tenant-Id": TENANT, "Authorization": f"Bearer {token}"}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        deleted = await client.delete(f"/v1/users/{user_id}", headers=headers)
+        missing = await client.delete(f"/v1/users/{user_id}", headers=headers)
+
+    assert (deleted.status_code, missing.status_code) == (204, 404)
+    assert meter.usage(TENANT, "users") == -1
@@ -0,0 +1,135 @@
+"""
+Rate limiter tests: both strategies on the Redis scripts (fakeredis with
+Lua) and on the local fallback
+"""
+
+import fakeredis.aioredis
+import pytest
+
+from src.infrastructure.ratelimit.limiter import (
+    LocalRateLimiter,
+    RateLimit,
+    RateLimiter,
+    RateLimitStrategy,
+)
+
+STRATEGIES = list(RateLimitStrategy)
+
+# Long windows, so a test never straddles a window boundary or sees a refill
+LIMITS = [RateLimit(limit=3, window_ms=3_600_000), RateLimit(limit=5, window_ms=86_400_000)]
+
+
+@pytest.fixture
+async def redis():
+    client = fakeredis.aioredis.FakeRedis()
+    yield client
+    await client.aclose()
+
+
+class FailingScript:
+    async def __call__(self, keys, args):
+        raise ConnectionError("Redis is down")
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+async def test_allows_up_to_the_limit_then_rejects(redis, strategy):
+    limiter = RateLimiter(redis, LIMITS, strategy=strategy)
+
+    results = [await limiter.hit("tenant-a:GET:/v1/users") for _ in range(4)]
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert [result.remaining for result in results] == [2, 1, 0, 0]
+    assert all(result.limit == 3 for result in results)
+    assert results[-1].retry_after_ms > 0
+    assert limiter.fallbacks == 0
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+async def test_keys_have_separate_budgets(redis, strategy):
+    limiter = RateLimiter(redis, LIMITS, strategy=strategy)
+
+    for _ in range(3):
+        await limiter.hit("tenant-a")
+
+    assert not (await limiter.hit("tenant-a")).allowed
+    assert (await limiter.hit("tenant-b")).allowed
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+async def test_budget_is_shared_between_limiters_on_one_redis(redis, strategy):
+    replicas = [RateLimiter(redis, LIMITS, strategy=strategy) for _ in range(3)]
+
+    results = [await replica.hit("tenant-a") for replica in replicas + replicas[:1]]
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+async def test_most_restrictive_limit_is_reported(redis, strategy):
+    limits = [RateLimit(limit=10, window_ms=3_600_000), RateLimit(limit=2, window_ms=86_400_000)]
+    limiter = RateLimiter(redis, limits, strategy=strategy)
+
+    result = await limiter.hit("tenant-a")
+
+    assert result.limit == 2
+    assert result.remaining == 1
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+async def test_rejection_headers(redis, strategy):
+    limiter = RateLimiter(redis, LIMITS, strategy=strategy)
+    for _ in range(3):
+        await limiter.hit("tenant-a")
+
+    headers = dict((await limiter.hit("tenant-a")).headers())
+
+    assert headers["RateLimit-Limit"] == "3"
+    assert headers["RateLimit-Remaining"] == "0"
+    assert int(headers["Retry-After"]) >= 1
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+async def test_redis_and_local_fallback_agree(redis, strategy):
+    limiter = RateLimiter(redis, LIMITS, strategy=strategy)
+    local = LocalRateLimiter(LIMITS, strategy)
+
+    for _ in range(5):
+        remote_result = await limiter.hit("tenant-a")
+        local_result = local.hit("tenant-a")
+        assert (remote_result.allowed, remote_result.remaining) == (
+            local_result.allowed,
+            local_result.remaining,
+        )
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+async def test_falls_back_to_local_limits_when_redis_fails(redis, strategy):
+    limiter = RateLimiter(redis, LIMITS, strategy=strategy, cooldown=60)
+    limiter._script = FailingScript()
+
+    results = [await limiter.hit("tenant-a") for _ in range(4)]
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+    # Only the first failure is paid for; Redis is skipped during the cooldown
+    assert limiter.fallbacks == 1
+    assert limiter.degraded
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_local_limiter_refills_over_time(strategy):
+    limiter = LocalRateLimiter([RateLimit(limit=2, window_ms=1000)], strategy)
+    start = 10_000
+
+    assert [limiter.hit("k", start).allowed for _ in range(3)] == [True, True, False]
+    # Two windows later the budget is whole again under both algorithms
+    assert limiter.hit("k", start + 2000).allowed
+
+
+def test_local_limiter_evicts_least_recently_used_keys():
+    limiter = LocalRateLimiter(LIMITS, max_keys=2)
+    limiter.hit("a", 0)
+    limiter.hit("b", 0)
+    limiter.hit("a", 0)
+    limiter.hit("c", 0)
+
+    assert set(limiter._state) == {"a", "c"}
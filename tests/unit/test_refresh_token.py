@@ -0,0 +1,122 @@
+"""
+Refresh token exchange: user reload and single use across replicas
+"""
+
+import asyncio
+from uuid import uuid4
+
+import fakeredis.aioredis
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.adapters.inbound.rest import dependencies
+from src.adapters.inbound.rest.v1 import auth
+from src.domain.entities.user import User, UserRole, UserStatus
+from src.infrastructure.fastapi.middleware.pipeline import RequestPipelineMiddleware
+from src.infrastructure.security import tokens as token_module
+from src.infrastructure.security.keys import KeyRing
+from src.infrastructure.security.tokens import TokenService
+
+TENANT_ID = uuid4()
+
+
+class UserStore:
+    def __init__(self, *users: User) -> None:
+        self.users = {user.id: user for user in users}
+
+    async def get_by_id(self, user_id):
+        user = self.users.get(user_id)
+        return user if user is not None and user.tenant_id == TENANT_ID else None
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis()
+
+
+def replica(redis) -> TokenService:
+    return TokenService(KeyRing("refresh-test-secret", "HS256"), redis)
+
+
+@pytest.fixture
+def user():
+    return User(tenant_id=TENANT_ID, email="admin@example.com", role=UserRole.ADMIN)
+
+
+def build_client(service: TokenService, store: UserStore, monkeypatch) -> httpx.AsyncClient:
+    monkeypatch.setattr(token_module, "_service", service)
+    app = FastAPI()
+    app.add_middleware(RequestPipelineMiddleware)
+    app.include_router(auth.router, prefix="/v1/auth")
+    app.dependency_overrides[dependencies.get_user_repository] = lambda: store
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(
+        transport=transport, base_url="http://test", headers={"X-Tenant-Id": str(TENANT_ID)}
+    )
+
+
+async def test_refresh_reissues_with_the_current_role(redis, user, monkeypatch):
+    service = replica(redis)
+    refresh = service.issue(str(user.id), str(TENANT_ID), role="admin").refresh_token
+    user.role = UserRole.MEMBER
+
+    async with build_client(service, UserStore(user), monkeypatch) as client:
+        response = await client.post("/v1/auth/refresh", json={"refresh_token": refresh})
+
+    assert response.status_code == 200
+    claims = await service.verify(response.json()["access_token"])
+    assert claims["role"] == "member"
+    assert claims["sub"] == str(user.id)
+
+
+@pytest.mark.parametrize("change", ["disabled", "deleted", "other_tenant"])
+async def test_refresh_rejects_users_who_may_no_longer_sign_in(redis, user, monkeypatch, change):
+    service = replica(redis)
+    tenant = str(uuid4()) if change == "other_tenant" else str(TENANT_ID)
+    refresh = service.issue(str(user.id), tenant, role="admin").refresh_token
+    user.status = UserStatus.DISABLED if change == "disabled" else user.status
+    store = UserStore() if change == "deleted" else UserStore(user)
+
+    async with build_client(service, store, monkeypatch) as client:
+        response = await client.post("/v1/auth/refresh", json={"refresh_token": refresh})
+
+    assert response.status_code == 401
+
+
+async def test_refresh_token_is_exchanged_once(redis, user, monkeypatch):
+    service = replica(redis)
+    refresh = service.issue(str(user.id), str(TENANT_ID), role="admin").refresh_token
+
+    async with build_client(service, UserStore(user), monkeypatch) as client:
+        first = await client.post("/v1/auth/refresh", json={"refresh_token": refresh})
+        second = await client.post("/v1/auth/refresh", json={"refresh_token": refresh})
+
+    assert (first.status_code, second.status_code) == (200, 401)
+
+
+async def test_concurrent_replay_on_two_replicas_issues_one_pair(redis, user):
+    first, second = replica(redis), replica(redis)
+    claims = await first.verify(
+        first.issue(str(user.id), str(TENANT_ID)).refresh_token, token_module.REFRESH_TOKEN
+    )
+
+    results = await asyncio.gather(first.revoke_once(claims), second.revoke_once(claims))
+
+    assert sorted(results) == [False, True]
+    assert await redis.exists(f"revoked:{claims['jti']}")
+
+
+async def test_revoke_once_raises_and_forgets_when_redis_fails(user):
+    class BrokenRedis:
+        async def set(self, *args, **kwargs):
+            raise ConnectionError("down")
+
+    service = TokenService(KeyRing("refresh-test-secret", "HS256"), BrokenRedis())
+    claims = await service.verify(
+        service.issue(str(user.id), str(TENANT_ID)).refresh_token, token_module.REFRESH_TOKEN
+    )
+
+    with pytest.raises(ConnectionError):
+        await service.revoke_once(claims)
+    assert not service.is_revoked(claims["jti"])
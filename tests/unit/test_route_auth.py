@@ -0,0 +1,123 @@
+"""
+Bearer token requirements of the v1 routes
+"""
+
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.adapters.inbound.rest import dependencies
+from src.adapters.inbound.rest.v1 import providers, tenants, users
+from src.domain.ports.repositories.pagination import Page
+from src.infrastructure.fastapi.middleware.pipeline import RequestPipelineMiddleware
+from src.infrastructure.security import tokens as token_module
+from src.infrastructure.security.keys import KeyRing
+from src.infrastructure.security.tokens import TokenService
+
+TENANT_ID = str(uuid4())
+
+
+class EmptyRepository:
+    async def list_page(self, limit, after=None):
+        return Page([], None)
+
+    async def stream_all(self, batch_size=500):
+        return
+        yield
+
+
+class EmptyProviderCache:
+    async def get_all(self, tenant_id):
+        return {}
+
+
+@pytest.fixture
+def token_service(monkeypatch):
+    service = TokenService(KeyRing("route-auth-test-secret", "HS256"))
+    monkeypatch.setattr(token_module, "_service", service)
+    return service
+
+
+@pytest.fixture
+async def client(token_service):
+    app = FastAPI()
+    app.add_middleware(RequestPipelineMiddleware)
+    app.include_router(users.router, prefix="/v1/users")
+    app.include_router(providers.router, prefix="/v1/providers")
+    app.include_router(tenants.router, prefix="/v1/tenants")
+    app.dependency_overrides[dependencies.get_tenant_repository] = EmptyRepository
+    app.dependency_overrides[dependencies.get_user_repository] = EmptyRepository
+    app.dependency_overrides[dependencies.get_provider_cache] = EmptyProviderCache
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def bearer(service: TokenService, role: str, tenant_id: str = TENANT_ID) -> dict:
+    token = service.issue(str(uuid4()), tenant_id, role=role).access_token
+    return {"X-Tenant-Id": TENANT_ID, "Authorization": f"Bearer {token}"}
+
+
+def operator(service: TokenService, role: str = "platform_admin") -> dict:
+    return {"Authorization": f"Bearer {service.issue('operator', role=role).access_token}"}
+
+
+@pytest.mark.parametrize("path", ["/v1/users/", "/v1/users/export", "/v1/providers/"])
+async def test_tenant_listings_require_a_token(client, path):
+    response = await client.get(path, headers={"X-Tenant-Id": TENANT_ID})
+
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+@pytest.mark.parametrize("path", ["/v1/users/", "/v1/users/export"])
+async def test_user_listings_require_an_admin(client, token_service, path):
+    response = await client.get(path, headers=bearer(token_service, "member"))
+    assert response.status_code == 403
+
+    response = await client.get(path, headers=bearer(token_service, "admin"))
+    assert response.status_code == 200
+
+
+async def test_any_tenant_token_lists_providers(client, token_service):
+    response = await client.get("/v1/providers/", headers=bearer(token_service, "member"))
+
+    assert response.status_code == 200
+    assert all(not provider["has_api_key"] for provider in response.json()["providers"])
+
+
+@pytest.mark.parametrize("path", ["/v1/tenants/", "/v1/tenants/export"])
+async def test_tenant_listings_are_for_platform_operators(client, token_service, path):
+    assert (await client.get(path)).status_code == 401
+    assert (await client.get(path, headers=bearer(token_service, "owner"))).status_code == 403
+    assert (await client.get(path, headers=operator(token_service, "admin"))).status_code == 403
+    # The operator role is only honoured on a token bound to no tenant
+    assert (
+        await client.get(path, headers=bearer(token_service, "platform_admin"))
+    ).status_code == 403
+
+    response = await client.get(path, headers=operator(token_service))
+    assert response.status_code == 200
+
+
+async def test_tenant_batches_are_for_platform_operators(client, token_service):
+    headers = {"Content-Type": "application/x-ndjson", **bearer(token_service, "admin")}
+
+    response = await client.post(
+        "/v1/tenants:batch", content=b'{"name": "Acme"}\n', headers=headers
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize("tenant_id", [None, str(uuid4())])
+async def test_tenant_routes_refuse_tokens_of_no_or_another_tenant(
+    client, token_service, tenant_id
+):
+    response = await client.get("/v1/users/", headers=bearer(token_service, "owner", tenant_id))
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Token not issued for this tenant"
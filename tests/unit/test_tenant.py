@@ -0,0 +1,26 @@
+"""
+Tenant entity settings
+"""
+
+from src.domain.entities.tenant import Tenant, TenantStatus, TenantTier
+
+
+def test_settings_are_writable_and_owned_by_each_tenant():
+    first, second = Tenant(name="First"), Tenant(name="Second")
+
+    first.settings["region"] = "eu-west-1"
+
+    assert first.settings == {"region": "eu-west-1"}
+    assert second.settings == {}
+
+
+def test_lifecycle_changes_record_settings():
+    tenant = Tenant(name="Acme", status=TenantStatus.ACTIVE)
+
+    tenant.suspend("unpaid invoice")
+    assert tenant.settings["suspension_reason"] == "unpaid invoice"
+    tenant.reactivate()
+    tenant.update_tier(TenantTier.PRO)
+
+    assert "suspension_reason" not in tenant.settings
+    assert [change["to"] for change in tenant.settings["tier_history"]] == ["pro"]
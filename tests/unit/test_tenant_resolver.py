@@ -0,0 +1,143 @@
+"""
+Tenant resolver cache tests, against a repository whose lookups can be held
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Dict, Optional
+from uuid import UUID
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.domain.entities.tenant import Tenant, TenantStatus
+from src.infrastructure.cache.tenant_resolver import TenantResolver
+
+
+class HeldRepository:
+    """Tenant lookups that wait for ``release`` while ``held`` is set"""
+
+    def __init__(self, *tenants: Tenant) -> None:
+        self.tenants: Dict[UUID, Tenant] = {tenant.id: tenant for tenant in tenants}
+        self.calls = 0
+        self.failing = False
+        self.held = False
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def _lookup(self, tenant: Optional[Tenant]) -> Optional[Tenant]:
+        self.calls += 1
+        if self.failing:
+            raise ConnectionError("database unavailable")
+        # A copy, like a row read from the database
+        row = (
+            None
+            if tenant is None
+            else Tenant(
+                **{name: getattr(tenant, name) for name in ("id", "name", "slug", "status")}
+            )
+        )
+        if self.held:
+            self.started.set()
+            await self.release.wait()
+        return row
+
+    async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        return await self._lookup(self.tenants.get(tenant_id))
+
+    async def get_by_slug(self, slug: str) -> Optional[Tenant]:
+        return await self._lookup(next((t for t in self.tenants.values() if t.slug == slug), None))
+
+
+@pytest.fixture
+def tenant():
+    tenant = Tenant(name="Acme")
+    tenant.activate()
+    return tenant
+
+
+@pytest.fixture
+def repository(tenant):
+    return HeldRepository(tenant)
+
+
+@pytest.fixture
+def resolver(repository):
+    return TenantResolver(repository, ttl=60, negative_ttl=5)
+
+
+def event(tenant: Tenant) -> SimpleNamespace:
+    return SimpleNamespace(
+        subject="platform.events.tenant.suspended",
+        data=json.dumps(
+            {
+                "aggregate_id": str(tenant.id),
+            }
+        ).encode(),
+    )
+
+
+async def test_concurrent_misses_share_one_lookup(resolver, repository, tenant):
+    results = await asyncio.gather(*(resolver.resolve(str(tenant.id)) for _ in range(10)))
+
+    assert {result.id for result in results} == {tenant.id}
+    assert repository.calls == 1
+    assert (await resolver.resolve(str(tenant.id))).id == tenant.id
+    assert resolver.stats()["hits"] == 1
+
+
+async def test_unknown_tenants_are_cached_briefly(resolver, repository):
+    assert await resolver.resolve("nobody") is None
+    assert await resolver.resolve("nobody") is None
+
+    assert repository.calls == 1
+    assert resolver.stats()["negative_hits"] == 1
+
+
+@pytest.mark.parametrize("by", ["id", "slug"])
+async def test_lookup_in_flight_during_an_invalidation_is_not_cached(
+    resolver, repository, tenant, by
+):
+    key = str(tenant.id) if by == "id" else tenant.slug
+    repository.held = True
+    lookup = asyncio.create_task(resolver.resolve(key))
+    await repository.started.wait()
+
+    # The tenant is suspended while the lookup has already read it as active
+    tenant.suspend()
+    await resolver._on_event(event(tenant))
+    repository.release.set()
+
+    assert (await lookup).status is TenantStatus.ACTIVE
+    repository.held = False
+    assert (await resolver.resolve(key)).status is TenantStatus.SUSPENDED
+    assert repository.calls == 2
+
+
+async def test_lifecycle_events_drop_entries_by_id_and_slug(resolver, repository, tenant):
+    await resolver.resolve(str(tenant.id))
+    await resolver.resolve(tenant.slug)
+
+    tenant.suspend()
+    await resolver._on_event(event(tenant))
+
+    assert (await resolver.resolve(str(tenant.id))).status is TenantStatus.SUSPENDED
+    assert (await resolver.resolve(tenant.slug)).status is TenantStatus.SUSPENDED
+    assert resolver.stats()["invalidations"] == 2
+
+
+async def test_failed_refreshes_back_off_while_serving_stale(repository, tenant):
+    resolver = TenantResolver(repository, ttl=0.0, stale_ttl=60, refresh_retry=60)
+    await resolver.resolve(str(tenant.id))
+    before = REGISTRY.get_sample_value("tenant_cache_lookups_total", {"result": "stale_hit"}) or 0
+
+    repository.failing = True
+    for _ in range(20):
+        assert (await resolver.resolve(str(tenant.id))).id == tenant.id
+        await asyncio.sleep(0)
+
+    assert repository.calls == 2
+    assert resolver.stats()["refresh_failures"] == 1
+    after = REGISTRY.get_sample_value("tenant_cache_lookups_total", {"result": "stale_hit"})
+    assert after - before == 20
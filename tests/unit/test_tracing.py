@@ -0,0 +1,187 @@
+"""
+Sampling, tail keeping and span attributes of the tracing setup
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import Decision
+from opentelemetry.trace import SpanKind, StatusCode
+from sqlalchemy import create_engine, text
+
+from src.domain.entities.tenant import TenantStatus
+from src.infrastructure.fastapi.middleware import pipeline
+from src.infrastructure.fastapi.middleware.pipeline import RequestPipelineMiddleware
+from src.infrastructure.observability import tracing
+from src.infrastructure.observability.tracing import HeadSampler, TailKeepProcessor, build_sampler
+
+TENANT_ID = str(uuid4())
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def provider(exporter, monkeypatch):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, "_provider", provider)
+    monkeypatch.setattr(tracing, "_tracer", provider.get_tracer(tracing.TRACER_NAME))
+    return provider
+
+
+@pytest.mark.parametrize(
+    "ratio, trace_id, decision",
+    [
+        (0.0, 1, Decision.RECORD_ONLY),
+        (1.0, 2**64 - 1, Decision.RECORD_AND_SAMPLE),
+        (0.5, 1, Decision.RECORD_AND_SAMPLE),
+        (0.5, 2**64 - 1, Decision.RECORD_ONLY),
+    ],
+)
+def test_head_sampler_records_what_the_ratio_leaves_out(ratio, trace_id, decision):
+    result = HeadSampler(ratio).should_sample(None, trace_id, "GET /v1/users")
+
+    assert result.decision is decision
+
+
+def test_head_sampler_samples_about_the_ratio():
+    sampler = HeadSampler(0.25)
+    trace_ids = range(1, 2**64, 2**64 // 4000)
+
+    sampled = sum(
+        sampler.should_sample(None, trace_id, "span").decision is Decision.RECORD_AND_SAMPLE
+        for trace_id in trace_ids
+    )
+
+    assert 900 <= sampled <= 1100
+
+
+@pytest.fixture
+def tail(exporter):
+    processor = TailKeepProcessor(SimpleSpanProcessor(exporter), latency_ms=50, keep_errors=True)
+    provider = TracerProvider(sampler=build_sampler(0.0, tail=True))
+    provider.add_span_processor(processor)
+    return processor, provider.get_tracer("test")
+
+
+def test_tail_keep_discards_fast_successful_traces(tail, exporter):
+    processor, tracer = tail
+
+    with tracer.start_as_current_span("root"):
+        with tracer.start_as_current_span("child"):
+            pass
+
+    assert exporter.get_finished_spans() == ()
+    assert (processor.kept, processor.discarded) == (0, 1)
+
+
+def test_tail_keep_exports_whole_trace_with_an_error(tail, exporter):
+    processor, tracer = tail
+
+    with tracer.start_as_current_span("root"):
+        with tracer.start_as_current_span("child") as child:
+            child.set_status(StatusCode.ERROR)
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["child", "root"]
+    assert all(span.context.trace_flags.sampled for span in spans)
+    assert processor.kept == 1
+
+
+def test_tail_keep_exports_slow_traces(tail, exporter):
+    processor, tracer = tail
+
+    root = tracer.start_span("root", start_time=1_000_000_000)
+    root.end(end_time=1_000_000_000 + 60_000_000)
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["root"]
+    assert processor.kept == 1
+
+
+@pytest.fixture
+async def client(provider, monkeypatch):
+    tenant = SimpleNamespace(
+        id=TENANT_ID, status=TenantStatus.ACTIVE, tier=SimpleNamespace(value="free")
+    )
+
+    class Resolver:
+        async def resolve(self, tenant_id):
+            return tenant
+
+    monkeypatch.setattr(pipeline, "get_tenant_resolver", Resolver)
+
+    app = FastAPI()
+    app.add_middleware(RequestPipelineMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    @app.get("/broken")
+    async def broken():
+        return Response(status_code=503)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def test_pipeline_server_span_attributes(client, exporter):
+    response = await client.get(
+        "/items/42", headers={"X-Tenant-Id": TENANT_ID, "X-Request-Id": "req-1"}
+    )
+
+    assert response.status_code == 200
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    server = spans["GET /items/{item_id}"]
+    assert server.kind is SpanKind.SERVER
+    assert server.attributes["http.method"] == "GET"
+    assert server.attributes["http.target"] == "/items/42"
+    assert server.attributes["http.route"] == "/items/{item_id}"
+    assert server.attributes["http.status_code"] == 200
+    assert server.attributes["http.request_id"] == "req-1"
+    assert server.attributes["tenant.id"] == TENANT_ID
+    assert spans["tenant.resolve"].parent.span_id == server.context.span_id
+
+
+async def test_pipeline_marks_server_errors(client, exporter):
+    response = await client.get("/broken", headers={"X-Tenant-Id": TENANT_ID})
+
+    assert response.status_code == 503
+    (server,) = [span for span in exporter.get_finished_spans() if span.kind is SpanKind.SERVER]
+    assert server.status.status_code is StatusCode.ERROR
+
+
+def test_instrumented_engine_emits_client_spans(provider, exporter):
+    engine = create_engine("sqlite://")
+    tracing.instrument_engine(engine)
+
+    with tracing.traced("repository.get"):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    statement = spans["SELECT"]
+    assert statement.kind is SpanKind.CLIENT
+    assert statement.attributes["db.system"] == "sqlite"
+    assert statement.parent.span_id == spans["repository.get"].context.span_id
+
+
+def test_instrument_engine_is_a_no_op_without_tracing(exporter, monkeypatch):
+    monkeypatch.setattr(tracing, "_provider", None)
+    engine = create_engine("sqlite://")
+    tracing.instrument_engine(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert exporter.get_finished_spans() == ()